@@ -8,7 +8,6 @@ import os
 import os.path
 import pathlib
 import re
-import shlex
 import shutil
 import traceback
 from typing import Any
@@ -22,7 +21,6 @@ from _pytest.runner import CallInfo
 from kubernetes.dynamic.exceptions import ConflictError
 from ocp_resources.network_config_openshift_io import Network
 from packaging.version import Version
-from pyhelper_utils.shell import run_command
 from pytest import Item
 from pytest_testconfig import config as py_config
 
@@ -31,7 +29,8 @@ import utilities.cluster
 # TODO: Remove this import when utilities modules are refactored...
 import utilities.infra  # noqa
 from libs.storage.config import StorageClassConfig
-from utilities.bitwarden import get_cnv_tests_secret_by_name
+from utilities.bitwarden import get_cnv_tests_secret_by_name, prefetch_cnv_tests_secrets
+from utilities.console import close_console_sessions
 from utilities.constants import (
     AMD_64,
     QUARANTINED,
@@ -40,7 +39,7 @@ from utilities.constants import (
     NamespacesNames,
 )
 from utilities.data_collector import (
-    collect_default_cnv_must_gather_with_vm_gather,
+    MustGatherCollectionQueue,
     get_data_collector_dir,
     get_scope_identifier,
     set_data_collector_directory,
@@ -48,8 +47,11 @@ from utilities.data_collector import (
 )
 from utilities.database import Database
 from utilities.exceptions import MissingEnvironmentVariableError, StorageSanityError
+from utilities.informer import start_session_informers, stop_session_informers
+from utilities.jira import prefetch_jira_statuses
 from utilities.junit_ai_utils import enrich_junit_xml, setup_ai_analysis
 from utilities.logger import setup_logging
+from utilities.network import get_mac_pool_state_file
 from utilities.pytest_utils import (
     assert_incremental_classes_fully_collected,
     config_default_storage_class,
@@ -59,6 +61,8 @@ from utilities.pytest_utils import (
     get_artifactory_server_url,
     get_base_matrix_name,
     get_cnv_version_explorer_url,
+    get_collected_tests_jira_ids,
+    get_dynamic_matrix_params_cache_stats,
     get_matrix_params,
     get_tests_cluster_markers,
     mark_nmstate_dependent_tests,
@@ -72,6 +76,7 @@ from utilities.pytest_utils import (
     update_latest_os_config,
     validate_collected_tests_arch_params,
 )
+from utilities.ssh_pool import start_ssh_connection_pool, stop_ssh_connection_pool
 
 pytest_plugins = [
     "tests.fixtures.network.l2_bridge",
@@ -119,7 +124,6 @@ MUST_GATHER_IGNORE_EXCEPTION_LIST = [
     StorageSanityError,
     ConflictError,
 ]
-INSPECT_BASE_COMMAND = "oc adm inspect"
 
 
 def pytest_addoption(parser):
@@ -333,6 +337,20 @@ def pytest_addoption(parser):
         help="Skip artifactory environment variable checks. To be used for tests that does not need articatory access",
     )
 
+    session_group.addoption(
+        "--session-informers",
+        action="store_true",
+        default=False,
+        help="Serve VM/VMI/DataVolume/Pod status reads of wait helpers from shared watch-backed caches",
+    )
+
+    session_group.addoption(
+        "--ssh-connection-pool",
+        action="store_true",
+        default=False,
+        help="Keep one SSH connection per VM open and run all SSH commands to the VM on it",
+    )
+
     session_group.addoption(
         "--remote_cluster_host",
         help="Host address of the remote cluster for cross-cluster tests",
@@ -733,7 +751,7 @@ def pytest_runtest_setup(item):
     if item.config.getoption("--data-collector"):
         # before the setup work starts, insert current epoch time into the database
         try:
-            db = Database(base_dir=item.config.getoption("--data-collector-output-dir"))
+            db = get_data_collector_database(config=item.config)
             scope_marker = item.get_closest_marker(name="data_collector_scope")
             scope_value = scope_marker.kwargs.get("scope") if scope_marker else None
 
@@ -832,6 +850,8 @@ def pytest_sessionstart(session):
     # Set py_config["servers"] and py_config["os_login_param"]
     # Send --tc=server_url:<url> to override servers URL
     if not skip_if_pytest_flags_exists(pytest_config=session.config):
+        # Fetch all the secrets with a single bws call, shared with the other pytest processes of the session
+        prefetch_cnv_tests_secrets(session=session)
         admin_client = utilities.cluster.cache_admin_client()
         py_config["version_explorer_url"] = get_cnv_version_explorer_url(pytest_config=session.config)
         py_config["cluster_service_network"] = Network(
@@ -846,6 +866,12 @@ def pytest_sessionstart(session):
             }
             py_config["os_login_param"] = get_cnv_tests_secret_by_name(secret_name="os_login", session=session)
 
+        if session.config.getoption("--session-informers"):
+            start_session_informers(client=admin_client)
+
+        if session.config.getoption("--ssh-connection-pool"):
+            start_ssh_connection_pool()
+
         # must be at the end to make sure we create it only after all pytest_sessionstart checks pass.
         stop_if_run_in_progress(client=admin_client)
         deploy_run_in_progress_namespace(client=admin_client)
@@ -858,15 +884,28 @@ def pytest_sessionstart(session):
 
 
 def pytest_collection_finish(session):
+    LOGGER.info(f"Dynamic matrices cache: {get_dynamic_matrix_params_cache_stats()}")
     assert_incremental_classes_fully_collected(items=session.items)
     validate_collected_tests_arch_params(session=session)
     if session.config.getoption("--collect-tests-markers"):
         get_tests_cluster_markers(items=session.items, filepath=session.config.getoption("--tests-markers-file"))
         pytest.exit(reason="Run with --collect-tests-markers. no tests are executed", returncode=0)
 
+    if not skip_if_pytest_flags_exists(pytest_config=session.config):
+        # Resolve all the Jira IDs of the run in a single request, instead of one request per is_jira_open call
+        prefetch_jira_statuses(jira_ids=get_collected_tests_jira_ids(items=session.items))
+
 
 def pytest_sessionfinish(session, exitstatus):
     shutil.rmtree(path=session.config.option.basetemp, ignore_errors=True)
+    stop_session_informers()
+    close_console_sessions()
+    stop_ssh_connection_pool()
+    # The pytest-xdist controller ends its session after the workers: remove the MAC reservations they shared
+    if (dsession := session.config.pluginmanager.get_plugin("dsession")) and dsession.nodemanager:
+        mac_pool_state_file = get_mac_pool_state_file(testrun_uid=dsession.nodemanager.testrunuid)
+        if os.path.exists(mac_pool_state_file):
+            os.remove(mac_pool_state_file)
     if not skip_if_pytest_flags_exists(pytest_config=session.config):
         admin_client = utilities.cluster.cache_admin_client()
         run_in_progress_config_map(client=admin_client).clean_up()
@@ -874,11 +913,15 @@ def pytest_sessionfinish(session, exitstatus):
 
     reporter = session.config.pluginmanager.get_plugin("terminalreporter")
     reporter.summary_stats()
+    if must_gather_queue := getattr(session.config.option, "must_gather_queue", None):
+        must_gather_queue.flush()
     if session.config.getoption("--data-collector"):
-        db = Database(base_dir=session.config.getoption("--data-collector-output-dir"))
+        db = get_data_collector_database(config=session.config)
+        db.close()
         file_path = db.database_file_path
-        LOGGER.info(f"Removing database file path {file_path}")
-        os.remove(file_path)
+        if os.path.exists(file_path):
+            LOGGER.info(f"Removing database file path {file_path}")
+            os.remove(file_path)
     # clean up the empty folders
     collector_directory = py_config["data_collector"]["data_collector_base_directory"]
     if os.path.exists(collector_directory):
@@ -911,14 +954,14 @@ def is_skip_must_gather(node: Node) -> bool:
     return "skip_must_gather_collection" in get_all_node_markers(node=node)
 
 
-def get_inspect_command_namespace_string(node: Node, test_name: str) -> str:
-    namespace_str = ""
+def get_inspect_namespaces(node: Node, test_name: str) -> list[str]:
+    namespaces_to_collect: list[str] = []
     components = [key for key in NAMESPACE_COLLECTION if f"tests/{key}/" in test_name]
     if not components:
         LOGGER.warning(f"{test_name} does not require special data collection on failure")
     else:
         component = components[0]
-        namespaces_to_collect: list[str] = NAMESPACE_COLLECTION[component].copy()
+        namespaces_to_collect = NAMESPACE_COLLECTION[component].copy()
         all_markers = get_all_node_markers(node=node)
         if component == "virt":
             if "gpu" in all_markers:
@@ -933,8 +976,7 @@ def get_inspect_command_namespace_string(node: Node, test_name: str) -> str:
                 namespaces_to_collect.append(NamespacesNames.OPENSHIFT_MTV)
             if "nmstate" in all_markers:
                 namespaces_to_collect.append(NamespacesNames.OPENSHIFT_NMSTATE)
-        namespace_str = " ".join([f"namespace/{namespace}" for namespace in namespaces_to_collect])
-    return namespace_str
+    return namespaces_to_collect
 
 
 def calculate_must_gather_timer(test_start_time):
@@ -958,33 +1000,35 @@ def pytest_exception_interact(node: Item | Collector, call: CallInfo[Any], repor
                 f"[DATA_COLLECTOR] Must-gather collection would be skipped for exception: {call.excinfo.type}"
             )
         else:
-            db = Database(base_dir=node.config.getoption("--data-collector-output-dir"))
+            db = get_data_collector_database(config=node.config)
             test_start_time = db.get_start_time_for_collection(node=node)
 
             try:
-                collection_dir = os.path.join(get_data_collector_dir(), "pytest_exception_interact")
-                collect_default_cnv_must_gather_with_vm_gather(
+                get_must_gather_queue(config=node.config).submit(
+                    test_name=test_name,
                     since_time=calculate_must_gather_timer(test_start_time=test_start_time),
-                    target_dir=collection_dir,
-                    admin_client=utilities.cluster.cache_admin_client(),
+                    target_dir=os.path.join(get_data_collector_dir(), "pytest_exception_interact"),
+                    inspect_namespaces=get_inspect_namespaces(test_name=test_name, node=node),
                 )
-                if inspect_str := get_inspect_command_namespace_string(test_name=test_name, node=node):
-                    target_dir = os.path.join(collection_dir, "inspect_collection")
-                    inspect_command = (
-                        f"{INSPECT_BASE_COMMAND} {inspect_str} "
-                        f"--since={calculate_must_gather_timer(test_start_time=test_start_time)}s "
-                        f"--dest-dir={target_dir}"
-                    )
-                    LOGGER.info(f"running inspect command on {inspect_command}")
-                    run_command(
-                        command=shlex.split(inspect_command),
-                        check=False,
-                        verify_stderr=False,
-                    )
             except Exception as current_exception:
                 LOGGER.warning(f"Failed to collect logs: {test_name}: {current_exception} {traceback.format_exc()}")
 
 
+def get_data_collector_database(config: Config) -> Database:
+    # Start times are written and read by the same process, so the session database never needs to hit the disk
+    if not getattr(config.option, "data_collector_database", None):
+        config.option.data_collector_database = Database(
+            base_dir=config.getoption("--data-collector-output-dir"), in_memory=True
+        )
+    return config.option.data_collector_database
+
+
+def get_must_gather_queue(config: Config) -> MustGatherCollectionQueue:
+    if not getattr(config.option, "must_gather_queue", None):
+        config.option.must_gather_queue = MustGatherCollectionQueue(admin_client=utilities.cluster.cache_admin_client())
+    return config.option.must_gather_queue
+
+
 @pytest.hookimpl(optionalhook=True)
 def pytest_html_results_table_header(cells):
     cells.pop()  # Remove the `Links` column
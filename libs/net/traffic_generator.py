@@ -1,12 +1,16 @@
 import contextlib
+import json
 import logging
+import shlex
+import statistics
 from abc import ABC, abstractmethod
-from collections.abc import Generator
-from typing import Final, Self
+from collections.abc import Generator, Sequence
+from dataclasses import dataclass
+from typing import Any, Final, Self
 
 from ocp_resources.pod import Pod
 from ocp_utilities.exceptions import CommandExecFailed
-from timeout_sampler import retry
+from timeout_sampler import TimeoutSampler, retry
 
 from libs.net.ip import filter_link_local_addresses
 from libs.net.vmspec import lookup_iface_status, lookup_iface_status_ip
@@ -15,6 +19,8 @@ from libs.vm.vm import BaseVirtualMachine
 _DEFAULT_CMD_TIMEOUT_SEC: Final[int] = 10
 _IPERF_BIN: Final[str] = "iperf3"
 IPERF_SERVER_PORT: Final[int] = 5201
+_TRAFFIC_TIMEOUT_BUFFER_SEC: Final[int] = 60  # extra time for the clients to connect and write their reports
+TRAFFIC_PERCENTILES: Final[tuple[int, ...]] = (50, 90, 99)
 
 
 LOGGER = logging.getLogger(__name__)
@@ -290,3 +296,235 @@ def client_server_active_connection(
             maximum_segment_size=maximum_segment_size,
         ) as client:
             yield client, server
+
+
+@dataclass(frozen=True)
+class TrafficStream:
+    """A client-server pair of a traffic run.
+
+    Attributes:
+        server_vm: VM running the iperf3 server.
+        server_ip: IP address to bind the server and connect the client to.
+        client: VM or pod running the iperf3 client; a pod needs a container with iperf3.
+        port: Server port; must be unique per server VM within a traffic run.
+        container: Container of the client pod to execute commands in.
+    """
+
+    server_vm: BaseVirtualMachine
+    server_ip: str
+    client: BaseVirtualMachine | Pod
+    port: int = IPERF_SERVER_PORT
+    container: str | None = None
+
+    @property
+    def report_file(self) -> str:
+        return f"/tmp/{_IPERF_BIN}-{self.server_ip}-{self.port}.json"
+
+
+@dataclass(frozen=True)
+class StreamStats:
+    """Totals of a single iperf3 connection (socket).
+
+    Attributes:
+        socket: iperf3 socket number of the connection.
+        bits_per_second: Throughput received by the server.
+        retransmits: TCP retransmits of the sender; None for UDP.
+        mean_rtt_usec: Mean TCP round trip time in microseconds; None for UDP or when not reported.
+        jitter_ms: UDP jitter in milliseconds; None for TCP.
+        lost_percent: Percent of lost UDP datagrams; None for TCP.
+    """
+
+    socket: int
+    bits_per_second: float
+    retransmits: int | None = None
+    mean_rtt_usec: int | None = None
+    jitter_ms: float | None = None
+    lost_percent: float | None = None
+
+
+@dataclass(frozen=True)
+class TrafficStats:
+    """Metrics of an iperf3 client run, over all its parallel connections.
+
+    Attributes:
+        streams: Totals of each connection.
+        bits_per_second: Throughput received by the server, over all connections.
+        retransmits: TCP retransmits over all connections; 0 for UDP.
+        throughput_percentiles: Percentiles (TRAFFIC_PERCENTILES) of the per-interval throughput of all
+            connections together, in bits per second.
+        rtt_percentiles_usec: Percentiles of the per-interval TCP round trip time samples of all connections,
+            in microseconds; empty for UDP.
+        jitter_ms: Highest UDP jitter of the connections in milliseconds; None for TCP.
+    """
+
+    streams: list[StreamStats]
+    bits_per_second: float
+    retransmits: int
+    throughput_percentiles: dict[int, float]
+    rtt_percentiles_usec: dict[int, float]
+    jitter_ms: float | None = None
+
+
+def percentiles(values: Sequence[float], percents: Sequence[int] = TRAFFIC_PERCENTILES) -> dict[int, float]:
+    """Compute percentiles with linear interpolation between the closest samples.
+
+    Args:
+        values: Samples.
+        percents: Percentiles to compute, in the 1-99 range.
+
+    Returns:
+        Percentile to value, e.g. {50: 9.4e9, 90: 9.6e9, 99: 9.7e9}; empty if there are no samples.
+    """
+    if not values:
+        return {}
+    if len(values) == 1:
+        return dict.fromkeys(percents, float(values[0]))
+
+    cut_points = statistics.quantiles(values, n=100, method="inclusive")
+    return {percent: cut_points[percent - 1] for percent in percents}
+
+
+def parse_iperf3_report(report: dict[str, Any]) -> TrafficStats:
+    """Parse the JSON report (--json) of an iperf3 TCP or UDP client.
+
+    Args:
+        report: Parsed iperf3 JSON output.
+
+    Returns:
+        Per-connection and aggregated metrics of the run.
+
+    Raises:
+        ValueError: If iperf3 reported an error.
+    """
+    if error := report.get("error"):
+        raise ValueError(f"iperf3 failed: {error}")
+
+    streams = []
+    for stream in report["end"]["streams"]:
+        if udp := stream.get("udp"):
+            streams.append(
+                StreamStats(
+                    socket=udp["socket"],
+                    bits_per_second=udp["bits_per_second"],
+                    jitter_ms=udp["jitter_ms"],
+                    lost_percent=udp["lost_percent"],
+                )
+            )
+        else:
+            streams.append(
+                StreamStats(
+                    socket=stream["sender"]["socket"],
+                    bits_per_second=stream["receiver"]["bits_per_second"],
+                    retransmits=stream["sender"].get("retransmits"),
+                    mean_rtt_usec=stream["sender"].get("mean_rtt"),
+                )
+            )
+
+    intervals = report.get("intervals", [])
+    rtt_samples = [
+        interval_stream["rtt"]
+        for interval in intervals
+        for interval_stream in interval["streams"]
+        if interval_stream.get("rtt")
+    ]
+    jitters = [stream.jitter_ms for stream in streams if stream.jitter_ms is not None]
+    return TrafficStats(
+        streams=streams,
+        bits_per_second=sum(stream.bits_per_second for stream in streams),
+        retransmits=sum(stream.retransmits or 0 for stream in streams),
+        throughput_percentiles=percentiles(values=[interval["sum"]["bits_per_second"] for interval in intervals]),
+        rtt_percentiles_usec=percentiles(values=rtt_samples),
+        jitter_ms=max(jitters) if jitters else None,
+    )
+
+
+def run_traffic(
+    streams: Sequence[TrafficStream],
+    duration: int,
+    parallel: int = 1,
+    udp_bitrate: str | None = None,
+) -> list[TrafficStats]:
+    """Run timed iperf3 traffic on several client-server pairs at once, and collect their metrics.
+
+    All servers are started first, then all clients are started in the background, writing their
+    JSON reports to a file, so the pairs run concurrently whatever VMs and pods they share.
+
+    Args:
+        streams: Client-server pairs.
+        duration: Traffic duration in seconds.
+        parallel: Parallel connections of each client (iperf3 --parallel).
+        udp_bitrate: Send UDP traffic at this target bitrate per connection (e.g. "100M"), instead of TCP.
+
+    Returns:
+        Metrics of each pair, in the order of the streams.
+
+    Raises:
+        ValueError: If two pairs use the same server VM and port.
+        TimeoutExpiredError: If the clients do not finish in time.
+    """
+    server_endpoints = [(stream.server_vm.name, stream.port) for stream in streams]
+    if len(set(server_endpoints)) != len(server_endpoints):
+        raise ValueError(f"Each traffic stream needs its own server VM and port, got: {server_endpoints}")
+
+    client_cmds = [
+        f"{_IPERF_BIN} --client {stream.server_ip} --port {stream.port} --time {duration} --parallel {parallel}"
+        f" --json --logfile {stream.report_file}" + (f" --udp --bitrate {udp_bitrate}" if udp_bitrate else "")
+        for stream in streams
+    ]
+    with contextlib.ExitStack() as stack:
+        for stream in streams:
+            stack.enter_context(TcpServer(vm=stream.server_vm, port=stream.port, bind_ip=stream.server_ip))
+
+        for stream, client_cmd in zip(streams, client_cmds):
+            _run_client_command(stream=stream, cmd=f"rm -f {stream.report_file}")
+            _start_client(stream=stream, cmd=client_cmd)
+
+        LOGGER.info(f"Running traffic of {len(streams)} client-server pairs for {duration} seconds")
+        for sample in TimeoutSampler(
+            wait_timeout=duration + _TRAFFIC_TIMEOUT_BUFFER_SEC,
+            sleep=2,
+            func=lambda: [
+                stream.server_ip
+                for stream, client_cmd in zip(streams, client_cmds)
+                if _is_client_running(stream=stream, cmd=client_cmd)
+            ],
+        ):
+            if not sample:
+                break
+
+    return [
+        parse_iperf3_report(
+            report=_read_json(output=_run_client_command(stream=stream, cmd=f"cat {stream.report_file}"))
+        )
+        for stream in streams
+    ]
+
+
+def _start_client(stream: TrafficStream, cmd: str) -> None:
+    if isinstance(stream.client, Pod):
+        stream.client.execute(
+            command=["sh", "-c", f"nohup {cmd} >/dev/null 2>&1 &"], container=stream.container or _IPERF_BIN
+        )
+    else:
+        stream.client.console(commands=[f"{cmd} &"], timeout=_DEFAULT_CMD_TIMEOUT_SEC)
+
+
+def _is_client_running(stream: TrafficStream, cmd: str) -> bool:
+    if isinstance(stream.client, Pod):
+        out = stream.client.execute(
+            command=["pgrep", "-f", cmd], container=stream.container or _IPERF_BIN, ignore_rc=True
+        )
+        return bool(out.strip())
+    return _is_process_running(vm=stream.client, cmd=cmd)
+
+
+def _run_client_command(stream: TrafficStream, cmd: str) -> str:
+    if isinstance(stream.client, Pod):
+        return stream.client.execute(command=shlex.split(cmd), container=stream.container or _IPERF_BIN)
+    output = stream.client.console(commands=[cmd], timeout=_DEFAULT_CMD_TIMEOUT_SEC)
+    return "\n".join(output[cmd])
+
+
+def _read_json(output: str) -> dict[str, Any]:
+    # Console output also holds the echoed command; the report is the outermost JSON object
+    return json.loads(output[output.index("{") : output.rindex("}") + 1])
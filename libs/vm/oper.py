@@ -2,19 +2,26 @@ import logging
 
 from kubernetes.client import ApiException
 
+from libs.vm.parallel import DEFAULT_MAX_WORKERS, run_concurrently
 from libs.vm.vm import BaseVirtualMachine
 
 LOGGER = logging.getLogger(__name__)
 
 
-def run_vms(vms: tuple[BaseVirtualMachine, ...]) -> tuple[BaseVirtualMachine, ...]:
-    """Start all VMs in parallel then wait for each to be ready and agent-connected.
+def run_vms(
+    vms: tuple[BaseVirtualMachine, ...], max_workers: int = DEFAULT_MAX_WORKERS
+) -> tuple[BaseVirtualMachine, ...]:
+    """Start all VMs then wait concurrently for each to be ready and agent-connected.
 
     Args:
         vms: VMs to start.
+        max_workers: Maximum number of VMs waited on at the same time.
 
     Returns:
         The same tuple of VMs, all running with guest agent connected.
+
+    Raises:
+        VMsOperationError: If any VM did not become ready, listing every failed VM.
     """
     for vm in vms:
         try:
@@ -23,7 +30,10 @@ def run_vms(vms: tuple[BaseVirtualMachine, ...]) -> tuple[BaseVirtualMachine, ..
             if "VM is already running" in vm_exception.body:
                 LOGGER.warning(f"VM {vm.name} is already running")
                 continue
-    for vm in vms:
-        vm.wait_for_ready_status(status=True)  # type: ignore[no-untyped-call]
-        vm.wait_for_agent_connected()
+    run_concurrently(vms=vms, operation=wait_for_vm_ready, max_workers=max_workers)
     return vms
+
+
+def wait_for_vm_ready(vm: BaseVirtualMachine) -> None:
+    vm.wait_for_ready_status(status=True)  # type: ignore[no-untyped-call]
+    vm.wait_for_agent_connected()
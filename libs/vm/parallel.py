@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Final, Protocol
+
+DEFAULT_MAX_WORKERS: Final[int] = 10
+
+LOGGER = logging.getLogger(__name__)
+
+
+class NamedResource(Protocol):
+    """A namespaced resource, e.g. a VM."""
+
+    @property
+    def name(self) -> str: ...
+
+    @property
+    def namespace(self) -> str: ...
+
+
+@dataclass(frozen=True)
+class VMOperationResult:
+    """Outcome of a single VM operation executed by run_concurrently.
+
+    Attributes:
+        vm_name: Name of the VM the operation ran against.
+        duration_sec: Wall time spent in the operation; 0 when it was cancelled before starting.
+        error: Exception raised by the operation, None on success.
+        cancelled: True when the operation never started because another VM already failed.
+    """
+
+    vm_name: str
+    duration_sec: float
+    error: BaseException | None = None
+    cancelled: bool = False
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and not self.cancelled
+
+
+class VMsOperationError(Exception):
+    def __init__(self, results: Sequence[VMOperationResult]) -> None:
+        self.results = results
+        self.failures = [result for result in results if result.error is not None]
+        self.cancelled = [result.vm_name for result in results if result.cancelled]
+        super().__init__(str(self))
+
+    def __str__(self) -> str:
+        failures = "\n".join(
+            f"  {result.vm_name} ({result.duration_sec:.1f}s): {type(result.error).__name__}: {result.error}"
+            for result in self.failures
+        )
+        msg = f"{len(self.failures)} of {len(self.results)} VM operation(s) failed:\n{failures}"
+        if self.cancelled:
+            msg += f"\nCancelled before start: {self.cancelled}"
+        return msg
+
+
+def run_concurrently[VMT: NamedResource](
+    vms: Sequence[VMT],
+    operation: Callable[[VMT], object],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    fail_fast: bool = True,
+) -> list[VMOperationResult]:
+    """Run an operation against many VMs in a bounded thread pool.
+
+    The total wait is bound by the slowest VM rather than the sum of all VMs.
+    Every VM's result is collected; when any operation failed, a single VMsOperationError
+    holding all failures is raised after the in-flight operations finish.
+
+    Args:
+        vms: VMs to run the operation against.
+        operation: Callable receiving a single VM, typically a blocking wait.
+        max_workers: Maximum number of operations running at the same time.
+        fail_fast: Cancel operations which did not start yet once any operation fails.
+
+    Returns:
+        Per-VM results, in the order of `vms`.
+
+    Raises:
+        VMsOperationError: If the operation failed for at least one VM.
+    """
+    durations: dict[tuple[str, str], float] = {}
+
+    def _timed(vm: VMT) -> None:
+        start = time.monotonic()
+        try:
+            operation(vm)
+        finally:
+            durations[vm.namespace, vm.name] = time.monotonic() - start
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(vms))), thread_name_prefix="vm-op") as executor:
+        futures: dict[Future[None], VMT] = {executor.submit(_timed, vm): vm for vm in vms}
+
+        if fail_fast:
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            if any(future.exception() for future in done):
+                for future in not_done:
+                    future.cancel()
+
+    results = []
+    for future, vm in futures.items():
+        if future.cancelled():
+            results.append(VMOperationResult(vm_name=vm.name, duration_sec=0, cancelled=True))
+        else:
+            results.append(
+                VMOperationResult(
+                    vm_name=vm.name, duration_sec=durations[vm.namespace, vm.name], error=future.exception()
+                )
+            )
+
+    LOGGER.info(
+        "VM operation timings: "
+        + ", ".join(f"{result.vm_name}={result.duration_sec:.1f}s" for result in results if not result.cancelled)
+    )
+    if not all(result.succeeded for result in results):
+        raise VMsOperationError(results=results)
+
+    return results
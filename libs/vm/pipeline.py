@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Final
+
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.exceptions import ConflictError
+from kubernetes.dynamic.resource import ResourceField
+from ocp_resources.virtual_machine_instance import VirtualMachineInstance
+
+from libs.vm.parallel import DEFAULT_MAX_WORKERS, NamedResource
+from utilities.informer import ResourceInformer, get_session_informer
+
+DEFAULT_REQUESTS_PER_SECOND: Final[float] = 10.0
+DEFAULT_MAX_RETRIES: Final[int] = 6
+# API statuses worth a retry: the request was throttled or the API server was overloaded
+RETRYABLE_STATUSES: Final[frozenset[int]] = frozenset({429, 500, 502, 503, 504})
+MAX_BACKOFF_SEC: Final[float] = 60.0
+# The throttled rate is not reduced below this fraction of the configured rate
+MIN_RATE_FRACTION: Final[float] = 0.1
+
+LOGGER = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket, with a rate adapting to API throttling.
+
+    The rate is halved on every throttled request and grows back linearly on successful ones (AIMD).
+
+    Args:
+        rate: Tokens added per second.
+        burst: Maximum number of tokens the bucket holds.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_sec = (1 - self._tokens) / self.rate
+            time.sleep(wait_sec)
+
+    def throttle(self) -> None:
+        with self._lock:
+            self.rate = max(self.rate / 2, self.max_rate * MIN_RATE_FRACTION)
+            LOGGER.warning(f"API throttling: request rate reduced to {self.rate:.2f}/s")
+
+    def recover(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * MIN_RATE_FRACTION)
+
+
+@dataclass(frozen=True)
+class VMPipelineResult:
+    """Outcome of a single VM in run_vm_pipeline.
+
+    Attributes:
+        vm_name: Name of the VM.
+        steps_sec: Seconds from the pipeline start until the VM steps were done.
+        time_to_running_sec: Seconds from the end of the VM steps until its VMI was running; None when not waited
+            for, or not running within the timeout.
+        retries: Number of retried API requests.
+        error: Exception which failed the VM steps, None on success.
+    """
+
+    vm_name: str
+    steps_sec: float
+    time_to_running_sec: float | None = None
+    retries: int = 0
+    error: BaseException | None = None
+
+
+@dataclass(frozen=True)
+class VMPipelineReport:
+    """Results of run_vm_pipeline.
+
+    Attributes:
+        results: Per-VM results, in the order of the VMs.
+        duration_sec: Wall time of the whole pipeline.
+        wait_for_running: Whether the pipeline waited for the VMIs to be running.
+    """
+
+    results: list[VMPipelineResult]
+    duration_sec: float
+    wait_for_running: bool = False
+    failures: list[VMPipelineResult] = field(init=False)
+    not_running: list[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "failures", [result for result in self.results if result.error is not None])
+        object.__setattr__(
+            self,
+            "not_running",
+            [
+                result.vm_name
+                for result in self.results
+                if self.wait_for_running and result.error is None and result.time_to_running_sec is None
+            ],
+        )
+
+    @property
+    def succeeded(self) -> bool:
+        return not (self.failures or self.not_running)
+
+    def time_to_running_histogram(self, bucket_sec: int = 30) -> dict[str, int]:
+        """Count the VMs per time-to-running bucket.
+
+        Args:
+            bucket_sec: Bucket width in seconds.
+
+        Returns:
+            Bucket label (e.g. "30-60s") to the number of VMs, ordered by bucket.
+        """
+        buckets = Counter(
+            int(result.time_to_running_sec // bucket_sec)
+            for result in self.results
+            if result.time_to_running_sec is not None
+        )
+        return {f"{bucket * bucket_sec}-{(bucket + 1) * bucket_sec}s": buckets[bucket] for bucket in sorted(buckets)}
+
+    def __str__(self) -> str:
+        times_to_running = sorted(
+            result.time_to_running_sec for result in self.results if result.time_to_running_sec is not None
+        )
+        summary = (
+            f"{len(self.results)} VMs in {self.duration_sec:.1f}s "
+            f"({len(self.results) / self.duration_sec if self.duration_sec else 0:.2f} VMs/s), "
+            f"{sum(result.retries for result in self.results)} retried requests, {len(self.failures)} failed"
+        )
+        if times_to_running:
+            summary += (
+                f", time to running: median {times_to_running[len(times_to_running) // 2]:.1f}s, "
+                f"max {times_to_running[-1]:.1f}s, histogram {self.time_to_running_histogram()}"
+            )
+        if self.not_running:
+            summary += f", not running: {self.not_running}"
+        return summary
+
+
+def run_vm_pipeline[VMT: NamedResource](
+    vms: Sequence[VMT],
+    steps: Sequence[Callable[[VMT], object]],
+    client: DynamicClient | None = None,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    burst: int | None = None,
+    max_in_flight: int = DEFAULT_MAX_WORKERS,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    running_timeout: float | None = None,
+) -> VMPipelineReport:
+    """Run API steps (e.g. create, start) for many VMs under a shared request rate limit.
+
+    Each step is one API request, issued once a token of the shared bucket is available, with at most
+    `max_in_flight` VMs running their steps at the same time. Requests failing with 429/5xx are retried
+    with an exponential backoff, and slow down the shared rate.
+
+    When `running_timeout` is set, the VMIs are then waited for to be running. Their phase is read from a single
+    watch (the session VMI informer when enabled), so waiting costs no request per VM.
+
+    Args:
+        vms: VMs to run the steps for; their namespace is used to watch the VMIs.
+        steps: Callables receiving a single VM, run in order for each VM, each issuing one API request.
+        client: Dynamic client for the VMI watch, when there is no session informer.
+        requests_per_second: Shared rate of the steps requests.
+        burst: Requests which can be issued at once, default is `requests_per_second`.
+        max_in_flight: Maximum number of VMs running their steps at the same time.
+        max_retries: Retries of a throttled or failed (5xx) request.
+        running_timeout: Seconds to wait for all the VMIs to be running after the steps; None to not wait.
+
+    Returns:
+        Report with the per-VM results; it has failures if any VM step failed or VMI was not running in time.
+    """
+    token_bucket = TokenBucket(rate=requests_per_second, burst=burst or max(1, int(requests_per_second)))
+    start_time = time.monotonic()
+    steps_done: dict[str, float] = {}
+    running_since: dict[str, float] = {}
+    running_changed = threading.Condition()
+    vm_keys = {(vm.namespace, vm.name) for vm in vms}
+    informers = []
+    unsubscribes = []
+
+    def _on_vmi_event(event_type: str, vmi: ResourceField) -> None:
+        if (
+            (vmi.metadata.namespace, vmi.metadata.name) in vm_keys
+            and vmi.status
+            and vmi.status.phase == VirtualMachineInstance.Status.RUNNING
+        ):
+            with running_changed:
+                running_since.setdefault(vmi.metadata.name, time.monotonic())
+                running_changed.notify_all()
+
+    if running_timeout is not None:
+        namespaces = {vm.namespace for vm in vms}
+        # The session informer is cluster-wide, otherwise every namespace gets an informer of its own
+        if session_informer := get_session_informer(resource_kind=VirtualMachineInstance):
+            namespace_informers = dict.fromkeys(namespaces, session_informer)
+            unsubscribes.append(session_informer.subscribe(callback=_on_vmi_event))
+        else:
+            namespace_informers = {
+                namespace: ResourceInformer(
+                    client=client, resource_kind=VirtualMachineInstance, namespace=namespace
+                ).start()
+                for namespace in namespaces
+            }
+            informers.extend(namespace_informers.values())
+            unsubscribes.extend(informer.subscribe(callback=_on_vmi_event) for informer in informers)
+        for namespace, informer in namespace_informers.items():
+            for vmi in informer.list(namespace=namespace):
+                _on_vmi_event(event_type="", vmi=vmi)
+
+    def _run_steps(vm: VMT) -> tuple[int, BaseException | None]:
+        retries = 0
+        try:
+            for step in steps:
+                retries += _run_request(vm=vm, step=step, token_bucket=token_bucket, max_retries=max_retries)
+        except Exception as exception:
+            LOGGER.error(f"VM {vm.name} pipeline failed: {exception}")
+            return retries, exception
+        finally:
+            steps_done[vm.name] = time.monotonic()
+        return retries, None
+
+    try:
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_in_flight, len(vms))), thread_name_prefix="vm-pipe"
+        ) as executor:
+            outcomes = list(executor.map(_run_steps, vms))
+
+        if running_timeout is not None:
+            deadline = time.monotonic() + running_timeout
+            expected_running = {vm.name for vm, (_, error) in zip(vms, outcomes) if error is None}
+            with running_changed:
+                while not expected_running <= running_since.keys() and (remaining := deadline - time.monotonic()) > 0:
+                    running_changed.wait(timeout=remaining)
+    finally:
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+        for informer in informers:
+            informer.stop()
+
+    with running_changed:
+        results = [
+            VMPipelineResult(
+                vm_name=vm.name,
+                steps_sec=steps_done[vm.name] - start_time,
+                # A VMI already running before its steps finished (e.g. RunStrategy Always) is running right away
+                time_to_running_sec=max(0.0, running_since[vm.name] - steps_done[vm.name])
+                if error is None and vm.name in running_since
+                else None,
+                retries=retries,
+                error=error,
+            )
+            for vm, (retries, error) in zip(vms, outcomes)
+        ]
+    report = VMPipelineReport(
+        results=results, duration_sec=time.monotonic() - start_time, wait_for_running=running_timeout is not None
+    )
+    LOGGER.info(f"VM pipeline: {report}")
+    return report
+
+
+def _run_request[VMT: NamedResource](
+    vm: VMT, step: Callable[[VMT], object], token_bucket: TokenBucket, max_retries: int
+) -> int:
+    """Run a single API request step with the rate limit, retrying throttled and 5xx failures.
+
+    Returns:
+        Number of retries.
+    """
+    for attempt in range(max_retries + 1):
+        token_bucket.acquire()
+        try:
+            step(vm)
+        except ConflictError:
+            # A retried request which had been applied before failing (e.g. a create timing out)
+            if not attempt:
+                raise
+            LOGGER.info(f"VM {vm.name}: retried request already applied")
+        except Exception as exception:
+            if getattr(exception, "status", None) not in RETRYABLE_STATUSES or attempt == max_retries:
+                raise
+            token_bucket.throttle()
+            backoff_sec = min(MAX_BACKOFF_SEC, 2**attempt) * random.uniform(0.5, 1.5)
+            LOGGER.warning(f"VM {vm.name}: request failed ({exception.status}), retrying in {backoff_sec:.1f}s")
+            time.sleep(backoff_sec)
+            continue
+        token_bucket.recover()
+        return attempt
+    return max_retries
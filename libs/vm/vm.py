@@ -27,6 +27,7 @@ from libs.vm.spec import (
 )
 from tests.network.libs import cloudinit
 from utilities import infra
+from utilities.console import close_console_session
 from utilities.constants import CLOUD_INIT_DISK_NAME
 from utilities.virt import get_oc_image_info, vm_console_run_commands
 
@@ -70,6 +71,11 @@ class BaseVirtualMachine(VirtualMachine):
     def _filter_out_none_values(data: list[tuple[str, Any]]) -> dict[str, Any]:
         return {key: val for (key, val) in data if val is not None}
 
+    def clean_up(self, wait: bool = True, timeout: int | None = None) -> bool:
+        # The pooled console session holds the single VM serial console connection
+        close_console_session(vm=self)
+        return super().clean_up(wait=wait, timeout=timeout)
+
     @property
     def login_params(self) -> dict[str, str]:
         return py_config["os_login_param"][self._os_distribution]
@@ -20,17 +20,22 @@ from __future__ import annotations
 from argparse import ArgumentParser, Namespace, RawDescriptionHelpFormatter
 from ast import AST, ClassDef, FunctionDef, parse, walk
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from datetime import UTC, datetime
+from fnmatch import fnmatch
 from html import escape as html_escape
 from json import dumps as json_dumps
-from os import environ
-from pathlib import Path
+from json import loads as json_loads
+from os import cpu_count, environ
+from pathlib import Path, PurePosixPath
 from re import DOTALL, MULTILINE, Pattern
 from re import compile as re_compile
 from re import search as re_search
 from shutil import rmtree
+from subprocess import run as subprocess_run
 from tempfile import gettempdir
-from typing import ClassVar, NamedTuple
+from typing import Any, ClassVar, NamedTuple
 
 from pyhelper_utils.shell import run_command
 from simple_logger.logger import get_logger
@@ -69,6 +74,15 @@ REPO_FOLDER_MAPPINGS: dict[str, dict[str, str]] = {
 # Working directory for cloned repos (hardcoded)
 WORKDIR = Path(gettempdir()) / "quarantine-stats"
 
+# Per-blob scan results, kept outside WORKDIR so they survive the cleanup of the clones
+SCAN_CACHE_FILE = Path(gettempdir()) / "quarantine-stats-scan-cache.json"
+
+# Bump when TestScanner.scan_content results change, to invalidate cached scan results
+SCAN_CACHE_VERSION = 1
+
+# Blob shards per scan process; smaller shards balance files of uneven size across processes
+SCAN_SHARDS_PER_JOB = 4
+
 
 def is_valid_branch(branch: str) -> bool:
     """Check if branch is main or matches cnv-X.Y pattern.
@@ -218,65 +232,6 @@ def get_display_path(file_path: Path) -> str:
         return file_path.name
 
 
-def checkout_branch(branch: str, cwd: Path | None = None) -> None:
-    """Checkout a specific branch.
-
-    Args:
-        branch: The branch name to checkout.
-        cwd: Working directory for git command. Defaults to current directory.
-
-    Raises:
-        RuntimeError: If checkout fails.
-
-    """
-    success, _, stderr = run_command(
-        command=["git", "checkout", branch],
-        check=False,
-        verify_stderr=False,
-        cwd=cwd,
-    )
-    if not success:
-        raise RuntimeError(f"Failed to checkout branch '{branch}': {stderr}")
-
-
-def scan_branch(
-    branch: str,
-    tests_dir: Path,
-    original_branch: str | None = None,
-    cwd: Path | None = None,
-    repo: str | None = None,
-) -> DashboardStats | None:
-    """Checkout branch and scan its tests.
-
-    Args:
-        branch: The branch to scan.
-        tests_dir: Path to the tests/ directory.
-        original_branch: The original branch to restore after scanning.
-            If None, does not restore to original branch after scanning.
-        cwd: Working directory for git commands. Defaults to current directory.
-        repo: Repository name in "owner/name" format for repo-specific configs.
-
-    Returns:
-        DashboardStats for the branch, or None if scanning failed.
-
-    """
-    try:
-        checkout_branch(branch=branch, cwd=cwd)
-        scanner = TestScanner(tests_dir=tests_dir, repo=repo)
-        stats = scanner.scan_all_tests()
-        return stats
-    except RuntimeError as error:
-        LOGGER.warning("Failed to scan branch '%s': %s", branch, error)
-        return None
-    finally:
-        # Return to original branch if specified
-        if original_branch:
-            try:
-                checkout_branch(branch=original_branch, cwd=cwd)
-            except RuntimeError as error:
-                LOGGER.warning("Failed to restore branch '%s': %s", original_branch, error)
-
-
 def format_unified_version_table(repo_stats: dict[str, list[VersionStats]]) -> str:
     """Format unified version stats for all repositories as a single ASCII table for CLI output.
 
@@ -512,24 +467,134 @@ def get_repo_branches(repo_dir: Path) -> list[str]:
     return get_valid_branches(cwd=repo_dir)
 
 
-def scan_repo_branch(repo_dir: Path, branch: str, repo: str | None = None) -> DashboardStats | None:
-    """Checkout branch in repository and scan its tests.
+def get_branch_ref(repo_dir: Path, branch: str) -> str:
+    """Get the ref to read a branch from, preferring the fetched remote branch.
+
+    Local branches of an existing clone are not updated by `git fetch`, so
+    `origin/<branch>` is used when it exists.
 
     Args:
         repo_dir: Path to the cloned repository.
-        branch: Branch name to checkout and scan.
-        repo: Repository name in "owner/name" format for repo-specific configs.
+        branch: The branch name.
 
     Returns:
-        DashboardStats for the branch, or None if scanning failed.
+        `origin/<branch>` if it exists, otherwise the branch name.
 
     """
-    tests_dir = repo_dir / "tests"
-    if not tests_dir.exists():
-        LOGGER.warning("tests/ directory not found in %s", repo_dir)
-        return None
+    success, _, _ = run_command(
+        command=["git", "rev-parse", "--verify", "--quiet", f"origin/{branch}^{{commit}}"],
+        check=False,
+        verify_stderr=False,
+        log_errors=False,
+        cwd=repo_dir,
+    )
+    return f"origin/{branch}" if success else branch
+
+
+def list_branch_test_files(repo_dir: Path, branch: str) -> list[tuple[str, str]]:
+    """List the test files of a branch without checking it out.
+
+    Args:
+        repo_dir: Path to the cloned repository.
+        branch: The branch to list.
+
+    Returns:
+        List of (blob SHA, path relative to the repository root) for every
+        test_*.py file under tests/.
+
+    Raises:
+        RuntimeError: If the branch tree cannot be listed.
+
+    """
+    ref = get_branch_ref(repo_dir=repo_dir, branch=branch)
+    success, stdout, stderr = run_command(
+        command=["git", "ls-tree", "-r", "-z", ref, "--", "tests/"],
+        check=False,
+        verify_stderr=False,
+        cwd=repo_dir,
+    )
+    if not success:
+        raise RuntimeError(f"Failed to list files of branch '{branch}': {stderr}")
+
+    test_files: list[tuple[str, str]] = []
+    for entry in stdout.split("\0"):
+        if not entry:
+            continue
+        # Entry format: "<mode> <type> <sha>\t<path>"
+        object_info, path = entry.split("\t", maxsplit=1)
+        mode, object_type, blob_sha = object_info.split()
+        # Skip symlinks (mode 120000) and submodules, like the checkout-based scan of regular files did
+        if object_type == "blob" and mode != "120000" and fnmatch(PurePosixPath(path).name, "test_*.py"):
+            test_files.append((blob_sha, path))
+    return test_files
+
+
+def read_blobs(repo_dir: Path, blob_shas: list[str]) -> dict[str, bytes]:
+    """Read blob contents from the object database with a single `git cat-file --batch`.
+
+    Args:
+        repo_dir: Path to the cloned repository.
+        blob_shas: SHAs of the blobs to read.
+
+    Returns:
+        Dict mapping blob SHA to its content; missing blobs are omitted.
+
+    Raises:
+        RuntimeError: If git cat-file fails.
+
+    """
+    process = subprocess_run(
+        ["git", "cat-file", "--batch"],
+        input="".join(f"{blob_sha}\n" for blob_sha in blob_shas).encode(),
+        capture_output=True,
+        check=False,
+        cwd=repo_dir,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"Failed to read blobs: {process.stderr.decode(errors='replace')}")
+
+    blobs: dict[str, bytes] = {}
+    output = process.stdout
+    offset = 0
+    while offset < len(output):
+        # Each object is "<sha> <type> <size>\n<content>\n", or "<sha> missing\n"
+        header_end = output.index(b"\n", offset)
+        header = output[offset:header_end].decode().split()
+        offset = header_end + 1
+        if header[-1] == "missing":
+            continue
+        size = int(header[2])
+        blobs[header[0]] = output[offset : offset + size]
+        offset += size + 1
+    return blobs
+
+
+def scan_blobs(repo_dir: Path, blob_shas: list[str]) -> dict[str, dict[str, Any]]:
+    """Scan test file blobs for test functions and their quarantine status.
 
-    return scan_branch(branch=branch, tests_dir=tests_dir, cwd=repo_dir, repo=repo)
+    Runs in the scan process pool, so it returns plain, picklable scan
+    results instead of TestInfo objects; categories are applied per branch
+    by TestScanner.build_stats.
+
+    Args:
+        repo_dir: Path to the cloned repository.
+        blob_shas: SHAs of the blobs to scan.
+
+    Returns:
+        Dict mapping blob SHA to {"tests": [ScannedTest fields, ...]}, or
+        to {"error": message} if the blob could not be decoded or parsed.
+
+    """
+    scanner = TestScanner(tests_dir=repo_dir / "tests")
+    results: dict[str, dict[str, Any]] = {}
+    for blob_sha, content in read_blobs(repo_dir=repo_dir, blob_shas=blob_shas).items():
+        try:
+            scanned_tests = scanner.scan_content(content=content.decode(encoding="utf-8"), filename=blob_sha)
+        except (SyntaxError, UnicodeDecodeError) as error:
+            results[blob_sha] = {"error": str(error)}
+            continue
+        results[blob_sha] = {"tests": [list(scanned_test) for scanned_test in scanned_tests]}
+    return results
 
 
 def scan_all_repos(
@@ -537,20 +602,30 @@ def scan_all_repos(
     workdir: Path,
     branch_filter: str | None = None,
     github_token: str | None = None,
+    jobs: int | None = None,
+    scan_cache_file: Path | None = None,
 ) -> dict[str, list[VersionStats]]:
     """Scan all repositories and branches, returning per-version stats.
 
+    Branches are read straight from the object database, without checkouts.
+    Test files are scanned once per distinct blob across all branches, in a
+    process pool, and the per-blob results are cached across runs.
+
     Args:
         repos: List of repository names in "owner/name" format.
         workdir: Working directory to clone repos into.
         branch_filter: If specified, only scan this specific branch.
         github_token: Optional GitHub personal access token for cloning private repos.
+        jobs: Number of scan processes. Defaults to the CPU count.
+        scan_cache_file: JSON file to cache per-blob scan results in. If None,
+            results are only shared between the branches of this run.
 
     Returns:
         Dict mapping repository name to list of VersionStats for each branch.
 
     """
     results: dict[str, list[VersionStats]] = {}
+    scan_cache = BlobScanCache(cache_file=scan_cache_file)
 
     for repo in repos:
         LOGGER.info("Processing repository: %s", repo)
@@ -585,18 +660,39 @@ def scan_all_repos(
 
         LOGGER.info("Found %d branches: %s", len(branches), ", ".join(branches))
 
+        branch_test_files: dict[str, list[tuple[str, str]]] = {}
+        for branch in branches:
+            try:
+                branch_test_files[branch] = list_branch_test_files(repo_dir=repo_dir, branch=branch)
+            except RuntimeError as error:
+                LOGGER.warning("Failed to scan branch '%s': %s", branch, error)
+
+        # Most test files are identical across branches: scan each distinct blob once
+        scan_cache.scan(
+            repo_dir=repo_dir,
+            blob_shas={blob_sha for test_files in branch_test_files.values() for blob_sha, _ in test_files},
+            jobs=jobs,
+        )
+
+        scanner = TestScanner(tests_dir=repo_dir / "tests", repo=repo)
         for branch in branches:
             LOGGER.info("Scanning branch: %s...", branch)
-            stats = scan_repo_branch(repo_dir=repo_dir, branch=branch, repo=repo)
-            if stats:
-                repo_stats.append(VersionStats(branch=branch, stats=stats))
-                LOGGER.info("  -> %d tests, %d quarantined", stats.total_tests, stats.quarantined_tests)
-            else:
+            if branch not in branch_test_files:
                 LOGGER.warning("  -> Failed to scan")
+                continue
+
+            stats = scanner.build_stats(
+                scanned_files=[
+                    (repo_dir / path, scan_cache.get(blob_sha=blob_sha)) for blob_sha, path in branch_test_files[branch]
+                ]
+            )
+            repo_stats.append(VersionStats(branch=branch, stats=stats))
+            LOGGER.info("  -> %d tests, %d quarantined", stats.total_tests, stats.quarantined_tests)
 
         if repo_stats:
             results[repo] = repo_stats
 
+    scan_cache.save()
     return results
 
 
@@ -662,6 +758,25 @@ class DashboardStats(NamedTuple):
     quarantined_list: list[TestInfo]
 
 
+class ScannedTest(NamedTuple):
+    """Scan result of a single test function, independent of the file's path.
+
+    Attributes:
+        name: The test function name (e.g., "test_vm_creation").
+        line_number: Line number where the test function is defined.
+        is_quarantined: Whether the test is marked as quarantined.
+        quarantine_reason: Reason for quarantine if applicable.
+        jira_ticket: Associated Jira ticket (e.g., "CNV-12345") if found.
+
+    """
+
+    name: str
+    line_number: int
+    is_quarantined: bool
+    quarantine_reason: str = ""
+    jira_ticket: str = ""
+
+
 class VersionStats(NamedTuple):
     """Statistics for a specific branch/version.
 
@@ -813,11 +928,35 @@ class TestScanner:
             return tests
 
         try:
-            tree = parse(source=content, filename=str(file_path))
+            scanned_tests = self.scan_content(content=content, filename=str(file_path))
         except SyntaxError as error:
             LOGGER.warning("Syntax error parsing %s: %s", file_path, error)
             return tests
 
+        return [
+            TestInfo(file_path=file_path, category=category, **scanned_test._asdict()) for scanned_test in scanned_tests
+        ]
+
+    def scan_content(self, content: str, filename: str = "<unknown>") -> list[ScannedTest]:
+        """Find test functions and their quarantine status in test file content.
+
+        Uses Python AST to find all functions starting with "test_". Checks
+        both function-level and class-level quarantine decorators.
+
+        Args:
+            content: Test file content.
+            filename: File name used in syntax error messages.
+
+        Returns:
+            List of ScannedTest objects for each test function found.
+
+        Raises:
+            SyntaxError: If the content cannot be parsed.
+
+        """
+        tests: list[ScannedTest] = []
+        tree = parse(source=content, filename=filename)
+
         quarantined_classes: dict[str, tuple[str, str]] = {}
 
         # First pass: identify quarantined classes
@@ -840,19 +979,46 @@ class TestScanner:
                         is_quarantined = True
                         reason, jira = quarantined_classes[parent_class]
 
-                test_info = TestInfo(
+                scanned_test = ScannedTest(
                     name=node.name,
-                    file_path=file_path,
                     line_number=node.lineno,
-                    category=category,
                     is_quarantined=is_quarantined,
                     quarantine_reason=reason,
                     jira_ticket=jira,
                 )
-                tests.append(test_info)
+                tests.append(scanned_test)
 
         return tests
 
+    def build_stats(self, scanned_files: list[tuple[Path, dict[str, Any]]]) -> DashboardStats:
+        """Build statistics from per-file scan results, as produced by scan_blobs.
+
+        Applies the categories, folder mappings and exclusions of this scanner
+        to the files' paths.
+
+        Args:
+            scanned_files: List of (file path, scan result) pairs.
+
+        Returns:
+            DashboardStats containing total counts, category breakdown,
+            and list of quarantined tests.
+
+        """
+        all_tests: list[TestInfo] = []
+        for file_path, scan_result in scanned_files:
+            category = self._get_category(file_path=file_path)
+            if category is None:
+                continue
+            if "error" in scan_result:
+                LOGGER.warning("Error scanning %s: %s", file_path, scan_result["error"])
+                continue
+            all_tests.extend(
+                TestInfo(file_path=file_path, category=category, **ScannedTest(*scanned_test)._asdict())
+                for scanned_test in scan_result["tests"]
+            )
+
+        return self._calculate_stats(all_tests=all_tests)
+
     def _get_parent_class(self, tree: AST, func_node: FunctionDef) -> str | None:
         """Find the parent class of a function node, if any.
 
@@ -1029,6 +1195,106 @@ class TestScanner:
         )
 
 
+class BlobScanCache:
+    """Scan results of test file blobs, keyed by git blob SHA.
+
+    A blob SHA identifies the file content, so results are shared by every
+    branch (and run) containing the same file. Missing blobs are scanned in a
+    process pool.
+
+    Attributes:
+        cache_file: JSON file the results are persisted to, or None.
+
+    """
+
+    def __init__(self, cache_file: Path | None = None) -> None:
+        """Initialize the cache, loading the results of previous runs from cache_file.
+
+        Args:
+            cache_file: JSON file to persist results in. A missing, unreadable or
+                outdated file starts an empty cache.
+
+        """
+        self.cache_file = cache_file
+        self._results: dict[str, dict[str, Any]] = {}
+        self._used_blob_shas: set[str] = set()
+
+        if cache_file and cache_file.exists():
+            try:
+                data = json_loads(cache_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as error:
+                LOGGER.warning("Ignoring unreadable scan cache %s: %s", cache_file, error)
+            else:
+                if data.get("version") == SCAN_CACHE_VERSION:
+                    self._results = data["blobs"]
+                    LOGGER.info("Loaded %d cached blob scan results from %s", len(self._results), cache_file)
+
+    def scan(self, repo_dir: Path, blob_shas: set[str], jobs: int | None = None) -> None:
+        """Scan the blobs which are not cached yet.
+
+        Args:
+            repo_dir: Path to the cloned repository containing the blobs.
+            blob_shas: SHAs of the blobs the caller needs.
+            jobs: Number of scan processes. Defaults to the CPU count.
+
+        """
+        self._used_blob_shas.update(blob_shas)
+        missing_blob_shas = sorted(blob_sha for blob_sha in blob_shas if blob_sha not in self._results)
+        LOGGER.info(
+            "Scanning %d new blobs (%d cached)", len(missing_blob_shas), len(blob_shas) - len(missing_blob_shas)
+        )
+        if not missing_blob_shas:
+            return
+
+        jobs = jobs or cpu_count() or 1
+        if jobs == 1:
+            self._results.update(scan_blobs(repo_dir=repo_dir, blob_shas=missing_blob_shas))
+            return
+
+        shard_count = min(len(missing_blob_shas), jobs * SCAN_SHARDS_PER_JOB)
+        shards = [missing_blob_shas[shard_index::shard_count] for shard_index in range(shard_count)]
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [executor.submit(scan_blobs, repo_dir=repo_dir, blob_shas=shard) for shard in shards]
+                for future in as_completed(futures):
+                    self._results.update(future.result())
+        except BrokenProcessPool as error:
+            LOGGER.warning("Scan process pool failed, scanning in-process: %s", error)
+            self._results.update(scan_blobs(repo_dir=repo_dir, blob_shas=missing_blob_shas))
+
+    def get(self, blob_sha: str) -> dict[str, Any]:
+        """Get the scan result of a blob; scan must have been called with it.
+
+        Args:
+            blob_sha: The blob SHA.
+
+        Returns:
+            {"tests": [...]} or {"error": message}, as returned by scan_blobs.
+
+        """
+        return self._results.get(blob_sha, {"error": "blob not found in repository"})
+
+    def save(self) -> None:
+        """Write the results of the blobs used in this run to cache_file.
+
+        Results of blobs no longer on any scanned branch are dropped.
+
+        """
+        if not self.cache_file:
+            return
+
+        blobs = {blob_sha: self._results[blob_sha] for blob_sha in self._used_blob_shas if blob_sha in self._results}
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_file.write_text(
+                data=json_dumps({"version": SCAN_CACHE_VERSION, "blobs": blobs}), encoding="utf-8"
+            )
+        except OSError as error:
+            LOGGER.warning("Failed to save scan cache %s: %s", self.cache_file, error)
+            return
+        LOGGER.info("Saved %d blob scan results to %s", len(blobs), self.cache_file)
+
+
 class DashboardGenerator:
     """Generator for HTML dashboard output.
 
@@ -1827,6 +2093,25 @@ Examples:
         help="GitHub personal access token for cloning private repositories. "
         "If not provided, falls back to GITHUB_TOKEN environment variable.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of processes scanning test files (default: CPU count)",
+    )
+    parser.add_argument(
+        "--scan-cache",
+        type=Path,
+        default=SCAN_CACHE_FILE,
+        help=f"File caching test file scan results across runs (default: {SCAN_CACHE_FILE})",
+    )
+    parser.add_argument(
+        "--no-scan-cache",
+        action="store_const",
+        const=None,
+        dest="scan_cache",
+        help="Do not read or write the scan cache",
+    )
     return parser.parse_args()
 
 
@@ -1837,6 +2122,8 @@ def run_multi_repo_mode(
     json_output: bool = False,
     workdir: Path = WORKDIR,
     github_token: str | None = None,
+    jobs: int | None = None,
+    scan_cache_file: Path | None = SCAN_CACHE_FILE,
 ) -> int:
     """Run dashboard generator in multi-repository mode.
 
@@ -1848,6 +2135,8 @@ def run_multi_repo_mode(
         json_output: If True, output JSON to stdout instead of generating HTML dashboard.
         workdir: Directory to clone repos into.
         github_token: Optional GitHub personal access token for cloning private repos.
+        jobs: Number of processes scanning test files. Defaults to the CPU count.
+        scan_cache_file: File caching test file scan results across runs, or None to disable.
 
     Returns:
         Exit code: 0 on success, 1 on error.
@@ -1858,7 +2147,14 @@ def run_multi_repo_mode(
     LOGGER.info("Working directory: %s", workdir)
 
     # Scan all repos and all branches
-    repo_stats = scan_all_repos(repos=REPOS, workdir=workdir, branch_filter=None, github_token=github_token)
+    repo_stats = scan_all_repos(
+        repos=REPOS,
+        workdir=workdir,
+        branch_filter=None,
+        github_token=github_token,
+        jobs=jobs,
+        scan_cache_file=scan_cache_file,
+    )
 
     if not repo_stats:
         LOGGER.error("No repositories could be scanned.")
@@ -1951,6 +2247,8 @@ def main() -> int:
         json_output=args.json_output,
         workdir=args.workdir,
         github_token=github_token,
+        jobs=args.jobs,
+        scan_cache_file=args.scan_cache,
     )
 
 
@@ -0,0 +1,305 @@
+"""Unit tests for the git object database scan of the quarantine dashboard generator.
+
+The tests run against small real repositories created with `git init`, with a
+`main` and a `cnv-4.19` branch cloned from a local origin.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scripts.quarantine_stats.generate_dashboard import (
+    SCAN_CACHE_VERSION,
+    BlobScanCache,
+    list_branch_test_files,
+    read_blobs,
+    scan_all_repos,
+    scan_blobs,
+)
+from scripts.quarantine_stats.generate_dashboard import (
+    TestScanner as DashboardTestScanner,
+)
+
+REPO = "RedHatQE/openshift-virtualization-tests"
+
+NETWORK_TESTS = """\
+import pytest
+
+from utilities.constants import QUARANTINED
+
+
+def test_active():
+    pass
+
+
+@pytest.mark.xfail(
+    reason=f"{QUARANTINED}: flaky connectivity, CNV-12345",
+    run=False,
+)
+def test_quarantined():
+    pass
+"""
+
+VIRT_TESTS = """\
+class TestVM:
+    def test_start(self):
+        pass
+
+    def test_stop(self):
+        pass
+"""
+
+# On cnv-4.19, test_active is quarantined too, and a test file does not parse
+NETWORK_TESTS_CNV_4_19 = NETWORK_TESTS.replace(
+    "def test_active():",
+    '@pytest.mark.xfail(reason=f"{QUARANTINED}: broken on 4.19, CNV-23456", run=False)\ndef test_active():',
+)
+INVALID_TESTS = "def test_broken(:\n"
+
+
+def _git(repo_dir: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=repo_dir, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _commit_files(repo_dir: Path, files: dict[str, str], message: str) -> None:
+    for path, content in files.items():
+        file_path = repo_dir / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content)
+    _git(repo_dir, "add", "-A")
+    _git(repo_dir, "commit", "-q", "-m", message)
+
+
+def _blob_sha(repo_dir: Path, ref: str, path: str) -> str:
+    return _git(repo_dir, "rev-parse", f"{ref}:{path}")
+
+
+@pytest.fixture
+def origin_repo(tmp_path: Path) -> Path:
+    """Repository with test files on main and cnv-4.19, sharing the unchanged virt test file."""
+    repo_dir = tmp_path / "origin"
+    repo_dir.mkdir()
+    _git(repo_dir, "init", "-q", "-b", "main")
+    _git(repo_dir, "config", "user.email", "tests@example.com")
+    _git(repo_dir, "config", "user.name", "tests")
+    _commit_files(
+        repo_dir=repo_dir,
+        files={
+            "tests/network/test_network.py": NETWORK_TESTS,
+            "tests/virt/test_virt.py": VIRT_TESTS,
+            "tests/virt/utils.py": "def test_helper():\n    pass\n",
+        },
+        message="main tests",
+    )
+    (repo_dir / "tests" / "virt" / "test_link.py").symlink_to("test_virt.py")
+    _commit_files(repo_dir=repo_dir, files={}, message="symlink")
+
+    _git(repo_dir, "checkout", "-q", "-b", "cnv-4.19")
+    _commit_files(
+        repo_dir=repo_dir,
+        files={
+            "tests/network/test_network.py": NETWORK_TESTS_CNV_4_19,
+            "tests/storage/test_invalid.py": INVALID_TESTS,
+        },
+        message="cnv-4.19 tests",
+    )
+    _git(repo_dir, "checkout", "-q", "main")
+    return repo_dir
+
+
+@pytest.fixture
+def cloned_repo(tmp_path: Path, origin_repo: Path) -> Path:
+    """Clone of origin_repo, as clone_or_update_repo leaves it: branches only as origin/<branch>."""
+    repo_dir = tmp_path / "workdir" / "openshift-virtualization-tests"
+    subprocess.run(["git", "clone", "-q", str(origin_repo), str(repo_dir)], check=True)
+    return repo_dir
+
+
+class TestReadBlobs:
+    """Test cases for read_blobs function"""
+
+    def test_contents_read(self, origin_repo):
+        """Test the content of every blob is read, byte for byte, from a single cat-file batch"""
+        network_sha = _blob_sha(repo_dir=origin_repo, ref="main", path="tests/network/test_network.py")
+        virt_sha = _blob_sha(repo_dir=origin_repo, ref="main", path="tests/virt/test_virt.py")
+
+        blobs = read_blobs(repo_dir=origin_repo, blob_shas=[network_sha, virt_sha])
+
+        assert blobs == {network_sha: NETWORK_TESTS.encode(), virt_sha: VIRT_TESTS.encode()}
+
+    def test_missing_blob_omitted(self, origin_repo):
+        """Test blobs missing from the repository are left out, and the following blobs are still read"""
+        virt_sha = _blob_sha(repo_dir=origin_repo, ref="main", path="tests/virt/test_virt.py")
+
+        blobs = read_blobs(repo_dir=origin_repo, blob_shas=["0" * 40, virt_sha])
+
+        assert blobs == {virt_sha: VIRT_TESTS.encode()}
+
+    def test_not_a_repository(self, tmp_path):
+        """Test RuntimeError is raised when git cat-file fails"""
+        with pytest.raises(RuntimeError, match="Failed to read blobs"):
+            read_blobs(repo_dir=tmp_path, blob_shas=["0" * 40])
+
+
+class TestListBranchTestFiles:
+    """Test cases for list_branch_test_files function"""
+
+    def test_remote_branch_listed(self, cloned_repo):
+        """Test the test files of the fetched remote branch are listed, without symlinks and non-test files"""
+        test_files = list_branch_test_files(repo_dir=cloned_repo, branch="cnv-4.19")
+
+        assert sorted(path for _, path in test_files) == [
+            "tests/network/test_network.py",
+            "tests/storage/test_invalid.py",
+            "tests/virt/test_virt.py",
+        ]
+
+    def test_unknown_branch(self, cloned_repo):
+        """Test RuntimeError is raised for a branch which does not exist"""
+        with pytest.raises(RuntimeError, match="cnv-9.9"):
+            list_branch_test_files(repo_dir=cloned_repo, branch="cnv-9.9")
+
+
+class TestScanBlobs:
+    """Test cases for scan_blobs function"""
+
+    def test_tests_scanned(self, origin_repo):
+        """Test the tests of each blob are scanned with their quarantine status"""
+        network_sha = _blob_sha(repo_dir=origin_repo, ref="main", path="tests/network/test_network.py")
+
+        results = scan_blobs(repo_dir=origin_repo, blob_shas=[network_sha])
+
+        assert results == {
+            network_sha: {
+                "tests": [
+                    ["test_active", 6, False, "", ""],
+                    ["test_quarantined", 14, True, "flaky connectivity, CNV-12345", "CNV-12345"],
+                ]
+            }
+        }
+
+    def test_invalid_blob(self, origin_repo):
+        """Test a blob which cannot be parsed gets an error result"""
+        invalid_sha = _blob_sha(repo_dir=origin_repo, ref="cnv-4.19", path="tests/storage/test_invalid.py")
+
+        results = scan_blobs(repo_dir=origin_repo, blob_shas=[invalid_sha])
+
+        assert list(results[invalid_sha]) == ["error"]
+
+
+class TestBlobScanCache:
+    """Test cases for BlobScanCache class"""
+
+    def test_blobs_scanned_once(self, tmp_path, origin_repo):
+        """Test cached blobs are not scanned again, in the same run or in the next run"""
+        cache_file = tmp_path / "scan-cache.json"
+        virt_sha = _blob_sha(repo_dir=origin_repo, ref="main", path="tests/virt/test_virt.py")
+        scan_cache = BlobScanCache(cache_file=cache_file)
+        scan_cache.scan(repo_dir=origin_repo, blob_shas={virt_sha}, jobs=1)
+        scan_cache.save()
+
+        with patch("scripts.quarantine_stats.generate_dashboard.scan_blobs") as mock_scan_blobs:
+            scan_cache.scan(repo_dir=origin_repo, blob_shas={virt_sha}, jobs=1)
+            next_run_cache = BlobScanCache(cache_file=cache_file)
+            next_run_cache.scan(repo_dir=origin_repo, blob_shas={virt_sha}, jobs=1)
+
+        mock_scan_blobs.assert_not_called()
+        assert len(next_run_cache.get(blob_sha=virt_sha)["tests"]) == 2
+
+    def test_unused_blobs_pruned(self, tmp_path, origin_repo):
+        """Test only the results of the blobs used in this run are saved"""
+        cache_file = tmp_path / "scan-cache.json"
+        network_sha = _blob_sha(repo_dir=origin_repo, ref="main", path="tests/network/test_network.py")
+        virt_sha = _blob_sha(repo_dir=origin_repo, ref="main", path="tests/virt/test_virt.py")
+        scan_cache = BlobScanCache(cache_file=cache_file)
+        scan_cache.scan(repo_dir=origin_repo, blob_shas={network_sha, virt_sha}, jobs=1)
+        scan_cache.save()
+
+        next_run_cache = BlobScanCache(cache_file=cache_file)
+        next_run_cache.scan(repo_dir=origin_repo, blob_shas={virt_sha}, jobs=1)
+        next_run_cache.save()
+
+        assert list(json.loads(cache_file.read_text())["blobs"]) == [virt_sha]
+
+    @pytest.mark.parametrize(
+        "cache_content",
+        [
+            pytest.param(
+                json.dumps({"version": SCAN_CACHE_VERSION - 1, "blobs": {"a" * 40: {"tests": []}}}),
+                id="outdated_version",
+            ),
+            pytest.param("not JSON", id="unreadable"),
+        ],
+    )
+    def test_cache_file_ignored(self, tmp_path, cache_content):
+        """Test an outdated or unreadable cache file starts an empty cache"""
+        cache_file = tmp_path / "scan-cache.json"
+        cache_file.write_text(cache_content)
+
+        assert BlobScanCache(cache_file=cache_file).get(blob_sha="a" * 40) == {"error": "blob not found in repository"}
+
+
+class TestBuildStats:
+    """Test cases for TestScanner.build_stats method"""
+
+    def test_categories_applied(self, tmp_path):
+        """Test the scan results are counted per category, with excluded folders and errors left out"""
+        tests_dir = tmp_path / "tests"
+        scanned_test = ["test_a", 1, False, "", ""]
+        quarantined_test = ["test_b", 5, True, "flaky", "CNV-1"]
+
+        stats = DashboardTestScanner(tests_dir=tests_dir).build_stats(
+            scanned_files=[
+                (tests_dir / "network" / "test_a.py", {"tests": [scanned_test, quarantined_test]}),
+                (tests_dir / "compute" / "test_c.py", {"tests": [scanned_test]}),
+                (tests_dir / "deprecated_api" / "test_d.py", {"tests": [scanned_test]}),
+                (tests_dir / "storage" / "test_e.py", {"error": "invalid syntax"}),
+            ]
+        )
+
+        assert stats.total_tests == 3
+        assert stats.quarantined_tests == 1
+        assert stats.category_breakdown == {
+            "network": {"total": 2, "active": 1, "quarantined": 1},
+            "virt": {"total": 1, "active": 1, "quarantined": 0},
+        }
+        assert stats.quarantined_list[0].file_path == tests_dir / "network" / "test_a.py"
+
+
+class TestScanAllRepos:
+    """Test cases for scan_all_repos function"""
+
+    def test_per_branch_stats(self, tmp_path, cloned_repo):
+        """Test every branch gets the stats of its own test files, and unchanged files are scanned once"""
+        with (
+            patch("scripts.quarantine_stats.generate_dashboard.clone_or_update_repo", return_value=cloned_repo),
+            patch(
+                "scripts.quarantine_stats.generate_dashboard.scan_blobs",
+                wraps=scan_blobs,
+            ) as mock_scan_blobs,
+        ):
+            results = scan_all_repos(
+                repos=[REPO], workdir=tmp_path / "workdir", jobs=1, scan_cache_file=tmp_path / "scan-cache.json"
+            )
+
+        stats_by_branch = {version_stats.branch: version_stats.stats for version_stats in results[REPO]}
+        assert list(stats_by_branch) == ["main", "cnv-4.19"]
+
+        main_stats = stats_by_branch["main"]
+        assert (main_stats.total_tests, main_stats.active_tests, main_stats.quarantined_tests) == (4, 3, 1)
+        assert main_stats.category_breakdown["network"] == {"total": 2, "active": 1, "quarantined": 1}
+
+        cnv_4_19_stats = stats_by_branch["cnv-4.19"]
+        assert (cnv_4_19_stats.total_tests, cnv_4_19_stats.quarantined_tests) == (4, 2)
+        assert cnv_4_19_stats.category_breakdown["network"] == {"total": 2, "active": 0, "quarantined": 2}
+        assert "storage" not in cnv_4_19_stats.category_breakdown
+        assert {test.jira_ticket for test in cnv_4_19_stats.quarantined_list} == {"CNV-12345", "CNV-23456"}
+
+        # 2 network test files, the shared virt test file and the invalid test file, in a single scan
+        mock_scan_blobs.assert_called_once()
+        assert len(mock_scan_blobs.call_args.kwargs["blob_shas"]) == 4
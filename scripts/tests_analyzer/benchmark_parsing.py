@@ -0,0 +1,143 @@
+#!/usr/bin/env -S uv run python
+
+"""
+Pytest Marker Analyzer Parsing Benchmark
+
+Measures how the AST-based phases of the pytest marker analyzer (fallback test discovery and
+dependency analysis) scale with the number of parsing processes (--jobs), and how long a run
+served from a persisted AST index takes.
+
+Each measurement starts from an empty in-memory AST index, so every file is parsed; the
+"warm index" row re-runs the analysis from an index saved by a previous run.
+
+Usage:
+    uv run python scripts/tests_analyzer/benchmark_parsing.py
+    uv run python scripts/tests_analyzer/benchmark_parsing.py --jobs 1 2 4 8 --repeat 5
+    uv run python scripts/tests_analyzer/benchmark_parsing.py --repo-root /path/to/checkout --markers tier2
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from simple_logger.logger import get_logger
+
+from scripts.tests_analyzer.pytest_marker_analyzer import AstIndex, MarkerTestAnalyzer
+from scripts.tests_analyzer.pytest_marker_analyzer import logger as analyzer_logger
+
+# Configure logging
+logger = get_logger(name=__name__, level=logging.INFO)
+
+
+def run_analysis(repo_root: Path, markers: str, jobs: int, ast_index: AstIndex) -> tuple[float, int]:
+    """Run AST-based discovery and dependency analysis once.
+
+    Args:
+        repo_root: Repository root to analyze.
+        markers: Pytest marker expression.
+        jobs: Number of parsing processes.
+        ast_index: AST index the analyzer uses.
+
+    Returns:
+        Tuple of (elapsed seconds, number of marked tests found).
+    """
+    start_time = time.perf_counter()
+    analyzer = MarkerTestAnalyzer(marker_expression=markers, repo_root=repo_root, ast_index=ast_index, jobs=jobs)
+    analyzer._fallback_discover_marked_tests()
+    analyzer.analyze_dependencies()
+    return time.perf_counter() - start_time, len(analyzer.marked_tests)
+
+
+def benchmark(repo_root: Path, markers: str, jobs_values: list[int], repeat: int) -> list[tuple[str, float, int]]:
+    """Measure the best wall time of each --jobs value, and of a run from a warm AST index.
+
+    Args:
+        repo_root: Repository root to analyze.
+        markers: Pytest marker expression.
+        jobs_values: Numbers of parsing processes to measure.
+        repeat: Runs per measurement; the fastest one is reported.
+
+    Returns:
+        List of (label, best elapsed seconds, marked test count).
+    """
+    results: list[tuple[str, float, int]] = []
+    for jobs in jobs_values:
+        timings = [
+            run_analysis(repo_root=repo_root, markers=markers, jobs=jobs, ast_index=AstIndex()) for _ in range(repeat)
+        ]
+        results.append((f"--jobs {jobs}", min(elapsed for elapsed, _ in timings), timings[0][1]))
+
+    with tempfile.TemporaryDirectory(prefix="ast_index_benchmark_") as index_dir:
+        index_file = Path(index_dir) / "ast_index.json"
+        cold_index = AstIndex(index_file=index_file)
+        run_analysis(repo_root=repo_root, markers=markers, jobs=max(jobs_values), ast_index=cold_index)
+        cold_index.save()
+        timings = [
+            run_analysis(repo_root=repo_root, markers=markers, jobs=1, ast_index=AstIndex(index_file=index_file))
+            for _ in range(repeat)
+        ]
+        results.append(("warm index", min(elapsed for elapsed, _ in timings), timings[0][1]))
+
+    return results
+
+
+def format_results(results: list[tuple[str, float, int]]) -> str:
+    """Format benchmark results as a markdown table with the speedup against the first row."""
+    baseline = results[0][1]
+    lines = ["| Run | Seconds | Speedup | Marked tests |", "|-----|---------|---------|--------------|"]
+    for label, elapsed, test_count in results:
+        lines.append(f"| {label} | {elapsed:.2f} | {baseline / elapsed:.1f}x | {test_count} |")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark AST parsing of the pytest marker analyzer across --jobs values",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--repo-root",
+        type=Path,
+        default=Path.cwd(),
+        help="Repository root to analyze (default: current directory)",
+    )
+    parser.add_argument(
+        "--markers",
+        "-m",
+        default="smoke",
+        help="Pytest marker expression (default: smoke)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+        help="Numbers of parsing processes to measure (default: 1 2 4 and the CPU count)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per measurement; the fastest one is reported (default: 3)",
+    )
+    args = parser.parse_args()
+
+    # The analyzer logs every phase; keep the benchmark output readable
+    analyzer_logger.setLevel(level=logging.WARNING)
+
+    logger.info(msg="Running benchmark", extra={"repo_root": str(args.repo_root), "jobs": args.jobs})
+    results = benchmark(repo_root=args.repo_root, markers=args.markers, jobs_values=args.jobs, repeat=args.repeat)
+    print(format_results(results=results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,6 +20,7 @@ from __future__ import annotations
 import argparse
 import ast
 import base64
+import hashlib
 import json
 import logging
 import os
@@ -28,10 +29,12 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import urllib.error
 import urllib.parse
 import urllib.request
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -50,9 +53,11 @@ MAX_TRANSITIVE_IMPORT_DEPTH = 2
 MAX_CONFTEST_SEARCH_ITERATIONS = 100
 REPORT_TIMEOUT_SECONDS = 10
 MAX_FILES_PER_PR = 10000
+AST_INDEX_VERSION = 1  # Bump when the format of AstIndex entries changes
 
 # Parallelization settings
 MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+PROCESS_POOL_CHUNKS_PER_JOB = 4  # Smaller shards balance files of uneven size across worker processes
 
 
 def validate_repo_name(repo: str) -> None:
@@ -935,8 +940,402 @@ class FixtureDefinitionVisitor(ast.NodeVisitor):
         self.generic_visit(node=node)
 
 
+class AstIndex:
+    """Content-addressed cache of per-file AST analysis results.
+
+    Entries are keyed by the SHA-256 of the file content, so any edit
+    invalidates the entry of that file only, while moved, reverted or
+    re-cloned files still hit the cache.  Each entry holds the parsed
+    imports, fixture definitions and line-to-symbol map of the file, plus
+    the marked tests and used fixtures per marker set, computed on demand.
+
+    With ``index_file`` the entries are loaded from and saved to a JSON
+    file, so a run only re-parses the files that changed since the
+    previous run.  Without it the index only deduplicates parsing within
+    a single run.
+
+    Attributes:
+        index_file: JSON file the index is persisted to, or ``None``.
+        hits: Number of lookups served from the index.
+        misses: Number of lookups which required parsing the file.
+    """
+
+    def __init__(self, index_file: Path | None = None) -> None:
+        self.index_file = index_file
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._used_digests: set[str] = set()
+        self._lock = threading.Lock()
+        if index_file:
+            self._load(index_file=index_file)
+
+    def import_visitor(self, file_path: Path) -> ImportVisitor:
+        """Return an ``ImportVisitor`` populated with the imports of a file.
+
+        Raises:
+            SyntaxError, UnicodeDecodeError, OSError: If the file cannot be read or parsed.
+        """
+        entry = self._lookup(file_path=file_path)
+        visitor = ImportVisitor()
+        visitor.imports = set(entry["imports"])
+        visitor.symbol_imports = {module: set(symbols) for module, symbols in entry["symbol_imports"].items()}
+        visitor.opaque_imports = set(entry["opaque_imports"])
+        return visitor
+
+    def fixture_definitions(self, file_path: Path) -> dict[str, Fixture]:
+        """Return the fixtures defined in a file, as ``FixtureDefinitionVisitor`` finds them.
+
+        Raises:
+            SyntaxError, UnicodeDecodeError, OSError: If the file cannot be read or parsed.
+        """
+        entry = self._lookup(file_path=file_path)
+        return {
+            name: Fixture(
+                name=name,
+                file_path=file_path,
+                fixture_deps=set(fixture["fixture_deps"]),
+                function_calls=set(fixture["function_calls"]),
+            )
+            for name, fixture in entry["fixtures"].items()
+        }
+
+    def marked_tests(self, file_path: Path, marker_names: set[str]) -> list[str]:
+        """Return the names of the tests in a file which carry any of the markers.
+
+        Raises:
+            SyntaxError, UnicodeDecodeError, OSError: If the file cannot be read or parsed.
+        """
+        entry = self._lookup(file_path=file_path, marker_names=marker_names)
+        return list(entry["markers"][_marker_key(marker_names=marker_names)]["tests"])
+
+    def used_fixtures(self, file_path: Path, marker_names: set[str]) -> set[str]:
+        """Return the fixture names used by the tests in a file, as ``FixtureVisitor`` finds them.
+
+        Raises:
+            SyntaxError, UnicodeDecodeError, OSError: If the file cannot be read or parsed.
+        """
+        entry = self._lookup(file_path=file_path, marker_names=marker_names)
+        return set(entry["markers"][_marker_key(marker_names=marker_names)]["fixtures"])
+
+    def symbol_map(self, source: str) -> SymbolMap:
+        """Return the line-to-symbol map of a source text.
+
+        Raises:
+            SyntaxError: If the source cannot be parsed.
+        """
+        entry = self._entry(source=source)["symbol_map"]
+        return SymbolMap(
+            top_level=[(start_line, end_line, name) for start_line, end_line, name in entry["top_level"]],
+            class_members={
+                class_name: ClassMemberInfo(
+                    class_name=class_name,
+                    members={name: (start_line, end_line) for name, (start_line, end_line) in info["members"].items()},
+                    internal_calls={name: set(callees) for name, callees in info["internal_calls"].items()},
+                )
+                for class_name, info in entry["class_members"].items()
+            },
+        )
+
+    def prefetch(self, file_paths: list[Path], jobs: int, marker_names: set[str] | None = None) -> None:
+        """Parse the files missing from the index in a pool of ``jobs`` processes.
+
+        AST parsing is CPU-bound, so threads serialize on the GIL.  The files
+        are sharded across worker processes, which return compact index
+        entries instead of AST objects, and the entries are merged into the
+        index; later lookups of the files are then served from memory.
+        Files which cannot be read or parsed are left to the normal lookups,
+        which report them.
+
+        Args:
+            file_paths: Files to parse.
+            jobs: Number of worker processes; with 1 nothing is prefetched.
+            marker_names: Also summarize the marked tests and used fixtures
+                for these marker names (for test files).
+        """
+        missing_files = sorted({
+            file_path for file_path in file_paths if not self._has_entry(file_path=file_path, marker_names=marker_names)
+        })
+        if jobs <= 1 or len(missing_files) < 2:
+            return
+
+        shard_count = min(len(missing_files), jobs * PROCESS_POOL_CHUNKS_PER_JOB)
+        shards = [missing_files[shard_index::shard_count] for shard_index in range(shard_count)]
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [
+                    executor.submit(_summarize_files, file_paths=shard, marker_names=marker_names) for shard in shards
+                ]
+                for future in as_completed(futures):
+                    self._merge(entries=future.result())
+        except (BrokenProcessPool, OSError) as e:  # fmt: skip
+            logger.warning(msg="Process pool parsing failed, parsing in-process", extra={"error": str(e)})
+            return
+
+        with self._lock:
+            self.misses += len(missing_files)
+        logger.info(msg="Parsed files in process pool", extra={"file_count": len(missing_files), "jobs": jobs})
+
+    def save(self) -> None:
+        """Write the entries used by this run to ``index_file``.
+
+        Entries of files which were not looked up are dropped, so the index
+        does not grow with every past version of the tree.  Failing to write
+        the index is logged and otherwise ignored.
+        """
+        if self.index_file is None:
+            return
+
+        with self._lock:
+            entries = {digest: self._entries[digest] for digest in self._used_digests}
+
+        tmp_file = self.index_file.with_name(f"{self.index_file.name}.tmp")
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(
+                data=json.dumps({"version": AST_INDEX_VERSION, "entries": entries}, sort_keys=True),
+                encoding="utf-8",
+            )
+            tmp_file.replace(target=self.index_file)
+        except OSError as e:
+            logger.warning(msg="Failed to save AST index", extra={"index_file": str(self.index_file), "error": str(e)})
+            return
+
+        logger.info(
+            msg="Saved AST index",
+            extra={
+                "index_file": str(self.index_file),
+                "entry_count": len(entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            },
+        )
+
+    def _load(self, index_file: Path) -> None:
+        """Load the entries of an index file; a missing, corrupt or outdated index is ignored."""
+        try:
+            data = json.loads(index_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:  # fmt: skip
+            logger.warning(msg="Ignoring unreadable AST index", extra={"index_file": str(index_file), "error": str(e)})
+            return
+
+        if not isinstance(data, dict) or data.get("version") != AST_INDEX_VERSION:
+            logger.info(msg="Ignoring AST index with another version", extra={"index_file": str(index_file)})
+            return
+
+        self._entries = data.get("entries", {})
+        logger.info(msg="Loaded AST index", extra={"index_file": str(index_file), "entry_count": len(self._entries)})
+
+    def _has_entry(self, file_path: Path, marker_names: set[str] | None = None) -> bool:
+        """Check whether the current content of a file is in the index, without parsing it."""
+        try:
+            digest = hashlib.sha256(file_path.read_text(encoding="utf-8").encode("utf-8")).hexdigest()
+        except (UnicodeDecodeError, OSError):  # fmt: skip
+            return False
+
+        with self._lock:
+            entry = self._entries.get(digest)
+        return entry is not None and (
+            marker_names is None or _marker_key(marker_names=marker_names) in entry["markers"]
+        )
+
+    def _merge(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Merge index entries computed by another index, e.g. in a worker process."""
+        with self._lock:
+            for digest, entry in entries.items():
+                if existing_entry := self._entries.get(digest):
+                    existing_entry["markers"].update(entry["markers"])
+                else:
+                    self._entries[digest] = entry
+
+    def _lookup(self, file_path: Path, marker_names: set[str] | None = None) -> dict[str, Any]:
+        """Return the index entry of a file, parsing it only on a cache miss."""
+        return self._entry(
+            source=file_path.read_text(encoding="utf-8"), filename=str(file_path), marker_names=marker_names
+        )
+
+    def _entry(self, source: str, filename: str = "<unknown>", marker_names: set[str] | None = None) -> dict[str, Any]:
+        """Return the index entry of a source text, parsing it only on a cache miss."""
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        marker_key = None if marker_names is None else _marker_key(marker_names=marker_names)
+
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and (marker_key is None or marker_key in entry["markers"]):
+                self.hits += 1
+                self._used_digests.add(digest)
+                return entry
+            self.misses += 1
+
+        # Parse outside the lock; a concurrent miss on the same content computes the same entry
+        tree = ast.parse(source, filename=filename)
+        new_entry = entry or _summarize_tree(tree=tree)
+        if marker_names is not None:
+            new_entry["markers"][_marker_key(marker_names=marker_names)] = _summarize_marked_tests(
+                tree=tree, marker_names=marker_names
+            )
+
+        with self._lock:
+            self._entries[digest] = new_entry
+            self._used_digests.add(digest)
+        return new_entry
+
+
+def _summarize_files(file_paths: list[Path], marker_names: set[str] | None) -> dict[str, dict[str, Any]]:
+    """Parse a shard of files into AST index entries (process pool worker of ``AstIndex.prefetch``).
+
+    Args:
+        file_paths: Files to parse.
+        marker_names: Marker names to summarize marked tests for, or ``None``.
+
+    Returns:
+        Mapping of content digest to index entry; files which cannot be read or parsed are skipped.
+    """
+    ast_index = AstIndex()
+    for file_path in file_paths:
+        try:
+            ast_index._lookup(file_path=file_path, marker_names=marker_names)
+        except (SyntaxError, UnicodeDecodeError, OSError):  # fmt: skip
+            continue
+    return ast_index._entries
+
+
+def _marker_key(marker_names: set[str]) -> str:
+    """Return the AST index key of a set of marker names."""
+    return ",".join(sorted(marker_names))
+
+
+def _summarize_tree(tree: ast.Module) -> dict[str, Any]:
+    """Summarize the marker-independent facts of a parsed file as a JSON-serializable AST index entry."""
+    import_visitor = ImportVisitor()
+    import_visitor.visit(node=tree)
+
+    fixture_visitor = FixtureDefinitionVisitor()
+    fixture_visitor.visit(node=tree)
+
+    symbol_map = _symbol_map_from_tree(tree=tree)
+
+    return {
+        "imports": sorted(import_visitor.imports),
+        "symbol_imports": {module: sorted(symbols) for module, symbols in import_visitor.symbol_imports.items()},
+        "opaque_imports": sorted(import_visitor.opaque_imports),
+        "fixtures": {
+            name: {"fixture_deps": sorted(fixture.fixture_deps), "function_calls": sorted(fixture.function_calls)}
+            for name, fixture in fixture_visitor.fixtures.items()
+        },
+        "symbol_map": {
+            "top_level": symbol_map.top_level,
+            "class_members": {
+                class_name: {
+                    "members": info.members,
+                    "internal_calls": {name: sorted(callees) for name, callees in info.internal_calls.items()},
+                }
+                for class_name, info in symbol_map.class_members.items()
+            },
+        },
+        "markers": {},
+    }
+
+
+def _summarize_marked_tests(tree: ast.Module, marker_names: set[str]) -> dict[str, list[str]]:
+    """Summarize the marked tests and used fixtures of a parsed file for one set of marker names."""
+    fixture_visitor = FixtureVisitor(marker_names=marker_names)
+    fixture_visitor.visit(node=tree)
+    return {
+        "tests": _find_marked_tests(tree=tree, marker_names=marker_names),
+        "fixtures": sorted(fixture_visitor.fixtures),
+    }
+
+
+def _find_marked_tests(tree: ast.Module, marker_names: set[str]) -> list[str]:
+    """Find the test names in a parsed test file which carry any of the markers.
+
+    Checks for markers in this priority:
+    1. Module-level pytestmark - if present, ALL tests in file match
+    2. Class-level decorators - if present, ALL test methods in class match
+    3. Individual function/method decorators - only marked tests match
+
+    Args:
+        tree: Parsed test module.
+        marker_names: Set of marker names to look for.
+
+    Returns:
+        Test names, ``TestClass::test_method`` for test methods.
+    """
+    tests = []
+
+    # STEP 1: Check for module-level pytestmark assignment
+    # If found, ALL test functions/methods in the file should be included
+    module_has_marker = False
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and check_pytestmark_assignment(node=node, marker_names=marker_names):
+            module_has_marker = True
+            break
+
+    if module_has_marker:
+        # Use proper tree traversal, not ast.walk() which loses context
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if node.name.startswith("test_"):
+                    tests.append(node.name)
+            elif isinstance(node, ast.ClassDef):
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        if item.name.startswith("test_"):
+                            tests.append(f"{node.name}::{item.name}")
+        return tests
+
+    # STEP 2: No module-level marker, check class-level and method-level markers
+    # Iterate through module body to properly handle classes vs functions
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            # Module-level function with marker
+            if node.name.startswith("test_"):
+                for decorator in node.decorator_list:
+                    if is_marker(decorator=decorator, marker_names=marker_names):
+                        tests.append(node.name)
+                        break
+                    # Also check for markers in parametrize pytest.param(..., marks=...)
+                    elif check_parametrize_marks(decorator=decorator, marker_names=marker_names):
+                        tests.append(node.name)
+                        break
+
+        elif isinstance(node, ast.ClassDef):
+            # Check if class has marker (applies to all test methods)
+            class_has_marker = False
+            for decorator in node.decorator_list:
+                if is_marker(decorator=decorator, marker_names=marker_names):
+                    class_has_marker = True
+                    break
+
+            if class_has_marker:
+                # Class-level marker: add ALL test methods
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        if item.name.startswith("test_"):
+                            tests.append(f"{node.name}::{item.name}")
+            else:
+                # No class-level marker: check individual methods
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        if item.name.startswith("test_"):
+                            # Check method-level markers
+                            for decorator in item.decorator_list:
+                                if is_marker(decorator=decorator, marker_names=marker_names):
+                                    tests.append(f"{node.name}::{item.name}")
+                                    break
+                                # Also check parametrize marks
+                                elif check_parametrize_marks(decorator=decorator, marker_names=marker_names):
+                                    tests.append(f"{node.name}::{item.name}")
+                                    break
+
+    return tests
+
+
 def _process_test_file_for_markers(
-    test_file: Path, marker_names: set[str], repo_root: Path
+    test_file: Path, marker_names: set[str], repo_root: Path, ast_index: AstIndex | None = None
 ) -> list[tuple[str, str, Path]]:
     """Process a single test file to extract marked tests.
 
@@ -944,71 +1343,18 @@ def _process_test_file_for_markers(
         test_file: Path to test file
         marker_names: Set of marker names to look for
         repo_root: Repository root path
+        ast_index: AST index to look the file up in (default: parse the file)
 
     Returns:
         List of tuples (node_id, test_name, file_path)
     """
     results = []
     try:
-        source = test_file.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(test_file))
-
-        # Check for module-level pytestmark assignment
-        module_has_marker = False
-        for node in tree.body:
-            if isinstance(node, ast.Assign) and check_pytestmark_assignment(node=node, marker_names=marker_names):
-                module_has_marker = True
-                break
-
-        tests = []
-        if module_has_marker:
-            for node in tree.body:
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    if node.name.startswith("test_"):
-                        tests.append(node.name)
-                elif isinstance(node, ast.ClassDef):
-                    for item in node.body:
-                        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                            if item.name.startswith("test_"):
-                                tests.append(f"{node.name}::{item.name}")
-        else:
-            # Check class-level and method-level markers
-            for node in tree.body:
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    if node.name.startswith("test_"):
-                        for decorator in node.decorator_list:
-                            if is_marker(decorator=decorator, marker_names=marker_names):
-                                tests.append(node.name)
-                                break
-                            elif check_parametrize_marks(decorator=decorator, marker_names=marker_names):
-                                tests.append(node.name)
-                                break
-                elif isinstance(node, ast.ClassDef):
-                    class_has_marker = False
-                    for decorator in node.decorator_list:
-                        if is_marker(decorator=decorator, marker_names=marker_names):
-                            class_has_marker = True
-                            break
-                    if class_has_marker:
-                        for item in node.body:
-                            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                                if item.name.startswith("test_"):
-                                    tests.append(f"{node.name}::{item.name}")
-                    else:
-                        for item in node.body:
-                            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                                if item.name.startswith("test_"):
-                                    for decorator in item.decorator_list:
-                                        if is_marker(decorator=decorator, marker_names=marker_names):
-                                            tests.append(f"{node.name}::{item.name}")
-                                            break
-                                        elif check_parametrize_marks(decorator=decorator, marker_names=marker_names):
-                                            tests.append(f"{node.name}::{item.name}")
-                                            break
+        tests = (ast_index or AstIndex()).marked_tests(file_path=test_file, marker_names=marker_names)
 
         for test_name in tests:
             try:
-                rel_path = test_file.relative_to(other=repo_root)
+                rel_path = test_file.relative_to(repo_root)
                 node_id = f"{rel_path}::{test_name}"
                 results.append((node_id, test_name, test_file))
             except ValueError:
@@ -1021,7 +1367,7 @@ def _process_test_file_for_markers(
 
 
 def _process_conftest_with_imports(
-    conftest: Path, repo_root: Path
+    conftest: Path, repo_root: Path, ast_index: AstIndex | None = None
 ) -> tuple[dict[str, Fixture], dict[Path, set[str]], set[Path]]:
     """Process conftest: extract fixtures + symbol imports + opaque deps in single parse.
 
@@ -1033,6 +1379,7 @@ def _process_conftest_with_imports(
     Args:
         conftest: Path to conftest.py file.
         repo_root: Repository root path.
+        ast_index: AST index to look the file up in (default: parse the file).
 
     Returns:
         Tuple of (fixtures, symbol_imports, opaque_deps) where:
@@ -1045,18 +1392,13 @@ def _process_conftest_with_imports(
     opaque_deps: set[Path] = set()
 
     try:
-        source = conftest.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(conftest))
+        ast_index = ast_index or AstIndex()
 
         # Extract fixtures
-        fixture_visitor = FixtureDefinitionVisitor()
-        fixture_visitor.file_path = conftest
-        fixture_visitor.visit(node=tree)
-        fixtures = fixture_visitor.fixtures
+        fixtures = ast_index.fixture_definitions(file_path=conftest)
 
         # Extract imports
-        import_visitor = ImportVisitor()
-        import_visitor.visit(node=tree)
+        import_visitor = ast_index.import_visitor(file_path=conftest)
 
         symbol_imports, opaque_deps = _resolve_visitor_symbol_imports(visitor=import_visitor, repo_root=repo_root)
 
@@ -1069,44 +1411,38 @@ def _process_conftest_with_imports(
     return fixtures, symbol_imports, opaque_deps
 
 
-def _extract_imports_from_file(file_path: Path) -> set[str]:
+def _extract_imports_from_file(file_path: Path, ast_index: AstIndex | None = None) -> set[str]:
     """Extract import statements from a Python file.
 
     Args:
         file_path: Path to Python file
+        ast_index: AST index to look the file up in (default: parse the file)
 
     Returns:
         Set of imported module names
     """
     imports = set()
     try:
-        source = file_path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(file_path))
-        visitor = ImportVisitor()
-        visitor.visit(node=tree)
-        imports = visitor.imports
+        imports = (ast_index or AstIndex()).import_visitor(file_path=file_path).imports
     except (SyntaxError, UnicodeDecodeError, OSError) as e:  # fmt: skip
         logger.info(msg="Error extracting imports from file", extra={"file": str(file_path), "error": str(e)})
     return imports
 
 
-def _extract_fixtures_from_file(file_path: Path, marker_names: set[str]) -> set[str]:
+def _extract_fixtures_from_file(file_path: Path, marker_names: set[str], ast_index: AstIndex | None = None) -> set[str]:
     """Extract fixture names used in test file.
 
     Args:
         file_path: Path to test file
         marker_names: Set of marker names
+        ast_index: AST index to look the file up in (default: parse the file)
 
     Returns:
         Set of fixture names
     """
     fixtures = set()
     try:
-        source = file_path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(file_path))
-        visitor = FixtureVisitor(marker_names=marker_names)
-        visitor.visit(node=tree)
-        fixtures = visitor.fixtures
+        fixtures = (ast_index or AstIndex()).used_fixtures(file_path=file_path, marker_names=marker_names)
     except (SyntaxError, UnicodeDecodeError, OSError) as e:  # fmt: skip
         logger.info(msg="Error extracting fixtures from file", extra={"file": str(file_path), "error": str(e)})
     return fixtures
@@ -1195,7 +1531,9 @@ def _resolve_visitor_symbol_imports(visitor: ImportVisitor, repo_root: Path) ->
     return symbol_imports, opaque_deps
 
 
-def _extract_symbol_imports_from_file(file_path: Path, repo_root: Path) -> dict[Path, set[str]]:
+def _extract_symbol_imports_from_file(
+    file_path: Path, repo_root: Path, ast_index: AstIndex | None = None
+) -> dict[Path, set[str]]:
     """Extract symbol-level imports from a Python file and resolve to file paths.
 
     Parses the file with ``ImportVisitor`` and resolves each module with
@@ -1207,6 +1545,7 @@ def _extract_symbol_imports_from_file(file_path: Path, repo_root: Path) -> dict[
     Args:
         file_path: Path to the Python file to analyze.
         repo_root: Repository root path for module resolution.
+        ast_index: AST index to look the file up in (default: parse the file).
 
     Returns:
         Mapping of resolved file path to set of imported symbol names.
@@ -1214,11 +1553,7 @@ def _extract_symbol_imports_from_file(file_path: Path, repo_root: Path) -> dict[
     """
     symbol_imports: dict[Path, set[str]] = {}
     try:
-        source = file_path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(file_path))
-        visitor = ImportVisitor()
-        visitor.visit(node=tree)
-
+        visitor = (ast_index or AstIndex()).import_visitor(file_path=file_path)
         symbol_imports, _ = _resolve_visitor_symbol_imports(visitor=visitor, repo_root=repo_root)
     except (SyntaxError, UnicodeDecodeError, OSError) as e:  # fmt: skip
         logger.info(
@@ -1258,7 +1593,11 @@ def _build_line_to_symbol_map(source: str) -> SymbolMap:
     Returns:
         SymbolMap with top-level symbols and class member details.
     """
-    tree = ast.parse(source)
+    return _symbol_map_from_tree(tree=ast.parse(source))
+
+
+def _symbol_map_from_tree(tree: ast.Module) -> SymbolMap:
+    """Build the ``SymbolMap`` of a parsed module; see ``_build_line_to_symbol_map``."""
     symbols: list[tuple[int, int, str]] = []
     class_members: dict[str, ClassMemberInfo] = {}
 
@@ -1714,6 +2053,7 @@ def _extract_modified_symbols(
     file_status: str | None = None,
     pr_head_ref: str | None = None,
     is_checkout: bool = False,
+    ast_index: AstIndex | None = None,
 ) -> SymbolClassification | None:
     """Determine which top-level symbols were modified or added in a file.
 
@@ -1740,6 +2080,8 @@ def _extract_modified_symbols(
             falling back to the local file after a fetch failure is safe.
             When ``False`` (remote analysis), the local file may be on a
             different branch and must not be used as fallback.
+        ast_index: AST index to look the symbol map up in (default: parse
+            the source).
 
     Returns:
         ``SymbolClassification`` with modified and new symbol sets, or
@@ -1809,7 +2151,7 @@ def _extract_modified_symbols(
         if source is None:
             # pr_head_ref was None — pure local mode, local file is authoritative
             source = file_path.read_text(encoding="utf-8")
-        symbol_map = _build_line_to_symbol_map(source=source)
+        symbol_map = ast_index.symbol_map(source=source) if ast_index else _build_line_to_symbol_map(source=source)
     except (SyntaxError, UnicodeDecodeError, OSError) as exc:  # fmt: skip
         logger.info(
             msg="Error building symbol map",
@@ -2035,7 +2377,7 @@ def _find_relevant_conftests_helper(test_file: Path, repo_root: Path) -> set[Pat
 
 
 def _analyze_single_test_dependencies(
-    marked_test: MarkedTest, repo_root: Path, marker_names: set[str]
+    marked_test: MarkedTest, repo_root: Path, marker_names: set[str], ast_index: AstIndex | None = None
 ) -> tuple[set[Path], set[str], dict[Path, set[str]]]:
     """Analyze dependencies for a single marked test (static method for parallel execution).
 
@@ -2043,6 +2385,8 @@ def _analyze_single_test_dependencies(
         marked_test: Test to analyze.
         repo_root: Repository root path.
         marker_names: Set of marker names.
+        ast_index: AST index shared by the tests, so each file is parsed
+            once (default: parse every file).
 
     Returns:
         Tuple of (dependencies, fixtures, symbol_imports) where
@@ -2055,22 +2399,27 @@ def _analyze_single_test_dependencies(
     fixtures: set[str] = set()
     symbol_imports: dict[Path, set[str]] = {}
 
+    ast_index = ast_index or AstIndex()
+
     try:
         # Add the test file itself as a dependency
         dependencies.add(marked_test.file_path)
 
         # Extract direct imports from test file
-        imports = _extract_imports_from_file(file_path=marked_test.file_path)
+        imports = _extract_imports_from_file(file_path=marked_test.file_path, ast_index=ast_index)
         dependencies.update(_resolve_imports_helper(imports=imports, repo_root=repo_root))
 
         # Extract symbol-level imports for non-conftest dependencies
         symbol_imports = _extract_symbol_imports_from_file(
             file_path=marked_test.file_path,
             repo_root=repo_root,
+            ast_index=ast_index,
         )
 
         # Extract fixtures used by the test
-        fixtures = _extract_fixtures_from_file(file_path=marked_test.file_path, marker_names=marker_names)
+        fixtures = _extract_fixtures_from_file(
+            file_path=marked_test.file_path, marker_names=marker_names, ast_index=ast_index
+        )
 
         # Add conftest files in the test's directory hierarchy
         conftest_deps = _find_relevant_conftests_helper(test_file=marked_test.file_path, repo_root=repo_root)
@@ -2091,7 +2440,7 @@ def _analyze_single_test_dependencies(
                     continue
 
                 visited.add(dep_file)
-                dep_imports = _extract_imports_from_file(file_path=dep_file)
+                dep_imports = _extract_imports_from_file(file_path=dep_file, ast_index=ast_index)
                 resolved = _resolve_imports_helper(imports=dep_imports, repo_root=repo_root)
 
                 for resolved_file in resolved:
@@ -2151,6 +2500,7 @@ def _check_conftest_pathway(
     modified_symbols_cache: dict[Path, SymbolClassification | None],
     fixtures_dict: dict[str, Fixture],
     repo_root: Path,
+    ast_index: AstIndex | None = None,
 ) -> tuple[bool, list[str]]:
     """Check if a changed file affects a test via conftest transitive imports.
 
@@ -2170,6 +2520,8 @@ def _check_conftest_pathway(
             to their symbol classifications.
         fixtures_dict: Dictionary of all fixtures.
         repo_root: Repository root path.
+        ast_index: AST index to look intermediate modules up in (default:
+            parse them).
 
     Returns:
         Tuple of (is_affected, matching_deps) where is_affected is True if
@@ -2242,7 +2594,9 @@ def _check_conftest_pathway(
         if changed_file not in conftest_syms:
             # Check transitive path: conftest -> intermediate -> changed_file
             for intermediate_path, conftest_imported_from_intermediate in conftest_syms.items():
-                intermediate_syms = _extract_symbol_imports_from_file(file_path=intermediate_path, repo_root=repo_root)
+                intermediate_syms = _extract_symbol_imports_from_file(
+                    file_path=intermediate_path, repo_root=repo_root, ast_index=ast_index
+                )
                 if changed_file not in intermediate_syms:
                     continue
 
@@ -2336,6 +2690,7 @@ def _check_test_impact(
     pr_file_statuses: dict[str, str] | None = None,
     is_checkout: bool = False,
     pr_head_ref: str | None = None,
+    ast_index: AstIndex | None = None,
 ) -> dict[str, Any] | None:
     """Check if a single test is affected by changed files (for parallel execution).
 
@@ -2371,6 +2726,8 @@ def _check_test_impact(
             GitHub file status strings.
         pr_head_ref: Optional PR head commit SHA used in remote (no-checkout)
             mode to fetch the correct version of files from GitHub.
+        ast_index: AST index to look dependency files up in (default:
+            parse them).
 
     Returns:
         Dictionary with test info if affected, ``None`` otherwise.
@@ -2555,6 +2912,7 @@ def _check_test_impact(
                     modified_symbols_cache=modified_symbols_cache,
                     fixtures_dict=fixtures_dict,
                     repo_root=repo_root,
+                    ast_index=ast_index,
                 )
                 if is_affected:
                     test_affected = True
@@ -3069,6 +3427,8 @@ class MarkerTestAnalyzer:
         base_branch: str = "main",
         github_pr_info: dict[str, Any] | None = None,
         is_checkout: bool = False,
+        ast_index: AstIndex | None = None,
+        jobs: int = 1,
     ) -> None:
         self.marker_expression = marker_expression
         self.marker_names = extract_marker_names(marker_expression=marker_expression)
@@ -3076,6 +3436,8 @@ class MarkerTestAnalyzer:
         self.base_branch = base_branch
         self.github_pr_info = github_pr_info  # Contains repo, pr_number, token for GitHub API calls
         self.is_checkout = is_checkout
+        self.ast_index = ast_index or AstIndex()  # Shared by all phases, so each file is parsed at most once
+        self.jobs = jobs or os.cpu_count() or 1  # Processes parsing files; 1 parses in the analysis threads
         self.marked_tests: dict[str, MarkedTest] = {}
         self.conftest_files: list[Path] = []
         self.fixtures: dict[str, Fixture] = {}  # name -> Fixture
@@ -3301,6 +3663,7 @@ class MarkerTestAnalyzer:
         test_files = list(set(test_files))
 
         logger.info(msg="Found test files to scan", extra={"file_count": len(test_files)})
+        self.ast_index.prefetch(file_paths=test_files, jobs=self.jobs, marker_names=self.marker_names)
 
         # Process files in parallel using ThreadPoolExecutor (I/O-bound: file reading and AST parsing)
         with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
@@ -3311,6 +3674,7 @@ class MarkerTestAnalyzer:
                     test_file=test_file,
                     marker_names=self.marker_names,
                     repo_root=self.repo_root,
+                    ast_index=self.ast_index,
                 ): test_file
                 for test_file in test_files
             }
@@ -3336,88 +3700,10 @@ class MarkerTestAnalyzer:
         )
 
     def _extract_marked_tests_from_file(self, file_path: Path) -> list[str]:
-        """Extract test names with specified markers from a file.
-
-        Checks for markers in this priority:
-        1. Module-level pytestmark - if present, ALL tests in file match
-        2. Class-level decorators - if present, ALL test methods in class match
-        3. Individual function/method decorators - only marked tests match
-        """
+        """Extract test names with specified markers from a file (see ``_find_marked_tests``)."""
         tests = []
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
-
-            # STEP 1: Check for module-level pytestmark assignment
-            # If found, ALL test functions/methods in the file should be included
-            module_has_marker = False
-            for node in tree.body:
-                if isinstance(node, ast.Assign) and check_pytestmark_assignment(
-                    node=node, marker_names=self.marker_names
-                ):
-                    module_has_marker = True
-                    logger.info(msg="Module-level marker found", extra={"file_path": str(file_path)})
-                    break
-
-            if module_has_marker:
-                # Use proper tree traversal, not ast.walk() which loses context
-                for node in tree.body:
-                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        if node.name.startswith("test_"):
-                            tests.append(node.name)
-                    elif isinstance(node, ast.ClassDef):
-                        for item in node.body:
-                            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                                if item.name.startswith("test_"):
-                                    tests.append(f"{node.name}::{item.name}")
-                return tests
-
-            # STEP 2: No module-level marker, check class-level and method-level markers
-            # Iterate through module body to properly handle classes vs functions
-            for node in tree.body:
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    # Module-level function with marker
-                    if node.name.startswith("test_"):
-                        for decorator in node.decorator_list:
-                            if is_marker(decorator=decorator, marker_names=self.marker_names):
-                                tests.append(node.name)
-                                break
-                            # Also check for markers in parametrize pytest.param(..., marks=...)
-                            elif check_parametrize_marks(decorator=decorator, marker_names=self.marker_names):
-                                tests.append(node.name)
-                                break
-
-                elif isinstance(node, ast.ClassDef):
-                    # Check if class has marker (applies to all test methods)
-                    class_has_marker = False
-                    for decorator in node.decorator_list:
-                        if is_marker(decorator=decorator, marker_names=self.marker_names):
-                            class_has_marker = True
-                            break
-
-                    if class_has_marker:
-                        # Class-level marker: add ALL test methods
-                        for item in node.body:
-                            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                                if item.name.startswith("test_"):
-                                    tests.append(f"{node.name}::{item.name}")
-                    else:
-                        # No class-level marker: check individual methods
-                        for item in node.body:
-                            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                                if item.name.startswith("test_"):
-                                    # Check method-level markers
-                                    for decorator in item.decorator_list:
-                                        if is_marker(decorator=decorator, marker_names=self.marker_names):
-                                            tests.append(f"{node.name}::{item.name}")
-                                            break
-                                        # Also check parametrize marks
-                                        elif check_parametrize_marks(
-                                            decorator=decorator, marker_names=self.marker_names
-                                        ):
-                                            tests.append(f"{node.name}::{item.name}")
-                                            break
-
+            tests = self.ast_index.marked_tests(file_path=file_path, marker_names=self.marker_names)
         except SyntaxError as e:
             logger.warning(msg="Syntax error in file", extra={"file_path": str(file_path), "error": str(e)})
         except UnicodeDecodeError as e:
@@ -3435,7 +3721,12 @@ class MarkerTestAnalyzer:
         with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
             # Submit all tasks
             future_to_conftest = {
-                executor.submit(_process_conftest_with_imports, conftest=conftest, repo_root=self.repo_root): conftest
+                executor.submit(
+                    _process_conftest_with_imports,
+                    conftest=conftest,
+                    repo_root=self.repo_root,
+                    ast_index=self.ast_index,
+                ): conftest
                 for conftest in self.conftest_files
             }
 
@@ -3502,6 +3793,9 @@ class MarkerTestAnalyzer:
         # Find all conftest.py files
         self._find_conftest_files()
 
+        # Parse the files read below in worker processes (no-op with a single job)
+        self._prefetch_dependencies()
+
         # Build fixture dependency graph (already parallelized)
         self.build_fixture_dependency_graph()
 
@@ -3519,6 +3813,7 @@ class MarkerTestAnalyzer:
                     marked_test=marked_test,
                     repo_root=self.repo_root,
                     marker_names=self.marker_names,
+                    ast_index=self.ast_index,
                 ): marked_test.node_id
                 for marked_test in tests_to_process
             }
@@ -3550,6 +3845,35 @@ class MarkerTestAnalyzer:
 
         logger.info(msg="Dependency analysis complete")
 
+    def _prefetch_dependencies(self) -> None:
+        """Parse the marked tests, conftest files and their transitive imports in the process pool.
+
+        Walks the import graph level by level, as deep as
+        ``_analyze_single_test_dependencies`` reads it, prefetching each
+        level before resolving the imports of the next one.
+        """
+        if self.jobs <= 1:
+            return
+
+        test_files = {marked_test.file_path for marked_test in self.marked_tests.values()}
+        self.ast_index.prefetch(file_paths=list(test_files), jobs=self.jobs, marker_names=self.marker_names)
+
+        level = test_files | set(self.conftest_files)
+        seen = set(level)
+        for _ in range(MAX_TRANSITIVE_IMPORT_DEPTH):
+            self.ast_index.prefetch(file_paths=list(level), jobs=self.jobs)
+            next_level: set[Path] = set()
+            for file_path in level:
+                try:
+                    imports = self.ast_index.import_visitor(file_path=file_path).imports
+                except (SyntaxError, UnicodeDecodeError, OSError):  # fmt: skip
+                    continue  # Reported by the dependency analysis itself
+                next_level.update(_resolve_imports_helper(imports=imports, repo_root=self.repo_root))
+            level = next_level - seen
+            seen |= level
+
+        self.ast_index.prefetch(file_paths=list(level), jobs=self.jobs)
+
     def _find_conftest_files(self) -> None:
         """Find all conftest.py files in the repository."""
         tests_dir = self.repo_root / "tests"
@@ -3662,6 +3986,7 @@ class MarkerTestAnalyzer:
                     file_status=file_status,
                     pr_head_ref=pr_head_ref,
                     is_checkout=self.is_checkout,
+                    ast_index=self.ast_index,
                 )
 
         # Check each marked test for dependency matches in parallel using ThreadPoolExecutor
@@ -3685,6 +4010,7 @@ class MarkerTestAnalyzer:
                     pr_file_statuses=pr_file_statuses,
                     is_checkout=self.is_checkout,
                     pr_head_ref=pr_head_ref,
+                    ast_index=self.ast_index,
                 ): node_id
                 for node_id, marked_test in self.marked_tests.items()
             }
@@ -3977,6 +4303,8 @@ def run_github_mode(args: argparse.Namespace) -> tuple[AnalysisResult | None, in
             base_branch=base_branch,
             github_pr_info=github_pr_info,
             is_checkout=args.checkout,
+            ast_index=AstIndex(index_file=args.ast_index),
+            jobs=args.jobs,
         )
         analyzer.discover_marked_tests()
 
@@ -3986,6 +4314,7 @@ def run_github_mode(args: argparse.Namespace) -> tuple[AnalysisResult | None, in
 
         analyzer.analyze_dependencies()
         result = analyzer.analyze_impact(changed_files=changed_files_list)
+        analyzer.ast_index.save()
         return result, 0
 
     except (ValueError, RuntimeError) as e:  # fmt: skip
@@ -4002,7 +4331,12 @@ def run_local_mode(args: argparse.Namespace) -> tuple[AnalysisResult | None, int
     Returns:
         Tuple of (AnalysisResult or None, exit_code)
     """
-    analyzer = MarkerTestAnalyzer(marker_expression=args.markers, base_branch=args.base)  # keyword args used
+    analyzer = MarkerTestAnalyzer(
+        marker_expression=args.markers,
+        base_branch=args.base,
+        ast_index=AstIndex(index_file=args.ast_index),
+        jobs=args.jobs,
+    )
     analyzer.discover_marked_tests()
 
     if not analyzer.marked_tests:
@@ -4016,6 +4350,7 @@ def run_local_mode(args: argparse.Namespace) -> tuple[AnalysisResult | None, int
         logger.warning(msg="No changed files found")
 
     result = analyzer.analyze_impact(changed_files=changed_files)
+    analyzer.ast_index.save()
     return result, 0
 
 
@@ -4085,6 +4420,24 @@ def main() -> int:
         type=Path,
         help="Base directory for temporary files (default: system temp). Useful in Jenkins to use workspace directory.",
     )
+    parser.add_argument(
+        "--ast-index",
+        type=Path,
+        help=(
+            "JSON file to persist parsed imports, fixtures, markers and symbol maps in, keyed by file content hash. "
+            "Subsequent runs only re-parse changed files. Keep it outside --workdir, e.g. in a CI cache directory."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help=(
+            "Number of processes parsing test files, conftest files and their imports "
+            "(default: 1, parse in the analysis threads; 0: one per CPU core)"
+        ),
+    )
 
     # Output arguments
     parser.add_argument(
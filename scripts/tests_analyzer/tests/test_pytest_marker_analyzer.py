@@ -6,11 +6,14 @@ Co-authored-by: Claude <noreply@anthropic.com>
 
 import argparse
 import ast
+import json
 import textwrap
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from scripts.tests_analyzer.pytest_marker_analyzer import (
+    AST_INDEX_VERSION,
+    AstIndex,
     AttributeAccessCollector,
     Fixture,
     ImportVisitor,
@@ -28,6 +31,8 @@ from scripts.tests_analyzer.pytest_marker_analyzer import (
     _get_modified_function_names,
     _is_fixture_decorator_standalone,
     _parse_diff_for_functions,
+    _process_conftest_with_imports,
+    _process_test_file_for_markers,
     run_github_mode,
 )
 
@@ -1582,6 +1587,8 @@ class TestRunGithubModeCheckoutGithubPrInfo:
             workdir=tmp_path,
             work_dir=None,
             markers="smoke",
+            ast_index=None,
+            jobs=1,
         )
 
         run_github_mode(args=args)
@@ -3080,3 +3087,209 @@ class TestPytestPluginsDetection:
         symbol_map = _build_line_to_symbol_map(source=source)
         symbol_names = {name for _, _, name in symbol_map.top_level}
         assert "pytest_plugins" in symbol_names, "pytest_plugins assignment should be tracked as a top-level symbol"
+
+
+class TestAstIndex:
+    """Tests for the content-hash keyed AST index."""
+
+    TEST_SOURCE = textwrap.dedent("""\
+        import pytest
+        from utilities.virt import VirtualMachineForTests, running_vm
+
+        @pytest.mark.smoke
+        def test_smoke(admin_client, namespace):
+            pass
+
+        class TestVM:
+            @pytest.mark.tier3
+            def test_tier3(self, vm):
+                pass
+    """)
+
+    CONFTEST_SOURCE = textwrap.dedent("""\
+        import pytest
+        from utilities.virt import running_vm
+
+        @pytest.fixture
+        def vm(namespace, request):
+            return running_vm(vm=create_vm())
+    """)
+
+    def _write_files(self, tmp_path: Path) -> tuple[Path, Path]:
+        test_file = tmp_path / "tests" / "test_vm.py"
+        test_file.parent.mkdir()
+        test_file.write_text(self.TEST_SOURCE)
+        conftest = tmp_path / "tests" / "conftest.py"
+        conftest.write_text(self.CONFTEST_SOURCE)
+        return test_file, conftest
+
+    def test_results_match_direct_parsing(self, tmp_path: Path) -> None:
+        """Marked tests, fixtures and imports are the same with and without the index."""
+        test_file, conftest = self._write_files(tmp_path=tmp_path)
+        ast_index = AstIndex()
+
+        assert _process_test_file_for_markers(
+            test_file=test_file, marker_names={"smoke"}, repo_root=tmp_path, ast_index=ast_index
+        ) == [("tests/test_vm.py::test_smoke", "test_smoke", test_file)]
+        assert ast_index.marked_tests(file_path=test_file, marker_names={"tier3"}) == ["TestVM::test_tier3"]
+        assert ast_index.used_fixtures(file_path=test_file, marker_names={"smoke"}) == {
+            "admin_client",
+            "namespace",
+            "vm",
+        }
+
+        fixtures, _, _ = _process_conftest_with_imports(conftest=conftest, repo_root=tmp_path, ast_index=ast_index)
+        assert fixtures["vm"].file_path == conftest
+        assert fixtures["vm"].fixture_deps == {"namespace"}
+        assert fixtures["vm"].function_calls == {"running_vm", "create_vm"}
+
+        visitor = ast_index.import_visitor(file_path=test_file)
+        assert visitor.symbol_imports == {"utilities.virt": {"VirtualMachineForTests", "running_vm"}}
+        assert visitor.opaque_imports == {"pytest"}
+
+    def test_symbol_map_matches_direct_parsing(self) -> None:
+        """The cached symbol map equals the one built by _build_line_to_symbol_map."""
+        assert AstIndex().symbol_map(source=self.TEST_SOURCE) == _build_line_to_symbol_map(source=self.TEST_SOURCE)
+
+    def test_unchanged_file_parsed_once(self, tmp_path: Path) -> None:
+        """Repeated lookups of the same content do not parse the file again."""
+        test_file, _ = self._write_files(tmp_path=tmp_path)
+        ast_index = AstIndex()
+
+        with patch("scripts.tests_analyzer.pytest_marker_analyzer.ast.parse", wraps=ast.parse) as mock_parse:
+            ast_index.import_visitor(file_path=test_file)
+            ast_index.fixture_definitions(file_path=test_file)
+            ast_index.symbol_map(source=self.TEST_SOURCE)
+            ast_index.marked_tests(file_path=test_file, marker_names={"smoke"})
+            ast_index.used_fixtures(file_path=test_file, marker_names={"smoke"})
+
+        # One parse for the file, one for the first lookup with the marker set
+        assert mock_parse.call_count == 2
+        assert (ast_index.hits, ast_index.misses) == (3, 2)
+
+    def test_persisted_index_skips_parsing(self, tmp_path: Path) -> None:
+        """A saved index serves the next run without parsing unchanged files."""
+        test_file, conftest = self._write_files(tmp_path=tmp_path)
+        index_file = tmp_path / "cache" / "ast_index.json"
+        ast_index = AstIndex(index_file=index_file)
+        expected_tests = ast_index.marked_tests(file_path=test_file, marker_names={"smoke"})
+        expected_fixtures = ast_index.fixture_definitions(file_path=conftest)
+        ast_index.save()
+
+        with patch("scripts.tests_analyzer.pytest_marker_analyzer.ast.parse") as mock_parse:
+            reloaded_index = AstIndex(index_file=index_file)
+            assert reloaded_index.marked_tests(file_path=test_file, marker_names={"smoke"}) == expected_tests
+            assert reloaded_index.fixture_definitions(file_path=conftest) == expected_fixtures
+
+        mock_parse.assert_not_called()
+
+    def test_changed_file_is_reparsed(self, tmp_path: Path) -> None:
+        """Changing a file's content invalidates its entry."""
+        test_file, _ = self._write_files(tmp_path=tmp_path)
+        ast_index = AstIndex()
+        assert ast_index.marked_tests(file_path=test_file, marker_names={"smoke"}) == ["test_smoke"]
+
+        test_file.write_text(self.TEST_SOURCE.replace("pytest.mark.tier3", "pytest.mark.smoke"))
+
+        assert ast_index.marked_tests(file_path=test_file, marker_names={"smoke"}) == [
+            "test_smoke",
+            "TestVM::test_tier3",
+        ]
+
+    def test_save_drops_unused_entries(self, tmp_path: Path) -> None:
+        """Only entries looked up during the run are written back."""
+        test_file, conftest = self._write_files(tmp_path=tmp_path)
+        index_file = tmp_path / "ast_index.json"
+        ast_index = AstIndex(index_file=index_file)
+        ast_index.import_visitor(file_path=test_file)
+        ast_index.import_visitor(file_path=conftest)
+        ast_index.save()
+
+        next_index = AstIndex(index_file=index_file)
+        next_index.import_visitor(file_path=conftest)
+        next_index.save()
+
+        assert len(json.loads(index_file.read_text())["entries"]) == 1
+
+    def test_index_with_other_version_is_ignored(self, tmp_path: Path) -> None:
+        """An index written by another format version is not used."""
+        test_file, _ = self._write_files(tmp_path=tmp_path)
+        index_file = tmp_path / "ast_index.json"
+        ast_index = AstIndex(index_file=index_file)
+        ast_index.import_visitor(file_path=test_file)
+        ast_index.save()
+        data = json.loads(index_file.read_text())
+        data["version"] = AST_INDEX_VERSION + 1
+        index_file.write_text(json.dumps(data))
+
+        assert AstIndex(index_file=index_file)._entries == {}
+
+    def test_corrupt_index_is_ignored(self, tmp_path: Path) -> None:
+        """An unreadable index file starts an empty index instead of failing the analysis."""
+        index_file = tmp_path / "ast_index.json"
+        index_file.write_text("{not json")
+
+        assert AstIndex(index_file=index_file)._entries == {}
+
+    def test_syntax_error_is_raised(self, tmp_path: Path) -> None:
+        """Files which fail to parse raise SyntaxError, so callers keep skipping them."""
+        broken_file = tmp_path / "test_broken.py"
+        broken_file.write_text("def test_broken(:\n")
+
+        assert _process_test_file_for_markers(test_file=broken_file, marker_names={"smoke"}, repo_root=tmp_path) == []
+
+
+class TestAstIndexPrefetch:
+    """Tests for process pool parsing of the AST index."""
+
+    def _write_test_files(self, tmp_path: Path, count: int) -> list[Path]:
+        test_files = []
+        for index in range(count):
+            test_file = tmp_path / f"test_file_{index}.py"
+            test_file.write_text(f"import pytest\n\n@pytest.mark.smoke\ndef test_{index}(fixture_{index}):\n    pass\n")
+            test_files.append(test_file)
+        return test_files
+
+    def test_prefetch_in_process_pool(self, tmp_path: Path) -> None:
+        """Files parsed by the worker processes are served without parsing in the analyzer process."""
+        test_files = self._write_test_files(tmp_path=tmp_path, count=4)
+        ast_index = AstIndex()
+
+        ast_index.prefetch(file_paths=test_files, jobs=2, marker_names={"smoke"})
+
+        with patch("scripts.tests_analyzer.pytest_marker_analyzer.ast.parse") as mock_parse:
+            assert [
+                ast_index.marked_tests(file_path=test_file, marker_names={"smoke"}) for test_file in test_files
+            ] == [
+                ["test_0"],
+                ["test_1"],
+                ["test_2"],
+                ["test_3"],
+            ]
+            assert ast_index.used_fixtures(file_path=test_files[0], marker_names={"smoke"}) == {"fixture_0"}
+        mock_parse.assert_not_called()
+        assert ast_index.misses == 4
+
+    def test_prefetch_single_job_is_noop(self, tmp_path: Path) -> None:
+        """With a single job, files are left to be parsed lazily by the lookups."""
+        test_files = self._write_test_files(tmp_path=tmp_path, count=2)
+        ast_index = AstIndex()
+
+        with patch("scripts.tests_analyzer.pytest_marker_analyzer.ProcessPoolExecutor") as mock_executor:
+            ast_index.prefetch(file_paths=test_files, jobs=1)
+
+        mock_executor.assert_not_called()
+        assert ast_index._entries == {}
+
+    def test_prefetch_skips_indexed_and_broken_files(self, tmp_path: Path) -> None:
+        """Only files missing from the index are sent to the workers; unparsable files are skipped."""
+        test_files = self._write_test_files(tmp_path=tmp_path, count=3)
+        broken_file = tmp_path / "test_broken.py"
+        broken_file.write_text("def test_broken(:\n")
+        ast_index = AstIndex()
+        ast_index.import_visitor(file_path=test_files[0])
+
+        ast_index.prefetch(file_paths=[*test_files, broken_file], jobs=2)
+
+        assert ast_index.misses == 1 + 3
+        assert len(ast_index._entries) == 3
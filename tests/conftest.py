@@ -167,6 +167,7 @@ from utilities.network import (
     cloud_init_network_data,
     enable_hyperconverged_ovs_annotations,
     get_cluster_cni_type,
+    get_mac_pool_state_file,
     network_device,
     network_nad,
     wait_for_node_marked_by_bridge,
@@ -191,10 +192,10 @@ from utilities.storage import (
     update_default_sc,
     verify_boot_sources_reimported,
 )
+from utilities.templates import get_base_templates_list
 from utilities.virt import (
     VirtualMachineForTests,
     fedora_vm_body,
-    get_base_templates_list,
     get_hyperconverged_kubevirt,
     get_hyperconverged_ovs_annotations,
     get_kubevirt_hyperconverged_spec,
@@ -1034,10 +1035,14 @@ def sriov_node_policy(
 
 @pytest.fixture(scope="session")
 def mac_pool(admin_client, hco_namespace):
+    # pytest-xdist workers of the same run share the MAC reservations, so they never pick the same MAC; the
+    # controller removes the state file at the end of the run, see pytest_sessionfinish
+    testrun_uid = os.environ.get("PYTEST_XDIST_TESTRUNUID")
     return MacPool(
         kmp_range=ConfigMap(
             namespace=hco_namespace.name, name=KUBEMACPOOL_MAC_RANGE_CONFIG, client=admin_client
-        ).instance["data"]
+        ).instance["data"],
+        state_file=get_mac_pool_state_file(testrun_uid=testrun_uid) if testrun_uid else None,
     )
 
 
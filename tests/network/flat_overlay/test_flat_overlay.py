@@ -4,7 +4,7 @@ import pytest
 
 from libs.net.vmspec import lookup_iface_status_ip
 from tests.network.utils import assert_no_ping
-from utilities.network import assert_ping_successful
+from utilities.network import assert_ping_matrix_successful, assert_ping_successful
 
 LOGGER = logging.getLogger(__name__)
 
@@ -23,10 +23,10 @@ class TestFlatOverlayConnectivity:
     @pytest.mark.polarion("CNV-10158")
     # conformance candidate
     @pytest.mark.dependency(name="test_flat_overlay_basic_ping")
-    def test_flat_overlay_basic_ping(self, vma_flat_overlay, vmb_flat_overlay_ip_address):
-        assert_ping_successful(
-            src_vm=vma_flat_overlay,
-            dst_ip=vmb_flat_overlay_ip_address,
+    def test_flat_overlay_basic_ping(self, flat_overlay_vma_vmb_nad, vma_flat_overlay, vmb_flat_overlay):
+        assert_ping_matrix_successful(
+            vms=[vma_flat_overlay, vmb_flat_overlay],
+            iface_name=flat_overlay_vma_vmb_nad.name,
         )
 
     @pytest.mark.polarion("CNV-10159")
@@ -1,57 +1,54 @@
-import json
+import ipaddress
 from typing import Final
 
-from libs.net.traffic_generator import IPERF_SERVER_PORT, TcpServer
+from libs.net.ip import filter_link_local_addresses
+from libs.net.traffic_generator import TrafficStats, TrafficStream, run_traffic
+from libs.net.vmspec import lookup_iface_status
 from libs.vm.vm import BaseVirtualMachine
 
 BANDWIDTH_SECONDARY_IFACE_NAME: Final[str] = "secondary"
 BANDWIDTH_RATE_BPS: Final[int] = 10_000_000  # 10 Mbps
 
 _IPERF_DURATION_SEC: Final[int] = 10
-_IPERF_TIMEOUT_BUFFER_SEC: Final[int] = 30  # extra buffer for iperf3 startup and output collection
 GUEST_2ND_IFACE_NAME: Final[str] = "eth1"
 
 
-def active_tcp_connection_output(
+def bidirectional_traffic_stats(
     server_vm: BaseVirtualMachine,
     client_vm: BaseVirtualMachine,
-    server_ip: str,
+    server_ip: ipaddress.IPv4Address | ipaddress.IPv6Address,
     duration: int = _IPERF_DURATION_SEC,
-) -> dict:
-    """Run a timed iperf3 bidirectional session and return the parsed JSON result.
+) -> tuple[TrafficStats, TrafficStats]:
+    """Run timed TCP traffic in both directions at once between the VMs secondary interfaces.
 
     Args:
-        server_vm: VM running the iperf3 server.
-        client_vm: VM running the iperf3 client.
-        server_ip: IP address to bind the server and connect the client to.
+        server_vm: VM whose ingress and egress are measured.
+        client_vm: Peer VM, sending to and receiving from the server VM.
+        server_ip: Server VM secondary interface IP; the client VM IP of the same family is used.
         duration: Test duration in seconds.
 
     Returns:
-        Parsed iperf3 JSON output dict, e.g.::
-
-            {
-                "end": {
-                    "sum_received": {"bits_per_second": 9_500_000.0},
-                    "sum_received_bidir_reverse": {"bits_per_second": 9_300_000.0},
-                }
-            }
+        Traffic stats received by the server VM (ingress) and by the client VM (egress).
     """
-    with TcpServer(vm=server_vm, port=IPERF_SERVER_PORT, bind_ip=server_ip):
-        output = client_vm.console(
-            commands=[
-                f"iperf3 --client {server_ip} --time {duration} --port {IPERF_SERVER_PORT} --json --bidir 2>/dev/null"
-            ],
-            timeout=duration + _IPERF_TIMEOUT_BUFFER_SEC,
-        )
-    try:
-        lines = next(iter((output or {}).values()))
-    except StopIteration:
-        raise ValueError(f"No iperf3 output received for {server_ip}")
-    return json.loads("\n".join(lines[1:-1]))
+    client_iface = lookup_iface_status(vm=client_vm, iface_name=BANDWIDTH_SECONDARY_IFACE_NAME)
+    client_ip = next(
+        ip
+        for ip in filter_link_local_addresses(ip_addresses=client_iface.ipAddresses)
+        if ip.version == server_ip.version
+    )
+    ingress_stats, egress_stats = run_traffic(
+        streams=[
+            TrafficStream(server_vm=server_vm, server_ip=str(server_ip), client=client_vm),
+            TrafficStream(server_vm=client_vm, server_ip=str(client_ip), client=server_vm),
+        ],
+        duration=duration,
+    )
+    return ingress_stats, egress_stats
 
 
 def assert_bidir_throughput_within_limit(
-    iperf3_json_report: dict,
+    ingress_stats: TrafficStats,
+    egress_stats: TrafficStats,
     rate_bps: int,
     tolerance: float,
     server_ip: str,
@@ -59,22 +56,14 @@ def assert_bidir_throughput_within_limit(
     """Assert that measured bidirectional throughput does not exceed the configured limit.
 
     Args:
-        iperf3_json_report: Parsed iperf3 JSON output dict, e.g.::
-
-            {
-                "end": {
-                    "sum_received": {"bits_per_second": 9_500_000.0},
-                    "sum_received_bidir_reverse": {"bits_per_second": 9_300_000.0},
-                }
-            }
-
+        ingress_stats: Traffic stats received by the server VM.
+        egress_stats: Traffic stats sent by the server VM.
         rate_bps: Configured bandwidth limit in bits per second.
         tolerance: Multiplier applied to the rate limit (e.g. 1.1 for 10% tolerance).
         server_ip: Server IP address used in the test session (for error messages).
     """
-    for direction, key in [("ingress", "sum_received"), ("egress", "sum_received_bidir_reverse")]:
-        throughput_bps = iperf3_json_report["end"][key]["bits_per_second"]
-        assert throughput_bps <= rate_bps * tolerance, (
-            f"Measured {direction} throughput {throughput_bps:.0f} bps exceeds "
-            f"configured limit {rate_bps} bps for {server_ip}"
+    for direction, stats in [("ingress", ingress_stats), ("egress", egress_stats)]:
+        assert stats.bits_per_second <= rate_bps * tolerance, (
+            f"Measured {direction} throughput {stats.bits_per_second:.0f} bps exceeds "
+            f"configured limit {rate_bps} bps for {server_ip} (p90 {stats.throughput_percentiles.get(90)} bps)"
         )
@@ -14,8 +14,8 @@ from libs.net.vmspec import lookup_iface_status
 from tests.network.l2_bridge.bandwidth.lib_helpers import (
     BANDWIDTH_RATE_BPS,
     BANDWIDTH_SECONDARY_IFACE_NAME,
-    active_tcp_connection_output,
     assert_bidir_throughput_within_limit,
+    bidirectional_traffic_stats,
 )
 
 _BANDWIDTH_TOLERANCE: Final[float] = 1.1
@@ -39,7 +39,7 @@ def test_bandwidth_limit_enforced_on_secondary_interface(
 
     Steps:
         1. For each IP address on the server VM's secondary interface (based on the cluster network stack):
-            a. Run a 10-second bidirectional iperf3 TCP session simultaneously between the client and server VMs
+            a. Run 10-second iperf3 TCP sessions in both directions simultaneously between the client and server VMs
             b. Measure the average received throughput in both directions
 
     Expected:
@@ -50,13 +50,14 @@ def test_bandwidth_limit_enforced_on_secondary_interface(
     iface = lookup_iface_status(vm=server_vm, iface_name=BANDWIDTH_SECONDARY_IFACE_NAME)
     for server_ip in filter_link_local_addresses(ip_addresses=iface.ipAddresses):
         with subtests.test(msg=f"Bandwidth limit for {server_ip}"):
-            json_output = active_tcp_connection_output(
+            ingress_stats, egress_stats = bidirectional_traffic_stats(
                 server_vm=server_vm,
                 client_vm=client_vm,
-                server_ip=str(server_ip),
+                server_ip=server_ip,
             )
             assert_bidir_throughput_within_limit(
-                iperf3_json_report=json_output,
+                ingress_stats=ingress_stats,
+                egress_stats=egress_stats,
                 rate_bps=BANDWIDTH_RATE_BPS,
                 tolerance=_BANDWIDTH_TOLERANCE,
                 server_ip=str(server_ip),
@@ -12,7 +12,7 @@ from libs.net.vmspec import lookup_iface_status_ip
 from libs.vm.affinity import new_pod_affinity
 from libs.vm.vm import BaseVirtualMachine
 from tests.network.l2_bridge.libl2bridge import secondary_network_vm
-from tests.network.libs.stuntime import CLIENT_VM_LABEL, SERVER_VM_LABEL, ContinuousPing
+from tests.network.libs.stuntime import CLIENT_VM_LABEL, SERVER_VM_LABEL, ContinuousPing, continuous_pings
 
 STUNTIME_BRIDGE_IFACE_NAME: Final[str] = "stuntime-bridge"
 
@@ -99,19 +99,18 @@ def l2_bridge_ip_family(request: pytest.FixtureRequest) -> int:
 
 
 @pytest.fixture()
-def l2_bridge_active_ping(
+def l2_bridge_active_pings(
     l2_bridge_ip_family: int,
     stuntime_server_vm: BaseVirtualMachine,
     stuntime_client_vm: BaseVirtualMachine,
-) -> Generator[ContinuousPing]:
-    """Continuous ping session from client to server for stuntime measurement."""
-    server_ip = str(
-        lookup_iface_status_ip(
-            vm=stuntime_server_vm,
-            iface_name=STUNTIME_BRIDGE_IFACE_NAME,
-            ip_family=l2_bridge_ip_family,
-        )
+) -> Generator[list[ContinuousPing]]:
+    """Continuous ping sessions from client to server and from server to client for stuntime measurement."""
+    server_ip, client_ip = (
+        str(lookup_iface_status_ip(vm=vm, iface_name=STUNTIME_BRIDGE_IFACE_NAME, ip_family=l2_bridge_ip_family))
+        for vm in (stuntime_server_vm, stuntime_client_vm)
     )
 
-    with ContinuousPing(source_vm=stuntime_client_vm, destination_ip=server_ip) as ping:
-        yield ping
+    with continuous_pings(
+        source_destination_pairs=[(stuntime_client_vm, server_ip), (stuntime_server_vm, client_ip)]
+    ) as pings:
+        yield pings
@@ -6,12 +6,14 @@ secondary network, for both IPv4 and IPv6, for regression detection.
 Stuntime is defined as the connectivity gap from last successful reply before loss
 to first successful reply after recovery.
 
-Stuntime is measured using continuous ICMP ping from client to server.
+Stuntime is measured using continuous ICMP pings from client to server and from server to client, and is the
+largest gap of both directions.
 The under-test VMs are configured with a secondary Linux bridge interface,
 on which IPv4/IPv6 static addresses will be defined according to the environment the test runs on.
 
 Client - The connectivity initiator VM that runs continuous ping toward the server VM.
-Server - The connectivity listener VM that receives the ping and responds.
+Server - The connectivity listener VM that receives the ping and responds, and runs continuous ping toward the
+         client VM to measure the return path.
 
 STP: https://github.com/RedHatQE/openshift-virtualization-tests-design-docs/blob/main/stps/sig-network/stuntime_measurement.md
 """
@@ -49,7 +51,7 @@ Preconditions:
 class TestMigrationStuntime:
     @pytest.mark.polarion("CNV-15252")
     def test_client_migrates_off_server_node(
-        self, admin_client, l2_bridge_ip_family, stuntime_client_vm, l2_bridge_active_ping
+        self, admin_client, l2_bridge_ip_family, stuntime_client_vm, l2_bridge_active_pings
     ):
         """
         Test that measured stuntime does not exceed the global threshold when the client
@@ -59,27 +61,27 @@ class TestMigrationStuntime:
             - Under-test server VM on Linux bridge secondary network, for the parametrized IP family.
             - Under-test client VM on Linux bridge secondary network, for that same IP family,
               running on the same node as the server VM.
-            - Ping initiated from the client to the server.
+            - Pings initiated from the client to the server and from the server to the client.
 
         Steps:
             1. Initiate live migration of the client VM to a node different from the node hosting the server VM
                and wait for migration completion.
-            2. Stop the continuous ping.
-            3. Compute stuntime from the ping results.
+            2. Stop the continuous pings.
+            3. Compute stuntime, the largest gap of both directions, from the ping results.
 
         Expected:
             - Measured stuntime does not exceed the global threshold.
         """
         stuntime_client_vm.set_template_affinity(affinity=new_pod_anti_affinity(label=SERVER_VM_LABEL))
         migrate_vm_and_verify(vm=stuntime_client_vm, client=admin_client)
-        measured_stuntime = measure_stuntime(active_ping=l2_bridge_active_ping)
+        measured_stuntime = measure_stuntime(active_pings=l2_bridge_active_pings)
         assert measured_stuntime <= STUNTIME_THRESHOLD_SECONDS, (
             f"Stuntime {measured_stuntime}s exceeds threshold ({STUNTIME_THRESHOLD_SECONDS}s)"
         )
 
     @pytest.mark.polarion("CNV-15253")
     def test_client_migrates_between_non_server_nodes(
-        self, admin_client, l2_bridge_ip_family, stuntime_client_vm, l2_bridge_active_ping
+        self, admin_client, l2_bridge_ip_family, stuntime_client_vm, l2_bridge_active_pings
     ):
         """
         Test that measured stuntime does not exceed the global threshold when the client VM migrates between nodes
@@ -89,26 +91,26 @@ class TestMigrationStuntime:
             - Under-test server VM on Linux bridge secondary network, for the parametrized IP family.
             - Under-test client VM on Linux bridge secondary network, for that same IP family,
               running on a worker node other than the node hosting the server VM.
-            - Ping initiated from the client to the server.
+            - Pings initiated from the client to the server and from the server to the client.
 
         Steps:
             1. Initiate live migration of the client VM to a node different from the node hosting the server VM
                and wait for migration completion.
-            2. Stop the continuous ping.
-            3. Compute stuntime from the ping results.
+            2. Stop the continuous pings.
+            3. Compute stuntime, the largest gap of both directions, from the ping results.
 
         Expected:
             - Measured stuntime does not exceed the global threshold.
         """
         migrate_vm_and_verify(vm=stuntime_client_vm, client=admin_client)
-        measured_stuntime = measure_stuntime(active_ping=l2_bridge_active_ping)
+        measured_stuntime = measure_stuntime(active_pings=l2_bridge_active_pings)
         assert measured_stuntime <= STUNTIME_THRESHOLD_SECONDS, (
             f"Stuntime {measured_stuntime}s exceeds threshold ({STUNTIME_THRESHOLD_SECONDS}s)"
         )
 
     @pytest.mark.polarion("CNV-15254")
     def test_client_migrates_to_server_node(
-        self, admin_client, l2_bridge_ip_family, stuntime_client_vm, l2_bridge_active_ping
+        self, admin_client, l2_bridge_ip_family, stuntime_client_vm, l2_bridge_active_pings
     ):
         """
         Test that measured stuntime does not exceed the global threshold when the client VM migrates
@@ -118,27 +120,27 @@ class TestMigrationStuntime:
             - Under-test server VM on Linux bridge secondary network, for the parametrized IP family.
             - Under-test client VM on Linux bridge secondary network, for that same IP family,
               running on a worker node other than the node hosting the server VM.
-            - Ping initiated from the client to the server.
+            - Pings initiated from the client to the server and from the server to the client.
 
         Steps:
             1. Initiate live migration of the client VM to the node hosting the server VM
                and wait for migration completion.
-            2. Stop the continuous ping.
-            3. Compute stuntime from the ping results.
+            2. Stop the continuous pings.
+            3. Compute stuntime, the largest gap of both directions, from the ping results.
 
         Expected:
             - Measured stuntime does not exceed the global threshold.
         """
         stuntime_client_vm.set_template_affinity(affinity=new_pod_affinity(label=SERVER_VM_LABEL))
         migrate_vm_and_verify(vm=stuntime_client_vm, client=admin_client)
-        measured_stuntime = measure_stuntime(active_ping=l2_bridge_active_ping)
+        measured_stuntime = measure_stuntime(active_pings=l2_bridge_active_pings)
         assert measured_stuntime <= STUNTIME_THRESHOLD_SECONDS, (
             f"Stuntime {measured_stuntime}s exceeds threshold ({STUNTIME_THRESHOLD_SECONDS}s)"
         )
 
     @pytest.mark.polarion("CNV-15255")
     def test_server_migrates_off_client_node(
-        self, admin_client, l2_bridge_ip_family, stuntime_server_vm, l2_bridge_active_ping
+        self, admin_client, l2_bridge_ip_family, stuntime_server_vm, l2_bridge_active_pings
     ):
         """
         Test that measured stuntime does not exceed the global threshold when the server
@@ -148,27 +150,27 @@ class TestMigrationStuntime:
             - Under-test server VM on Linux bridge secondary network, for the parametrized IP family.
             - Under-test client VM on Linux bridge secondary network, for that same IP family,
               running on the same node as the server VM.
-            - Ping initiated from the client to the server.
+            - Pings initiated from the client to the server and from the server to the client.
 
         Steps:
             1. Initiate live migration of the server VM to a node different from the node hosting the client VM
                and wait for migration completion.
-            2. Stop the continuous ping.
-            3. Compute stuntime from the ping results.
+            2. Stop the continuous pings.
+            3. Compute stuntime, the largest gap of both directions, from the ping results.
 
         Expected:
             - Measured stuntime does not exceed the global threshold.
         """
         stuntime_server_vm.set_template_affinity(affinity=new_pod_anti_affinity(label=CLIENT_VM_LABEL))
         migrate_vm_and_verify(vm=stuntime_server_vm, client=admin_client)
-        measured_stuntime = measure_stuntime(active_ping=l2_bridge_active_ping)
+        measured_stuntime = measure_stuntime(active_pings=l2_bridge_active_pings)
         assert measured_stuntime <= STUNTIME_THRESHOLD_SECONDS, (
             f"Stuntime {measured_stuntime}s exceeds threshold ({STUNTIME_THRESHOLD_SECONDS}s)"
         )
 
     @pytest.mark.polarion("CNV-15256")
     def test_server_migrates_between_non_client_nodes(
-        self, admin_client, l2_bridge_ip_family, stuntime_server_vm, l2_bridge_active_ping
+        self, admin_client, l2_bridge_ip_family, stuntime_server_vm, l2_bridge_active_pings
     ):
         """
         Test that measured stuntime does not exceed the global threshold when the server VM migrates between nodes
@@ -178,27 +180,27 @@ class TestMigrationStuntime:
             - Under-test server VM on Linux bridge secondary network, for the parametrized IP family.
             - Under-test client VM on Linux bridge secondary network, for that same IP family,
               running on a worker node other than the node hosting the server VM (before and after migration).
-            - Ping initiated from the client to the server.
+            - Pings initiated from the client to the server and from the server to the client.
 
         Steps:
             1. Initiate live migration of the server VM to a node different from the node hosting the client VM
                and wait for migration completion.
-            2. Stop the continuous ping.
-            3. Compute stuntime from the ping results.
+            2. Stop the continuous pings.
+            3. Compute stuntime, the largest gap of both directions, from the ping results.
 
         Expected:
             - Measured stuntime does not exceed the global threshold.
         """
         stuntime_server_vm.set_template_affinity(affinity=new_pod_anti_affinity(label=CLIENT_VM_LABEL))
         migrate_vm_and_verify(vm=stuntime_server_vm, client=admin_client)
-        measured_stuntime = measure_stuntime(active_ping=l2_bridge_active_ping)
+        measured_stuntime = measure_stuntime(active_pings=l2_bridge_active_pings)
         assert measured_stuntime <= STUNTIME_THRESHOLD_SECONDS, (
             f"Stuntime {measured_stuntime}s exceeds threshold ({STUNTIME_THRESHOLD_SECONDS}s)"
         )
 
     @pytest.mark.polarion("CNV-15257")
     def test_server_migrates_to_client_node(
-        self, admin_client, l2_bridge_ip_family, stuntime_server_vm, l2_bridge_active_ping
+        self, admin_client, l2_bridge_ip_family, stuntime_server_vm, l2_bridge_active_pings
     ):
         """
         Test that measured stuntime does not exceed the global threshold when the server VM migrates from a node
@@ -208,20 +210,20 @@ class TestMigrationStuntime:
             - Under-test server VM on Linux bridge secondary network, for the parametrized IP family.
             - Under-test client VM on Linux bridge secondary network, for that same IP family,
               running on a worker node other than the node hosting the server VM.
-            - Ping initiated from the client to the server.
+            - Pings initiated from the client to the server and from the server to the client.
 
         Steps:
             1. Initiate live migration of the server VM to the node hosting the client VM
                and wait for migration completion.
-            2. Stop the continuous ping.
-            3. Compute stuntime from the ping results.
+            2. Stop the continuous pings.
+            3. Compute stuntime, the largest gap of both directions, from the ping results.
 
         Expected:
             - Measured stuntime does not exceed the global threshold.
         """
         stuntime_server_vm.set_template_affinity(affinity=new_pod_affinity(label=CLIENT_VM_LABEL))
         migrate_vm_and_verify(vm=stuntime_server_vm, client=admin_client)
-        measured_stuntime = measure_stuntime(active_ping=l2_bridge_active_ping)
+        measured_stuntime = measure_stuntime(active_pings=l2_bridge_active_pings)
         assert measured_stuntime <= STUNTIME_THRESHOLD_SECONDS, (
             f"Stuntime {measured_stuntime}s exceeds threshold ({STUNTIME_THRESHOLD_SECONDS}s)"
         )
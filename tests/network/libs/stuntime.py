@@ -2,9 +2,13 @@
 
 import ipaddress
 import logging
-import re
+from collections.abc import Generator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
 from typing import Final, Self
 
+from libs.net.traffic_generator import percentiles
 from libs.vm.vm import BaseVirtualMachine
 from tests.network.libs.connectivity import build_ping_command
 
@@ -14,8 +18,14 @@ STUNTIME_LABEL_KEY: Final[str] = "stuntime.test"
 SERVER_VM_LABEL: Final[tuple[str, str]] = (STUNTIME_LABEL_KEY, "server")
 CLIENT_VM_LABEL: Final[tuple[str, str]] = (STUNTIME_LABEL_KEY, "client")
 STUNTIME_THRESHOLD_SECONDS: Final[float] = 5.0
-STUNTIME_PING_LOG_PATH: Final[str] = "/tmp/stuntime-ping.log"
+STUNTIME_PING_LOG_PATH: Final[str] = "/tmp/stuntime-ping-{destination_ip}.log"
 PING_INTERVAL_SECONDS: Final[float] = 0.01
+# Intervals between consecutive replies longer than this missed at least one reply, and count as gaps
+GAP_MIN_SECONDS: Final[float] = 1.5 * PING_INTERVAL_SECONDS
+STUNTIME_PERCENTILES: Final[tuple[int, ...]] = (50, 90, 99)
+_GAPS_TAG: Final[str] = "stuntime"
+# Appended to the ping log by stop(), with the time the session was stopped
+_STOP_MARKER: Final[str] = "stuntime-stopped"
 DEFAULT_COMMAND_TIMEOUT_SECONDS: Final[int] = 10
 
 
@@ -23,14 +33,44 @@ class InsufficientStuntimeDataError(ValueError):
     """Raised when ping log has too few successful replies to compute stuntime."""
 
 
+@dataclass(frozen=True)
+class StuntimeReport:
+    """Connectivity gaps of a continuous ping session, from the timestamps of its replies.
+
+    Attributes:
+        destination_ip: Pinged IP address.
+        replies: Number of received replies.
+        gaps: (timestamp of the last reply before the gap, gap duration) of each interval between consecutive
+            replies longer than GAP_MIN_SECONDS, in seconds. An outage still ongoing when the session was stopped
+            is a gap from the last reply to the stop time.
+    """
+
+    destination_ip: str
+    replies: int
+    gaps: list[tuple[float, float]]
+
+    @property
+    def stuntime(self) -> float:
+        """The largest gap in seconds, or 0.0 when no reply was missed."""
+        return max((duration for _, duration in self.gaps), default=0.0)
+
+    @property
+    def gap_percentiles(self) -> dict[int, float]:
+        """Percentiles (STUNTIME_PERCENTILES) of the gap durations in seconds; empty when there are no gaps."""
+        return percentiles(values=[duration for _, duration in self.gaps], percents=STUNTIME_PERCENTILES)
+
+
 class ContinuousPing:
     """Context manager for continuous ping monitoring during VM operations.
 
+    Each reply is logged with its timestamp (ping -D), so the connectivity gaps are measured exactly rather
+    than derived from the lost packets count.
+
     Example:
         >>> with ContinuousPing(source_vm=client_vm, destination_ip=server_ip) as ping:
         ...     migrate_vm_and_verify(vm=client_vm, client=admin_client)
         ...     ping.stop()
-        ...     transmitted, received, lost = ping.report()
+        ...     stuntime = ping.stuntime_report().stuntime
     """
 
     def __init__(self, source_vm: BaseVirtualMachine, destination_ip: str):
@@ -43,16 +83,16 @@ class ContinuousPing:
         self._vm = source_vm
         self._destination_ip = destination_ip
         self._cmd = self._build_ping_cmd()
+        self._log_path = STUNTIME_PING_LOG_PATH.format(destination_ip=destination_ip)
+        self._stopped = False
 
     def __enter__(self) -> Self:
         self._verify_ping_reaches_destination()
         self._vm.console(
-            commands=[f"{self._cmd} >{STUNTIME_PING_LOG_PATH} 2>&1 &"],
+            commands=[f"{self._cmd} >{self._log_path} 2>&1 &"],
             timeout=DEFAULT_COMMAND_TIMEOUT_SECONDS,
         )
-        LOGGER.info(
-            f"Started continuous ping from {self._vm.name} to {self._destination_ip} (log {STUNTIME_PING_LOG_PATH})"
-        )
+        LOGGER.info(f"Started continuous ping from {self._vm.name} to {self._destination_ip} (log {self._log_path})")
         return self
 
     def __exit__(
@@ -61,38 +101,65 @@ class ContinuousPing:
         self.stop()
 
     def stop(self) -> None:
-        # Use SIGINT (not default SIGTERM) to ensure ping flushes statistics summary before exit
+        if self._stopped:
+            return
+
+        # Use SIGINT (not default SIGTERM) to ensure ping flushes statistics summary before exit.
+        # The stop time is taken before ping is stopped, and logged once it exited, to measure a trailing outage.
         self._vm.console(
             commands=[
+                "stop_ts=$(date +%s.%N); "
                 f"pkill -SIGINT -f '{self._cmd}' || true; "
-                f"while pgrep -f '{self._cmd}' >/dev/null 2>&1; do sleep 0.1; done"
+                f"while pgrep -f '{self._cmd}' >/dev/null 2>&1; do sleep 0.1; done; "
+                f'echo "[$stop_ts] {_STOP_MARKER}" >>{self._log_path}'
             ],
             timeout=DEFAULT_COMMAND_TIMEOUT_SECONDS,
         )
+        self._stopped = True
+
+    def stuntime_report(self) -> StuntimeReport:
+        """Extract the connectivity gaps from the reply timestamps of the ping log.
 
-    def report(self) -> tuple[int, int, int]:
-        """Extract packet statistics from ping log.
+        The gaps are computed in the guest, so only the gaps (not the whole log) are read over the console.
+        Call it after stop(), so an outage ongoing at the stop time is reported.
 
         Returns:
-            Tuple of (transmitted_packets, received_packets, lost_packets).
+            StuntimeReport: Replies count and gaps of the session.
 
         Raises:
-            InsufficientStuntimeDataError: When ping summary is missing.
+            InsufficientStuntimeDataError: When the log has less than 2 replies.
         """
-        cmd_tail = f"tail -n 3 {STUNTIME_PING_LOG_PATH}"
-        result = self._vm.console(commands=[cmd_tail], timeout=DEFAULT_COMMAND_TIMEOUT_SECONDS)
-        ping_summary = "\n".join(result[cmd_tail])
+        # Reply lines look like: [1700000000.123456] 64 bytes from 10.0.0.1: icmp_seq=1 ttl=64 time=0.3 ms
+        cmd_gaps = (
+            f"awk -v tag={_GAPS_TAG} -v min_gap={GAP_MIN_SECONDS} "
+            "'/bytes from/ { ts = substr($1, 2, length($1) - 2) + 0; "
+            'if (replies && ts - prev > min_gap) printf "%s-gap %.6f %.6f\\n", tag, prev, ts - prev; '
+            "prev = ts; replies++ } "
+            f"/{_STOP_MARKER}/ {{ stop_ts = substr($1, 2, length($1) - 2) + 0 }} "
+            'END { if (replies && stop_ts - prev > min_gap) printf "%s-gap %.6f %.6f\\n", tag, prev, stop_ts - prev; '
+            'printf "%s-replies %d\\n", tag, replies }\' '
+            f"{self._log_path}"
+        )
+        result = self._vm.console(commands=[cmd_gaps], timeout=DEFAULT_COMMAND_TIMEOUT_SECONDS)
 
-        summary_match = re.search(r"(\d+)\s+packets transmitted,\s+(\d+)\s+received", ping_summary)
-        if not summary_match:
-            raise InsufficientStuntimeDataError(f"Missing ping summary in log (got: {ping_summary})")
+        replies = 0
+        gaps = []
+        for line in result[cmd_gaps]:
+            if line.startswith(f"{_GAPS_TAG}-gap "):
+                _, start, duration = line.split()
+                gaps.append((float(start), float(duration)))
+            elif line.startswith(f"{_GAPS_TAG}-replies "):
+                replies = int(line.split()[1])
 
-        transmitted = int(summary_match.group(1))
-        received = int(summary_match.group(2))
-        lost = transmitted - received
+        if replies < 2:
+            raise InsufficientStuntimeDataError(f"Only {replies} ping replies in {self._log_path}")
 
-        LOGGER.info(f"Ping report: transmitted={transmitted}, received={received}, lost={lost}")
-        return transmitted, received, lost
+        report = StuntimeReport(destination_ip=self._destination_ip, replies=replies, gaps=gaps)
+        LOGGER.info(
+            f"Ping to {self._destination_ip}: {replies} replies, {len(gaps)} gaps, "
+            f"largest {report.stuntime:.3f}s, percentiles {report.gap_percentiles}"
+        )
+        return report
 
     def _build_ping_cmd(self) -> str:
         """Build the continuous ping command with necessary flags.
@@ -102,7 +169,7 @@ class ContinuousPing:
         """
         ip = ipaddress.ip_address(address=self._destination_ip)
         ping_ipv6_flag = " -6" if ip.version == 6 else ""
-        return f"ping{ping_ipv6_flag} -O -i {PING_INTERVAL_SECONDS} {self._destination_ip}"
+        return f"ping{ping_ipv6_flag} -D -O -i {PING_INTERVAL_SECONDS} {self._destination_ip}"
 
     def _verify_ping_reaches_destination(self) -> None:
         """Verify network connectivity from source VM to destination IP."""
@@ -114,30 +181,53 @@ class ContinuousPing:
         )
 
 
-def measure_stuntime(active_ping: ContinuousPing) -> float:
-    """Stop a continuous ping session and compute the stuntime.
+@contextmanager
+def continuous_pings(
+    source_destination_pairs: Sequence[tuple[BaseVirtualMachine, str]],
+) -> Generator[list[ContinuousPing]]:
+    """Run continuous ping sessions for several VM pairs at once, e.g. during mass migrations.
 
     Args:
-        active_ping: Active ContinuousPing session to stop and evaluate.
+        source_destination_pairs: (source VM, destination IP) of each session.
+
+    Yields:
+        list[ContinuousPing]: Active sessions, in the order of the pairs.
+    """
+    with ExitStack() as stack:
+        yield [
+            stack.enter_context(ContinuousPing(source_vm=source_vm, destination_ip=destination_ip))
+            for source_vm, destination_ip in source_destination_pairs
+        ]
+
+
+def measure_stuntimes(active_pings: Sequence[ContinuousPing]) -> list[StuntimeReport]:
+    """Stop continuous ping sessions and compute their gaps, through the consoles of all VMs concurrently.
+
+    Args:
+        active_pings: Active ContinuousPing sessions, with different source VMs.
 
     Returns:
-        Measured stuntime in seconds.
+        list[StuntimeReport]: Report of each session, in the order of the sessions.
     """
-    active_ping.stop()
-    _, _, lost = active_ping.report()
-    return _compute_stuntime(lost_packets=lost)
+
+    def _stop_and_report(active_ping: ContinuousPing) -> StuntimeReport:
+        active_ping.stop()
+        return active_ping.stuntime_report()
+
+    with ThreadPoolExecutor(max_workers=max(1, len(active_pings))) as executor:
+        return list(executor.map(_stop_and_report, active_pings))
 
 
-def _compute_stuntime(lost_packets: int) -> float:
-    """Compute stuntime from lost packet count.
+def measure_stuntime(active_pings: Sequence[ContinuousPing]) -> float:
+    """Stop continuous ping sessions and compute the stuntime.
 
     Args:
-        lost_packets: Number of packets lost during migration.
+        active_pings: Active ContinuousPing sessions, e.g. both directions between a client and a server VM.
 
     Returns:
-        Stuntime in seconds (connectivity gap).
+        Measured stuntime in seconds: the largest gap of all sessions, between consecutive replies or from the last
+        reply to the stop time when connectivity did not recover.
     """
-    # Add +1 to account for the gap from last successful reply before loss to first successful reply after recovery
-    stuntime = 0.0 if lost_packets == 0 else (lost_packets + 1) * PING_INTERVAL_SECONDS
-    LOGGER.info(f"Stuntime: {stuntime:.2f}s (from {lost_packets} lost packets)")
+    stuntime = max(report.stuntime for report in measure_stuntimes(active_pings=active_pings))
+    LOGGER.info(f"Stuntime: {stuntime:.3f}s")
     return stuntime
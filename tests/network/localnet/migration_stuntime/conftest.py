@@ -11,7 +11,7 @@ from libs.vm.spec import Interface, Multus, Network
 from libs.vm.vm import BaseVirtualMachine
 from tests.network.libs import cloudinit
 from tests.network.libs import cluster_user_defined_network as libcudn
-from tests.network.libs.stuntime import CLIENT_VM_LABEL, SERVER_VM_LABEL, ContinuousPing
+from tests.network.libs.stuntime import CLIENT_VM_LABEL, SERVER_VM_LABEL, ContinuousPing, continuous_pings
 from tests.network.localnet.liblocalnet import (
     GUEST_1ST_IFACE_NAME,
     LOCALNET_OVS_BRIDGE_INTERFACE,
@@ -100,19 +100,18 @@ def localnet_stuntime_client_vm(
 
 
 @pytest.fixture()
-def active_ping(
+def active_pings(
     ip_family: int,
     localnet_stuntime_server_vm: BaseVirtualMachine,
     localnet_stuntime_client_vm: BaseVirtualMachine,
-) -> Generator[ContinuousPing]:
-    """Continuous ping session from client to server for stuntime measurement."""
-    server_ip = str(
-        lookup_iface_status_ip(
-            vm=localnet_stuntime_server_vm,
-            iface_name=LOCALNET_OVS_BRIDGE_INTERFACE,
-            ip_family=ip_family,
-        )
+) -> Generator[list[ContinuousPing]]:
+    """Continuous ping sessions from client to server and from server to client for stuntime measurement."""
+    server_ip, client_ip = (
+        str(lookup_iface_status_ip(vm=vm, iface_name=LOCALNET_OVS_BRIDGE_INTERFACE, ip_family=ip_family))
+        for vm in (localnet_stuntime_server_vm, localnet_stuntime_client_vm)
     )
 
-    with ContinuousPing(source_vm=localnet_stuntime_client_vm, destination_ip=server_ip) as ping:
-        yield ping
+    with continuous_pings(
+        source_destination_pairs=[(localnet_stuntime_client_vm, server_ip), (localnet_stuntime_server_vm, client_ip)]
+    ) as pings:
+        yield pings
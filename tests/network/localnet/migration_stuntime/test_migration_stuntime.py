@@ -6,12 +6,14 @@ secondary network, for both IPv4 and IPv6, for regression detection.
 Stuntime is defined as the connectivity gap from last successful reply before loss
 to first successful reply after recovery.
 
-Stuntime is measured using continuous ICMP ping from client to server.
+Stuntime is measured using continuous ICMP pings from client to server and from server to client, and is the
+largest gap of both directions.
 The under-test VMs are configured on an OVN localnet secondary network, with a single interface,
 on which IPv4/IPv6 static addresses will be defined according to the environment the test runs on.
 
 Client - The connectivity initiator VM that runs continuous ping toward the server VM.
-Server - The connectivity listener VM that receives the ping and responds.
+Server - The connectivity listener VM that receives the ping and responds, and runs continuous ping toward the
+         client VM to measure the return path.
 
 STP: https://github.com/RedHatQE/openshift-virtualization-tests-design-docs/blob/main/stps/sig-network/stuntime_measurement.md
 """
@@ -55,7 +57,7 @@ class TestMigrationStuntime:
     """
 
     @pytest.mark.polarion("CNV-15258")
-    def test_client_migrates_off_server_node(self, admin_client, ip_family, localnet_stuntime_client_vm, active_ping):
+    def test_client_migrates_off_server_node(self, admin_client, ip_family, localnet_stuntime_client_vm, active_pings):
         """
         Test that measured stuntime does not exceed the global threshold when the client
         VM migrates from the node hosting the server VM into a different node.
@@ -64,27 +66,27 @@ class TestMigrationStuntime:
             - Under-test server VM on OVN localnet secondary network, for the IP family from ip_family parametrization.
             - Under-test client VM on OVN localnet secondary network, for that same IP family,
               running on the same node as the server VM.
-            - Ping initiated from the client to the server.
+            - Pings initiated from the client to the server and from the server to the client.
 
         Steps:
             1. Initiate live migration of the client VM to a node different from the node hosting the server VM
                and wait for migration completion.
-            2. Stop the continuous ping.
-            3. Compute stuntime from the ping results.
+            2. Stop the continuous pings.
+            3. Compute stuntime, the largest gap of both directions, from the ping results.
 
         Expected:
             - Measured stuntime does not exceed the global threshold.
         """
         localnet_stuntime_client_vm.set_template_affinity(affinity=new_pod_anti_affinity(label=SERVER_VM_LABEL))
         migrate_vm_and_verify(vm=localnet_stuntime_client_vm, client=admin_client)
-        measured_stuntime = measure_stuntime(active_ping=active_ping)
+        measured_stuntime = measure_stuntime(active_pings=active_pings)
         assert measured_stuntime <= STUNTIME_THRESHOLD_SECONDS, (
             f"Stuntime {measured_stuntime}s exceeds threshold ({STUNTIME_THRESHOLD_SECONDS}s)"
         )
 
     @pytest.mark.polarion("CNV-15259")
     def test_client_migrates_between_non_server_nodes(
-        self, admin_client, ip_family, localnet_stuntime_client_vm, active_ping
+        self, admin_client, ip_family, localnet_stuntime_client_vm, active_pings
     ):
         """
         Test that measured stuntime does not exceed the global threshold when the client VM migrates between nodes
@@ -94,25 +96,25 @@ class TestMigrationStuntime:
             - Under-test server VM on OVN localnet secondary network, for the IP family from ip_family parametrization.
             - Under-test client VM on OVN localnet secondary network, for that same IP family,
               running on a worker node other than the node hosting the server VM.
-            - Ping initiated from the client to the server.
+            - Pings initiated from the client to the server and from the server to the client.
 
         Steps:
             1. Initiate live migration of the client VM to a node different from the node hosting the server VM
                and wait for migration completion.
-            2. Stop the continuous ping.
-            3. Compute stuntime from the ping results.
+            2. Stop the continuous pings.
+            3. Compute stuntime, the largest gap of both directions, from the ping results.
 
         Expected:
             - Measured stuntime does not exceed the global threshold.
         """
         migrate_vm_and_verify(vm=localnet_stuntime_client_vm, client=admin_client)
-        measured_stuntime = measure_stuntime(active_ping=active_ping)
+        measured_stuntime = measure_stuntime(active_pings=active_pings)
         assert measured_stuntime <= STUNTIME_THRESHOLD_SECONDS, (
             f"Stuntime {measured_stuntime}s exceeds threshold ({STUNTIME_THRESHOLD_SECONDS}s)"
         )
 
     @pytest.mark.polarion("CNV-15260")
-    def test_client_migrates_to_server_node(self, admin_client, ip_family, localnet_stuntime_client_vm, active_ping):
+    def test_client_migrates_to_server_node(self, admin_client, ip_family, localnet_stuntime_client_vm, active_pings):
         """
         Test that measured stuntime does not exceed the global threshold when the client VM migrates
         from a node other than the node hosting the server VM onto the node hosting the server VM.
@@ -121,26 +123,26 @@ class TestMigrationStuntime:
             - Under-test server VM on OVN localnet secondary network, for the IP family from ip_family parametrization.
             - Under-test client VM on OVN localnet secondary network, for that same IP family,
               running on a worker node other than the node hosting the server VM.
-            - Ping initiated from the client to the server.
+            - Pings initiated from the client to the server and from the server to the client.
 
         Steps:
             1. Initiate live migration of the client VM to the node hosting the server VM
                and wait for migration completion.
-            2. Stop the continuous ping.
-            3. Compute stuntime from the ping results.
+            2. Stop the continuous pings.
+            3. Compute stuntime, the largest gap of both directions, from the ping results.
 
         Expected:
             - Measured stuntime does not exceed the global threshold.
         """
         localnet_stuntime_client_vm.set_template_affinity(affinity=new_pod_affinity(label=SERVER_VM_LABEL))
         migrate_vm_and_verify(vm=localnet_stuntime_client_vm, client=admin_client)
-        measured_stuntime = measure_stuntime(active_ping=active_ping)
+        measured_stuntime = measure_stuntime(active_pings=active_pings)
         assert measured_stuntime <= STUNTIME_THRESHOLD_SECONDS, (
             f"Stuntime {measured_stuntime}s exceeds threshold ({STUNTIME_THRESHOLD_SECONDS}s)"
         )
 
     @pytest.mark.polarion("CNV-15261")
-    def test_server_migrates_off_client_node(self, admin_client, ip_family, localnet_stuntime_server_vm, active_ping):
+    def test_server_migrates_off_client_node(self, admin_client, ip_family, localnet_stuntime_server_vm, active_pings):
         """
         Test that measured stuntime does not exceed the global threshold when the server
         VM migrates from the node hosting the client VM into a different node.
@@ -149,27 +151,27 @@ class TestMigrationStuntime:
             - Under-test server VM on OVN localnet secondary network, for the IP family from ip_family parametrization.
             - Under-test client VM on OVN localnet secondary network, for that same IP family,
               running on the same node as the server VM.
-            - Ping initiated from the client to the server.
+            - Pings initiated from the client to the server and from the server to the client.
 
         Steps:
             1. Initiate live migration of the server VM to a node different from the node hosting the client VM
                and wait for migration completion.
-            2. Stop the continuous ping.
-            3. Compute stuntime from the ping results.
+            2. Stop the continuous pings.
+            3. Compute stuntime, the largest gap of both directions, from the ping results.
 
         Expected:
             - Measured stuntime does not exceed the global threshold.
         """
         localnet_stuntime_server_vm.set_template_affinity(affinity=new_pod_anti_affinity(label=CLIENT_VM_LABEL))
         migrate_vm_and_verify(vm=localnet_stuntime_server_vm, client=admin_client)
-        measured_stuntime = measure_stuntime(active_ping=active_ping)
+        measured_stuntime = measure_stuntime(active_pings=active_pings)
         assert measured_stuntime <= STUNTIME_THRESHOLD_SECONDS, (
             f"Stuntime {measured_stuntime}s exceeds threshold ({STUNTIME_THRESHOLD_SECONDS}s)"
         )
 
     @pytest.mark.polarion("CNV-15262")
     def test_server_migrates_between_non_client_nodes(
-        self, admin_client, ip_family, localnet_stuntime_server_vm, active_ping
+        self, admin_client, ip_family, localnet_stuntime_server_vm, active_pings
     ):
         """
         Test that measured stuntime does not exceed the global threshold when the server VM migrates between nodes
@@ -179,26 +181,26 @@ class TestMigrationStuntime:
             - Under-test server VM on OVN localnet secondary network, for the IP family from ip_family parametrization.
             - Under-test client VM on OVN localnet secondary network, for that same IP family,
               running on a worker node other than the node hosting the server VM (before and after migration).
-            - Ping initiated from the client to the server.
+            - Pings initiated from the client to the server and from the server to the client.
 
         Steps:
             1. Initiate live migration of the server VM to a node different from the node hosting the client VM
                and wait for migration completion.
-            2. Stop the continuous ping.
-            3. Compute stuntime from the ping results.
+            2. Stop the continuous pings.
+            3. Compute stuntime, the largest gap of both directions, from the ping results.
 
         Expected:
             - Measured stuntime does not exceed the global threshold.
         """
         localnet_stuntime_server_vm.set_template_affinity(affinity=new_pod_anti_affinity(label=CLIENT_VM_LABEL))
         migrate_vm_and_verify(vm=localnet_stuntime_server_vm, client=admin_client)
-        measured_stuntime = measure_stuntime(active_ping=active_ping)
+        measured_stuntime = measure_stuntime(active_pings=active_pings)
         assert measured_stuntime <= STUNTIME_THRESHOLD_SECONDS, (
             f"Stuntime {measured_stuntime}s exceeds threshold ({STUNTIME_THRESHOLD_SECONDS}s)"
         )
 
     @pytest.mark.polarion("CNV-15263")
-    def test_server_migrates_to_client_node(self, admin_client, ip_family, localnet_stuntime_server_vm, active_ping):
+    def test_server_migrates_to_client_node(self, admin_client, ip_family, localnet_stuntime_server_vm, active_pings):
         """
         Test that measured stuntime does not exceed the global threshold when the server VM migrates from a node
         other than the node hosting the client VM onto the node hosting the client VM.
@@ -207,20 +209,20 @@ class TestMigrationStuntime:
             - Under-test server VM on OVN localnet secondary network, for the IP family from ip_family parametrization.
             - Under-test client VM on OVN localnet secondary network, for that same IP family,
               running on a worker node other than the node hosting the server VM.
-            - Ping initiated from the client to the server.
+            - Pings initiated from the client to the server and from the server to the client.
 
         Steps:
             1. Initiate live migration of the server VM to the node hosting the client VM
                and wait for migration completion.
-            2. Stop the continuous ping.
-            3. Compute stuntime from the ping results.
+            2. Stop the continuous pings.
+            3. Compute stuntime, the largest gap of both directions, from the ping results.
 
         Expected:
             - Measured stuntime does not exceed the global threshold.
         """
         localnet_stuntime_server_vm.set_template_affinity(affinity=new_pod_affinity(label=CLIENT_VM_LABEL))
         migrate_vm_and_verify(vm=localnet_stuntime_server_vm, client=admin_client)
-        measured_stuntime = measure_stuntime(active_ping=active_ping)
+        measured_stuntime = measure_stuntime(active_pings=active_pings)
         assert measured_stuntime <= STUNTIME_THRESHOLD_SECONDS, (
             f"Stuntime {measured_stuntime}s exceeds threshold ({STUNTIME_THRESHOLD_SECONDS}s)"
         )
@@ -59,7 +59,7 @@ from utilities.constants.timeouts import (
     TIMEOUT_30SEC,
     TIMEOUT_40MIN,
 )
-from utilities.monitoring import get_metrics_value
+from utilities.monitoring import get_metrics_value, get_prometheus_query_batcher
 from utilities.virt import VirtualMachineForTests, running_vm
 
 LOGGER = logging.getLogger(__name__)
@@ -90,12 +90,15 @@ def get_vm_metrics(prometheus: Prometheus, query: str, vm_name: str, timeout: in
     sampler = TimeoutSampler(
         wait_timeout=timeout,
         sleep=5,
-        func=prometheus.query_sampler,
+        func=get_prometheus_query_batcher(prometheus=prometheus).query,
         query=query,
     )
     sample = None
     try:
-        for sample in sampler:
+        for response in sampler:
+            if response.get("status") != "success":
+                continue
+            sample = response.get("data", {}).get("result", [])
             if sample and vm_name in [name.get("metric").get("name") for name in sample]:
                 return sample
     except TimeoutExpiredError:
@@ -768,6 +771,49 @@ def validate_metric_value_greater_than_initial_value(
         raise
 
 
+def validate_metrics_values_greater_than_initial_values(
+    prometheus: Prometheus,
+    initial_values: dict[str, float],
+    timeout: int = TIMEOUT_4MIN,
+) -> None:
+    """
+    Wait for all metrics to be greater than their initial values, fetching the metrics together on every sample.
+
+    Args:
+        prometheus (Prometheus): Prometheus object
+        initial_values (dict[str, float]): metric query to its initial value
+        timeout (int): Timeout value in seconds
+
+    Raise:
+        TimeoutExpiredError: if any of the metrics is not greater than its initial value in time
+    """
+    samples = TimeoutSampler(
+        wait_timeout=timeout,
+        sleep=TIMEOUT_15SEC,
+        func=get_prometheus_query_batcher(prometheus=prometheus).query_many,
+        queries=list(initial_values),
+    )
+    not_increased_metrics = None
+    try:
+        for responses in samples:
+            metrics_values = {
+                query: float(result[0]["value"][1]) if (result := response.get("data", {}).get("result")) else None
+                for query, response in responses.items()
+            }
+            not_increased_metrics = {
+                query: value
+                for query, value in metrics_values.items()
+                if value is None or value <= initial_values[query]
+            }
+            if not not_increased_metrics:
+                return
+    except TimeoutExpiredError:
+        LOGGER.error(
+            f"Metrics values should be greater than {initial_values}, not increased metrics: {not_increased_metrics}"
+        )
+        raise
+
+
 def vnic_info_from_vm_or_vmi(vm_or_vmi: str, vm: VirtualMachineForTests) -> dict[str, str]:
     vm_spec = vm.vmi.instance.spec if vm_or_vmi == "vmi" else vm.instance.spec.template.spec
     vm_interface = vm_spec.domain.devices.interfaces[0]
@@ -3,7 +3,6 @@ import logging
 import os
 import re
 import shlex
-import time
 from collections import Counter
 
 import pytest
@@ -18,6 +17,8 @@ from ocp_resources.virtual_machine_instance_migration import (
 from pyhelper_utils.shell import run_command
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 
+from libs.vm.parallel import DEFAULT_MAX_WORKERS
+from libs.vm.pipeline import DEFAULT_REQUESTS_PER_SECOND, run_vm_pipeline
 from tests.os_params import (
     FEDORA_LATEST,
     FEDORA_LATEST_LABELS,
@@ -50,6 +51,7 @@ from utilities.virt import (
     verify_vm_migrated,
     wait_for_migration_finished,
 )
+from utilities.vmi_fleet_monitor import VMIFleetMonitor
 
 LOGGER = logging.getLogger(__name__)
 OCS = "ocs"
@@ -80,19 +82,27 @@ def log_nodes_load_data(vms=None):
     LOGGER.info(f"Nodes load statistics:\n {nodes_load_statistics}")
 
 
-def all_vms_running(vms):
+def vm_pipeline_params(scale_test_param):
     """
-    Check if all VMIs are in running state
+    Get the VM creation pipeline limits from the scale params
 
     Args:
-        vms (list): List of vms to verify
+        scale_test_param (dict): scale params
 
     Returns:
-        bool: True if all vms in running state, False otherwise
+        dict: run_vm_pipeline rate and concurrency arguments
     """
-    num_of_running_vms = len([vm for vm in vms if vm.vmi.status == vm.Status.RUNNING])
-    LOGGER.info(f"Number of running vms: {num_of_running_vms}")
-    return num_of_running_vms == len(vms)
+    return {
+        "requests_per_second": scale_test_param.get("api_requests_per_second", DEFAULT_REQUESTS_PER_SECOND),
+        "burst": scale_test_param.get("api_requests_burst"),
+        "max_in_flight": scale_test_param.get("max_in_flight_requests", DEFAULT_MAX_WORKERS),
+    }
+
+
+def start_vm_if_not_always_running(vm):
+    # VMs with the Always run strategy are started on creation
+    if vm.run_strategy != vm.RunStrategy.ALWAYS:
+        vm.start()
 
 
 def delete_resources(resources):
@@ -385,64 +395,70 @@ class TestScale:
     def test_create_vms(
         self,
         fail_if_param_vms_zero,
-        scale_vms,
+        scale_test_param,
+        all_vms_objects,
     ):
         log_nodes_load_data()
-        for batch in scale_vms:
-            for vm in batch:
-                vm.deploy()
+        report = run_vm_pipeline(
+            vms=all_vms_objects,
+            steps=[lambda vm: vm.deploy()],
+            **vm_pipeline_params(scale_test_param=scale_test_param),
+        )
+        assert report.succeeded, f"Failed to create VMs: {[result.vm_name for result in report.failures]}"
 
     @pytest.mark.dependency(
         name="test_start_vms",
         depends=["test_create_vms"],
     )
     @pytest.mark.polarion("CNV-8448")
-    def test_start_vms(self, scale_test_param, scale_vms, all_vms_objects, must_gather_image_url):
-        for batch in scale_vms:
-            for vm in batch:
-                if vm.instance.spec.runStrategy == vm.RunStrategy.ALWAYS:
-                    continue
-                vm.start()
-            time.sleep(scale_test_param["seconds_between_batches"])
-        for batch in scale_vms:
-            for vm in batch:
-                try:
-                    vm.vmi.wait(timeout=TIMEOUT_30MIN)
-                    vm.vmi.wait_until_running()
-                except TimeoutExpiredError:
-                    LOGGER.error("Could not start new VM, running must-gather, check cluster capacity.")
-                    failure_finalizer(
-                        vms_list=all_vms_objects,
-                        must_gather_image_url=must_gather_image_url,
-                    )
+    def test_start_vms(self, admin_client, scale_test_param, all_vms_objects, must_gather_image_url):
+        report = run_vm_pipeline(
+            vms=all_vms_objects,
+            steps=[start_vm_if_not_always_running],
+            client=admin_client,
+            running_timeout=TIMEOUT_30MIN,
+            **vm_pipeline_params(scale_test_param=scale_test_param),
+        )
+        if not report.succeeded:
+            LOGGER.error("Could not start new VM, running must-gather, check cluster capacity.")
+            failure_finalizer(
+                vms_list=all_vms_objects,
+                must_gather_image_url=must_gather_image_url,
+            )
 
     # TODO check the os internally to see if it didn't reboot
     @pytest.mark.dependency(name="test_scale_vms_running_stability", depends=["test_start_vms"])
     @pytest.mark.polarion("CNV-8449")
     def test_scale_vms_running_stability(
         self,
+        admin_client,
         scale_test_param,
+        scale_namespace,
         all_vms_objects,
         must_gather_image_url,
     ):
         log_nodes_load_data(vms=all_vms_objects)
         LOGGER.info("Verifying all VMS are running")
-        try:
-            sampler = TimeoutSampler(
-                wait_timeout=scale_test_param["test_duration"] * TIMEOUT_1MIN,
-                sleep=scale_test_param["vms_verification_interval"] * TIMEOUT_1MIN,
-                func=all_vms_running,
-                vms=all_vms_objects,
-            )
-            for vms_are_ready in sampler:
-                if not vms_are_ready:
-                    LOGGER.error("VMs check failed, running must gather to collect data.")
-                    failure_finalizer(
-                        vms_list=all_vms_objects,
-                        must_gather_image_url=must_gather_image_url,
-                    )
-        except TimeoutExpiredError:
-            return
+        # Phase changes are watched, so VMIs flapping between two verifications are caught as well
+        with VMIFleetMonitor(
+            client=admin_client, namespace=scale_namespace.name, vmi_names=[vm.name for vm in all_vms_objects]
+        ) as fleet_monitor:
+            try:
+                sampler = TimeoutSampler(
+                    wait_timeout=scale_test_param["test_duration"] * TIMEOUT_1MIN,
+                    sleep=scale_test_param["vms_verification_interval"] * TIMEOUT_1MIN,
+                    func=fleet_monitor.summary,
+                )
+                for fleet_summary in sampler:
+                    LOGGER.info(f"VMs state: {fleet_summary}")
+                    if not fleet_summary.stable:
+                        LOGGER.error("VMs check failed, running must gather to collect data.")
+                        failure_finalizer(
+                            vms_list=all_vms_objects,
+                            must_gather_image_url=must_gather_image_url,
+                        )
+            except TimeoutExpiredError:
+                return
 
     @pytest.mark.dependency(depends=["test_scale_vms_running_stability"])
     @pytest.mark.polarion("CNV-8993")
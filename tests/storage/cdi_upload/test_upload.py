@@ -3,8 +3,8 @@ Upload tests
 """
 
 import logging
-import multiprocessing
 import time
+from contextlib import contextmanager
 from random import shuffle
 from time import sleep
 
@@ -21,7 +21,7 @@ import utilities.storage
 from utilities.constants import Images
 from utilities.constants.components import CDI_UPLOADPROXY
 from utilities.constants.timeouts import TIMEOUT_1MIN, TIMEOUT_3MIN, TIMEOUT_5MIN
-from utilities.storage import create_vm_from_dv, get_downloaded_artifact
+from utilities.storage import TimedUpload, create_vm_from_dv, get_downloaded_artifact
 
 LOGGER = logging.getLogger(__name__)
 HTTP_UNAUTHORIZED = 401
@@ -251,15 +251,16 @@ def test_successful_upload_token_expiry(unprivileged_client, namespace, data_vol
         wait_for_upload_response_code(token=token, data="test", response_code=HTTP_UNAUTHORIZED)
 
 
-def _upload_image(dv_name, namespace, storage_class, local_name, client):
+@contextmanager
+def _upload_image(client, namespace, name, image_path, storage_class):
     """
-    Upload image function for the use of other tests
+    Upload an image to a new DataVolume as the client user, with an upload token, timing the image transfer only
     """
     with utilities.storage.create_dv(
         client=client,
         source="upload",
-        dv_name=dv_name,
-        namespace=namespace.name,
+        dv_name=name,
+        namespace=namespace,
         size="3Gi",
         storage_class=storage_class,
     ) as dv:
@@ -267,20 +268,21 @@ def _upload_image(dv_name, namespace, storage_class, local_name, client):
         dv.wait_for_status(status=DataVolume.Status.UPLOAD_READY, timeout=TIMEOUT_5MIN)
         with UploadTokenRequest(
             client=client,
-            name=dv_name,
-            namespace=namespace.name,
+            name=name,
+            namespace=namespace,
             pvc_name=dv.pvc.name,
         ) as utr:
             token = utr.create().status.token
             sleep(5)
             LOGGER.info("Ensure upload was successful")
-            wait_for_upload_response_code(token=token, data=local_name, response_code=HTTP_OK)
+            start_time = time.monotonic()
+            uploaded = wait_for_upload_response_code(token=token, data=image_path, response_code=HTTP_OK)
+            yield TimedUpload(result=uploaded, transfer_duration=time.monotonic() - start_time)
 
 
 @pytest.mark.sno
 @pytest.mark.s390x
 @pytest.mark.polarion("CNV-2015")
-@pytest.mark.usefixtures("multiprocessing_start_method_fork")
 @pytest.mark.parametrize(
     "upload_file_path",
     [
@@ -299,21 +301,24 @@ def test_successful_concurrent_uploads(
     namespace,
     storage_class_matrix__module__,
 ):
-    dvs_processes = []
     storage_class = [*storage_class_matrix__module__][0]
     available_pv = PersistentVolume(name=namespace).max_available_pvs
-    for dv in range(available_pv):
-        dv_process = multiprocessing.Process(
-            target=_upload_image,
-            args=(f"dv-{dv}", namespace, storage_class, upload_file_path, unprivileged_client),
-        )
-        dv_process.start()
-        dvs_processes.append(dv_process)
-
-    for dvs in dvs_processes:
-        dvs.join()
-        if dvs.exitcode != 0:
-            raise pytest.fail("Creating DV exited with non-zero return code")
+    with utilities.storage.concurrent_uploads(
+        uploads=[
+            {
+                "client": unprivileged_client,
+                "namespace": namespace.name,
+                "name": f"dv-{dv}",
+                "image_path": upload_file_path,
+                "storage_class": storage_class,
+            }
+            for dv in range(available_pv)
+        ],
+        upload=_upload_image,
+        max_workers=available_pv,
+    ) as uploads_report:
+        failed_uploads = [upload.name for upload in uploads_report.results if not upload.result]
+        assert not failed_uploads, f"Failed uploads: {failed_uploads}"
 
 
 @pytest.mark.sno
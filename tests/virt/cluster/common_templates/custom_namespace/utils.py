@@ -12,7 +12,8 @@ from utilities.constants.timeouts import (
 )
 from utilities.hco import wait_for_hco_conditions
 from utilities.ssp import wait_for_ssp_conditions
-from utilities.virt import VirtualMachineForTestsFromTemplate, get_base_templates_list
+from utilities.templates import clear_base_templates_index, get_base_templates_list
+from utilities.virt import VirtualMachineForTestsFromTemplate
 
 TEMPLATE_PATCH_LABEL = f"{Resource.ApiGroup.APP_KUBERNETES_IO}/managed-by"
 TEMPLATE_PATCH_LABEL_VALUE = "general-kenobi"
@@ -151,3 +152,4 @@ def remove_templates(templates_list):
         template.delete()
     for template in templates_list:
         template.wait_deleted(timeout=TIMEOUT_2MIN)
+    clear_base_templates_index()
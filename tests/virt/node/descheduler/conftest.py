@@ -23,7 +23,7 @@ from tests.virt.node.descheduler.utils import (
 )
 from tests.virt.utils import (
     build_node_affinity_dict,
-    get_boot_time_for_multiple_vms,
+    get_linux_boot_time_for_multiple_vms,
     get_non_terminated_pods,
 )
 from utilities.constants.namespaces import NamespacesNames
@@ -230,7 +230,7 @@ def deployed_vms_on_labeled_node(
 def vms_boot_time_before_utilization_imbalance(
     deployed_vms_for_utilization_imbalance,
 ):
-    yield get_boot_time_for_multiple_vms(vm_list=deployed_vms_for_utilization_imbalance)
+    yield get_linux_boot_time_for_multiple_vms(vm_list=deployed_vms_for_utilization_imbalance)
 
 
 @pytest.fixture(scope="class")
@@ -6,7 +6,7 @@ from tests.virt.node.descheduler.utils import (
     assert_vms_consistent_virt_launcher_pods,
     verify_at_least_one_vm_migrated,
 )
-from tests.virt.utils import verify_guest_boot_time
+from tests.virt.utils import verify_linux_guest_boot_time
 
 pytestmark = [
     pytest.mark.tier3,
@@ -57,7 +57,7 @@ class TestDeschedulerEvictsVMFromUtilizationImbalance:
         deployed_vms_for_utilization_imbalance,
         vms_boot_time_before_utilization_imbalance,
     ):
-        verify_guest_boot_time(
+        verify_linux_guest_boot_time(
             vm_list=deployed_vms_for_utilization_imbalance,
             initial_boot_time=vms_boot_time_before_utilization_imbalance,
         )
@@ -35,11 +35,11 @@ from utilities.storage import (
     data_volume_template_with_source_ref_dict,
     generate_data_source_dict,
 )
+from utilities.templates import get_base_templates_list
 from utilities.virt import (
     VirtualMachineForTests,
     VirtualMachineForTestsFromTemplate,
     fedora_vm_body,
-    get_base_templates_list,
     running_vm,
 )
 
@@ -25,7 +25,7 @@ from tests.virt.utils import assert_migration_post_copy_mode, verify_guest_boot_
 from utilities.constants.hco import DATA_SOURCE_NAME
 from utilities.constants.pytest import DEPENDENCY_SCOPE_SESSION
 from utilities.exceptions import ResourceValueError
-from utilities.virt import migrate_vm_and_verify, vm_console_run_commands
+from utilities.virt import migrate_vm_and_verify, vms_console_run_commands
 
 if TYPE_CHECKING:
     from kubernetes.dynamic import DynamicClient
@@ -93,8 +93,7 @@ class TestUpgradeVirt:
         scope=DEPENDENCY_SCOPE_SESSION,
     )
     def test_vm_console_before_upgrade(self, vms_for_upgrade):
-        for vm in vms_for_upgrade:
-            vm_console_run_commands(vm=vm, commands=["ls"])
+        vms_console_run_commands(vms=vms_for_upgrade, commands=["ls"])
 
     @pytest.mark.gating
     @pytest.mark.ocp_upgrade
@@ -209,8 +208,7 @@ class TestUpgradeVirt:
         scope=DEPENDENCY_SCOPE_SESSION,
     )
     def test_vm_console_after_upgrade(self, vms_for_upgrade):
-        for vm in vms_for_upgrade:
-            vm_console_run_commands(vm=vm, commands=["ls"])
+        vms_console_run_commands(vms=vms_for_upgrade, commands=["ls"])
 
     @pytest.mark.gating
     @pytest.mark.ocp_upgrade
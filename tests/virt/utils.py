@@ -60,6 +60,7 @@ from utilities.virt import (
     start_and_fetch_processid_on_linux_vm,
     start_and_fetch_processid_on_windows_vm,
     verify_vm_migrated,
+    vms_run_ssh_commands,
     wait_for_migration_finished,
     wait_for_updated_kv_value,
 )
@@ -424,6 +425,20 @@ def get_boot_time_for_multiple_vms(vm_list):
     return {vm.name: get_vm_boot_time(vm=vm) for vm in vm_list}
 
 
+def get_linux_boot_time_for_multiple_vms(vm_list):
+    """
+    Get the boot time of many Linux VMs, over SSH to all the VMs concurrently.
+
+    Args:
+        vm_list (list): Linux VirtualMachineForTests, created with SSH access
+
+    Returns:
+        dict: VM name to its boot time, as reported by "who -b"
+    """
+    vms_outputs = vms_run_ssh_commands(vms=vm_list, commands=["who -b"])
+    return {vm_name: outputs[0] for vm_name, outputs in vms_outputs.items()}
+
+
 def verify_guest_boot_time(vm_list, initial_boot_time):
     rebooted_vms = {}
     for vm in vm_list:
@@ -433,6 +448,22 @@ def verify_guest_boot_time(vm_list, initial_boot_time):
     assert not rebooted_vms, f"Boot time changed for VMs:\n {rebooted_vms}"
 
 
+def verify_linux_guest_boot_time(vm_list, initial_boot_time):
+    """
+    Verify Linux VMs did not reboot, comparing their boot times from get_linux_boot_time_for_multiple_vms.
+
+    Args:
+        vm_list (list): Linux VirtualMachineForTests, created with SSH access
+        initial_boot_time (dict): VM name to its boot time, from get_linux_boot_time_for_multiple_vms
+    """
+    rebooted_vms = {
+        vm_name: {"initial": initial_boot_time[vm_name], "current": current_boot_time}
+        for vm_name, current_boot_time in get_linux_boot_time_for_multiple_vms(vm_list=vm_list).items()
+        if initial_boot_time[vm_name] != current_boot_time
+    }
+    assert not rebooted_vms, f"Boot time changed for VMs:\n {rebooted_vms}"
+
+
 def get_or_create_golden_image_data_source(
     admin_client: DynamicClient, golden_images_namespace: Namespace, os_dict: dict[str, Any]
 ) -> Generator[DataSource]:
@@ -0,0 +1,285 @@
+"""
+Host cache of the artifacts downloaded from the test artifact server.
+
+Artifacts are stored once per host, keyed by their URL and their ETag / Last-Modified validators, so a changed
+artifact is downloaded again. Large artifacts are downloaded with parallel HTTP range requests, and an
+interrupted download is resumed. Callers get their own path to the cached file: a reflink (copy-on-write clone)
+when the filesystem supports it, else a hard link, else a copy.
+
+Once the cache is larger than its size limit, the least recently used artifacts are removed; remove the cache
+directory, when no test run uses it, to reclaim all its space.
+"""
+
+import contextlib
+import fcntl
+import hashlib
+import logging
+import os
+import shutil
+import threading
+from collections.abc import Generator, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+LOGGER = logging.getLogger(__name__)
+
+# Artifacts are kept on disk between runs; PYTEST_ARTIFACT_CACHE_DIR overrides the directory
+ARTIFACT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "cnv-tests", "artifacts")
+# Least recently used artifacts are removed above this size; PYTEST_ARTIFACT_CACHE_MAX_SIZE_GB overrides it
+ARTIFACT_CACHE_MAX_SIZE_GB = 50
+# Files of the cache directory which are not cached artifacts: download locks and partial downloads
+ARTIFACT_CACHE_WORK_FILE_SUFFIXES = (".lock", ".part", ".part.done")
+ARTIFACT_DOWNLOAD_CONNECTIONS = 4
+# Artifacts smaller than a segment are downloaded with a single request
+ARTIFACT_SEGMENT_SIZE = 64 * 1024 * 1024
+ARTIFACT_CHUNK_SIZE = 1024 * 1024
+ARTIFACT_REQUEST_TIMEOUT = 60
+# ioctl cloning a file on copy-on-write filesystems (linux/fs.h)
+FICLONE = 0x40049409
+
+
+def get_artifact_cache_dir() -> str:
+    return os.getenv("PYTEST_ARTIFACT_CACHE_DIR") or ARTIFACT_CACHE_DIR
+
+
+def get_artifact_cache_max_size() -> int:
+    """Get the artifact cache size limit, in bytes."""
+    return int(float(os.getenv("PYTEST_ARTIFACT_CACHE_MAX_SIZE_GB") or ARTIFACT_CACHE_MAX_SIZE_GB) * 10**9)
+
+
+def download_artifact(url: str, local_name: str | os.PathLike, headers: dict[str, str], head_headers: Mapping) -> None:
+    """
+    Get an artifact to a local path, through the host artifact cache.
+
+    Artifacts without ETag nor Last-Modified cannot be validated, they are downloaded without caching, with a
+    single request.
+
+    Args:
+        url (str): Artifact URL.
+        local_name (str | os.PathLike): Path to put the artifact at.
+        headers (dict): Headers of the artifact server requests, e.g. the authorization header.
+        head_headers (Mapping): Response headers of a HEAD request of the artifact.
+    """
+    local_name = os.fspath(local_name)
+    size = int(head_headers["Content-Length"]) if head_headers.get("Content-Length") else None
+    accept_ranges = head_headers.get("Accept-Ranges") == "bytes"
+    validator = head_headers.get("ETag") or head_headers.get("Last-Modified")
+    if not validator:
+        LOGGER.info(f"{url} has no ETag nor Last-Modified, downloading it without caching")
+        # Without validator, a partial download of a previous run may be of another content: no resume
+        _download(url=url, path=local_name, headers=headers, size=size, accept_ranges=False)
+        return
+
+    cache_path = get_artifact_cache_path(url=url, validator=validator)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    # Lock across processes (e.g. pytest-xdist workers), so an artifact is downloaded once per host
+    with _file_lock(path=f"{cache_path}.lock"):
+        if os.path.exists(cache_path):
+            LOGGER.info(f"Using cached {url}")
+            # The modification time orders the cached artifacts by last use
+            os.utime(cache_path)
+        else:
+            _download(url=url, path=cache_path, headers=headers, size=size, accept_ranges=accept_ranges)
+            os.chmod(cache_path, 0o444)
+            _remove_stale_artifacts(cache_path=cache_path)
+            _remove_least_recently_used_artifacts(cache_path=cache_path)
+
+        link_artifact(cache_path=cache_path, local_name=local_name)
+
+
+def get_artifact_cache_path(url: str, validator: str) -> str:
+    """
+    Get the cache path of an artifact version.
+
+    Args:
+        url (str): Artifact URL.
+        validator (str): Artifact ETag or Last-Modified.
+
+    Returns:
+        str: "<cache dir>/<URL hash>-<validator hash>-<artifact file name>"
+    """
+    url_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
+    validator_hash = hashlib.sha256(validator.encode()).hexdigest()[:16]
+    return os.path.join(get_artifact_cache_dir(), f"{url_hash}-{validator_hash}-{os.path.basename(url)}")
+
+
+def link_artifact(cache_path: str, local_name: str) -> None:
+    """
+    Atomically put a cached artifact at a local path, as a reflink, hard link or copy of the cached file.
+
+    Args:
+        cache_path (str): Cached artifact path.
+        local_name (str): Path to put the artifact at; replaced if it exists.
+    """
+    tmp_name = f"{local_name}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        try:
+            _reflink(source=cache_path, destination=tmp_name)
+        except OSError:
+            try:
+                os.link(cache_path, tmp_name)
+            except OSError:
+                shutil.copyfile(cache_path, tmp_name)
+        os.replace(tmp_name, local_name)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_name)
+
+
+def _download(url: str, path: str, headers: dict[str, str], size: int | None, accept_ranges: bool) -> None:
+    """Download to `<path>.part`, resuming a previous partial download, then rename it to path."""
+    part_path = f"{path}.part"
+    if accept_ranges and size and size > ARTIFACT_SEGMENT_SIZE:
+        _download_segments(url=url, part_path=part_path, headers=headers, size=size)
+    else:
+        _download_stream(url=url, part_path=part_path, headers=headers, resume=accept_ranges)
+
+    if size is not None and (downloaded_size := os.path.getsize(part_path)) != size:
+        os.remove(part_path)
+        raise OSError(f"Downloaded {downloaded_size} bytes of {url}, expected {size}")
+
+    os.replace(part_path, path)
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(f"{part_path}.done")
+
+
+def _download_stream(url: str, part_path: str, headers: dict[str, str], resume: bool) -> None:
+    offset = os.path.getsize(part_path) if resume and os.path.exists(part_path) else 0
+    request_headers = {**headers, "Range": f"bytes={offset}-"} if offset else headers
+    with requests.get(
+        url, headers=request_headers, verify=False, stream=True, timeout=ARTIFACT_REQUEST_TIMEOUT
+    ) as response:
+        response.raise_for_status()
+        resumed = response.status_code == requests.codes.partial_content
+        if offset:
+            LOGGER.info(f"Resuming download of {url} from byte {offset}" if resumed else f"Restarting {url} download")
+        with open(part_path, "ab" if resumed else "wb") as fd:
+            fd.writelines(response.iter_content(chunk_size=ARTIFACT_CHUNK_SIZE))
+
+
+def _download_segments(url: str, part_path: str, headers: dict[str, str], size: int) -> None:
+    """Download segments of the artifact in parallel; segments downloaded before are recorded in `<part>.done`."""
+    done_path = f"{part_path}.done"
+    done_segments = set()
+    if os.path.exists(part_path) and os.path.exists(done_path):
+        with open(done_path) as fd:
+            done_segments = {int(line) for line in fd if line.strip()}
+
+    segments = [start for start in range(0, size, ARTIFACT_SEGMENT_SIZE) if start not in done_segments]
+    LOGGER.info(
+        f"Downloading {len(segments)} segments of {url} ({size} bytes) with {ARTIFACT_DOWNLOAD_CONNECTIONS} "
+        f"connections{', resuming' if done_segments else ''}"
+    )
+    with open(part_path, "r+b" if done_segments else "wb") as fd:
+        fd.truncate(size)
+
+    part_fd = os.open(part_path, os.O_WRONLY)
+    try:
+        with (
+            ThreadPoolExecutor(max_workers=ARTIFACT_DOWNLOAD_CONNECTIONS) as executor,
+            open(done_path, "a" if done_segments else "w") as done_fd,
+        ):
+            futures = [
+                executor.submit(
+                    _download_segment,
+                    url=url,
+                    headers=headers,
+                    fd=part_fd,
+                    start=start,
+                    end=min(start + ARTIFACT_SEGMENT_SIZE, size) - 1,
+                )
+                for start in segments
+            ]
+            for future in as_completed(futures):
+                done_fd.write(f"{future.result()}\n")
+                done_fd.flush()
+    finally:
+        os.close(part_fd)
+
+
+def _download_segment(url: str, headers: dict[str, str], fd: int, start: int, end: int) -> int:
+    with requests.get(
+        url,
+        headers={**headers, "Range": f"bytes={start}-{end}"},
+        verify=False,
+        stream=True,
+        timeout=ARTIFACT_REQUEST_TIMEOUT,
+    ) as response:
+        response.raise_for_status()
+        if response.status_code != requests.codes.partial_content:
+            raise OSError(f"Range request of {url} returned status {response.status_code}")
+
+        offset = start
+        for chunk in response.iter_content(chunk_size=ARTIFACT_CHUNK_SIZE):
+            offset += os.pwrite(fd, chunk, offset)
+
+    if offset != end + 1:
+        raise OSError(f"Segment {start}-{end} of {url} is incomplete: got {offset - start} bytes")
+    return start
+
+
+def _reflink(source: str, destination: str) -> None:
+    with open(source, "rb") as source_fd, open(destination, "wb") as destination_fd:
+        try:
+            fcntl.ioctl(destination_fd.fileno(), FICLONE, source_fd.fileno())
+        except OSError:
+            destination_fd.close()
+            os.remove(destination)
+            raise
+
+
+def _remove_stale_artifacts(cache_path: str) -> None:
+    """Remove the cached versions of the artifact other than cache_path."""
+    cache_dir, cache_name = os.path.split(cache_path)
+    url_hash = cache_name.split("-", 1)[0]
+    for name in os.listdir(cache_dir):
+        if name.startswith(f"{url_hash}-") and not name.startswith(cache_name):
+            LOGGER.info(f"Removing stale cached artifact {name}")
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(cache_dir, name))
+
+
+def _remove_least_recently_used_artifacts(cache_path: str) -> None:
+    """
+    Remove the least recently used cached artifacts, other than cache_path, until the cache fits its size limit.
+
+    Artifacts locked by another process, i.e. being linked, are kept.
+    """
+    cache_dir = os.path.dirname(cache_path)
+    artifacts = []
+    for entry in os.scandir(cache_dir):
+        if entry.path == cache_path or entry.name.endswith(ARTIFACT_CACHE_WORK_FILE_SUFFIXES):
+            continue
+        with contextlib.suppress(FileNotFoundError):
+            artifact_stat = entry.stat()
+            artifacts.append((artifact_stat.st_mtime, artifact_stat.st_size, entry.path))
+
+    max_size = get_artifact_cache_max_size()
+    cache_size = os.path.getsize(cache_path) + sum(size for _, size, _ in artifacts)
+    for _, size, path in sorted(artifacts):
+        if cache_size <= max_size:
+            return
+        with _file_lock(path=f"{path}.lock", blocking=False) as locked:
+            if not locked:
+                continue
+            LOGGER.info(f"Removing least recently used cached artifact {os.path.basename(path)}")
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+        cache_size -= size
+
+
+@contextlib.contextmanager
+def _file_lock(path: str, blocking: bool = True) -> Generator[bool]:
+    """Lock a file exclusively; without blocking, yield False when another process holds the lock."""
+    with open(path, "a") as lock_fd:
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
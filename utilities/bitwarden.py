@@ -1,17 +1,38 @@
+import base64
+import hashlib
 import json
 import logging
 import os
+import tempfile
 from functools import cache
 from typing import Any
 
 from _pytest.main import Session
+from cryptography.fernet import Fernet, InvalidToken
 from pyhelper_utils.shell import run_command
 from timeout_sampler import retry
 
+from utilities.constants import TIMEOUT_60MIN
 from utilities.exceptions import MissingEnvironmentVariableError
 
 LOGGER = logging.getLogger(__name__)
 
+# The secrets store is shared by the pytest processes of a session (xdist workers, reruns); tmpfs keeps it off disk
+SECRETS_STORE_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+SECRETS_STORE_TTL = TIMEOUT_60MIN
+
+# Secrets listed by `bws secret list` (with their values), by name
+_CNV_TESTS_SECRETS: dict[str, dict[str, Any]] = {}
+
+
+def _get_access_token() -> str:
+    access_token = os.getenv("ACCESS_TOKEN")
+
+    if not access_token:
+        raise MissingEnvironmentVariableError("Bitwarden client needs ACCESS_TOKEN environment variable set up")
+
+    return access_token
+
 
 def _run_bws_command(args: list[str]) -> Any:
     """Run bws CLI command and return parsed JSON output.
@@ -29,12 +50,7 @@ def _run_bws_command(args: list[str]) -> Any:
         MissingEnvironmentVariableError: If ACCESS_TOKEN not set
         TimeoutExpiredError: If bws CLI repeatedly fails within the retry window
     """
-    access_token = os.getenv("ACCESS_TOKEN")
-
-    if not access_token:
-        raise MissingEnvironmentVariableError("Bitwarden client needs ACCESS_TOKEN environment variable set up")
-
-    return json.loads(_run_bws_cli(access_token=access_token, args=args))
+    return json.loads(_run_bws_cli(access_token=_get_access_token(), args=args))
 
 
 @retry(wait_timeout=60, sleep=10)
@@ -69,17 +85,74 @@ def _run_bws_cli(access_token: str, args: list[str]) -> str:
     return stdout
 
 
+def _get_secrets_store(access_token: str) -> tuple[str, Fernet]:
+    """Get the secrets store file of an access token, and the cipher of its content.
+
+    The file name and the encryption key are both derived from the access token, so only the
+    processes holding the token find and decrypt the store.
+
+    Args:
+        access_token: Bitwarden access token
+
+    Returns:
+        tuple[str, Fernet]: Secrets store file path and cipher
+    """
+    digest = hashlib.sha256(access_token.encode()).digest()
+    store_file = os.path.join(SECRETS_STORE_DIR, f"cnv-tests-bws-{hashlib.sha256(digest).hexdigest()[:16]}")
+    return store_file, Fernet(key=base64.urlsafe_b64encode(digest))
+
+
+def _read_secrets_store(access_token: str) -> list[dict[str, Any]] | None:
+    """Read the secrets listed by another pytest process, if stored less than SECRETS_STORE_TTL seconds ago.
+
+    Args:
+        access_token: Bitwarden access token
+
+    Returns:
+        list[dict[str, Any]] | None: `bws secret list` output, or None if not stored or expired
+    """
+    store_file, fernet = _get_secrets_store(access_token=access_token)
+    try:
+        with open(store_file, "rb") as fd:
+            return json.loads(fernet.decrypt(token=fd.read(), ttl=SECRETS_STORE_TTL))
+    except FileNotFoundError:
+        return None
+    except (OSError, InvalidToken) as exp:
+        LOGGER.info(f"Ignoring expired or unreadable Bitwarden secrets store {store_file}: {exp!r}")
+        return None
+
+
+def _write_secrets_store(access_token: str, secrets: list[dict[str, Any]]) -> None:
+    store_file, fernet = _get_secrets_store(access_token=access_token)
+    try:
+        # mkstemp creates the file readable by the owner only
+        fd, tmp_file = tempfile.mkstemp(dir=SECRETS_STORE_DIR, prefix=".cnv-tests-bws-")
+        with os.fdopen(fd, "wb") as tmp_fd:
+            tmp_fd.write(fernet.encrypt(data=json.dumps(secrets).encode()))
+        os.replace(tmp_file, store_file)
+    except OSError as exp:
+        LOGGER.warning(f"Failed to write Bitwarden secrets store {store_file}: {exp}")
+
+
 @cache
 def get_all_cnv_tests_secrets() -> dict[str, str]:
     """Gets a list of all cnv-secrets saved in Bitwarden Secret Manager.
 
-    Uses bws CLI to list all secrets associated with the organization.
+    Uses bws CLI to list all secrets associated with the organization, with their values.
+    The list is kept in an encrypted secrets store for SECRETS_STORE_TTL seconds, so the other
+    pytest processes of the session (xdist workers, reruns) do not run bws again.
     ACCESS_TOKEN environment variable must be set.
 
     Returns:
         dict[str, str]: Dictionary mapping secret name to secret UUID
     """
-    data = _run_bws_command(args=["secret", "list"])
+    access_token = _get_access_token()
+    data = _read_secrets_store(access_token=access_token)
+    if data is None:
+        data = _run_bws_command(args=["secret", "list"])
+        _write_secrets_store(access_token=access_token, secrets=data)
+
+    _CNV_TESTS_SECRETS.update({secret["key"]: secret for secret in data})
 
     LOGGER.info(f"Cache info stats for pulling secrets: {get_all_cnv_tests_secrets.cache_info()}")
 
@@ -110,9 +183,24 @@ def get_cnv_tests_secret_by_name(secret_name: str, session: Session | None = Non
     if not secret_id:
         raise ValueError(f"Secret '{secret_name}' not found in Bitwarden")
 
-    secret_data = _run_bws_command(args=["secret", "get", secret_id])
-    secret_value = secret_data.get("value", "")
+    # Values come with the secrets list; a secret listed without its value is pulled on its own
+    secret_value = _CNV_TESTS_SECRETS.get(secret_name, {}).get("value")
+    if secret_value is None:
+        secret_data = _run_bws_command(args=["secret", "get", secret_id])
+        secret_value = secret_data.get("value", "")
 
     secret_dict = json.loads(secret_value)
     LOGGER.info(f"Cache info stats for getting specific secret: {get_cnv_tests_secret_by_name.cache_info()}")
     return secret_dict
+
+
+def prefetch_cnv_tests_secrets(session: Session) -> None:
+    """Fetch all Bitwarden secrets once at session start, unless Bitwarden is disabled or ACCESS_TOKEN is not set.
+
+    Args:
+        session: Pytest session object
+    """
+    if session.config.getoption("--disabled-bitwarden") or not os.getenv("ACCESS_TOKEN"):
+        return
+
+    LOGGER.info(f"Prefetched {len(get_all_cnv_tests_secrets())} Bitwarden secrets")
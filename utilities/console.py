@@ -1,5 +1,6 @@
 import logging
 import os
+import threading
 
 import pexpect
 from ocp_resources.virtual_machine import VirtualMachine
@@ -7,6 +8,7 @@ from timeout_sampler import TimeoutSampler, retry
 
 from utilities.constants import (
     TIMEOUT_5MIN,
+    TIMEOUT_5SEC,
     TIMEOUT_10SEC,
     TIMEOUT_30SEC,
     VIRTCTL,
@@ -60,7 +62,7 @@ class Console:
         self.timeout = timeout
         self.child = None
         self.login_prompt = "login:"
-        self.prompt = prompt if prompt else [r"#", r"\$"]
+        self.prompt = prompt or [r"#", r"\$"]
         self.kubeconfig = kubeconfig
         self.cmd = self._generate_cmd()
         self.base_dir = get_data_collector_base_directory()
@@ -137,6 +139,8 @@ class Console:
         """
         Connect to console
         """
+        # The VM serial console accepts a single connection, release a pooled session which holds it
+        close_console_session(vm=self.vm)
         return self.connect()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -144,3 +148,133 @@ class Console:
         Logout from shell
         """
         self.disconnect()
+
+
+class ConsoleSession:
+    def __init__(
+        self,
+        vm: VirtualMachine,
+        prompt: str | list[str] | None = None,
+        timeout: int = TIMEOUT_30SEC,
+        kubeconfig: str | None = None,
+    ) -> None:
+        """
+        Logged-in VM console kept open across calls.
+
+        The console logs in on first use and on every use after the prompt was lost (VM reboot, virtctl exit or
+        a failed command); users of the session are serialized.
+
+        Args:
+            vm: VM resource
+            prompt: Shell prompt pattern(s) to expect
+            timeout: Connection timeout in seconds
+            kubeconfig: Path to kubeconfig file for remote cluster access
+
+        Examples:
+            with get_console_session(vm=vm) as vmc:
+                vmc.sendline('some command')
+                vmc.expect('some output')
+        """
+        self.vm = vm
+        self.console = Console(vm=vm, prompt=prompt, timeout=timeout, kubeconfig=kubeconfig)
+        self.lock = threading.Lock()
+
+    @property
+    def child(self):
+        return self.console.child
+
+    def is_connected(self) -> bool:
+        """
+        Check the console is alive and still at the shell prompt.
+        """
+        if not (self.child and self.child.isalive()):
+            return False
+
+        try:
+            self.child.sendline("")
+            self.child.expect(self.console.prompt, timeout=TIMEOUT_5SEC)
+            return True
+        except pexpect.exceptions.TIMEOUT, pexpect.exceptions.EOF:
+            LOGGER.warning(f"{self.vm.name}: console prompt lost, reconnecting")
+            return False
+
+    def invalidate(self) -> None:
+        """
+        Drop the console process without logging out; the next use logs in again.
+        """
+        if self.child:
+            self.child.close(force=True)
+            self.console.child = None
+
+    def close(self) -> None:
+        with self.lock:
+            if self.child and self.child.isalive():
+                try:
+                    self.console.disconnect()
+                except Exception:
+                    LOGGER.warning(f"{self.vm.name}: failed to log out from console")
+            self.invalidate()
+
+    def __enter__(self):
+        self.lock.acquire()
+        try:
+            if not self.is_connected():
+                self.invalidate()
+                self.console.connect()
+        except Exception:
+            self.lock.release()
+            raise
+        return self.child
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            # The state of the shell is unknown after a failure, do not reuse it
+            if exc_type:
+                self.invalidate()
+        finally:
+            self.lock.release()
+
+
+_CONSOLE_SESSIONS: dict[tuple[str, str], ConsoleSession] = {}
+_CONSOLE_SESSIONS_LOCK = threading.Lock()
+
+
+def get_console_session(vm: VirtualMachine, prompt: str | list[str] | None = None) -> ConsoleSession:
+    """
+    Get the pooled console session of a VM, creating it when needed.
+
+    Args:
+        vm: VM resource
+        prompt: Shell prompt pattern(s) to expect
+
+    Returns:
+        ConsoleSession: Session to use as a context manager.
+    """
+    key = (vm.namespace, vm.name)
+    prompt = prompt or [r"#", r"\$"]
+    with _CONSOLE_SESSIONS_LOCK:
+        stale_session = _CONSOLE_SESSIONS.get(key)
+        if stale_session and stale_session.vm is vm and stale_session.console.prompt == prompt:
+            return stale_session
+
+        session = _CONSOLE_SESSIONS[key] = ConsoleSession(vm=vm, prompt=prompt)
+
+    # A session of a re-created VM object or of another prompt holds the console, release it
+    if stale_session:
+        stale_session.close()
+    return session
+
+
+def close_console_session(vm: VirtualMachine) -> None:
+    with _CONSOLE_SESSIONS_LOCK:
+        session = _CONSOLE_SESSIONS.pop((vm.namespace, vm.name), None)
+    if session:
+        session.close()
+
+
+def close_console_sessions() -> None:
+    with _CONSOLE_SESSIONS_LOCK:
+        sessions = list(_CONSOLE_SESSIONS.values())
+        _CONSOLE_SESSIONS.clear()
+    for session in sessions:
+        session.close()
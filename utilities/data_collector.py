@@ -2,22 +2,28 @@ import json
 import logging
 import os
 import shlex
+import threading
+import time
+from dataclasses import dataclass, field
 from functools import cache
 
 from _pytest.nodes import Collector
 from ocp_resources.namespace import Namespace
 from ocp_resources.virtual_machine import VirtualMachine
 from ocp_utilities.monitoring import Prometheus
+from pyhelper_utils.shell import run_command
 from pytest import Item
 from pytest_testconfig import config as py_config
 
 import utilities.hco
 import utilities.infra
-from utilities.constants import TIMEOUT_20MIN
+from utilities.constants import TIMEOUT_20MIN, TIMEOUT_30MIN
 from utilities.must_gather import run_must_gather
 
 LOGGER = logging.getLogger(__name__)
 BASE_DIRECTORY_NAME = "tests-collected-info"
+INSPECT_BASE_COMMAND = "oc adm inspect"
+SHARED_COLLECTION_FILE_NAME = "shared_collection.txt"
 
 
 @cache
@@ -154,6 +160,156 @@ def collect_default_cnv_must_gather_with_vm_gather(since_time, target_dir, admin
     )
 
 
+def run_inspect_collection(inspect_namespaces, since_time, target_dir):
+    inspect_command = (
+        f"{INSPECT_BASE_COMMAND} {' '.join(f'namespace/{namespace}' for namespace in inspect_namespaces)} "
+        f"--since={since_time}s --dest-dir={target_dir}"
+    )
+    LOGGER.info(f"running inspect command on {inspect_command}")
+    run_command(command=shlex.split(inspect_command), check=False, verify_stderr=False)
+
+
+@dataclass
+class MustGatherRequest:
+    """
+    A pending must-gather collection, possibly merged from the failures of several tests.
+
+    Attributes:
+        since_timestamp (float): epoch time from which data should be collected.
+        target_dir (str): directory the collected data is written to.
+        inspect_namespaces (frozenset): namespaces collected with `oc adm inspect`, also the deduplication key.
+        test_names (list): tests which requested this collection.
+    """
+
+    since_timestamp: float
+    target_dir: str
+    inspect_namespaces: frozenset[str]
+    test_names: list[str] = field(default_factory=list)
+
+
+class MustGatherCollectionQueue:
+    """
+    Collect must-gather and `oc adm inspect` data in background worker threads.
+
+    Test execution continues while diagnostics are gathered. Requests for the same namespace set which are still
+    waiting for a worker are merged into a single collection whose `since` window covers all of them; a collection
+    which already started does not serve new failures, as it may miss the end of their window. Tests served by
+    another test's collection get a pointer file in their own collection dir.
+
+    Args:
+        admin_client (DynamicClient): admin client used to find the CNV must-gather image.
+        max_workers (int): number of collections running at the same time.
+    """
+
+    def __init__(self, admin_client, max_workers=1):
+        self.admin_client = admin_client
+        self._pending: list[MustGatherRequest] = []
+        self._condition = threading.Condition()
+        self._in_progress = 0
+        self._closed = False
+        self._workers = [
+            threading.Thread(target=self._worker, name=f"must-gather-{index}", daemon=True)
+            for index in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, test_name, since_time, target_dir, inspect_namespaces=()):
+        """
+        Queue a collection for a failed test.
+
+        Args:
+            test_name (str): failed test name.
+            since_time (int): seconds of data to collect, counted back from now.
+            target_dir (str): directory to write the collected data to.
+            inspect_namespaces (Iterable): namespaces to collect with `oc adm inspect`.
+        """
+        since_timestamp = time.time() - since_time
+        key = frozenset(inspect_namespaces)
+        with self._condition:
+            if self._closed:
+                LOGGER.warning(f"[DATA_COLLECTOR] Collection queue is closed, skipping collection for {test_name}")
+                return
+
+            for request in self._pending:
+                if request.inspect_namespaces == key:
+                    LOGGER.info(f"[DATA_COLLECTOR] Merging collection of {test_name} into {request.target_dir}")
+                    request.since_timestamp = min(request.since_timestamp, since_timestamp)
+                    request.test_names.append(test_name)
+                    _write_shared_collection_pointer(target_dir=target_dir, shared_dir=request.target_dir)
+                    return
+
+            self._pending.append(
+                MustGatherRequest(
+                    since_timestamp=since_timestamp,
+                    target_dir=target_dir,
+                    inspect_namespaces=key,
+                    test_names=[test_name],
+                )
+            )
+            self._condition.notify()
+
+    def flush(self, timeout=TIMEOUT_30MIN):
+        """
+        Wait for all queued collections to finish and stop the workers.
+
+        Args:
+            timeout (int): maximum seconds to wait for all the collections; workers still collecting after it are
+                left running as daemon threads.
+        """
+        with self._condition:
+            pending_count = len(self._pending) + self._in_progress
+            self._closed = True
+            self._condition.notify_all()
+        if pending_count:
+            LOGGER.info(f"[DATA_COLLECTOR] Waiting for {pending_count} queued collection(s) to finish")
+        deadline = time.monotonic() + timeout
+        for worker in self._workers:
+            worker.join(timeout=max(0, deadline - time.monotonic()))
+        if any(worker.is_alive() for worker in self._workers):
+            LOGGER.warning(f"[DATA_COLLECTOR] Collections did not finish within {timeout}s, not waiting for them")
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                request = self._pending.pop(0)
+                self._in_progress += 1
+            try:
+                self._collect(request=request)
+            except Exception as exception:
+                LOGGER.warning(f"Failed to collect logs: {request.test_names}: {exception}")
+            finally:
+                with self._condition:
+                    self._in_progress -= 1
+
+    def _collect(self, request):
+        since_time = int(time.time() - request.since_timestamp)
+        LOGGER.info(f"[DATA_COLLECTOR] Collecting {since_time}s of data for {request.test_names}")
+        collect_default_cnv_must_gather_with_vm_gather(
+            since_time=since_time,
+            target_dir=request.target_dir,
+            admin_client=self.admin_client,
+        )
+        if request.inspect_namespaces:
+            run_inspect_collection(
+                inspect_namespaces=sorted(request.inspect_namespaces),
+                since_time=since_time,
+                target_dir=os.path.join(request.target_dir, "inspect_collection"),
+            )
+
+
+def _write_shared_collection_pointer(target_dir, shared_dir):
+    write_to_file(
+        file_name=SHARED_COLLECTION_FILE_NAME,
+        content=f"Data for this test was collected under: {shared_dir}\n",
+        base_directory=target_dir,
+    )
+
+
 def prepare_pytest_item_data_dir(item, output_dir):
     """
     Prepare output directory for pytest item
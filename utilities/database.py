@@ -1,16 +1,19 @@
 import datetime
 import logging
+import sqlite3
+import time
 
 from _pytest.nodes import Collector
 from pytest import Item
-from sqlalchemy import Integer, String, create_engine
-from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+from sqlalchemy import Integer, String, create_engine, insert, select, text
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from utilities.data_collector import get_data_collector_base, get_scope_identifier
 
 LOGGER = logging.getLogger(__name__)
 
 CNV_TEST_DB = "cnvtests.db"
+IN_MEMORY_CONNECTION_STRING = "sqlite://"
 
 
 class Base(DeclarativeBase):
@@ -21,19 +24,50 @@ class CnvTestTable(Base):
     __tablename__ = "CnvTestTable"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, nullable=False)
-    test_name: Mapped[str] = mapped_column(String(500))
+    test_name: Mapped[str] = mapped_column(String(500), unique=True, index=True)
     start_time: Mapped[int] = mapped_column(Integer, nullable=False)
 
 
 class Database:
+    """
+    Start time database of the data collector.
+
+    A single connection is kept open for the lifetime of the object, so a test session should create one
+    instance and reuse it (see conftest.get_data_collector_database).
+
+    Args:
+        database_file_name (str): Database file name, created under the data collector base directory.
+        verbose (bool): Log the SQL statements.
+        base_dir (str, optional): Data collector base directory.
+        in_memory (bool): Keep the database in memory; it is written to database_file_path only on flush.
+        commit_batch_size (int): Number of inserts committed together.
+        flush_interval (int, optional): Seconds between automatic flushes of an in-memory database to its file.
+    """
+
     def __init__(
-        self, database_file_name: str = CNV_TEST_DB, verbose: bool = True, base_dir: str | None = None
+        self,
+        database_file_name: str = CNV_TEST_DB,
+        verbose: bool = True,
+        base_dir: str | None = None,
+        in_memory: bool = False,
+        commit_batch_size: int = 1,
+        flush_interval: int | None = None,
     ) -> None:
         self.database_file_path = f"{get_data_collector_base(base_dir=base_dir)}{database_file_name}"
-        self.connection_string = f"sqlite:///{self.database_file_path}"
+        self.connection_string = IN_MEMORY_CONNECTION_STRING if in_memory else f"sqlite:///{self.database_file_path}"
         self.verbose = verbose
+        self.in_memory = in_memory
+        self.commit_batch_size = commit_batch_size
+        self.flush_interval = flush_interval
         self.engine = create_engine(url=self.connection_string, echo=self.verbose)
-        Base.metadata.create_all(bind=self.engine)
+        self.connection = self.engine.connect()
+        if not in_memory:
+            # WAL avoids an fsync of the whole journal on every commit
+            self.connection.execute(text("PRAGMA journal_mode=WAL"))
+            self.connection.execute(text("PRAGMA synchronous=NORMAL"))
+        Base.metadata.create_all(bind=self.connection)
+        self._pending_inserts = 0
+        self._last_flush = time.monotonic()
 
     def insert_start_time(self, name: str, start_time: int) -> None:
         """
@@ -43,13 +77,37 @@ class Database:
             name (str): Test/class/module identifier.
             start_time (int): Start time in seconds since epoch.
         """
-        with Session(bind=self.engine) as db_session:
-            existing_entry = db_session.query(CnvTestTable).filter_by(test_name=name).first()
+        self.connection.execute(
+            insert(CnvTestTable).prefix_with("OR IGNORE").values(test_name=name, start_time=start_time)
+        )
+        self._pending_inserts += 1
+        if self._pending_inserts >= self.commit_batch_size:
+            self.commit()
+
+        if self.in_memory and self.flush_interval and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
 
-            if not existing_entry:
-                new_entry = CnvTestTable(test_name=name, start_time=start_time)
-                db_session.add(new_entry)
-                db_session.commit()
+    def commit(self) -> None:
+        self.connection.commit()
+        self._pending_inserts = 0
+
+    def flush(self) -> None:
+        """
+        Commit pending inserts; an in-memory database is also copied to database_file_path.
+        """
+        self.commit()
+        if self.in_memory:
+            file_connection = sqlite3.connect(self.database_file_path)
+            try:
+                self.connection.connection.driver_connection.backup(file_connection)
+            finally:
+                file_connection.close()
+            self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        self.connection.commit()
+        self.connection.close()
+        self.engine.dispose()
 
     def get_start_time(self, name: str) -> int | None:
         """
@@ -61,11 +119,8 @@ class Database:
         Returns:
             int | None: Start time in seconds since epoch, or None if not found.
         """
-        with Session(bind=self.engine) as db_session:
-            result = (
-                db_session.query(CnvTestTable).with_entities(CnvTestTable.start_time).filter_by(test_name=name).first()
-            )
-            return result[0] if result else None
+        result = self.connection.execute(select(CnvTestTable.start_time).filter_by(test_name=name)).first()
+        return result[0] if result else None
 
     def get_start_time_for_collection(self, node: Item | Collector) -> int:
         """
@@ -0,0 +1,369 @@
+"""
+Watch-backed, in-memory caches of cluster resources shared by a whole test session.
+
+Each ResourceInformer issues a single LIST to seed its store and then keeps it current with one watch, so wait
+helpers read resource state from memory instead of issuing their own GET requests.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+from kubernetes.client import ApiException
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.resource import ResourceField
+from ocp_resources.resource import Resource
+from timeout_sampler import TimeoutExpiredError
+
+from utilities.constants import TIMEOUT_5MIN, TIMEOUT_5SEC
+
+LOGGER = logging.getLogger(__name__)
+
+ADDED = "ADDED"
+MODIFIED = "MODIFIED"
+DELETED = "DELETED"
+ALL_NAMESPACES = ""
+
+_SESSION_INFORMER_CACHE: InformerCache | None = None
+
+
+class UnsupportedLabelSelectorError(ValueError):
+    pass
+
+
+class ResourceInformer:
+    """
+    Keep an in-memory store of a single resource kind, updated by a background watch.
+
+    Objects are indexed by namespace/name and by label, and subscribers are notified on every change.
+
+    Args:
+        client (DynamicClient): Dynamic client used for the LIST and the watch.
+        resource_kind (type[Resource]): Resource class to watch (e.g. VirtualMachineInstance, Pod).
+        namespace (str): Namespace to watch, ALL_NAMESPACES to watch the whole cluster.
+        watch_timeout (int): Server-side timeout of each watch request; the watch is resumed from the last seen
+            resourceVersion when it ends.
+    """
+
+    def __init__(
+        self,
+        client: DynamicClient,
+        resource_kind: type[Resource],
+        namespace: str = ALL_NAMESPACES,
+        watch_timeout: int = TIMEOUT_5MIN,
+    ) -> None:
+        self.client = client
+        self.resource_kind = resource_kind
+        self.namespace = namespace
+        self.watch_timeout = watch_timeout
+        self._objects: dict[tuple[str, str], ResourceField] = {}
+        self._label_index: defaultdict[tuple[str, str], set[tuple[str, str]]] = defaultdict(set)
+        self._subscribers: list[Callable[[str, ResourceField], None]] = []
+        self._changed = threading.Condition()
+        self._stop_event = threading.Event()
+        self._resource_version: str | None = None
+        self._thread: threading.Thread | None = None
+        self._api: Any = None
+
+    def __repr__(self) -> str:
+        return f"ResourceInformer({self.resource_kind.kind}, namespace={self.namespace or '<all>'})"
+
+    @property
+    def api(self) -> Any:
+        if self._api is None:
+            if api_version := getattr(self.resource_kind, "api_version", None):
+                self._api = self.client.resources.get(api_version=api_version, kind=self.resource_kind.kind)
+            else:
+                api_resources = self.client.resources.search(
+                    group=self.resource_kind.api_group, kind=self.resource_kind.kind
+                )
+                self._api = next((resource for resource in api_resources if resource.preferred), api_resources[0])
+        return self._api
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def start(self) -> ResourceInformer:
+        self._relist()
+        self._thread = threading.Thread(target=self._run, name=f"informer-{self.resource_kind.kind}", daemon=True)
+        self._thread.start()
+        LOGGER.info(f"Started {self} with {len(self._objects)} objects")
+        return self
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=TIMEOUT_5SEC)
+        LOGGER.info(f"Stopped {self}")
+
+    def get(self, name: str, namespace: str = ALL_NAMESPACES) -> ResourceField | None:
+        with self._changed:
+            return self._objects.get((namespace, name))
+
+    def list(self, namespace: str | None = None, label_selector: str = "") -> list[ResourceField]:
+        """
+        List cached objects.
+
+        Args:
+            namespace (str, optional): Return only objects from this namespace.
+            label_selector (str): Equality-based label selector (e.g. "app=foo,tier!=db,kubevirt.io").
+
+        Returns:
+            list: Matching objects.
+
+        Raises:
+            UnsupportedLabelSelectorError: If the selector uses set-based requirements.
+        """
+        requirements = parse_label_selector(label_selector=label_selector)
+        with self._changed:
+            keys = self._keys_by_labels(equal_labels=requirements["equal"])
+            return [
+                self._objects[key]
+                for key in keys
+                if (namespace is None or key[0] == namespace)
+                and _matches_label_requirements(labels=_object_labels(obj=self._objects[key]), **requirements)
+            ]
+
+    def subscribe(self, callback: Callable[[str, ResourceField], None]) -> Callable[[], None]:
+        """
+        Register a callback called with the event type and the object on every change.
+
+        Returns:
+            Callable: Function which unsubscribes the callback.
+        """
+        with self._changed:
+            self._subscribers.append(callback)
+
+        def _unsubscribe() -> None:
+            with self._changed:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return _unsubscribe
+
+    def wait_for(
+        self,
+        name: str,
+        predicate: Callable[[ResourceField], bool],
+        namespace: str = ALL_NAMESPACES,
+        timeout: int = TIMEOUT_5MIN,
+    ) -> ResourceField:
+        """
+        Wait until the cached object exists and the predicate returns True for it.
+
+        Returns:
+            ResourceField: The object which satisfied the predicate.
+
+        Raises:
+            TimeoutExpiredError: If the predicate was not satisfied within the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while True:
+                obj = self._objects.get((namespace, name))
+                if obj is not None and predicate(obj):
+                    return obj
+                remaining_time = deadline - time.monotonic()
+                if remaining_time <= 0:
+                    raise TimeoutExpiredError(f"{self.resource_kind.kind} {namespace}/{name}: {obj}")
+                self._changed.wait(timeout=remaining_time)
+
+    def _keys_by_labels(self, equal_labels: dict[str, str]) -> set[tuple[str, str]]:
+        if not equal_labels:
+            return set(self._objects)
+        return set.intersection(*(self._label_index.get(label, set()) for label in equal_labels.items()))
+
+    def _relist(self) -> None:
+        resources = self.api.get(namespace=self.namespace or None)
+        with self._changed:
+            self._objects.clear()
+            self._label_index.clear()
+            for obj in resources.items:
+                self._store(obj=obj)
+            self._resource_version = resources.metadata.resourceVersion
+            self._changed.notify_all()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                for event in self.api.watch(
+                    namespace=self.namespace or None,
+                    resource_version=self._resource_version,
+                    timeout=self.watch_timeout,
+                ):
+                    if self._stop_event.is_set():
+                        return
+                    self._handle_event(event_type=event["type"], obj=event["object"])
+
+            except ApiException as exception:
+                if exception.status == 410:
+                    LOGGER.info(f"{self}: resourceVersion {self._resource_version} expired, re-listing")
+                else:
+                    LOGGER.warning(f"{self}: watch failed, re-listing: {exception}")
+                    self._stop_event.wait(timeout=TIMEOUT_5SEC)
+                self._relist_safely()
+
+            except Exception as exception:
+                LOGGER.warning(f"{self}: watch failed, re-listing: {exception}")
+                self._stop_event.wait(timeout=TIMEOUT_5SEC)
+                self._relist_safely()
+
+    def _relist_safely(self) -> None:
+        if self._stop_event.is_set():
+            return
+        try:
+            self._relist()
+        except Exception as exception:
+            LOGGER.warning(f"{self}: re-list failed: {exception}")
+
+    def _handle_event(self, event_type: str, obj: ResourceField) -> None:
+        if event_type not in (ADDED, MODIFIED, DELETED):
+            return
+
+        with self._changed:
+            self._resource_version = obj.metadata.resourceVersion
+            if event_type == DELETED:
+                self._discard(key=_object_key(obj=obj))
+            else:
+                self._store(obj=obj)
+            subscribers = list(self._subscribers)
+            self._changed.notify_all()
+
+        for callback in subscribers:
+            try:
+                callback(event_type, obj)
+            except Exception as exception:
+                LOGGER.warning(f"{self}: subscriber {callback} failed: {exception}")
+
+    def _store(self, obj: ResourceField) -> None:
+        key = _object_key(obj=obj)
+        self._discard(key=key)
+        self._objects[key] = obj
+        for label in _object_labels(obj=obj).items():
+            self._label_index[label].add(key)
+
+    def _discard(self, key: tuple[str, str]) -> None:
+        if (obj := self._objects.pop(key, None)) is None:
+            return
+        for label in _object_labels(obj=obj).items():
+            keys = self._label_index.get(label)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._label_index[label]
+
+
+class InformerCache:
+    """
+    Registry of ResourceInformers, started lazily, one per resource kind and namespace.
+
+    An informer which watches all namespaces serves requests for any namespace of its kind.
+    """
+
+    def __init__(self, client: DynamicClient) -> None:
+        self.client = client
+        self._informers: dict[tuple[str, str], ResourceInformer] = {}
+        self._lock = threading.Lock()
+
+    def informer(self, resource_kind: type[Resource], namespace: str = ALL_NAMESPACES) -> ResourceInformer:
+        with self._lock:
+            if cluster_informer := self._informers.get((resource_kind.kind, ALL_NAMESPACES)):
+                return cluster_informer
+            key = (resource_kind.kind, namespace)
+            if key not in self._informers:
+                self._informers[key] = ResourceInformer(
+                    client=self.client, resource_kind=resource_kind, namespace=namespace
+                ).start()
+            return self._informers[key]
+
+    def stop(self) -> None:
+        with self._lock:
+            for informer in self._informers.values():
+                informer.stop()
+            self._informers.clear()
+
+
+def start_session_informers(client: DynamicClient) -> InformerCache:
+    global _SESSION_INFORMER_CACHE
+    if _SESSION_INFORMER_CACHE is None:
+        _SESSION_INFORMER_CACHE = InformerCache(client=client)
+    return _SESSION_INFORMER_CACHE
+
+
+def stop_session_informers() -> None:
+    global _SESSION_INFORMER_CACHE
+    if _SESSION_INFORMER_CACHE is not None:
+        _SESSION_INFORMER_CACHE.stop()
+        _SESSION_INFORMER_CACHE = None
+
+
+def get_session_informer(resource_kind: type[Resource]) -> ResourceInformer | None:
+    """
+    Return the session informer of a resource kind, or None when session informers are not enabled.
+
+    The session has one cluster-wide informer per kind, so test namespaces do not each start their own watch
+    (which would outlive the namespace). Helpers use the informer when available and fall back to direct API
+    requests otherwise.
+    """
+    if _SESSION_INFORMER_CACHE is None:
+        return None
+    return _SESSION_INFORMER_CACHE.informer(resource_kind=resource_kind)
+
+
+def parse_label_selector(label_selector: str) -> dict[str, Any]:
+    """
+    Parse an equality-based label selector.
+
+    Args:
+        label_selector (str): Selector such as "app=foo,tier!=db,kubevirt.io,!debug".
+
+    Returns:
+        dict: "equal", "not_equal" (label -> value), "exists" and "not_exists" (label keys) requirements.
+
+    Raises:
+        UnsupportedLabelSelectorError: If the selector uses set-based requirements (in, notin).
+    """
+    requirements: dict[str, Any] = {"equal": {}, "not_equal": {}, "exists": set(), "not_exists": set()}
+    for requirement in filter(None, (part.strip() for part in label_selector.split(","))):
+        if "(" in requirement or " " in requirement:
+            raise UnsupportedLabelSelectorError(f"Set-based label selector is not supported: {label_selector}")
+        if "!=" in requirement:
+            key, value = requirement.split("!=", 1)
+            requirements["not_equal"][key] = value
+        elif "=" in requirement:
+            key, value = requirement.replace("==", "=").split("=", 1)
+            requirements["equal"][key] = value
+        elif requirement.startswith("!"):
+            requirements["not_exists"].add(requirement[1:])
+        else:
+            requirements["exists"].add(requirement)
+    return requirements
+
+
+def _matches_label_requirements(
+    labels: dict[str, str],
+    equal: dict[str, str],
+    not_equal: dict[str, str],
+    exists: set[str],
+    not_exists: set[str],
+) -> bool:
+    return (
+        all(labels.get(key) == value for key, value in equal.items())
+        and all(labels.get(key) != value for key, value in not_equal.items())
+        and all(key in labels for key in exists)
+        and not any(key in labels for key in not_exists)
+    )
+
+
+def _object_key(obj: ResourceField) -> tuple[str, str]:
+    return obj.metadata.namespace or ALL_NAMESPACES, obj.metadata.name
+
+
+def _object_labels(obj: ResourceField) -> dict[str, str]:
+    return dict(obj.metadata.labels or {})
@@ -2,6 +2,7 @@ import base64
 import io
 import json
 import logging
+import math
 import os
 import platform
 import re
@@ -10,9 +11,11 @@ import stat
 import subprocess
 import tarfile
 import tempfile
+import threading
 import time
 import zipfile
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 from functools import cache
 from subprocess import PIPE, CalledProcessError, Popen
@@ -74,12 +77,15 @@ from utilities.exceptions import (
     UrlNotFoundError,
     UtilityPodNotFoundError,
 )
+from utilities.informer import UnsupportedLabelSelectorError, get_session_informer
 from utilities.ssp import guest_agent_version_parser
 
 NON_EXIST_URL = "https://noneexist.test"  # Use 'test' domain rfc6761
 EXCLUDED_FROM_URL_VALIDATION = ("", NON_EXIST_URL)
 INTERNAL_HTTP_SERVER_ADDRESS = "internal-http.cnv-tests-utilities.svc.cluster.local"
 HOST_MODEL_CPU_LABEL = f"host-model-cpu.node.{Resource.ApiGroup.KUBEVIRT_IO}"
+# Audit log files read at the same time, across the control plane nodes and rotated files
+AUDIT_LOG_READERS = 8
 LOGGER = logging.getLogger(__name__)
 
 
@@ -166,6 +172,15 @@ def generate_namespace_name(file_path):
 
 
 def get_pods(client: DynamicClient, namespace: Namespace, label: str = "") -> list[Pod]:
+    # The session informer lists with the admin client, other clients must only get the pods their RBAC allows
+    if (informer := get_session_informer(resource_kind=Pod)) and informer.client is client:
+        try:
+            return [
+                Pod(client=client, name=pod.metadata.name, namespace=namespace.name)
+                for pod in informer.list(namespace=namespace.name, label_selector=label)
+            ]
+        except UnsupportedLabelSelectorError:
+            LOGGER.info(f"Label selector {label} is not supported by {informer}, listing pods from the API")
     return list(
         Pod.get(
             client=client,
@@ -301,13 +316,14 @@ def wait_for_consistent_resource_conditions(
     consecutive_checks_count: int = 10,
     exceptions_dict: dict[type[Exception], list[str]] | None = None,
     resource_name: str | None = None,
+    stable_for_seconds: int | None = None,
 ) -> None:
     """This function awaits certain conditions of a given resource_kind (HCO, CSV, etc.).
 
-    Using TimeoutSampler loop and poll the CR (of the resource_kind type) and attempt to match the expected conditions
-    against the actual conditions found in the CR.
-    Since the conditions statuses might change, we use consecutive checks in order to have consistent results (stable),
-    thereby ascertaining that the expected conditions are met over time.
+    The CR (of the resource_kind type) is fetched once and then followed with a Kubernetes watch, resumed from the
+    last seen resourceVersion, and the expected conditions are matched against the actual conditions on every change.
+    Since the conditions statuses might change, the expected conditions must hold for stable_for_seconds without
+    interruption, thereby ascertaining that the expected conditions are met over time.
 
     Args:
         dynamic_client (DynamicClient): admin client
@@ -324,69 +340,108 @@ def wait_for_consistent_resource_conditions(
         condition_key1 (str): the key of the first condition in the actual resource_kind (e.g. type, reason, status)
         condition_key2 (str): the key of the second condition in the actual resource_kind (e.g. type, reason, status)
         total_timeout (int): total timeout to wait for (seconds)
-        polling_interval (int): the time to sleep after each iteration (seconds)
-        consecutive_checks_count (int): the number of repetitions for the status check to make sure the transition is
-        done.
+        polling_interval (int): the time to sleep before re-fetching the resource after an API error (seconds)
+        consecutive_checks_count (int): used with polling_interval to derive stable_for_seconds when it is not set,
+            preserving the stability window of the former "N polls in a row" rule.
             The default value for this argument is not absolute, and there are situations in which it should be higher
             in order to ascertain the consistency of the Ready status.
             Possible situations:
             1. the resource is in a Ready status, because the process (that should cause
             the change in its state) has not started yet.
             2. some components are in Ready status, but others have not started the process yet.
-        exceptions_dict: TimeoutSampler exceptions_dict
+        exceptions_dict: exceptions (and message substrings) tolerated while fetching or watching the resource
+        resource_name (str, optional): resource name; the first resource of resource_kind is used when not set.
+        stable_for_seconds (int, optional): how long the expected conditions must hold (seconds).
+            Defaults to polling_interval * consecutive_checks_count.
 
     Raises:
         TimeoutExpiredError: raised when expected conditions are not met within the timeframe
     """
-    samples = TimeoutSampler(
-        wait_timeout=total_timeout,
-        sleep=polling_interval,
-        func=lambda: list(
-            resource_kind.get(
-                client=dynamic_client,
-                namespace=namespace,
-                name=resource_name,
-            )
-        ),
-        exceptions_dict=exceptions_dict,
-    )
-    current_check = 0
-    actual_conditions = {}
+    if stable_for_seconds is None:
+        stable_for_seconds = polling_interval * consecutive_checks_count
+    deadline = time.monotonic() + total_timeout
+    matched_since: float | None = None
+    actual_conditions: dict[str, str] = {}
+
+    def _conditions_stable(_status_conditions: list[Any] | None) -> bool:
+        nonlocal matched_since, actual_conditions
+        actual_conditions = {
+            condition[condition_key1]: condition[condition_key2]
+            for condition in _status_conditions or []
+            if condition[condition_key1] in expected_conditions
+        }
+        if _status_conditions and actual_conditions == expected_conditions:
+            matched_since = matched_since or time.monotonic()
+            return time.monotonic() - matched_since >= stable_for_seconds
+
+        matched_since = None
+        if _status_conditions and stop_conditions:
+            if matched_stop_conditions := _get_matched_stop_conditions(
+                status_conditions=_status_conditions, stop_conditions=stop_conditions
+            ):
+                LOGGER.error(
+                    f"Execution halted due to matched stop conditions: {matched_stop_conditions}. "
+                    f"Current status conditions: {_status_conditions}."
+                )
+                raise TimeoutExpiredError(f"Stop condition met for {resource_kind.__name__}/{resource_name}.")
+        return False
+
     LOGGER.info(
         f"Waiting for resource to stabilize: resource_kind={resource_kind.__name__} conditions={expected_conditions} "
-        f"sleep={total_timeout} consecutive_checks_count={consecutive_checks_count}"
+        f"timeout={total_timeout} stable_for_seconds={stable_for_seconds}"
     )
     try:
-        for sample in samples:
-            status_conditions = sample[0].instance.get("status", {}).get("conditions")
-            if status_conditions:
-                actual_conditions = {
-                    condition[condition_key1]: condition[condition_key2]
-                    for condition in status_conditions
-                    if condition[condition_key1] in expected_conditions
-                }
-                if actual_conditions == expected_conditions:
-                    current_check += 1
-                    if current_check >= consecutive_checks_count:
+        resource = _get_first_resource_sample(
+            dynamic_client=dynamic_client,
+            resource_kind=resource_kind,
+            namespace=namespace,
+            resource_name=resource_name,
+            total_timeout=total_timeout,
+            polling_interval=polling_interval,
+            exceptions_dict=exceptions_dict,
+        )
+        tolerated_exceptions = tuple(exceptions_dict or ())
+        resource_version = None
+        while True:
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                raise TimeoutExpiredError(f"Timeout expired waiting for {resource_kind.__name__}/{resource.name}")
+
+            try:
+                if not resource_version:
+                    resource_instance = resource.instance
+                    resource_version = resource_instance.metadata.resourceVersion
+                    if _conditions_stable(_status_conditions=resource_instance.get("status", {}).get("conditions")):
+                        return
+
+                # Bound each watch so that a quiet period completing the stability window ends the wait.
+                watch_timeout = min(remaining_time, TIMEOUT_1MIN)
+                if matched_since:
+                    watch_timeout = min(watch_timeout, stable_for_seconds - (time.monotonic() - matched_since))
+                for event in resource.watcher(
+                    timeout=max(math.ceil(watch_timeout), 1), resource_version=resource_version
+                ):
+                    resource_version = event["object"].metadata.resourceVersion
+                    status_conditions = (
+                        None if event["type"] == "DELETED" else event["object"].get("status", {}).get("conditions")
+                    )
+                    if _conditions_stable(_status_conditions=status_conditions):
                         return
-                    continue
+
+            except (ApiException, *tolerated_exceptions) as exception:
+                if isinstance(exception, ApiException) and exception.status == 410:
+                    LOGGER.warning(f"resourceVersion {resource_version} of {resource.name} expired, re-syncing")
+                elif _is_tolerated_exception(exception=exception, exceptions_dict=exceptions_dict):
+                    LOGGER.warning(f"Failed to watch {resource.name}, re-syncing: {exception}")
+                    time.sleep(polling_interval)
                 else:
-                    current_check = 0
-                    if stop_conditions:
-                        actual_conditions = {condition["type"]: condition["reason"] for condition in status_conditions}
-                        matched_stop_conditions = {
-                            type: reason
-                            for type, reason in stop_conditions.items()
-                            if type in actual_conditions and actual_conditions[type] == reason
-                        }
-                        if matched_stop_conditions:
-                            LOGGER.error(
-                                f"Execution halted due to matched stop conditions: {matched_stop_conditions}. "
-                                f"Current status conditions: {status_conditions}."
-                            )
-                            raise TimeoutExpiredError(
-                                f"Stop condition met for {resource_kind.__name__}/{resource_name}."
-                            )
+                    raise
+                resource_version = None
+                continue
+
+            # The watch window ended without events, the conditions did not change since the last evaluation.
+            if matched_since and time.monotonic() - matched_since >= stable_for_seconds:
+                return
 
     except TimeoutExpiredError:
         LOGGER.error(
@@ -396,6 +451,41 @@ def wait_for_consistent_resource_conditions(
         raise
 
 
+def _get_first_resource_sample(
+    dynamic_client: DynamicClient,
+    resource_kind: type[Resource],
+    namespace: str | None,
+    resource_name: str | None,
+    total_timeout: int,
+    polling_interval: int,
+    exceptions_dict: dict[type[Exception], list[str]] | None,
+) -> Resource:
+    for sample in TimeoutSampler(
+        wait_timeout=total_timeout,
+        sleep=polling_interval,
+        func=lambda: list(resource_kind.get(client=dynamic_client, namespace=namespace, name=resource_name)),
+        exceptions_dict=exceptions_dict,
+    ):
+        if sample:
+            return sample[0]
+
+
+def _is_tolerated_exception(exception: Exception, exceptions_dict: dict[type[Exception], list[str]] | None) -> bool:
+    for exception_type, messages in (exceptions_dict or {}).items():
+        if isinstance(exception, exception_type) and (not messages or any(msg in str(exception) for msg in messages)):
+            return True
+    return False
+
+
+def _get_matched_stop_conditions(status_conditions: list[Any], stop_conditions: dict[str, str]) -> dict[str, str]:
+    actual_conditions = {condition["type"]: condition["reason"] for condition in status_conditions}
+    return {
+        type: reason
+        for type, reason in stop_conditions.items()
+        if type in actual_conditions and actual_conditions[type] == reason
+    }
+
+
 def get_node_pod(utility_pods, node):
     """
     This function will return a pod based on the node specified as an argument.
@@ -810,18 +900,21 @@ def generate_openshift_pull_secret_file(client: DynamicClient = None) -> str:
     sleep=TIMEOUT_10SEC,
     exceptions_dict={RuntimeError: []},
 )
-def get_node_audit_log_entries(log: str, node: str, log_entry: str) -> tuple[bool, list[str]]:
+def get_node_audit_log_entries(log: str, node: str, log_entry: str) -> tuple[bool, list[dict[str, Any]]]:
     """
     Retrieve audit log entries from a node matching a specific log entry pattern.
 
+    The log is streamed from `oc adm node-logs` and filtered line by line, so it is never held in memory;
+    only lines whose raw bytes contain the pattern are JSON decoded.
+
     Args:
         log: Name of the audit log file to read
         node: Node name to retrieve logs from
         log_entry: Pattern to search for in the audit logs
 
     Returns:
-        Tuple of (success: bool, lines: list[str]) where success indicates if operation completed
-        and lines contains matching log entries
+        Tuple of (success: bool, entries: list[dict]) where success indicates if operation completed
+        and entries contains the parsed matching log entries
     """
     # Patterns to match errors that should trigger a retry
     error_patterns_list = [
@@ -829,47 +922,70 @@ def get_node_audit_log_entries(log: str, node: str, log_entry: str) -> tuple[boo
         r"Unhandled Error.*couldn't get current server API group list.*i/o timeout",
         r".*read tcp.*connection reset by peer",
     ]
-    error_patterns = re.compile("|".join(f"({pattern})" for pattern in error_patterns_list))
-
-    result = subprocess.run(
-        f"{OC_ADM_LOGS_COMMAND} {node} {AUDIT_LOGS_PATH}/{log} | grep {shlex.quote(log_entry)}",
-        shell=True,
-        capture_output=True,
-        text=True,
-        timeout=TIMEOUT_3MIN,
-    )
-    lines = result.stdout.splitlines()
-    has_errors = any(error_patterns.search(line) for line in lines)
-    if has_errors:
-        if any(line.strip().startswith("404 page not found") for line in lines):
-            LOGGER.warning(f"Skipping {log} check as it was rotated:\n{lines}")
-            return True, []
-        LOGGER.warning(f"oc command failed for node {node}, log {log}:\n{lines}")
+    error_patterns = re.compile("|".join(f"({pattern})" for pattern in error_patterns_list), re.MULTILINE)
+
+    needle = log_entry.encode()
+    entries = []
+    log_rotated = False
+    with (
+        tempfile.TemporaryFile() as stderr_file,
+        Popen(
+            [*shlex.split(OC_ADM_LOGS_COMMAND), node, f"{AUDIT_LOGS_PATH}/{log}"],
+            stdout=PIPE,
+            stderr=stderr_file,
+        ) as process,
+    ):
+        kill_timer = threading.Timer(interval=TIMEOUT_3MIN, function=process.kill)
+        kill_timer.start()
+        try:
+            for line in process.stdout:
+                if needle in line:
+                    try:
+                        entries.append(json.loads(line))
+                    except json.decoder.JSONDecodeError:
+                        LOGGER.error(f"Unable to parse line: {line!r}")
+                        raise
+                elif line.startswith(b"404 page not found"):
+                    log_rotated = True
+            process.wait()
+        finally:
+            kill_timer.cancel()
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode(errors="replace")
+
+    if log_rotated or "404 page not found" in stderr:
+        LOGGER.warning(f"Skipping {log} check as it was rotated:\n{stderr}")
+        return True, []
+    if process.returncode or error_patterns.search(stderr):
+        LOGGER.warning(f"oc command failed for node {node}, log {log} (rc={process.returncode}):\n{stderr}")
         raise RuntimeError
-    return True, lines
+    return True, entries
 
 
-def get_node_audit_log_line_dict(logs: list[str], node: str, log_entry: str) -> Generator[dict[str, Any]]:
+def get_nodes_audit_log_line_dict(
+    nodes_logs: dict[str, list[str]], log_entry: str, max_workers: int = AUDIT_LOG_READERS
+) -> Generator[dict[str, Any]]:
     """
-    Parse audit log entries into dictionaries.
+    Parse the audit log entries of several nodes into dictionaries, reading the nodes and log files in parallel.
 
     Args:
-        logs: List of audit log file names
-        node: Node name to retrieve logs from
+        nodes_logs: Audit log file names of each node name
         log_entry: Pattern to search for in the audit logs
+        max_workers: Maximum number of log files read at the same time
 
     Yields:
-        Parsed JSON dictionaries from matching audit log lines
+        Parsed JSON dictionaries from matching audit log lines, one log file after the other as they are read
     """
-    for log in logs:
-        _, deprecated_api_lines = get_node_audit_log_entries(log=log, node=node, log_entry=log_entry)
-        if deprecated_api_lines:
-            for line in deprecated_api_lines:
-                try:
-                    yield json.loads(line)
-                except json.decoder.JSONDecodeError:
-                    LOGGER.error(f"Unable to parse line: {line!r}")
-                    raise
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(get_node_audit_log_entries, log=log, node=node, log_entry=log_entry)
+            for node, logs in nodes_logs.items()
+            for log in logs
+        ]
+        for future in as_completed(futures):
+            _, entries = future.result()
+            yield from entries
 
 
 def wait_for_node_status(node, status=True, wait_timeout=TIMEOUT_1MIN):
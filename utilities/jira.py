@@ -1,34 +1,187 @@
+import json
 import logging
 import os
+import tempfile
+import time
+from collections.abc import Iterable
+from functools import cache
 
-from jira import JIRA
+from jira import JIRA, JIRAError
 from pytest_testconfig import config as py_config
 
+from utilities.constants import TIMEOUT_60MIN
 from utilities.exceptions import MissingEnvironmentVariableError
 
 LOGGER = logging.getLogger(__name__)
 
+# Jira statuses are kept on disk between runs; PYTEST_JIRA_STATUS_CACHE overrides the file
+JIRA_STATUS_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "cnv-tests", "jira-status.json")
+JIRA_STATUS_CACHE_TTL = TIMEOUT_60MIN
+# Jira IDs resolved per JQL search request
+JIRA_SEARCH_BATCH_SIZE = 100
+
+_JIRA_STATUS_CACHE: dict[str, dict[str, str | float]] | None = None
+
+
+def get_jira_credentials() -> tuple[str, str, str] | None:
+    """
+    Get the JIRA credentials from the environment.
+
+    Returns:
+        tuple | None: (url, email, token), or None if any of them is not set.
+    """
+    url = os.getenv("PYTEST_JIRA_URL")
+    token = os.getenv("PYTEST_JIRA_TOKEN")
+    email = os.getenv("PYTEST_JIRA_USERNAME")
+
+    return (url, email, token) if token and url and email else None
+
+
+@cache
+def get_jira_connection() -> JIRA:
+    """
+    Get the JIRA connection shared by all the lookups; JIRA credentials must be set.
+
+    Returns:
+        JIRA: JIRA connection
+    """
+    url, email, token = get_jira_credentials()
+    return JIRA(
+        server=url,
+        basic_auth=(email, token),
+    )
+
+
+def get_jira_status_cache_file() -> str:
+    return os.getenv("PYTEST_JIRA_STATUS_CACHE") or JIRA_STATUS_CACHE_FILE
+
+
+def get_jira_status_cache() -> dict[str, dict[str, str | float]]:
+    """
+    Get the Jira statuses cache, loaded from the cache file on first use.
+
+    Returns:
+        dict: Jira ID to {"status": <status>, "time": <epoch seconds of the lookup>}
+    """
+    global _JIRA_STATUS_CACHE
+    if _JIRA_STATUS_CACHE is None:
+        _JIRA_STATUS_CACHE = read_jira_status_cache_file()
+    return _JIRA_STATUS_CACHE
+
+
+def read_jira_status_cache_file() -> dict[str, dict[str, str | float]]:
+    try:
+        with open(get_jira_status_cache_file()) as fd:
+            return json.load(fd)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exp:
+        LOGGER.warning(f"Ignoring unreadable Jira status cache {get_jira_status_cache_file()}: {exp}")
+        return {}
+
+
+def update_jira_status_cache(statuses: dict[str, str]) -> None:
+    """
+    Store Jira statuses in the cache and in the cache file.
+
+    The cache file is merged with the statuses other processes (e.g. pytest-xdist workers) stored
+    meanwhile, and replaced atomically.
+
+    Args:
+        statuses (dict): Jira ID to status
+    """
+    now = time.time()
+    jira_status_cache = get_jira_status_cache()
+    jira_status_cache.update({jira_id: {"status": status, "time": now} for jira_id, status in statuses.items()})
+
+    cache_file = get_jira_status_cache_file()
+    try:
+        merged_cache = read_jira_status_cache_file()
+        for jira_id, entry in jira_status_cache.items():
+            if entry["time"] >= merged_cache.get(jira_id, {}).get("time", 0):
+                merged_cache[jira_id] = entry
+
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with tempfile.NamedTemporaryFile(mode="w", dir=os.path.dirname(cache_file), delete=False) as fd:
+            json.dump(merged_cache, fd)
+        os.replace(fd.name, cache_file)
+    except OSError as exp:
+        LOGGER.warning(f"Failed to write Jira status cache {cache_file}: {exp}")
+
+
+def get_cached_jira_status(jira: str, ttl: float | None = JIRA_STATUS_CACHE_TTL) -> str | None:
+    """
+    Get a Jira status from the cache.
+
+    Args:
+        jira (str): jira card ID
+        ttl (float | None): Maximum age of the cached status in seconds; None to accept any age.
+
+    Returns:
+        str | None: cached jira status, or None if it is not cached or expired.
+    """
+    entry = get_jira_status_cache().get(jira)
+    if not entry or (ttl is not None and time.time() - entry["time"] > ttl):
+        return None
+    return entry["status"]
+
+
+def prefetch_jira_statuses(jira_ids: Iterable[str]) -> None:
+    """
+    Resolve the statuses of Jira IDs with batched JQL searches and cache them.
+
+    IDs with a fresh cached status are not looked up. Without JIRA credentials nothing is looked up.
+
+    Args:
+        jira_ids (Iterable): jira card IDs
+    """
+    missing_jira_ids = sorted({jira_id for jira_id in jira_ids if get_cached_jira_status(jira=jira_id) is None})
+    if not (get_jira_credentials() and missing_jira_ids):
+        return
+
+    jira_connection = get_jira_connection()
+    statuses = {}
+    for index in range(0, len(missing_jira_ids), JIRA_SEARCH_BATCH_SIZE):
+        batch = missing_jira_ids[index : index + JIRA_SEARCH_BATCH_SIZE]
+        try:
+            issues = jira_connection.search_issues(
+                jql_str=f"key in ({', '.join(batch)})", fields="status", maxResults=False
+            )
+        except JIRAError as exp:
+            # e.g. a non-existing ID fails the whole search; the IDs are looked up one by one when used
+            LOGGER.warning(f"Failed to prefetch the status of Jira IDs {batch}: {exp.text}")
+            continue
+
+        statuses.update({issue.key: issue.fields.status.name.lower() for issue in issues})
+
+    LOGGER.info(f"Prefetched the status of {len(statuses)} Jira IDs")
+    if statuses:
+        update_jira_status_cache(statuses=statuses)
+
 
 def get_jira_status(jira: str) -> str:
     """
     Get jira status.
 
+    Statuses are cached for JIRA_STATUS_CACHE_TTL seconds, across runs. Without JIRA credentials (offline), the
+    cached status is used whatever its age.
+
     Args:
         jira (str): jira card ID
 
     Returns:
-        str: jira status. For conformance tests without JIRA credentials, assume the JIRA is open.
+        str: jira status. For conformance tests without JIRA credentials nor cached status, assume the JIRA is open.
 
     Raises:
         MissingEnvironmentVariableError: if PYTEST_JIRA_TOKEN or PYTEST_JIRA_URL or
-            PYTEST_JIRA_USERNAME environment variables are not set
+            PYTEST_JIRA_USERNAME environment variables are not set and the status is not cached
 
     """
-    url = os.getenv("PYTEST_JIRA_URL")
-    token = os.getenv("PYTEST_JIRA_TOKEN")
-    email = os.getenv("PYTEST_JIRA_USERNAME")
+    if not get_jira_credentials():
+        if cached_status := get_cached_jira_status(jira=jira, ttl=None):
+            LOGGER.info(f"No JIRA credentials: using cached status of {jira}: {cached_status}")
+            return cached_status
 
-    if not (token and url and email):
         # For conformance tests without JIRA credentials, assume the JIRA is open
         if py_config.get("conformance_tests"):
             LOGGER.info(f"Conformance tests without JIRA credentials: assuming {jira} is open")
@@ -38,13 +191,12 @@ def get_jira_status(jira: str) -> str:
             "Please set PYTEST_JIRA_TOKEN, PYTEST_JIRA_URL and PYTEST_JIRA_USERNAME environment variables"
         )
 
-    jira_connection = JIRA(
-        server=url,
-        basic_auth=(email, token),
-    )
+    if cached_status := get_cached_jira_status(jira=jira):
+        return cached_status
 
-    status = jira_connection.issue(id=jira).fields.status.name.lower()
+    status = get_jira_connection().issue(id=jira).fields.status.name.lower()
     LOGGER.info(f"Jira {jira}: status is {status}")
+    update_jira_status_cache(statuses={jira: status})
 
     return status
 
@@ -1,4 +1,8 @@
 import logging
+import threading
+import time
+import urllib.parse
+from functools import cache
 
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 
@@ -15,6 +19,175 @@ from utilities.data_collector import collect_alerts_data
 
 LOGGER = logging.getLogger(__name__)
 
+# Label tagging the series of each query merged into a batched Prometheus request
+BATCH_QUERY_LABEL = "cnv_tests_batch_query"
+# Maximal length of a batched query, to keep the request URL within the route limits
+PROMETHEUS_BATCH_MAX_QUERY_LENGTH = 8000
+
+
+class PrometheusQueryBatcher:
+    """
+    Batches and caches Prometheus instant queries.
+
+    Queries fetched together are merged into one `or`-joined PromQL request; each sub-query is tagged with
+    the BATCH_QUERY_LABEL label to demultiplex the series of the response. Responses are cached for a scrape
+    interval, as Prometheus cannot return newer values before the next scrape.
+
+    Queries are used as is in the request URL: special characters must be encoded by the caller.
+    """
+
+    def __init__(self, prometheus, cache_ttl=None):
+        """
+        Args:
+            prometheus (Prometheus): Prometheus object
+            cache_ttl (int): seconds a response is served from the cache, default is the prometheus scrape interval
+        """
+        self.prometheus = prometheus
+        self.cache_ttl = prometheus.scrape_interval if cache_ttl is None else cache_ttl
+        self._responses = {}
+        self._pending_queries = set()
+        self._lock = threading.Lock()
+
+    def add_queries(self, queries):
+        """
+        Add queries to fetch with the next query which is not served from the cache.
+
+        Args:
+            queries (Iterable): Prometheus query strings
+        """
+        with self._lock:
+            self._pending_queries.update(queries)
+
+    def query(self, query):
+        """
+        Get a query response, from the cache or fetched with the pending queries.
+
+        Args:
+            query (str): Prometheus query string
+
+        Returns:
+            dict: query response, as returned by Prometheus.query
+        """
+        return self.query_many(queries=[query])[query]
+
+    def query_many(self, queries):
+        """
+        Get query responses; the queries which are not cached are fetched, with the pending queries, in batches.
+
+        Args:
+            queries (Iterable): Prometheus query strings
+
+        Returns:
+            dict: query string to its response, as returned by Prometheus.query
+        """
+        queries = list(dict.fromkeys(queries))
+        with self._lock:
+            now = time.monotonic()
+            fresh_responses = {
+                query: response
+                for query, (fetch_time, response) in self._responses.items()
+                if now - fetch_time < self.cache_ttl
+            }
+            responses = {query: fresh_responses[query] for query in queries if query in fresh_responses}
+
+            if missing_queries := [query for query in queries if query not in responses]:
+                missing_queries.extend(
+                    query
+                    for query in self._pending_queries
+                    if query not in fresh_responses and query not in missing_queries
+                )
+                self._pending_queries.difference_update(missing_queries)
+                for batch in self._split_to_batches(queries=missing_queries):
+                    fetched_responses = self._fetch(queries=batch)
+                    fetch_time = time.monotonic()
+                    for query, response in fetched_responses.items():
+                        self._responses[query] = (fetch_time, response)
+                        if query in queries:
+                            responses[query] = response
+
+        return responses
+
+    def query_range(self, query, start, end, step):
+        """
+        Get the values of a query over time; range responses are not cached.
+
+        Args:
+            query (str): Prometheus query string
+            start (float): range start, unix timestamp
+            end (float): range end, unix timestamp
+            step (int | str): resolution, in seconds or as a Prometheus duration (e.g. "30s")
+
+        Returns:
+            list: range vector results, each one with the "metric" labels and the [timestamp, value] "values"
+        """
+        response = self.prometheus._get_response(
+            query=f"{self.prometheus.api_v1}/query_range?query={query}&start={start}&end={end}&step={step}"
+        )
+        if response.get("status") != "success":
+            LOGGER.error(f"Range query {query} failed: {response}")
+            return []
+        return response.get("data", {}).get("result", [])
+
+    def invalidate(self):
+        with self._lock:
+            self._responses.clear()
+
+    @staticmethod
+    def _split_to_batches(queries):
+        batches = [[]]
+        batch_length = 0
+        for query in queries:
+            if batches[-1] and batch_length + len(query) > PROMETHEUS_BATCH_MAX_QUERY_LENGTH:
+                batches.append([])
+                batch_length = 0
+            batches[-1].append(query)
+            batch_length += len(query)
+        return batches
+
+    def _fetch(self, queries):
+        if len(queries) == 1:
+            return {queries[0]: self.prometheus.query(query=queries[0])}
+
+        # The queries are already URL-safe: only the added PromQL is encoded
+        batch_query = urllib.parse.quote(" or ").join(
+            urllib.parse.quote("label_replace(")
+            + query
+            + urllib.parse.quote(f', "{BATCH_QUERY_LABEL}", "{index}", "", "")')
+            for index, query in enumerate(queries)
+        )
+        response = self.prometheus.query(query=batch_query)
+        if response.get("status") != "success" or response.get("data", {}).get("resultType") != "vector":
+            # e.g. a scalar query cannot be tagged with a label; fall back to one request per query
+            LOGGER.warning(f"Batched query of {len(queries)} queries failed, querying them one by one: {response}")
+            return {query: self.prometheus.query(query=query) for query in queries}
+
+        results = {query: [] for query in queries}
+        for result in response["data"]["result"]:
+            query_index = int(result["metric"].pop(BATCH_QUERY_LABEL))
+            results[queries[query_index]].append(result)
+
+        return {
+            query: {"status": "success", "data": {"resultType": "vector", "result": result}}
+            for query, result in results.items()
+        }
+
+
+@cache
+def get_prometheus_query_batcher(prometheus):
+    """
+    Get the query batcher shared by the users of a Prometheus object.
+
+    Use it for polling only: a cached response may predate the change under test, which a sampler outlives but a
+    one-shot read (e.g. a baseline value) does not.
+
+    Args:
+        prometheus (Prometheus): Prometheus object
+
+    Returns:
+        PrometheusQueryBatcher: query batcher of the Prometheus object
+    """
+    return PrometheusQueryBatcher(prometheus=prometheus)
+
 
 def wait_for_alert(prometheus, alert):
     sampler = TimeoutSampler(
@@ -179,7 +352,7 @@ def wait_for_gauge_metrics_value(prometheus, query, expected_value, timeout=TIME
     samples = TimeoutSampler(
         wait_timeout=timeout,
         sleep=TIMEOUT_5SEC,
-        func=prometheus.query,
+        func=get_prometheus_query_batcher(prometheus=prometheus).query,
         query=query,
     )
     sample = None
@@ -193,3 +366,26 @@ def wait_for_gauge_metrics_value(prometheus, query, expected_value, timeout=TIME
     except TimeoutExpiredError:
         LOGGER.error(f"Query: {query} did not return expected result {expected_value}, actual result: {sample}")
         raise
+
+
+def get_metrics_values_over_time(prometheus, query, duration, step=None):
+    """
+    Get the values of a metrics query over the last duration, e.g. to assert a value did not change.
+
+    Args:
+        prometheus (Prometheus): Prometheus object
+        query (str): Prometheus query string, returning a single series
+        duration (int): seconds until now to get the values of
+        step (int): seconds between values, default is the prometheus scrape interval
+
+    Returns:
+        list: (timestamp, value) tuples, value as returned by Prometheus (str); empty if the query has no results
+    """
+    end = time.time()
+    results = get_prometheus_query_batcher(prometheus=prometheus).query_range(
+        query=query, start=end - duration, end=end, step=step or prometheus.scrape_interval
+    )
+    if not results:
+        LOGGER.warning(f"For range query {query}, empty results found.")
+        return []
+    return [(float(timestamp), value) for timestamp, value in results[0]["values"]]
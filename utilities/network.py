@@ -1,10 +1,16 @@
+import collections
 import contextlib
+import fcntl
 import ipaddress
+import json
 import logging
 import os
 import random
 import re
 import shlex
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import netaddr
 from ocp_resources.network_addons_config import NetworkAddonsConfig
@@ -43,6 +49,7 @@ from utilities.constants import (
     WORKERS_TYPE,
 )
 from utilities.hco import ResourceEditorValidateHCOReconcile
+from utilities.ssh_pool import run_ssh_batch
 
 LOGGER = logging.getLogger(__name__)
 IFACE_UP_STATE = NodeNetworkConfigurationPolicy.Interface.State.UP
@@ -51,12 +58,23 @@ OVS_DS_NAME = "ovs-cni-amd64"
 DEPLOY_OVS = "deployOVS"
 BOND = "bond"
 INPROGRESS = "InProgress"
+MAC_POOL_BLOCK_SIZE = 256
+# Source VMs pinging their destinations at the same time in a ping matrix
+PING_MATRIX_MAX_WORKERS = 8
+PING_RTT_PATTERN = re.compile(r"= [\d.]+/(?P<avg>[\d.]+)/[\d.]+")
+
+# A ping matrix edge; packet_loss is None if the ping could not be run (e.g. the source VM SSH failed)
+PingResult = collections.namedtuple("PingResult", ["src_vm", "dst_vm", "dst_ip", "packet_loss", "rtt_avg"])
 
 
 class SriovIfaceNotFound(Exception):
     pass
 
 
+class MacPoolExhaustedError(Exception):
+    pass
+
+
 class BridgeNodeNetworkConfigurationPolicy(NodeNetworkConfigurationPolicy):
     def __init__(
         self,
@@ -607,29 +625,136 @@ def sriov_network_dict(namespace, network):
     return {network.name: f"{namespace.name}/{network.name}"}
 
 
+def get_mac_pool_state_file(testrun_uid):
+    """
+    Get the path of the MAC block reservations file shared by the pytest-xdist workers of a test run.
+
+    Args:
+        testrun_uid (str): pytest-xdist test run unique id.
+
+    Returns:
+        str: State file path, in the temporary directory.
+    """
+    return os.path.join(tempfile.gettempdir(), f"mac-pool-{testrun_uid}.json")
+
+
 class MacPool:
     """
     Class to manage the mac addresses pool.
     to get this class, use mac_pool fixture.
     whenever you create a VM, before yield, call: mac_pool.append_macs(vm)
     and after yield, call: mac_pool.remove_macs(vm).
+
+    MACs are handed out from blocks of the range, reserved in turn from a random offset; a MAC is
+    allocated and released in constant time. When a state file is given, the reservations are kept
+    in it under a file lock, so pools of several processes (pytest-xdist workers) sharing the file
+    never hand out the same MAC.
+
+    Args:
+        kmp_range (dict): KubeMacPool range, with RANGE_START and RANGE_END keys.
+        state_file (str, optional): File holding the block reservations shared between processes.
+        block_size (int): Number of MACs reserved at a time.
     """
 
-    def __init__(self, kmp_range):
+    def __init__(self, kmp_range, state_file=None, block_size=MAC_POOL_BLOCK_SIZE):
         self.range_start = self.mac_to_int(mac=kmp_range["RANGE_START"])
         self.range_end = self.mac_to_int(mac=kmp_range["RANGE_END"])
         self.pool = range(self.range_start, self.range_end + 1)
-        self.used_macs = []
+        self.state_file = state_file
+        self.block_size = block_size
+        self.used_macs = set()
+        # Released MACs of this pool, handed out again before new blocks are reserved
+        self._free_macs = collections.deque()
+        self._owned_macs = set()
+        # Positions (relative to the range offset) of the current block, not handed out yet
+        self._block = range(0)
+        self._offset = random.randrange(len(self.pool))
+        self._reserved = 0
+        self._lock = threading.Lock()
 
     def get_mac_from_pool(self):
-        return self.mac_sampler(func=random.choice, seq=self.pool)
+        return self.get_macs_from_pool(count=1)[0]
 
-    def mac_sampler(self, func, *args, **kwargs):
-        sampler = TimeoutSampler(wait_timeout=20, sleep=1, func=func, *args, **kwargs)
-        for sample in sampler:
-            mac = self.int_to_mac(num=sample)
-            if mac not in self.used_macs:
-                return mac
+    def get_macs_from_pool(self, count):
+        """
+        Allocate MACs, e.g. for a batch of VMs.
+
+        Args:
+            count (int): Number of MACs to allocate.
+
+        Returns:
+            list: Allocated MACs.
+
+        Raises:
+            MacPoolExhaustedError: If the range has no free MACs left.
+        """
+        with self._lock:
+            macs = []
+            while len(macs) < count:
+                if self._free_macs:
+                    mac = self._free_macs.popleft()
+                elif self._block:
+                    mac = self.pool[(self._offset + self._block[0]) % len(self.pool)]
+                    self._block = self._block[1:]
+                else:
+                    self._block = self._reserve_block(size=max(self.block_size, count - len(macs)))
+                    continue
+
+                # Skip MACs assigned outside the pool, e.g. by KubeMacPool itself
+                if mac not in self.used_macs:
+                    self.used_macs.add(mac)
+                    self._owned_macs.add(mac)
+                    macs.append(mac)
+
+            return [self.int_to_mac(num=mac) for mac in macs]
+
+    def release_macs(self, macs):
+        """
+        Return MACs to the pool; MACs allocated by this pool are handed out again.
+
+        Args:
+            macs (list): MACs to release.
+        """
+        with self._lock:
+            for mac in macs:
+                mac = self.mac_to_int(mac=mac)
+                self.used_macs.discard(mac)
+                if mac in self._owned_macs:
+                    self._owned_macs.remove(mac)
+                    self._free_macs.append(mac)
+
+    def _reserve_block(self, size):
+        if not self.state_file:
+            self._reserved, block = self._next_block(reserved=self._reserved, size=size)
+            return block
+
+        with open(self.state_file, "a+") as fd:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                fd.seek(0)
+                state = json.loads(fd.read() or json.dumps({"offset": self._offset, "reserved": 0}))
+                # All the pools sharing the file reserve their blocks from the same offset
+                self._offset = state["offset"]
+                state["reserved"], block = self._next_block(reserved=state["reserved"], size=size)
+                fd.seek(0)
+                fd.truncate()
+                fd.write(json.dumps(state))
+                fd.flush()
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+        LOGGER.info(f"Reserved MAC pool block of {len(block)} MACs in {self.state_file}")
+        return block
+
+    def _next_block(self, reserved, size):
+        if reserved >= len(self.pool):
+            raise MacPoolExhaustedError(
+                f"No free MACs left in range {self.int_to_mac(num=self.range_start)} - "
+                f"{self.int_to_mac(num=self.range_end)}"
+            )
+
+        block = range(reserved, min(reserved + size, len(self.pool)))
+        return block.stop, block
 
     @staticmethod
     def mac_to_int(mac):
@@ -642,12 +767,16 @@ class MacPool:
         return str(mac)
 
     def append_macs(self, vm):
-        for iface in vm.get_interfaces():
-            self.used_macs.append(iface["macAddress"])
+        with self._lock:
+            self.used_macs.update(self.mac_to_int(mac=mac) for mac in self._vm_macs(vm=vm))
 
     def remove_macs(self, vm):
-        for iface in vm.get_interfaces():
-            self.used_macs.remove(iface["macAddress"])
+        self.release_macs(macs=self._vm_macs(vm=vm))
+
+    @staticmethod
+    def _vm_macs(vm):
+        # Interfaces have no MAC when KubeMacPool ignores the namespace
+        return [iface["macAddress"] for iface in vm.get_interfaces() if iface.get("macAddress")]
 
     def mac_is_within_range(self, mac):
         return self.mac_to_int(mac) in self.pool
@@ -700,12 +829,13 @@ def ping(src_vm, dst_ip, packet_size=None, count=None, quiet_output=True, interf
     Returns:
         float or None: The packet loss amount in a number (Range - 0 to 100).
     """
-    ping_ipv6 = "-6" if get_valid_ip_address(dst_ip=dst_ip, family=IPV6_STR) else ""
-    packet_size = f"-s {packet_size} -M do" if packet_size else ""
-    interface = f"-I {interface}" if interface else ""
-    ping_cmd = (
-        f"ping {'-q' if quiet_output else ''} {ping_ipv6} {'-n' if windows else '-c'} "
-        f"{count if count else '3'} {dst_ip} {packet_size} {interface}"
+    ping_cmd = compose_ping_command(
+        dst_ip=dst_ip,
+        packet_size=packet_size,
+        count=count,
+        quiet_output=quiet_output,
+        interface=interface,
+        windows=windows,
     )
     _, out, err = src_vm.ssh_exec.run_command(command=shlex.split(ping_cmd))
     out_to_process = err or out
@@ -715,6 +845,34 @@ def ping(src_vm, dst_ip, packet_size=None, count=None, quiet_output=True, interf
         return float(match.group(1))
 
 
+def compose_ping_command(dst_ip, packet_size=None, count=None, quiet_output=True, interface=None, windows=False):
+    ping_ipv6 = "-6" if get_valid_ip_address(dst_ip=dst_ip, family=IPV6_STR) else ""
+    packet_size = f"-s {packet_size} -M do" if packet_size else ""
+    interface = f"-I {interface}" if interface else ""
+    return (
+        f"ping {'-q' if quiet_output else ''} {ping_ipv6} {'-n' if windows else '-c'} "
+        f"{count if count else '3'} {dst_ip} {packet_size} {interface}"
+    )
+
+
+def parse_ping_output(out):
+    """
+    Parse the summary of a Linux ping output.
+
+    Args:
+        out (str): ping output
+
+    Returns:
+        tuple: packet loss (float, range 0 to 100) and average RTT in ms (float); None for values not found
+    """
+    loss_match = re.search(r"(\d*\.?\d+)% packet loss", out)
+    rtt_match = PING_RTT_PATTERN.search(out)
+    return (
+        float(loss_match.group(1)) if loss_match else None,
+        float(rtt_match.group("avg")) if rtt_match else None,
+    )
+
+
 def assert_ping_successful(
     src_vm,
     dst_ip,
@@ -737,6 +895,129 @@ def assert_ping_successful(
     )
 
 
+def _ping_destinations(src_vm, destinations, count, packet_size):
+    """
+    Ping all the destinations at once from a source VM, over a single SSH session.
+
+    Args:
+        src_vm (VirtualMachineForTests): source VM
+        destinations (list): (destination VM, destination IP) tuples
+        count (int): amount of packets
+        packet_size (int): number of data bytes to send
+
+    Returns:
+        list: PingResult of each destination
+    """
+    ping_commands = [
+        f'{compose_ping_command(dst_ip=dst_ip, packet_size=packet_size, count=count)} >"$ping_dir/{index}" 2>&1 &'
+        for index, (_, dst_ip) in enumerate(destinations)
+    ]
+    # Pings run in the background and are waited for, outputs are collected once all finished
+    commands = ["ping_dir=$(mktemp -d)", f"{' '.join(ping_commands)} wait"]
+    commands.extend(f'cat "$ping_dir/{index}"' for index in range(len(destinations)))
+    commands.append('rm -rf "$ping_dir"')
+    try:
+        outputs = run_ssh_batch(host=src_vm.ssh_exec, commands=commands, check_rc=False)
+    except Exception as exp:
+        LOGGER.error(f"Failed to ping from {src_vm.name}: {exp}")
+        return [PingResult(src_vm, dst_vm, dst_ip, None, None) for dst_vm, dst_ip in destinations]
+
+    ping_outputs = outputs[2 : 2 + len(destinations)]
+    if len(ping_outputs) < len(destinations):
+        LOGGER.error(f"Got {len(ping_outputs)} ping outputs of {len(destinations)} destinations from {src_vm.name}")
+    # Destinations without output count as failed, with unknown packet loss
+    ping_outputs += [""] * (len(destinations) - len(ping_outputs))
+    return [
+        PingResult(src_vm, dst_vm, dst_ip, *parse_ping_output(out=out))
+        for (dst_vm, dst_ip), out in zip(destinations, ping_outputs, strict=True)
+    ]
+
+
+def _lookup_destination_ip(vm, iface_name, ip_family):
+    iface_name = iface_name or vm.vmi.interfaces[0]["name"]
+    try:
+        return vm, lookup_iface_status_ip(vm=vm, iface_name=iface_name, ip_family=4 if ip_family == IPV4_STR else 6)
+    except IpNotFound:
+        LOGGER.warning(f"{vm.name} interface {iface_name} has no {ip_family} address, not pinging it")
+        return vm, None
+
+
+def ping_matrix(
+    vms,
+    ip_families=(IPV4_STR,),
+    iface_name=None,
+    count=None,
+    packet_size=None,
+    max_workers=PING_MATRIX_MAX_WORKERS,
+):
+    """
+    Ping between every pair of VMs, for every IP family.
+
+    Every source VM pings all its destinations at once over one SSH session; up to max_workers source VMs
+    ping at the same time. Destination IP families a VM has no address of (e.g. IPv6 on a single stack VM) are
+    left out.
+
+    Args:
+        vms (list): VMs to ping from and to
+        ip_families (Iterable): IP families to ping, IPV4_STR and/or IPV6_STR
+        iface_name (str): destination VMs interface to ping, default is the first interface
+        count (int): amount of packets per ping
+        packet_size (int): number of data bytes to send
+        max_workers (int): source VMs pinging at the same time
+
+    Returns:
+        list: PingResult of every (source VM, destination IP) edge
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        destination_ips = [
+            (dst_vm, dst_ip)
+            for dst_vm, dst_ip in executor.map(
+                lambda destination: _lookup_destination_ip(
+                    vm=destination[0], iface_name=iface_name, ip_family=destination[1]
+                ),
+                [(dst_vm, ip_family) for dst_vm in vms for ip_family in ip_families],
+            )
+            if dst_ip
+        ]
+        LOGGER.info(f"Pinging {len(destination_ips)} destinations from each of {len(vms)} VMs")
+        results = []
+        futures = [
+            executor.submit(
+                _ping_destinations,
+                src_vm=src_vm,
+                destinations=[(dst_vm, dst_ip) for dst_vm, dst_ip in destination_ips if dst_vm is not src_vm],
+                count=count,
+                packet_size=packet_size,
+            )
+            for src_vm in vms
+        ]
+        for future in as_completed(futures):
+            results.extend(future.result())
+
+    return results
+
+
+def assert_ping_matrix_successful(vms, ip_families=(IPV4_STR,), iface_name=None, count=None, packet_size=None):
+    """
+    Assert every VM pings every other VM without packet loss; all the failing edges are reported at once.
+
+    Args:
+        vms (list): VMs to ping from and to
+        ip_families (Iterable): IP families to ping, IPV4_STR and/or IPV6_STR
+        iface_name (str): destination VMs interface to ping, default is the first interface
+        count (int): amount of packets per ping
+        packet_size (int): number of data bytes to send
+    """
+    failed_edges = [
+        f"{result.src_vm.name} -> {result.dst_vm.name} ({result.dst_ip}): packet loss {result.packet_loss}"
+        for result in ping_matrix(
+            vms=vms, ip_families=ip_families, iface_name=iface_name, count=count, packet_size=packet_size
+        )
+        if result.packet_loss != 0
+    ]
+    assert not failed_edges, "Ping failed:\n" + "\n".join(sorted(failed_edges))
+
+
 def get_ip_from_vm_or_virt_handler_pod(family, vm=None, virt_handler_pod=None):
     """
     Attempt to find an IP in one of 2 possible sources - VirtualMachine or virt-handler Pod.
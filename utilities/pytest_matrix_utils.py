@@ -5,6 +5,8 @@ def foo_matrix(matrix):
     return matrix
 """
 
+from functools import cache
+
 from ocp_resources.storage_class import StorageClass
 
 from utilities.cluster import cache_admin_client
@@ -44,19 +46,32 @@ def hpp_matrix(matrix):
         StorageClass.Provisioner.HOSTPATH_CSI,
         StorageClass.Provisioner.HOSTPATH,
     ]
+    storage_class_provisioners = _get_storage_class_provisioners() if matrix else {}
 
     for storage_class in matrix:
-        # Using `get_client` explicitly as this function is dynamically called (like other functions in the module).
-        # The other functions do not need a client.
-        if (
-            StorageClass(client=cache_admin_client(), name=[*storage_class][0]).instance.provisioner
-            in hpp_sc_provisioners
-        ):
+        if storage_class_provisioners.get([*storage_class][0]) in hpp_sc_provisioners:
             matrix_to_return.append(storage_class)
 
     return matrix_to_return
 
 
+@cache
+def _get_storage_class_provisioners():
+    """
+    Get the provisioner of every storage class with a single LIST request, once per session.
+
+    Returns:
+        dict: storage class name to its provisioner
+    """
+    # Using `cache_admin_client` explicitly as matrix functions are dynamically called and cannot get a client.
+    storage_classes = (
+        cache_admin_client()
+        .resources.get(api_version=f"{StorageClass.api_group}/{StorageClass.ApiVersion.V1}", kind=StorageClass.kind)
+        .get()
+    )
+    return {storage_class.metadata.name: storage_class.provisioner for storage_class in storage_classes.items}
+
+
 def wffc_matrix(matrix):
     matrix_to_return = []
     for storage_class in matrix:
@@ -1,3 +1,4 @@
+import copy
 import getpass
 import importlib
 import json
@@ -8,7 +9,7 @@ import re
 import shutil
 import socket
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import Any
 
 import pytest
@@ -46,6 +47,11 @@ from utilities.os_utils import (
 )
 
 LOGGER = logging.getLogger(__name__)
+IS_JIRA_OPEN_CALL_PATTERN = re.compile(r"""is_jira_open\((?:jira_id=)?["']([A-Z][A-Z0-9]*-\d+)["']\)""")
+
+# Dynamic matrices resolved in the session, by (base matrix name, matrix function name)
+_DYNAMIC_MATRIX_PARAMS_CACHE: dict[tuple[str, str], list[Any]] = {}
+_DYNAMIC_MATRIX_PARAMS_CACHE_STATS: Counter[str] = Counter()
 
 
 def get_base_matrix_name(matrix_name):
@@ -74,6 +80,8 @@ def get_matrix_params(pytest_config, matrix_name):
        snapshot_matrix is a function in utilities.pytest_matrix_utils
        all function in utilities.pytest_matrix_utils accept only matrix args.
 
+    Dynamic matrices are resolved once per session, see get_dynamic_matrix_params_cache_stats.
+
     Returns:
          list: list of matrix params
     """
@@ -101,13 +109,35 @@ def get_matrix_params(pytest_config, matrix_name):
             if module_name not in sys.modules:
                 sys.modules[module_name] = importlib.import_module(name=module_name)
 
-            pytest_matrix_utils = sys.modules[module_name]
-            matrix_func = getattr(pytest_matrix_utils, _matrix_func_name, None)
-            return matrix_func(matrix=_base_matrix_params)
+            cache_key = (base_matrix_name, _matrix_func_name)
+            if cache_key in _DYNAMIC_MATRIX_PARAMS_CACHE:
+                _DYNAMIC_MATRIX_PARAMS_CACHE_STATS["hits"] += 1
+            else:
+                _DYNAMIC_MATRIX_PARAMS_CACHE_STATS["misses"] += 1
+                pytest_matrix_utils = sys.modules[module_name]
+                matrix_func = getattr(pytest_matrix_utils, _matrix_func_name, None)
+                _DYNAMIC_MATRIX_PARAMS_CACHE[cache_key] = matrix_func(matrix=_base_matrix_params)
+
+            # A deep copy, so callers cannot alter the cached matrix nor its storage class / param dicts
+            return copy.deepcopy(_DYNAMIC_MATRIX_PARAMS_CACHE[cache_key])
 
     return _matrix_params if isinstance(_matrix_params, list) else [_matrix_params]
 
 
+def get_dynamic_matrix_params_cache_stats():
+    """
+    Get the dynamic matrices cache statistics of the session.
+
+    Returns:
+        dict: "hits" and "misses" counts and the number of cached "matrices"
+    """
+    return {
+        "hits": _DYNAMIC_MATRIX_PARAMS_CACHE_STATS["hits"],
+        "misses": _DYNAMIC_MATRIX_PARAMS_CACHE_STATS["misses"],
+        "matrices": len(_DYNAMIC_MATRIX_PARAMS_CACHE),
+    }
+
+
 def config_default_storage_class(session):
     # Default storage class selection order:
     # 1. --default-storage-class from command line
@@ -491,6 +521,26 @@ def validate_collected_tests_arch_params(session: pytest.Session) -> None:
         )
 
 
+def get_collected_tests_jira_ids(items: list[pytest.Item]) -> set[str]:
+    """Get the Jira IDs referenced by collected tests.
+
+    The IDs come from `jira` markers and from literal `is_jira_open` calls in the tests modules.
+
+    Args:
+        items: Collected test items.
+
+    Returns:
+        Jira IDs, e.g. {"CNV-12345"}.
+    """
+    jira_ids = {marker.args[0] for item in items for marker in item.iter_markers(name="jira") if marker.args}
+    for module_path in {item.path for item in items}:
+        try:
+            jira_ids.update(IS_JIRA_OPEN_CALL_PATTERN.findall(module_path.read_text()))
+        except OSError as exp:
+            LOGGER.warning(f"Failed to read {module_path} to collect its Jira IDs: {exp}")
+    return jira_ids
+
+
 def generate_common_template_matrix_dicts(os_dict: dict[str, Any], cpu_arch: str | None = None) -> None:
     """Generate common template matrix dictionaries in py_config from OS lists.
 
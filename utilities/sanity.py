@@ -1,13 +1,22 @@
-from typing import Any
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, NamedTuple
 
 from _pytest.fixtures import FixtureRequest
 from kubernetes.client import ApiException
 from kubernetes.dynamic import DynamicClient
 from kubernetes.dynamic.exceptions import ResourceNotFoundError
+from kubernetes.dynamic.resource import ResourceField
 from ocp_resources.endpoints import Endpoints
 from ocp_resources.mutating_webhook_config import MutatingWebhookConfiguration
 from ocp_resources.namespace import Namespace
 from ocp_resources.node import Node
+from ocp_resources.pod import Pod
+from ocp_resources.resource import Resource
 from ocp_resources.validating_webhook_config import ValidatingWebhookConfiguration
 from ocp_resources.virtual_machine import VirtualMachine
 from ocp_utilities.exceptions import NodeNotReadyError, NodeUnschedulableError
@@ -22,6 +31,49 @@ from utilities.infra import LOGGER, wait_for_pods_running
 from utilities.pytest_utils import exit_pytest_execution
 
 
+@dataclass(frozen=True)
+class ClusterSnapshot:
+    """
+    Cluster state the sanity checks are evaluated against, read with a single LIST per resource kind.
+
+    Args:
+        nodes: Nodes of the cluster.
+        pods: Pods of the HCO namespace.
+        endpoints: Endpoints of the HCO namespace, by name.
+        webhook_configurations: Mutating and validating webhook configurations.
+        duration: Seconds it took to read the snapshot.
+    """
+
+    nodes: list[ResourceField]
+    pods: list[ResourceField]
+    endpoints: dict[str, ResourceField]
+    webhook_configurations: list[ResourceField]
+    duration: float
+
+
+@dataclass(frozen=True)
+class SanityCheckResult:
+    """
+    Outcome of a single sanity check.
+
+    Args:
+        name: Check name.
+        duration: Seconds the check took.
+        error: Exception which failed the check, None if it passed.
+    """
+
+    name: str
+    duration: float
+    error: Exception | None = None
+
+
+class _SnapshotNode(NamedTuple):
+    """Node of a ClusterSnapshot, with the attributes the ocp_utilities node asserts use."""
+
+    name: str
+    instance: ResourceField
+
+
 def storage_sanity_check(cluster_storage_classes_names: list[str]) -> bool:
     """
     Verify cluster has all expected storage classes from pytest configuration.
@@ -59,29 +111,48 @@ def _discover_webhook_services(admin_client: DynamicClient, namespace: Namespace
     Returns:
         Set of service names that are referenced by webhook configurations in the namespace.
     """
-    webhook_services: set[str] = set()
-
+    webhook_configurations = []
     for webhook_kind in [MutatingWebhookConfiguration, ValidatingWebhookConfiguration]:
         LOGGER.info(f"Scanning {webhook_kind.kind} resources for webhook services")
-        for webhook in webhook_kind.get(client=admin_client):
-            webhook_items = webhook.instance.webhooks or []
-            if not webhook_items:
-                LOGGER.warning(f"Webhook configuration {webhook.name} has no webhooks")
-                continue
+        webhook_configurations.extend(webhook.instance for webhook in webhook_kind.get(client=admin_client))
 
-            for webhook_item in webhook_items:
-                service_config = webhook_item.get("clientConfig", {}).get("service")
-                # Skip URL-based webhooks (they don't use a service)
-                if not service_config:
-                    continue
+    return _get_webhook_services(webhook_configurations=webhook_configurations, namespace=namespace)
+
+
+def _get_webhook_services(webhook_configurations: list[ResourceField], namespace: Namespace) -> set[str]:
+    """
+    Extract the names of the services in the namespace which webhook configurations point to.
+
+    Args:
+        webhook_configurations: Mutating and validating webhook configurations.
+        namespace: Namespace resource.
+
+    Returns:
+        Set of service names that are referenced by the webhook configurations in the namespace.
+    """
+    webhook_services: set[str] = set()
+
+    for webhook_configuration in webhook_configurations:
+        webhook_items = webhook_configuration.webhooks or []
+        if not webhook_items:
+            LOGGER.warning(f"Webhook configuration {webhook_configuration.metadata.name} has no webhooks")
+            continue
+
+        for webhook_item in webhook_items:
+            service_config = webhook_item.get("clientConfig", {}).get("service")
+            # Skip URL-based webhooks (they don't use a service)
+            if not service_config:
+                continue
 
-                if service_config["namespace"] == namespace.name:
-                    webhook_services.add(service_config["name"])
+            if service_config["namespace"] == namespace.name:
+                webhook_services.add(service_config["name"])
 
     return webhook_services
 
 
-def check_webhook_endpoints_health(admin_client: DynamicClient, namespace: Namespace) -> None:
+def check_webhook_endpoints_health(
+    admin_client: DynamicClient, namespace: Namespace, snapshot: ClusterSnapshot | None = None
+) -> None:
     """
     Check that all webhook services in the HCO namespace have available endpoints.
 
@@ -90,13 +161,19 @@ def check_webhook_endpoints_health(admin_client: DynamicClient, namespace: Names
     Args:
         admin_client: Kubernetes dynamic client with admin privileges for cluster operations.
         namespace: Namespace resource.
+        snapshot: Cluster snapshot to read the webhook configurations and endpoints from, instead of the API.
 
     Raises:
         ClusterSanityError: When any webhook service has no ready endpoint addresses.
     """
     LOGGER.info(f"Checking webhook endpoints health for services in namespace: {namespace.name}")
 
-    webhook_services = _discover_webhook_services(admin_client=admin_client, namespace=namespace)
+    if snapshot:
+        webhook_services = _get_webhook_services(
+            webhook_configurations=snapshot.webhook_configurations, namespace=namespace
+        )
+    else:
+        webhook_services = _discover_webhook_services(admin_client=admin_client, namespace=namespace)
 
     if not webhook_services:
         LOGGER.warning(f"No webhook services discovered in namespace {namespace.name}")
@@ -107,14 +184,21 @@ def check_webhook_endpoints_health(admin_client: DynamicClient, namespace: Names
     for service_name in sorted(webhook_services):
         LOGGER.info(f"Checking endpoints for service: {service_name}")
         try:
-            endpoint = Endpoints(
-                name=service_name,
-                namespace=namespace.name,
-                client=admin_client,
-                ensure_exists=True,
-            )
+            if snapshot:
+                if (endpoint_instance := snapshot.endpoints.get(service_name)) is None:
+                    LOGGER.error(f"Endpoints resource not found for service: {service_name}")
+                    services_without_endpoints.append(service_name)
+                    continue
+                subsets = endpoint_instance.subsets
+            else:
+                endpoint = Endpoints(
+                    name=service_name,
+                    namespace=namespace.name,
+                    client=admin_client,
+                    ensure_exists=True,
+                )
+                subsets = endpoint.instance.subsets
 
-            subsets = endpoint.instance.subsets
             if not subsets:
                 LOGGER.error(f"No subsets found in endpoints for service: {service_name}")
                 services_without_endpoints.append(service_name)
@@ -201,6 +285,187 @@ def check_vm_creation_capability(admin_client: DynamicClient, namespace: str) ->
         ) from ex
 
 
+def take_cluster_snapshot(admin_client: DynamicClient, hco_namespace: Namespace) -> ClusterSnapshot:
+    """
+    Read the cluster state the sanity checks need, listing all the resource kinds in parallel.
+
+    Args:
+        admin_client: Kubernetes dynamic client with admin privileges for cluster operations.
+        hco_namespace: Namespace resource where HyperConverged Operator is deployed.
+
+    Returns:
+        The cluster snapshot.
+    """
+    start_time = time.monotonic()
+    with ThreadPoolExecutor(max_workers=5, thread_name_prefix="sanity-snapshot") as executor:
+        nodes = executor.submit(_list_resources, admin_client=admin_client, resource_kind=Node)
+        pods = executor.submit(
+            _list_resources, admin_client=admin_client, resource_kind=Pod, namespace=hco_namespace.name
+        )
+        endpoints = executor.submit(
+            _list_resources, admin_client=admin_client, resource_kind=Endpoints, namespace=hco_namespace.name
+        )
+        webhook_configurations = [
+            executor.submit(_list_resources, admin_client=admin_client, resource_kind=webhook_kind)
+            for webhook_kind in (MutatingWebhookConfiguration, ValidatingWebhookConfiguration)
+        ]
+
+    snapshot = ClusterSnapshot(
+        nodes=nodes.result(),
+        pods=pods.result(),
+        endpoints={endpoint.metadata.name: endpoint for endpoint in endpoints.result()},
+        webhook_configurations=[
+            webhook_configuration for future in webhook_configurations for webhook_configuration in future.result()
+        ],
+        duration=time.monotonic() - start_time,
+    )
+    LOGGER.info(
+        f"Cluster snapshot: {len(snapshot.nodes)} nodes, {len(snapshot.pods)} pods, "
+        f"{len(snapshot.endpoints)} endpoints, {len(snapshot.webhook_configurations)} webhook configurations "
+        f"in {snapshot.duration:.2f}s"
+    )
+    return snapshot
+
+
+def check_nodes_health(nodes: list[Node], snapshot: ClusterSnapshot) -> None:
+    """
+    Check that the nodes are healthy and schedulable, from their state in the cluster snapshot.
+
+    Args:
+        nodes: List of Node resources to check.
+        snapshot: Cluster snapshot.
+
+    Raises:
+        NodeNotReadyError: When one or more nodes are not in the cluster anymore.
+        NodeUnschedulableError: When one or more nodes are unschedulable.
+    """
+    snapshot_nodes = {node.metadata.name: node for node in snapshot.nodes}
+    if missing_nodes := sorted(node.name for node in nodes if node.name not in snapshot_nodes):
+        raise NodeNotReadyError(f"Following nodes are not in the cluster: {missing_nodes}")
+
+    nodes_to_check = [_SnapshotNode(name=node.name, instance=snapshot_nodes[node.name]) for node in nodes]
+    assert_nodes_in_healthy_condition(nodes=nodes_to_check, healthy_node_condition_type=KUBELET_READY_CONDITION)
+    assert_nodes_schedulable(nodes=nodes_to_check)
+
+
+def get_not_running_snapshot_pods(pods: list[ResourceField], filter_pods_by_name: str = "") -> list[dict[str, str]]:
+    """
+    Get the pods which are not in a final healthy state (running / completed), like get_not_running_pods but from
+    listed pods, without a request per pod.
+
+    Args:
+        pods: Pods, as listed from the API.
+        filter_pods_by_name: Pods with this string in their name are ignored.
+
+    Returns:
+        Pod name to its phase, or to its waiting container reason, for each pod which is not running.
+    """
+    not_running_pods = []
+    for pod in pods:
+        pod_name = pod.metadata.name
+        if filter_pods_by_name and filter_pods_by_name in pod_name:
+            continue
+
+        pod_status = pod.status or {}
+        if pod.metadata.get("deletionTimestamp") or pod_status.get("phase") not in (
+            Pod.Status.RUNNING,
+            Pod.Status.SUCCEEDED,
+        ):
+            not_running_pods.append({pod_name: pod_status.get("phase")})
+            continue
+
+        for container_status in pod_status.get("containerStatuses") or []:
+            if waiting_container := (container_status.get("state") or {}).get("waiting"):
+                not_running_pods.append({pod_name: waiting_container.get("reason") or waiting_container})
+                break
+
+    return not_running_pods
+
+
+def check_pods_running(admin_client: DynamicClient, hco_namespace: Namespace, snapshot: ClusterSnapshot) -> None:
+    """
+    Check that the HCO namespace pods are running; if they are not all running in the cluster snapshot, wait for them.
+
+    Args:
+        admin_client: Kubernetes dynamic client with admin privileges for cluster operations.
+        hco_namespace: Namespace resource where HyperConverged Operator is deployed.
+        snapshot: Cluster snapshot.
+
+    Raises:
+        ClusterSanityError: When the pods are not running within the timeout.
+    """
+    if not (not_running_pods := get_not_running_snapshot_pods(pods=snapshot.pods, filter_pods_by_name=IMAGE_CRON_STR)):
+        return
+
+    LOGGER.warning(f"Not running pods: {not_running_pods}")
+    try:
+        wait_for_pods_running(
+            admin_client=admin_client,
+            namespace=hco_namespace,
+            filter_pods_by_name=IMAGE_CRON_STR,
+        )
+    except TimeoutExpiredError as timeout_error:
+        LOGGER.error(timeout_error)
+        raise ClusterSanityError(
+            err_str=f"Timed out waiting for all pods in namespace {hco_namespace.name} to get to running state."
+        )
+
+
+def run_sanity_checks(checks: dict[str, Callable[[], None]]) -> list[SanityCheckResult]:
+    """
+    Run sanity checks in parallel.
+
+    Args:
+        checks: Check name to the check function, which raises on failure.
+
+    Returns:
+        The checks results, in the order of the checks.
+    """
+    if not checks:
+        return []
+
+    with ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="sanity") as executor:
+        futures = [executor.submit(_run_timed_check, name=name, check=check) for name, check in checks.items()]
+    return [future.result() for future in futures]
+
+
+def _run_timed_check(name: str, check: Callable[[], None]) -> SanityCheckResult:
+    start_time = time.monotonic()
+    try:
+        check()
+    except Exception as ex:
+        return SanityCheckResult(name=name, duration=time.monotonic() - start_time, error=ex)
+    return SanityCheckResult(name=name, duration=time.monotonic() - start_time)
+
+
+def _start_background_check(name: str, check: Callable[[], None]) -> Callable[[], SanityCheckResult]:
+    """
+    Start a sanity check in a daemon thread, which does not hold the pytest exit if its result is not needed.
+
+    Returns:
+        Function waiting for the check and returning its result.
+    """
+    results: list[SanityCheckResult] = []
+    thread = threading.Thread(
+        target=lambda: results.append(_run_timed_check(name=name, check=check)),
+        name=f"sanity-{name}",
+        daemon=True,
+    )
+    thread.start()
+
+    def _join() -> SanityCheckResult:
+        thread.join()
+        return results[0]
+
+    return _join
+
+
+def _list_resources(
+    admin_client: DynamicClient, resource_kind: type[Resource], namespace: str | None = None
+) -> list[ResourceField]:
+    return list(resource_kind.get(client=admin_client, raw=True, namespace=namespace))
+
+
 def cluster_sanity(
     request: FixtureRequest,
     admin_client: DynamicClient,
@@ -221,7 +486,13 @@ def cluster_sanity(
        are present on the cluster.
     2. Nodes: Ensures all nodes are in ready and schedulable state.
     3. Pods: Validates all CNV pods in the HCO namespace are running.
-    4. HCO conditions: Waits for HyperConverged Operator to reach healthy state.
+    4. Webhooks: Validates webhook services have endpoints and a VM can be created (dry-run).
+    5. HCO conditions: Waits for HyperConverged Operator to reach healthy state.
+
+    Nodes, pods, endpoints and webhook configurations are read once into a cluster snapshot, with the
+    resource kinds listed in parallel, and the checks run in parallel against it. The HCO conditions are
+    waited for in the background from the start. Failures are raised in the order above, and the duration
+    of each check is logged.
 
     Args:
         request: Pytest fixture request object providing access to test configuration
@@ -264,6 +535,13 @@ def cluster_sanity(
         LOGGER.info(
             f"Running cluster sanity. (To skip cluster sanity check pass {skip_cluster_sanity_check} to pytest)"
         )
+        # The HCO conditions take the longest to stabilize: wait for them while the other checks run
+        join_hco_check = _start_background_check(
+            name="hco",
+            check=partial(wait_for_hco_conditions, admin_client=admin_client, hco_namespace=hco_namespace),
+        )
+
+        checks: dict[str, Callable[[], None]] = {}
         # Check storage class only if --cluster-sanity-skip-storage-check not passed to pytest.
         if request.session.config.getoption(skip_storage_classes_check):
             LOGGER.warning(f"Skipping storage classes check, got {skip_storage_classes_check}")
@@ -272,47 +550,63 @@ def cluster_sanity(
                 f"Check storage classes sanity. (To skip storage class sanity check pass {skip_storage_classes_check} "
                 f"to pytest)"
             )
-            if not storage_sanity_check(cluster_storage_classes_names=cluster_storage_classes_names):
-                raise StorageSanityError(
-                    err_str=f"Cluster is missing storage class.\n"
-                    f"either run with '--storage-class-matrix' or with '{skip_storage_classes_check}'"
-                )
 
-        # Check nodes only if --cluster-sanity-skip-nodes-check not passed to pytest.
-        if request.session.config.getoption(skip_nodes_check):
-            LOGGER.warning(f"Skipping nodes check, got {skip_nodes_check}")
+            def _check_storage_classes() -> None:
+                if not storage_sanity_check(cluster_storage_classes_names=cluster_storage_classes_names):
+                    raise StorageSanityError(
+                        err_str=f"Cluster is missing storage class.\n"
+                        f"either run with '--storage-class-matrix' or with '{skip_storage_classes_check}'"
+                    )
+
+            checks["storage"] = _check_storage_classes
+
+        check_nodes = not request.session.config.getoption(skip_nodes_check)
+        check_webhooks = not request.session.config.getoption(skip_webhook_check)
+        snapshot = (
+            take_cluster_snapshot(admin_client=admin_client, hco_namespace=hco_namespace)
+            if check_nodes or check_webhooks
+            else None
+        )
 
-        else:
+        # Check nodes only if --cluster-sanity-skip-nodes-check not passed to pytest.
+        if check_nodes:
             # validate that all the nodes are ready and schedulable and CNV pods are running
             LOGGER.info(f"Check nodes sanity. (To skip nodes sanity check pass {skip_nodes_check} to pytest)")
-            assert_nodes_in_healthy_condition(nodes=nodes, healthy_node_condition_type=KUBELET_READY_CONDITION)
-            assert_nodes_schedulable(nodes=nodes)
-
-            try:
-                wait_for_pods_running(
-                    admin_client=admin_client,
-                    namespace=hco_namespace,
-                    filter_pods_by_name=IMAGE_CRON_STR,
-                )
-            except TimeoutExpiredError as timeout_error:
-                LOGGER.error(timeout_error)
-                raise ClusterSanityError(
-                    err_str=f"Timed out waiting for all pods in namespace {hco_namespace.name} to get to running state."
-                )
+            checks["nodes"] = partial(check_nodes_health, nodes=nodes, snapshot=snapshot)
+            checks["pods"] = partial(
+                check_pods_running, admin_client=admin_client, hco_namespace=hco_namespace, snapshot=snapshot
+            )
+        else:
+            LOGGER.warning(f"Skipping nodes check, got {skip_nodes_check}")
 
         # Check webhook endpoints only if --cluster-sanity-skip-webhook-check not passed to pytest.
-        if request.session.config.getoption(skip_webhook_check):
-            LOGGER.warning(f"Skipping webhook health check, got {skip_webhook_check}")
-        else:
+        if check_webhooks:
             LOGGER.info(f"Check webhook endpoints health. (To skip webhook check pass {skip_webhook_check} to pytest)")
-            check_webhook_endpoints_health(admin_client=admin_client, namespace=hco_namespace)
-            check_vm_creation_capability(admin_client=admin_client, namespace="default")
+            checks["webhook"] = partial(
+                check_webhook_endpoints_health, admin_client=admin_client, namespace=hco_namespace, snapshot=snapshot
+            )
+            checks["vm_creation"] = partial(
+                check_vm_creation_capability, admin_client=admin_client, namespace="default"
+            )
+        else:
+            LOGGER.warning(f"Skipping webhook health check, got {skip_webhook_check}")
 
-        # Wait for hco to be healthy
-        wait_for_hco_conditions(
-            admin_client=admin_client,
-            hco_namespace=hco_namespace,
+        results = run_sanity_checks(checks=checks)
+        # Wait for hco to be healthy, unless another check already failed
+        if not any(result.error for result in results):
+            results.append(join_hco_check())
+
+        LOGGER.info(
+            "Cluster sanity checks: "
+            + ", ".join(
+                f"{result.name}: {'failed' if result.error else 'passed'} in {result.duration:.2f}s"
+                for result in results
+            )
         )
+        # Failures are raised in the checks order
+        for result in results:
+            if result.error:
+                raise result.error
 
     except (ClusterSanityError, NodeUnschedulableError, NodeNotReadyError, StorageSanityError) as ex:
         exit_pytest_execution(
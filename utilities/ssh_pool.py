@@ -0,0 +1,311 @@
+"""
+Pooled SSH connections to VMs.
+
+A VM's SSH connection (and the `virtctl port-forward` process behind it) is opened once and kept alive; every
+command runs on its own channel of the shared transport, like an OpenSSH ControlMaster.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+import paramiko
+from ocp_utilities.exceptions import CommandExecFailed
+from rrmngmnt import Host, ssh
+from rrmngmnt.executor import ExecutorFactory
+from rrmngmnt.user import User
+
+from utilities.constants import TIMEOUT_30SEC
+
+LOGGER = logging.getLogger(__name__)
+
+BATCH_RC_MARKER = "__cnv_batch_rc__"
+
+_SESSION_SSH_CONNECTION_POOL: SSHConnectionPool | None = None
+
+
+class UnsupportedSSHSessionError(Exception):
+    pass
+
+
+class _SessionInternals:
+    """
+    The rrmngmnt session internals a pooled session is built on: its paramiko client, TCP timeout and private key.
+
+    rrmngmnt has no public API for them, every access to its private attributes is kept here; an rrmngmnt version
+    without them fails on the first session with UnsupportedSSHSessionError rather than deep inside paramiko.
+    """
+
+    def __init__(self, session: ssh.RemoteExecutor.Session) -> None:
+        try:
+            self.client: paramiko.SSHClient = session._ssh
+            self.timeout: float = session._timeout
+            self.pkey: paramiko.PKey | None = session.pkey
+        except AttributeError as exception:
+            raise UnsupportedSSHSessionError(
+                f"rrmngmnt SSH session internals not found, cannot pool SSH connections: {exception}"
+            ) from exception
+
+
+class PooledSSHSession(ssh.RemoteExecutor.Session):
+    """
+    SSH session which stays connected when its context exits.
+
+    The connection is dropped only by `disconnect`, or when the context exits with an exception and the
+    transport is no longer active.
+    """
+
+    def __init__(self, executor: PooledRemoteExecutor, timeout: float | None = None) -> None:
+        super().__init__(executor=executor, timeout=timeout)
+        self._internals = _SessionInternals(session=self)
+        self._proxy: paramiko.ProxyCommand | None = None
+
+    @property
+    def is_active(self) -> bool:
+        transport = self._internals.client.get_transport()
+        return bool(transport and transport.is_active())
+
+    def open(self) -> None:
+        if self.is_active:
+            return
+
+        self._internals.client.get_host_keys().clear()
+        self._proxy = paramiko.ProxyCommand(self._executor.proxy_command) if self._executor.proxy_command else None
+        self._internals.client.connect(
+            self._executor.address,
+            username=self._executor.user.name,
+            password=self._executor.user.password,
+            timeout=self._internals.timeout,
+            pkey=self._internals.pkey,
+            port=self._executor.port,
+            disabled_algorithms=self._executor.disabled_algorithms,
+            sock=self._proxy,
+            banner_timeout=self._executor.banner_timeout,
+        )
+        self._internals.client.get_transport().set_keepalive(interval=self._executor.keepalive_interval)
+        LOGGER.info(f"Opened pooled SSH connection to {self._executor.address}")
+
+    def close(self) -> None:
+        # Keep the connection for the next command; see disconnect
+        pass
+
+    def disconnect(self) -> None:
+        self._internals.client.close()
+        if self._proxy:
+            try:
+                self._proxy.close()
+                self._proxy.process.wait(timeout=5)
+            except Exception as exception:
+                LOGGER.debug(f"ProxyCommand cleanup error: {exception}")
+            self._proxy = None
+
+    def __exit__(self, type_, value, tb):
+        if type_ and not self.is_active:
+            LOGGER.warning(f"Pooled SSH connection to {self._executor.address} lost: {value}")
+            self.disconnect()
+
+
+class PooledRemoteExecutor(ssh.RemoteExecutor):
+    """
+    RemoteExecutor whose sessions share one SSH connection.
+
+    Args:
+        user (User): SSH user.
+        address (str): Hostname; only used for logging when proxy_command is set.
+        proxy_command (str): Command used as the transport, e.g. `virtctl port-forward --stdio=true ...`.
+        sudo (bool): Run the commands with sudo.
+        disabled_algorithms (dict): Algorithms paramiko does not negotiate, e.g. {"pubkeys": ["rsa-sha2-512"]}.
+        keepalive_interval (int): Seconds between SSH keepalive packets.
+    """
+
+    def __init__(
+        self,
+        user: User,
+        address: str,
+        proxy_command: str | None = None,
+        sudo: bool = False,
+        disabled_algorithms: dict[str, list[str]] | None = None,
+        keepalive_interval: int = TIMEOUT_30SEC,
+    ) -> None:
+        super().__init__(user=user, address=address, sudo=sudo, disabled_algorithms=disabled_algorithms)
+        self.proxy_command = proxy_command
+        self.keepalive_interval = keepalive_interval
+        self._session: PooledSSHSession | None = None
+        self._lock = threading.Lock()
+
+    def session(self, timeout: float | None = None) -> PooledSSHSession:
+        with self._lock:
+            if self._session is None:
+                self._session = PooledSSHSession(executor=self, timeout=timeout)
+            elif not self._session.is_active:
+                # Reconnect lazily, e.g. after the VM rebooted
+                self._session.disconnect()
+            self._session.open()
+            return self._session
+
+    def disconnect(self) -> None:
+        with self._lock:
+            if self._session:
+                self._session.disconnect()
+                self._session = None
+
+
+class PooledRemoteExecutorFactory(ExecutorFactory):
+    """
+    Executor factory for rrmngmnt Host objects, which hands out the pooled executor of a connection key.
+    """
+
+    def __init__(
+        self,
+        pool: SSHConnectionPool,
+        key: str,
+        proxy_command: str | None = None,
+        disabled_algorithms: dict[str, list[str]] | None = None,
+    ) -> None:
+        self.pool = pool
+        self.key = key
+        self.proxy_command = proxy_command
+        self.disabled_algorithms = disabled_algorithms
+
+    def build(self, host: Host, user: User, sudo: bool = False) -> PooledRemoteExecutor:
+        return self.pool.executor(
+            key=self.key,
+            user=user,
+            address=host.ip,
+            proxy_command=self.proxy_command,
+            sudo=sudo,
+            disabled_algorithms=self.disabled_algorithms,
+        )
+
+
+class SSHConnectionPool:
+    """
+    Pooled SSH executors, one per connection key (a VM UID), user and sudo mode.
+    """
+
+    def __init__(self, keepalive_interval: int = TIMEOUT_30SEC) -> None:
+        self.keepalive_interval = keepalive_interval
+        self._executors: dict[tuple[str, str, bool], PooledRemoteExecutor] = {}
+        self._lock = threading.Lock()
+
+    def executor(
+        self,
+        key: str,
+        user: User,
+        address: str,
+        proxy_command: str | None = None,
+        sudo: bool = False,
+        disabled_algorithms: dict[str, list[str]] | None = None,
+    ) -> PooledRemoteExecutor:
+        executor_key = (key, user.name, sudo)
+        with self._lock:
+            stale_executor = self._executors.get(executor_key)
+            if (
+                stale_executor
+                and stale_executor.user.password == user.password
+                and stale_executor.disabled_algorithms == disabled_algorithms
+            ):
+                return stale_executor
+
+            executor = self._executors[executor_key] = PooledRemoteExecutor(
+                user=user,
+                address=address,
+                proxy_command=proxy_command,
+                sudo=sudo,
+                disabled_algorithms=disabled_algorithms,
+                keepalive_interval=self.keepalive_interval,
+            )
+
+        if stale_executor:
+            stale_executor.disconnect()
+        return executor
+
+    def close(self, key: str | None = None) -> None:
+        """
+        Disconnect the executors of a connection key, or of all keys.
+        """
+        with self._lock:
+            executor_keys = [executor_key for executor_key in self._executors if key in (None, executor_key[0])]
+            executors = [self._executors.pop(executor_key) for executor_key in executor_keys]
+
+        for executor in executors:
+            executor.disconnect()
+
+
+def run_ssh_batch(host: Host, commands: list[str], check_rc: bool = True, timeout: int | None = None) -> list[str]:
+    """
+    Run shell commands through a single SSH channel, i.e. a single round trip.
+
+    Works with pooled and non-pooled hosts; with a pooled host no new connection is opened.
+
+    Args:
+        host (Host): rrmngmnt host to execute the commands from.
+        commands (list): Shell command lines, run in order by the remote shell.
+        check_rc (bool): Stop at the first command with a non-zero return code and raise.
+        timeout (int, optional): Timeout of the whole batch.
+
+    Returns:
+        list: stdout of each command, without its trailing newline.
+
+    Raises:
+        CommandExecFailed: If check_rc and a command failed, with the stderr of the batch.
+    """
+    script_lines = []
+    for command in commands:
+        script_lines.append(f"{command}\n__rc=$?; printf '\\n{BATCH_RC_MARKER}%s\\n' $__rc")
+        if check_rc:
+            script_lines.append('[ "$__rc" -eq 0 ] || exit "$__rc"')
+
+    # The script is sent on stdin, so it is not re-quoted by the remote login shell
+    with host.executor().session() as ssh_session:
+        _, out, err = ssh_session.run_cmd(cmd=["sh"], input_="\n".join(script_lines) + "\n", timeout=timeout)
+    outputs, return_codes = parse_batch_output(out=out)
+    if check_rc:
+        failed_index = next((index for index, rc in enumerate(return_codes) if rc), len(return_codes))
+        if failed_index < len(commands):
+            raise CommandExecFailed(name=commands[failed_index], err=err)
+
+    return outputs
+
+
+def parse_batch_output(out: str) -> tuple[list[str], list[int]]:
+    """
+    Split the stdout of run_ssh_batch into the stdout (without its trailing newline) and the
+    return code of each command.
+    """
+    outputs: list[str] = []
+    return_codes: list[int] = []
+    current_output: list[str] = []
+    for line in out.split("\n"):
+        if line.startswith(BATCH_RC_MARKER):
+            # printf starts the marker on a new line; drop the empty line it leaves after a newline-terminated output
+            if current_output and not current_output[-1]:
+                current_output.pop()
+            outputs.append("\n".join(current_output))
+            return_codes.append(int(line.removeprefix(BATCH_RC_MARKER)))
+            current_output = []
+        else:
+            current_output.append(line)
+    return outputs, return_codes
+
+
+def start_ssh_connection_pool(keepalive_interval: int = TIMEOUT_30SEC) -> SSHConnectionPool:
+    global _SESSION_SSH_CONNECTION_POOL
+    if _SESSION_SSH_CONNECTION_POOL is None:
+        _SESSION_SSH_CONNECTION_POOL = SSHConnectionPool(keepalive_interval=keepalive_interval)
+    return _SESSION_SSH_CONNECTION_POOL
+
+
+def stop_ssh_connection_pool() -> None:
+    global _SESSION_SSH_CONNECTION_POOL
+    if _SESSION_SSH_CONNECTION_POOL is not None:
+        _SESSION_SSH_CONNECTION_POOL.close()
+        _SESSION_SSH_CONNECTION_POOL = None
+
+
+def get_ssh_connection_pool() -> SSHConnectionPool | None:
+    """
+    Return the session SSH connection pool, or None when SSH connection pooling is not enabled.
+    """
+    return _SESSION_SSH_CONNECTION_POOL
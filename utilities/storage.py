@@ -2,8 +2,12 @@ import logging
 import math
 import os
 import shlex
-from collections.abc import Generator
-from contextlib import contextmanager
+import threading
+import time
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from dataclasses import dataclass
 from typing import Any
 
 import cachetools.func
@@ -34,6 +38,7 @@ import utilities.artifactory
 import utilities.infra
 import utilities.virt as virt_util
 from utilities import console
+from utilities.artifact_cache import download_artifact
 from utilities.artifactory import get_test_artifact_server_url
 from utilities.constants import (
     CDI_LABEL,
@@ -67,6 +72,7 @@ HPP_CSI = "hpp-csi"
 
 LOGGER = logging.getLogger(__name__)
 _DEFAULT_DISK_SERIAL_COMMAND = shlex.split("sudo ls /dev/disk/by-id")
+UPLOADS_MAX_WORKERS = 4
 
 
 def create_dummy_first_consumer_pod(volume_mode=DataVolume.VolumeMode.FILE, dv=None, pvc=None):
@@ -292,6 +298,8 @@ def data_volume(
 def get_downloaded_artifact(remote_name, local_name):
     """
     Download image or artifact to local tmpdir path
+
+    Artifacts are downloaded once per host to the artifact cache, see utilities.artifact_cache.
     """
     artifactory_header = utilities.artifactory.get_artifactory_header()
     url = f"{get_test_artifact_server_url()}{remote_name}"
@@ -303,10 +311,7 @@ def get_downloaded_artifact(remote_name, local_name):
     )
     assert resp.status_code == requests.codes.ok, f"Unable to connect to {url} with error: {resp}."
     LOGGER.info(f"Download {url} to {local_name}")
-    with requests.get(url, headers=artifactory_header, verify=False, stream=True) as created_request:
-        created_request.raise_for_status()
-        with open(local_name, "wb") as file_downloaded:
-            file_downloaded.writelines(created_request.iter_content(chunk_size=8192))
+    download_artifact(url=url, local_name=local_name, headers=artifactory_header, head_headers=resp.headers)
     try:
         assert os.path.isfile(local_name)
         return True
@@ -478,6 +483,127 @@ def check_upload_virtctl_result(
         assert expected_output in err, err
 
 
+@dataclass(frozen=True)
+class TimedUpload:
+    """
+    Value yielded by an upload context manager which times the image transfer itself, without its setup
+    (e.g. creating the DataVolume and waiting for it to be UploadReady).
+
+    Args:
+        result (Any): Upload result, e.g. whether the upload proxy accepted the image.
+        transfer_duration (float): Image transfer duration, in seconds.
+    """
+
+    result: Any
+    transfer_duration: float
+
+
+@dataclass(frozen=True)
+class UploadResult:
+    """
+    Outcome of a single image upload.
+
+    Args:
+        name (str): DataVolume / PVC name.
+        image_size (int): Uploaded image size, in bytes.
+        transfer_duration (float): Image transfer duration, in seconds, as reported by the upload context manager
+            with TimedUpload; otherwise the time to enter the upload context manager, e.g. the whole
+            `virtctl image-upload` command, which creates the DataVolume before transferring the image.
+        result (Any): Upload result, e.g. virtctl (status, out, err).
+    """
+
+    name: str
+    image_size: int
+    transfer_duration: float
+    result: Any
+
+    @property
+    def throughput(self) -> float:
+        """Image transfer throughput, in MB/s."""
+        return self.image_size / self.transfer_duration / 10**6 if self.transfer_duration else 0.0
+
+
+@dataclass(frozen=True)
+class UploadsReport:
+    """
+    Outcome of concurrent image uploads.
+
+    Args:
+        results (list): UploadResult of each upload, in the uploads order.
+        duration (float): Wall time of all the uploads, in seconds, including the setup of every upload.
+    """
+
+    results: list[UploadResult]
+    duration: float
+
+    @property
+    def throughput(self) -> float:
+        """Aggregate throughput of the uploads over their wall time, setup included, in MB/s."""
+        return sum(upload.image_size for upload in self.results) / self.duration / 10**6 if self.duration else 0.0
+
+    def __str__(self) -> str:
+        uploads = ", ".join(
+            f"{upload.name}: transfer {upload.transfer_duration:.1f}s {upload.throughput:.1f} MB/s"
+            for upload in self.results
+        )
+        return f"{len(self.results)} uploads in {self.duration:.1f}s, aggregate {self.throughput:.1f} MB/s [{uploads}]"
+
+
+@contextmanager
+def concurrent_uploads(
+    uploads: list[dict[str, Any]],
+    upload: Callable[..., AbstractContextManager] = virtctl_upload_dv,
+    max_workers: int = UPLOADS_MAX_WORKERS,
+) -> Generator[UploadsReport]:
+    """
+    Run image uploads concurrently, at most max_workers at a time.
+
+    Each upload is a context manager (virtctl_upload_dv by default) entered in a worker thread; all of them are
+    exited, e.g. to clean up the uploaded DataVolumes / PVCs, when the caller is done with the report.
+    An upload context manager with a setup step should yield a TimedUpload, so its throughput is the one of the
+    image transfer only.
+
+    Args:
+        uploads (list): Keyword arguments of each upload; they must include name and image_path.
+        upload (Callable): Context manager uploading an image, yielding the upload result or a TimedUpload.
+        max_workers (int): Maximum number of uploads running at the same time.
+
+    Yields:
+        UploadsReport: Per upload transfer duration, throughput and result, and the aggregate throughput.
+    """
+    exit_stack_lock = threading.Lock()
+
+    def _upload(exit_stack: ExitStack, upload_kwargs: dict[str, Any]) -> UploadResult:
+        upload_stack = ExitStack()
+        start_time = time.monotonic()
+        result = upload_stack.enter_context(upload(**upload_kwargs))
+        transfer_duration = time.monotonic() - start_time
+        if isinstance(result, TimedUpload):
+            result, transfer_duration = result.result, result.transfer_duration
+        # Exited with the other uploads, when the caller is done with them
+        with exit_stack_lock:
+            exit_stack.push(upload_stack)
+        LOGGER.info(f"Upload {upload_kwargs['name']} transferred in {transfer_duration:.1f}s")
+        return UploadResult(
+            name=upload_kwargs["name"],
+            image_size=os.path.getsize(upload_kwargs["image_path"]),
+            transfer_duration=transfer_duration,
+            result=result,
+        )
+
+    max_workers = max(1, min(max_workers, len(uploads)))
+    LOGGER.info(f"Running {len(uploads)} uploads, {max_workers} at a time")
+    with ExitStack() as exit_stack:
+        start_time = time.monotonic()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(lambda upload_kwargs: _upload(exit_stack=exit_stack, upload_kwargs=upload_kwargs), uploads)
+            )
+        report = UploadsReport(results=results, duration=time.monotonic() - start_time)
+        LOGGER.info(f"Uploads: {report}")
+        yield report
+
+
 class ErrorMsg:
     """
     error messages that might show in pod containers
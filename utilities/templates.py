@@ -0,0 +1,289 @@
+"""
+Client-side processing of OpenShift templates.
+
+Templates are rendered locally, as the OpenShift processedtemplates API does: `${PARAM}` references are replaced
+with the parameter value in strings, and a string which is only a `${{PARAM}}` reference is replaced with the
+JSON value of the parameter. Templates which cannot be rendered locally (e.g. a required parameter without value,
+or an unsupported generate expression) are processed by the server.
+"""
+
+import copy
+import json
+import logging
+import random
+import re
+import string
+import threading
+from typing import Any
+
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.template import Template
+from pytest_testconfig import config as py_config
+
+from utilities.cluster import cache_admin_client
+from utilities.informer import parse_label_selector
+
+LOGGER = logging.getLogger(__name__)
+
+TEMPLATE_NAMESPACE_LABEL = "vm.kubevirt.io/template.namespace"
+PARAMETER_REFERENCE_PATTERN = re.compile(r"\$\{\{?(?P<name>[a-zA-Z0-9_]+)\}?\}")
+NON_STRING_PARAMETER_REFERENCE_PATTERN = re.compile(r"\$\{\{(?P<name>[a-zA-Z0-9_]+)\}\}")
+# Generate expressions made of literals and character classes with a count, e.g. "[a-z0-9]{16}"
+GENERATE_EXPRESSION_PART_PATTERN = re.compile(r"\[(?P<chars>[^\]]+)\]\{(?P<count>\d+)\}|(?P<literal>[^\[\]\\{}]+)")
+GENERATE_CHAR_CLASSES = {r"\w": string.ascii_letters + string.digits + "_", r"\d": string.digits}
+# Lists only the objects metadata, without the (large) templates objects and parameters
+PARTIAL_OBJECT_METADATA_LIST_ACCEPT = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
+
+_BASE_TEMPLATES_INDEX: dict[str, dict[str, Any]] | None = None
+_BASE_TEMPLATES_INDEX_LOCK = threading.Lock()
+
+
+class UnsupportedTemplateError(ValueError):
+    pass
+
+
+def process_template_locally(template_dict: dict[str, Any], parameters: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Process a template without the processedtemplates API.
+
+    Args:
+        template_dict (dict): Template, as returned by the API.
+        parameters (dict): Parameter name to value; values override the template defaults.
+
+    Returns:
+        list: The template objects, with the parameters substituted and the template labels applied.
+
+    Raises:
+        UnsupportedTemplateError: If the template cannot be processed locally.
+    """
+    values = {}
+    for parameter in template_dict.get("parameters", []):
+        name = parameter["name"]
+        if (value := parameters.get(name, parameter.get("value"))) not in (None, ""):
+            values[name] = str(value)
+        elif parameter.get("generate") == "expression":
+            values[name] = generate_template_parameter(expression=parameter.get("from", ""))
+        elif parameter.get("required"):
+            raise UnsupportedTemplateError(f"Template parameter {name} is required and has no value")
+        else:
+            values[name] = ""
+
+    objects = _substitute_parameters(obj=copy.deepcopy(template_dict.get("objects", [])), values=values)
+    template_labels = template_dict.get("labels") or {}
+    for obj in objects:
+        obj.setdefault("metadata", {}).setdefault("labels", {}).update(template_labels)
+    # Like Template.process: the template namespace, when not defined the template belongs to the VM namespace
+    if objects:
+        objects[0]["metadata"]["labels"][TEMPLATE_NAMESPACE_LABEL] = template_dict["metadata"]["namespace"]
+
+    return objects
+
+
+def generate_template_parameter(expression: str) -> str:
+    """
+    Generate a parameter value from a template generate expression.
+
+    Args:
+        expression (str): Generate expression, e.g. "[a-z0-9]{16}" or "vm-[a-z]{4}".
+
+    Returns:
+        str: A random value matching the expression.
+
+    Raises:
+        UnsupportedTemplateError: If the expression is not a sequence of literals and counted character classes.
+    """
+    value = []
+    position = 0
+    while position < len(expression):
+        if not (match := GENERATE_EXPRESSION_PART_PATTERN.match(expression, position)):
+            raise UnsupportedTemplateError(f"Unsupported template generate expression: {expression}")
+        if match["literal"]:
+            value.append(match["literal"])
+        else:
+            chars = _expand_char_class(char_class=match["chars"], expression=expression)
+            value.extend(random.choices(chars, k=int(match["count"])))
+        position = match.end()
+
+    return "".join(value)
+
+
+def get_base_template_by_labels(template_labels: list[str]) -> dict[str, Any] | None:
+    """
+    Get a base template of the openshift namespace from the session base templates index.
+
+    The index is built from get_base_templates_list, see get_base_templates_index.
+
+    Args:
+        template_labels (list): Template labels, as passed to get_template_by_labels.
+
+    Returns:
+        dict | None: The template, or None if the labels do not match exactly one indexed template.
+    """
+    requirements = parse_label_selector(label_selector=",".join(template_labels))
+    if requirements["not_equal"] or requirements["not_exists"]:
+        return None
+
+    matching_templates = [
+        template_dict
+        for template_dict in get_base_templates_index().values()
+        if template_dict["metadata"]["namespace"] == "openshift"
+        and all(
+            template_dict["metadata"].get("labels", {}).get(key) == value
+            for key, value in requirements["equal"].items()
+        )
+        and requirements["exists"] <= template_dict["metadata"].get("labels", {}).keys()
+    ]
+    return matching_templates[0] if len(matching_templates) == 1 else None
+
+
+def get_base_templates_index() -> dict[str, dict[str, Any]]:
+    """
+    Get the base templates of the cluster.
+
+    The templates are fetched once, and fetched again when the resourceVersion of a base template changed or base
+    templates were added or removed (e.g. by an upgrade, or by HCO when its templates spec is modified), which is
+    checked with a metadata only LIST on every call.
+
+    Returns:
+        dict: "<namespace>/<name>" to the template dict
+    """
+    global _BASE_TEMPLATES_INDEX
+    client = cache_admin_client()
+    with _BASE_TEMPLATES_INDEX_LOCK:
+        if _BASE_TEMPLATES_INDEX is not None:
+            indexed_resource_versions = {
+                key: template_dict["metadata"].get("resourceVersion")
+                for key, template_dict in _BASE_TEMPLATES_INDEX.items()
+            }
+            if get_base_templates_resource_versions(client=client) != indexed_resource_versions:
+                LOGGER.info("Base templates changed, indexing them again")
+                _BASE_TEMPLATES_INDEX = None
+
+        if _BASE_TEMPLATES_INDEX is None:
+            _BASE_TEMPLATES_INDEX = {}
+            for template in get_base_templates_list(client=client):
+                template_dict = template.instance.to_dict()
+                _BASE_TEMPLATES_INDEX[f"{template.namespace}/{template.name}"] = template_dict
+            LOGGER.info(f"Indexed {len(_BASE_TEMPLATES_INDEX)} base templates")
+        return _BASE_TEMPLATES_INDEX
+
+
+def get_base_templates_resource_versions(client: DynamicClient) -> dict[str, str]:
+    """
+    Get the resourceVersion of the base templates, listing their metadata only.
+
+    Args:
+        client (DynamicClient): Client to use for listing the base templates.
+
+    Returns:
+        dict: "<namespace>/<name>" to the template resourceVersion, for the base templates of get_base_templates_list
+    """
+    templates_metadata = client.resources.get(
+        api_version=f"{Template.api_group}/{Template.ApiVersion.V1}", kind=Template.kind
+    ).get(
+        label_selector=_base_templates_label_selector(),
+        header_params={"Accept": PARTIAL_OBJECT_METADATA_LIST_ACCEPT},
+    )
+    return {
+        f"{item.metadata.namespace}/{item.metadata.name}": item.metadata.resourceVersion
+        for item in templates_metadata.items
+        if not (item.metadata.annotations or {}).get(Template.Annotations.DEPRECATED)
+    }
+
+
+def get_base_templates_list(client: DynamicClient) -> list[Template]:
+    """
+    Return base templates list.
+
+    Args:
+        client (DynamicClient): Client to use for getting base templates list.
+
+    Returns:
+        list[Template]: List of base templates.
+    """
+    common_templates_list = list(
+        Template.get(
+            client=client,
+            singular_name=Template.singular_name,
+            label_selector=_base_templates_label_selector(),
+        )
+    )
+    return [
+        template
+        for template in common_templates_list
+        if not template.instance.metadata.annotations.get(template.Annotations.DEPRECATED)
+    ]
+
+
+def _base_templates_label_selector() -> str:
+    return f"{Template.Labels.BASE},{Template.Labels.ARCHITECTURE}={py_config['cpu_arch']}"
+
+
+def clear_base_templates_index() -> None:
+    """Drop the base templates index, e.g. after templates were modified."""
+    global _BASE_TEMPLATES_INDEX
+    with _BASE_TEMPLATES_INDEX_LOCK:
+        _BASE_TEMPLATES_INDEX = None
+
+
+def process_template(template_dict: dict[str, Any], parameters: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Process a template locally, or with the processedtemplates API if it cannot be processed locally.
+
+    Args:
+        template_dict (dict): Template, as returned by the API.
+        parameters (dict): Parameter name to value.
+
+    Returns:
+        list: The processed template objects.
+    """
+    try:
+        return process_template_locally(template_dict=template_dict, parameters=parameters)
+    except UnsupportedTemplateError as exp:
+        LOGGER.info(f"Processing template {template_dict['metadata']['name']} by the server: {exp}")
+
+    template = Template(
+        client=cache_admin_client(),
+        name=template_dict["metadata"]["name"],
+        namespace=template_dict["metadata"]["namespace"],
+    )
+    return template.process(**parameters)
+
+
+def _expand_char_class(char_class: str, expression: str) -> str:
+    chars = []
+    position = 0
+    while position < len(char_class):
+        if char_class[position] == "\\":
+            if (escape := char_class[position : position + 2]) not in GENERATE_CHAR_CLASSES:
+                raise UnsupportedTemplateError(f"Unsupported template generate expression: {expression}")
+            chars.append(GENERATE_CHAR_CLASSES[escape])
+            position += 2
+        elif position + 2 < len(char_class) and char_class[position + 1] == "-":
+            chars.extend(chr(code) for code in range(ord(char_class[position]), ord(char_class[position + 2]) + 1))
+            position += 3
+        else:
+            chars.append(char_class[position])
+            position += 1
+
+    return "".join(chars)
+
+
+def _substitute_parameters(obj: Any, values: dict[str, str]) -> Any:
+    if isinstance(obj, dict):
+        return {key: _substitute_parameters(obj=value, values=values) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_substitute_parameters(obj=value, values=values) for value in obj]
+    if not isinstance(obj, str):
+        return obj
+
+    if (match := NON_STRING_PARAMETER_REFERENCE_PATTERN.fullmatch(obj)) and match["name"] in values:
+        try:
+            return json.loads(values[match["name"]])
+        except ValueError:
+            return values[match["name"]]
+
+    return PARAMETER_REFERENCE_PATTERN.sub(
+        lambda reference: values.get(reference["name"], reference.group()),
+        obj,
+    )
@@ -0,0 +1,221 @@
+"""Unit tests for artifact_cache module"""
+
+import fcntl
+import os
+import re
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utilities.artifact_cache import download_artifact, get_artifact_cache_path, link_artifact
+
+URL = "https://artifacts.example.com/cdi/cirros.qcow2"
+CONTENT = b"0123456789"
+ETAG = '"v1"'
+OTHER_URLS = ["https://artifacts.example.com/cdi/fedora.qcow2", "https://artifacts.example.com/cdi/rhel.qcow2"]
+
+
+@pytest.fixture(autouse=True)
+def artifact_cache_dir(tmp_path, monkeypatch):
+    """Use an empty artifact cache directory in each test"""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("PYTEST_ARTIFACT_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture
+def mock_requests_get():
+    """Serve CONTENT, honoring Range headers"""
+
+    def _get(url, headers, **kwargs):
+        response = MagicMock()
+        response.__enter__.return_value = response
+        if range_header := headers.get("Range"):
+            start, end = re.fullmatch(r"bytes=(\d+)-(\d*)", range_header).groups()
+            body = CONTENT[int(start) : int(end) + 1 if end else None]
+            response.status_code = 206
+        else:
+            body = CONTENT
+            response.status_code = 200
+        response.iter_content.return_value = [body[index : index + 3] for index in range(0, len(body), 3)]
+        return response
+
+    with patch("utilities.artifact_cache.requests.get", side_effect=_get) as mock_get:
+        yield mock_get
+
+
+def _head_headers(etag=ETAG, accept_ranges=True):
+    headers = {"Content-Length": str(len(CONTENT))}
+    if etag:
+        headers["ETag"] = etag
+    if accept_ranges:
+        headers["Accept-Ranges"] = "bytes"
+    return headers
+
+
+class TestDownloadArtifact:
+    """Test cases for download_artifact function"""
+
+    def test_artifact_downloaded_once(self, tmp_path, mock_requests_get):
+        """Test an artifact is downloaded once, and every caller gets its own file"""
+        first, second = tmp_path / "first.qcow2", tmp_path / "second.qcow2"
+
+        download_artifact(url=URL, local_name=first, headers={}, head_headers=_head_headers())
+        download_artifact(url=URL, local_name=str(second), headers={}, head_headers=_head_headers())
+
+        assert mock_requests_get.call_count == 1
+        assert first.read_bytes() == second.read_bytes() == CONTENT
+        assert os.path.exists(get_artifact_cache_path(url=URL, validator=ETAG))
+
+    def test_changed_artifact_downloaded_again(self, tmp_path, artifact_cache_dir, mock_requests_get):
+        """Test a new ETag downloads the artifact again, and removes the stale cached version"""
+        download_artifact(url=URL, local_name=tmp_path / "a", headers={}, head_headers=_head_headers(etag=ETAG))
+        download_artifact(url=URL, local_name=tmp_path / "b", headers={}, head_headers=_head_headers(etag='"v2"'))
+
+        assert mock_requests_get.call_count == 2
+        assert not os.path.exists(get_artifact_cache_path(url=URL, validator=ETAG))
+        assert os.path.exists(get_artifact_cache_path(url=URL, validator='"v2"'))
+
+    def test_artifact_without_validator_not_cached(self, tmp_path, artifact_cache_dir, mock_requests_get):
+        """Test an artifact without ETag nor Last-Modified is downloaded directly to the local path"""
+        local_name = tmp_path / "artifact"
+
+        download_artifact(url=URL, local_name=local_name, headers={}, head_headers=_head_headers(etag=None))
+
+        assert local_name.read_bytes() == CONTENT
+        assert not artifact_cache_dir.exists()
+
+    def test_incomplete_download_fails(self, tmp_path, mock_requests_get):
+        """Test a download shorter than Content-Length is not cached"""
+        head_headers = {**_head_headers(accept_ranges=False), "Content-Length": "20"}
+
+        with pytest.raises(OSError, match="expected 20"):
+            download_artifact(url=URL, local_name=tmp_path / "artifact", headers={}, head_headers=head_headers)
+
+        assert not os.path.exists(get_artifact_cache_path(url=URL, validator=ETAG))
+
+    @patch("utilities.artifact_cache.ARTIFACT_SEGMENT_SIZE", 4)
+    def test_segmented_download(self, tmp_path, mock_requests_get):
+        """Test an artifact larger than a segment is downloaded with range requests"""
+        local_name = tmp_path / "artifact"
+
+        download_artifact(
+            url=URL, local_name=local_name, headers={"Authorization": "token"}, head_headers=_head_headers()
+        )
+
+        assert local_name.read_bytes() == CONTENT
+        assert sorted(call.kwargs["headers"]["Range"] for call in mock_requests_get.call_args_list) == [
+            "bytes=0-3",
+            "bytes=4-7",
+            "bytes=8-9",
+        ]
+        assert all(call.kwargs["headers"]["Authorization"] == "token" for call in mock_requests_get.call_args_list)
+
+    @patch("utilities.artifact_cache.ARTIFACT_SEGMENT_SIZE", 4)
+    def test_segmented_download_resumed(self, tmp_path, mock_requests_get):
+        """Test the segments downloaded by an interrupted download are not downloaded again"""
+        part_path = f"{get_artifact_cache_path(url=URL, validator=ETAG)}.part"
+        os.makedirs(os.path.dirname(part_path))
+        with open(part_path, "wb") as fd:
+            fd.write(CONTENT[:4])
+        with open(f"{part_path}.done", "w") as fd:
+            fd.write("0\n")
+        local_name = tmp_path / "artifact"
+
+        download_artifact(url=URL, local_name=local_name, headers={}, head_headers=_head_headers())
+
+        assert local_name.read_bytes() == CONTENT
+        assert sorted(call.kwargs["headers"]["Range"] for call in mock_requests_get.call_args_list) == [
+            "bytes=4-7",
+            "bytes=8-9",
+        ]
+        assert not os.path.exists(f"{part_path}.done")
+
+    def test_stream_download_resumed(self, tmp_path, mock_requests_get):
+        """Test a partial single stream download is resumed from its size"""
+        part_path = f"{get_artifact_cache_path(url=URL, validator=ETAG)}.part"
+        os.makedirs(os.path.dirname(part_path))
+        with open(part_path, "wb") as fd:
+            fd.write(CONTENT[:6])
+        local_name = tmp_path / "artifact"
+
+        download_artifact(url=URL, local_name=local_name, headers={}, head_headers=_head_headers())
+
+        assert local_name.read_bytes() == CONTENT
+        assert mock_requests_get.call_args.kwargs["headers"]["Range"] == "bytes=6-"
+
+
+class TestRemoveLeastRecentlyUsedArtifacts:
+    """Test cases for the removal of the least recently used artifacts, once the cache is over its size limit"""
+
+    @pytest.fixture
+    def cached_artifacts(self, tmp_path, monkeypatch, mock_requests_get):
+        """Cache URL and OTHER_URLS[0], OTHER_URLS[0] last used, in a cache with room for 2 artifacts"""
+        monkeypatch.setenv("PYTEST_ARTIFACT_CACHE_MAX_SIZE_GB", str(2 * len(CONTENT) / 10**9))
+        cache_paths = []
+        for index, url in enumerate([URL, OTHER_URLS[0]]):
+            download_artifact(url=url, local_name=tmp_path / "artifact", headers={}, head_headers=_head_headers())
+            cache_paths.append(get_artifact_cache_path(url=url, validator=ETAG))
+            os.utime(cache_paths[-1], (1000 + index, 1000 + index))
+        return cache_paths
+
+    def test_least_recently_used_removed(self, tmp_path, cached_artifacts):
+        """Test the artifact not used for the longest time is removed when a new artifact does not fit"""
+        download_artifact(url=URL, local_name=tmp_path / "artifact", headers={}, head_headers=_head_headers())
+        download_artifact(url=OTHER_URLS[1], local_name=tmp_path / "artifact", headers={}, head_headers=_head_headers())
+
+        assert os.path.exists(cached_artifacts[0])
+        assert not os.path.exists(cached_artifacts[1])
+        assert os.path.exists(get_artifact_cache_path(url=OTHER_URLS[1], validator=ETAG))
+
+    def test_locked_artifact_kept(self, tmp_path, cached_artifacts):
+        """Test an artifact locked by another process is kept, and the next least recently used one is removed"""
+        with open(f"{cached_artifacts[0]}.lock", "a") as lock_fd:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            download_artifact(
+                url=OTHER_URLS[1], local_name=tmp_path / "artifact", headers={}, head_headers=_head_headers()
+            )
+
+        assert os.path.exists(cached_artifacts[0])
+        assert not os.path.exists(cached_artifacts[1])
+
+
+class TestLinkArtifact:
+    """Test cases for link_artifact function"""
+
+    @pytest.fixture
+    def cached_artifact(self, tmp_path):
+        cache_path = tmp_path / "cached"
+        cache_path.write_bytes(CONTENT)
+        return str(cache_path)
+
+    @patch("utilities.artifact_cache._reflink", side_effect=OSError("Operation not supported"))
+    def test_hard_link_without_reflink(self, _mock_reflink, tmp_path, cached_artifact):
+        """Test the artifact is hard linked when the filesystem does not support reflinks"""
+        local_name = str(tmp_path / "artifact")
+
+        link_artifact(cache_path=cached_artifact, local_name=local_name)
+
+        assert os.path.samefile(cached_artifact, local_name)
+
+    @patch("utilities.artifact_cache.os.link", side_effect=OSError("Invalid cross-device link"))
+    @patch("utilities.artifact_cache._reflink", side_effect=OSError("Operation not supported"))
+    def test_copy_across_filesystems(self, _mock_reflink, _mock_link, tmp_path, cached_artifact):
+        """Test the artifact is copied when it cannot be linked"""
+        local_name = str(tmp_path / "artifact")
+
+        link_artifact(cache_path=cached_artifact, local_name=local_name)
+
+        assert not os.path.samefile(cached_artifact, local_name)
+        with open(local_name, "rb") as fd:
+            assert fd.read() == CONTENT
+        assert sorted(os.listdir(tmp_path)) == ["artifact", "cached"]
+
+    def test_existing_file_replaced(self, tmp_path, cached_artifact):
+        """Test an existing local file is replaced"""
+        local_name = tmp_path / "artifact"
+        local_name.write_bytes(b"old")
+
+        link_artifact(cache_path=cached_artifact, local_name=str(local_name))
+
+        assert local_name.read_bytes() == CONTENT
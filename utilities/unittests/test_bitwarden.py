@@ -14,9 +14,11 @@ from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 # Add utilities to Python path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import bitwarden
 from bitwarden import (
     get_all_cnv_tests_secrets,
     get_cnv_tests_secret_by_name,
+    prefetch_cnv_tests_secrets,
 )
 
 from utilities.exceptions import MissingEnvironmentVariableError
@@ -31,6 +33,13 @@ def _short_timeout_init(self: TimeoutSampler, *args: object, **kwargs: object) -
     _original_timeout_sampler_init(self, *args, **kwargs)
 
 
+@pytest.fixture(autouse=True)
+def secrets_store_dir(tmp_path):
+    """Use an empty secrets store directory in each test"""
+    with patch("bitwarden.SECRETS_STORE_DIR", str(tmp_path)), patch.dict(bitwarden._CNV_TESTS_SECRETS, clear=True):
+        yield tmp_path
+
+
 class TestGetAllCnvTestsSecrets:
     """Test cases for get_all_cnv_tests_secrets function"""
 
@@ -219,3 +228,54 @@ class TestGetCnvTestsSecretByName:
         mock_get_all.assert_not_called()
         # Verify getoption was called with correct argument
         mock_session.config.getoption.assert_called_once_with("--disabled-bitwarden")
+
+
+class TestSecretsStore:
+    """Test cases for the Bitwarden secrets store shared by the pytest processes of a session"""
+
+    @patch("bitwarden.run_command")
+    def test_secrets_listed_once_across_processes(self, mock_run_command, secrets_store_dir):
+        """Test secrets are served from the encrypted store and without `secret get` calls"""
+        with patch.dict(os.environ, {"ACCESS_TOKEN": "test-token"}):
+            get_all_cnv_tests_secrets.cache_clear()
+            get_cnv_tests_secret_by_name.cache_clear()
+            mock_run_command.return_value = (
+                True,
+                json.dumps([{"key": "secret1", "id": "uuid-1", "value": json.dumps({"user": "name"})}]),
+                "",
+            )
+
+            assert get_all_cnv_tests_secrets() == {"secret1": "uuid-1"}
+            # A new process: empty in-process caches
+            get_all_cnv_tests_secrets.cache_clear()
+            bitwarden._CNV_TESTS_SECRETS.clear()
+
+            assert get_cnv_tests_secret_by_name("secret1") == {"user": "name"}
+            assert mock_run_command.call_count == 1
+            store_files = list(secrets_store_dir.iterdir())
+            assert len(store_files) == 1
+            assert b"uuid-1" not in store_files[0].read_bytes()
+
+    @patch("bitwarden.SECRETS_STORE_TTL", -1)
+    @patch("bitwarden.run_command")
+    def test_expired_secrets_store(self, mock_run_command):
+        """Test secrets are listed again when the store expired"""
+        with patch.dict(os.environ, {"ACCESS_TOKEN": "test-token"}):
+            mock_run_command.return_value = (True, json.dumps([{"key": "secret1", "id": "uuid-1"}]), "")
+
+            for _ in range(2):
+                get_all_cnv_tests_secrets.cache_clear()
+                get_all_cnv_tests_secrets()
+
+            assert mock_run_command.call_count == 2
+
+    @patch("bitwarden.get_all_cnv_tests_secrets")
+    def test_prefetch_cnv_tests_secrets_disabled_bitwarden(self, mock_get_all):
+        """Test secrets are not fetched with --disabled-bitwarden"""
+        mock_session = MagicMock()
+        mock_session.config.getoption.return_value = True
+
+        with patch.dict(os.environ, {"ACCESS_TOKEN": "test-token"}):
+            prefetch_cnv_tests_secrets(session=mock_session)
+
+        mock_get_all.assert_not_called()
@@ -5,7 +5,10 @@
 import os
 from unittest.mock import MagicMock, mock_open, patch
 
-from console import Console
+import console as console_module
+import pexpect
+import pytest
+from console import Console, ConsoleSession, close_console_session, close_console_sessions, get_console_session
 
 
 class TestConsole:
@@ -408,3 +411,124 @@ class TestConsole:
 
         # Should not change child when no valid sample is found
         assert console.child == original_child
+
+
+@pytest.fixture
+def console_session(mock_vm):
+    """ConsoleSession whose connect spawns a mocked, alive console child"""
+    session = ConsoleSession(vm=mock_vm)
+
+    def _connect():
+        session.console.child = MagicMock()
+        session.console.child.isalive.return_value = True
+        return session.console.child
+
+    with patch.object(session.console, "connect", side_effect=_connect) as mock_connect:
+        session.mock_connect = mock_connect
+        yield session
+
+
+class TestConsoleSession:
+    """Test cases for ConsoleSession class"""
+
+    def test_console_session_connects_once(self, console_session):
+        """Test the login is done once and the child is reused while the prompt is there"""
+        with console_session as first_child:
+            pass
+        with console_session as second_child:
+            pass
+
+        assert first_child is second_child
+        console_session.mock_connect.assert_called_once()
+        second_child.sendline.assert_called_once_with("")
+
+    def test_console_session_reconnects_on_prompt_loss(self, console_session):
+        """Test a new login is done when the prompt does not answer"""
+        with console_session as first_child:
+            first_child.expect.side_effect = pexpect.exceptions.TIMEOUT("no prompt")
+
+        with console_session as second_child:
+            pass
+
+        assert first_child is not second_child
+        first_child.close.assert_called_once_with(force=True)
+        assert console_session.mock_connect.call_count == 2
+
+    def test_console_session_invalidated_on_failure(self, console_session):
+        """Test the console is dropped when a command fails inside the session"""
+        with pytest.raises(pexpect.exceptions.EOF):
+            with console_session as child:
+                raise pexpect.exceptions.EOF("console closed")
+
+        child.close.assert_called_once_with(force=True)
+        assert console_session.child is None
+        assert not console_session.lock.locked()
+
+    def test_console_session_close_logs_out(self, console_session):
+        """Test close logs out from an alive console"""
+        with console_session as child:
+            pass
+
+        with patch.object(console_session.console, "disconnect") as mock_disconnect:
+            console_session.close()
+
+        mock_disconnect.assert_called_once()
+        child.close.assert_called_once_with(force=True)
+
+
+class TestConsoleSessionPool:
+    """Test cases for the console session pool functions"""
+
+    def teardown_method(self):
+        console_module._CONSOLE_SESSIONS.clear()
+
+    def test_get_console_session_reuses_session(self, mock_vm):
+        """Test the same session is returned for the same VM and prompt"""
+        session = get_console_session(vm=mock_vm, prompt="$ ")
+
+        assert get_console_session(vm=mock_vm, prompt="$ ") is session
+
+    def test_get_console_session_replaces_session_of_other_prompt(self, mock_vm):
+        """Test a session opened with another prompt is closed and replaced"""
+        session = get_console_session(vm=mock_vm, prompt="$ ")
+
+        with patch.object(session, "close") as mock_close:
+            new_session = get_console_session(vm=mock_vm, prompt="# ")
+
+        assert new_session is not session
+        mock_close.assert_called_once()
+
+    def test_close_console_session(self, mock_vm):
+        """Test closing the session of a single VM removes it from the pool"""
+        session = get_console_session(vm=mock_vm)
+
+        with patch.object(session, "close") as mock_close:
+            close_console_session(vm=mock_vm)
+
+        mock_close.assert_called_once()
+        assert get_console_session(vm=mock_vm) is not session
+
+    def test_close_console_sessions(self, mock_vm, mock_vm_with_login_params):
+        """Test all pooled sessions are closed"""
+        mock_vm_with_login_params.name = "other-vm"
+        sessions = [get_console_session(vm=mock_vm), get_console_session(vm=mock_vm_with_login_params)]
+
+        with patch.object(ConsoleSession, "close") as mock_close:
+            close_console_sessions()
+
+        assert mock_close.call_count == len(sessions)
+        assert console_module._CONSOLE_SESSIONS == {}
+
+    def test_console_enter_releases_pooled_session(self, mock_vm):
+        """Test a plain Console releases the pooled session of its VM, which holds the serial console"""
+        console = Console(vm=mock_vm)
+
+        with (
+            patch("console.close_console_session") as mock_close_session,
+            patch.object(console, "connect"),
+            patch.object(console, "disconnect"),
+        ):
+            with console:
+                pass
+
+        mock_close_session.assert_called_once_with(vm=mock_vm)
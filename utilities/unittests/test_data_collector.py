@@ -5,6 +5,8 @@
 import json
 import os
 import sys
+import threading
+import time
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
@@ -127,6 +129,8 @@ from ocp_resources.virtual_machine import VirtualMachine
 # Now import the real data_collector module functions
 from utilities.data_collector import (
     BASE_DIRECTORY_NAME,
+    SHARED_COLLECTION_FILE_NAME,
+    MustGatherCollectionQueue,
     collect_alerts_data,
     collect_default_cnv_must_gather_with_vm_gather,
     collect_ocp_must_gather,
@@ -136,6 +140,7 @@ from utilities.data_collector import (
     get_data_collector_dir,
     get_scope_identifier,
     prepare_pytest_item_data_dir,
+    run_inspect_collection,
     set_data_collector_directory,
     set_data_collector_values,
     write_to_file,
@@ -442,6 +447,157 @@ class TestCollectDefaultCnvMustGatherWithVmGather:
         )
 
 
+class TestRunInspectCollection:
+    """Test cases for run_inspect_collection function"""
+
+    @patch("utilities.data_collector.run_command")
+    def test_run_inspect_collection(self, mock_run_command):
+        """Test oc adm inspect command is built from namespaces"""
+        run_inspect_collection(inspect_namespaces=["ns1", "ns2"], since_time=600, target_dir="/target/inspect")
+
+        mock_run_command.assert_called_once_with(
+            command=[
+                "oc",
+                "adm",
+                "inspect",
+                "namespace/ns1",
+                "namespace/ns2",
+                "--since=600s",
+                "--dest-dir=/target/inspect",
+            ],
+            check=False,
+            verify_stderr=False,
+        )
+
+
+class TestMustGatherCollectionQueue:
+    """Test cases for MustGatherCollectionQueue class"""
+
+    @pytest.fixture
+    def blocked_collection(self):
+        """Block the first collection until the event is set, so later requests stay pending"""
+        release_event = threading.Event()
+        with patch(
+            "utilities.data_collector.collect_default_cnv_must_gather_with_vm_gather",
+            side_effect=lambda **kwargs: release_event.wait(timeout=5),
+        ) as mock_collect:
+            yield mock_collect, release_event
+
+    @patch("utilities.data_collector.run_inspect_collection")
+    @patch("utilities.data_collector.collect_default_cnv_must_gather_with_vm_gather")
+    def test_submit_collects_in_background(self, mock_collect, mock_inspect):
+        """Test a submitted request runs must-gather and inspect, and flush waits for it"""
+        queue = MustGatherCollectionQueue(admin_client=MagicMock())
+
+        queue.submit(test_name="test_a", since_time=600, target_dir="/target/a", inspect_namespaces=["ns1"])
+        queue.flush(timeout=5)
+
+        mock_collect.assert_called_once()
+        assert mock_collect.call_args.kwargs["target_dir"] == "/target/a"
+        assert 600 <= mock_collect.call_args.kwargs["since_time"] <= 605
+        mock_inspect.assert_called_once()
+        assert mock_inspect.call_args.kwargs["inspect_namespaces"] == ["ns1"]
+        assert mock_inspect.call_args.kwargs["target_dir"] == "/target/a/inspect_collection"
+
+    @patch("utilities.data_collector.run_inspect_collection")
+    @patch("utilities.data_collector.write_to_file")
+    def test_pending_requests_with_same_namespaces_are_merged(
+        self, mock_write_to_file, mock_inspect, blocked_collection
+    ):
+        """Test pending requests for the same namespace set are merged with the widest since window"""
+        mock_collect, release_event = blocked_collection
+        queue = MustGatherCollectionQueue(admin_client=MagicMock())
+
+        queue.submit(test_name="test_a", since_time=60, target_dir="/target/a")
+        while mock_collect.call_count == 0:
+            time.sleep(0.01)
+        queue.submit(test_name="test_b", since_time=300, target_dir="/target/b")
+        queue.submit(test_name="test_c", since_time=900, target_dir="/target/c")
+        release_event.set()
+        queue.flush(timeout=5)
+
+        assert mock_collect.call_count == 2
+        merged_call = mock_collect.call_args_list[1].kwargs
+        assert merged_call["target_dir"] == "/target/b"
+        assert merged_call["since_time"] >= 900
+        mock_write_to_file.assert_called_once_with(
+            file_name=SHARED_COLLECTION_FILE_NAME,
+            content="Data for this test was collected under: /target/b\n",
+            base_directory="/target/c",
+        )
+        mock_inspect.assert_not_called()
+
+    @patch("utilities.data_collector.write_to_file")
+    def test_requests_with_different_namespaces_are_not_merged(self, mock_write_to_file, blocked_collection):
+        """Test requests are deduplicated by namespace set only"""
+        mock_collect, release_event = blocked_collection
+        queue = MustGatherCollectionQueue(admin_client=MagicMock())
+
+        queue.submit(test_name="test_a", since_time=60, target_dir="/target/a")
+        queue.submit(test_name="test_b", since_time=60, target_dir="/target/b", inspect_namespaces=["ns1"])
+        queue.submit(test_name="test_c", since_time=60, target_dir="/target/c", inspect_namespaces=["ns2"])
+        release_event.set()
+        with patch("utilities.data_collector.run_inspect_collection"):
+            queue.flush(timeout=5)
+
+        assert mock_collect.call_count == 3
+        mock_write_to_file.assert_not_called()
+
+    @patch("utilities.data_collector.write_to_file")
+    def test_request_after_collection_started_is_collected(self, mock_write_to_file, blocked_collection):
+        """Test a failure submitted after a collection started is collected again, as it may miss its window end"""
+        mock_collect, release_event = blocked_collection
+        queue = MustGatherCollectionQueue(admin_client=MagicMock())
+        queue.submit(test_name="test_a", since_time=900, target_dir="/target/a")
+        while mock_collect.call_count == 0:
+            time.sleep(0.01)
+
+        queue.submit(test_name="test_b", since_time=300, target_dir="/target/b")
+        release_event.set()
+        queue.flush(timeout=5)
+
+        assert [call.kwargs["target_dir"] for call in mock_collect.call_args_list] == ["/target/a", "/target/b"]
+        mock_write_to_file.assert_not_called()
+
+    def test_flush_timeout(self, blocked_collection):
+        """Test flush returns after its timeout when a collection does not finish"""
+        mock_collect, release_event = blocked_collection
+        queue = MustGatherCollectionQueue(admin_client=MagicMock())
+        queue.submit(test_name="test_a", since_time=60, target_dir="/target/a")
+        while mock_collect.call_count == 0:
+            time.sleep(0.01)
+
+        start_time = time.monotonic()
+        queue.flush(timeout=0.1)
+
+        assert time.monotonic() - start_time < 1
+        release_event.set()
+
+    @patch("utilities.data_collector.collect_default_cnv_must_gather_with_vm_gather")
+    def test_submit_after_flush_is_ignored(self, mock_collect):
+        """Test no collection is queued once the queue was flushed"""
+        queue = MustGatherCollectionQueue(admin_client=MagicMock())
+        queue.flush(timeout=5)
+
+        queue.submit(test_name="test_a", since_time=60, target_dir="/target/a")
+
+        mock_collect.assert_not_called()
+
+    @patch("utilities.data_collector.collect_default_cnv_must_gather_with_vm_gather")
+    def test_collection_failure_does_not_stop_worker(self, mock_collect):
+        """Test a failing collection is logged and the next request is still collected"""
+        mock_collect.side_effect = [RuntimeError("must-gather failed"), None]
+        queue = MustGatherCollectionQueue(admin_client=MagicMock())
+
+        queue.submit(test_name="test_a", since_time=60, target_dir="/target/a")
+        while mock_collect.call_count == 0:
+            time.sleep(0.01)
+        queue.submit(test_name="test_b", since_time=60, target_dir="/target/b")
+        queue.flush(timeout=5)
+
+        assert mock_collect.call_count == 2
+
+
 class TestPrepareDataDir:
     """Test cases for prepare_pytest_item_data_dir function"""
 
@@ -25,6 +25,10 @@ class TestCnvTestTable:
         assert hasattr(CnvTestTable, "test_name")
         assert hasattr(CnvTestTable, "start_time")
 
+        # test_name is unique, so start times can be inserted with INSERT OR IGNORE
+        assert CnvTestTable.__table__.c.test_name.unique
+        assert CnvTestTable.__table__.c.test_name.index
+
         # Check that it inherits from Base
         assert issubclass(CnvTestTable, Base)
 
@@ -54,7 +58,9 @@ class TestDatabase:
             url=f"sqlite:////tmp/data/{CNV_TEST_DB}",
             echo=True,
         )
-        mock_create_all.assert_called_once_with(bind=mock_engine)
+        mock_create_all.assert_called_once_with(bind=mock_engine.connect.return_value)
+        executed_pragmas = [str(_call.args[0]) for _call in mock_engine.connect.return_value.execute.call_args_list]
+        assert executed_pragmas == ["PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL"]
 
     @patch("database.create_engine")
     @patch("database.get_data_collector_base")
@@ -77,90 +83,125 @@ class TestDatabase:
 
         mock_get_base.assert_called_once_with(base_dir="/custom/dir")
 
-    @patch("database.Session")
     @patch("database.create_engine")
     @patch("database.get_data_collector_base")
     @patch("database.Base.metadata.create_all")
-    def test_insert_start_time_new_entry(self, mock_create_all, mock_get_base, mock_create_engine, mock_session_class):
-        """Test inserting start time when entry doesn't exist"""
+    def test_database_init_in_memory(self, mock_create_all, mock_get_base, mock_create_engine):
+        """Test in-memory Database keeps the file path for flushing and skips the WAL pragmas"""
         mock_get_base.return_value = "/tmp/data/"
         mock_engine = MagicMock()
         mock_create_engine.return_value = mock_engine
 
-        # Mock session - no existing entry
-        mock_session = MagicMock()
-        mock_session.query.return_value.filter_by.return_value.first.return_value = None
-        mock_session_class.return_value.__enter__.return_value = mock_session
+        db = Database(in_memory=True)
+
+        assert db.database_file_path == f"/tmp/data/{CNV_TEST_DB}"
+        assert db.connection_string == "sqlite://"
+        mock_create_engine.assert_called_once_with(url="sqlite://", echo=True)
+        mock_engine.connect.return_value.execute.assert_not_called()
+
+    @patch("database.create_engine")
+    @patch("database.get_data_collector_base")
+    @patch("database.Base.metadata.create_all")
+    def test_insert_start_time_new_entry(self, mock_create_all, mock_get_base, mock_create_engine):
+        """Test inserting start time issues a single INSERT OR IGNORE and commits it"""
+        mock_get_base.return_value = "/tmp/data/"
+        mock_engine = MagicMock()
+        mock_create_engine.return_value = mock_engine
+        mock_connection = mock_engine.connect.return_value
 
         db = Database()
+        mock_connection.reset_mock()
         db.insert_start_time(name="test_example", start_time=1234567890)
 
-        # Check that add and commit were called
-        mock_session.add.assert_called_once()
-        mock_session.commit.assert_called_once()
-
-        # Check the object that was added
-        added_obj = mock_session.add.call_args[0][0]
-        assert isinstance(added_obj, CnvTestTable)
-        assert added_obj.test_name == "test_example"
-        assert added_obj.start_time == 1234567890
+        mock_connection.execute.assert_called_once()
+        statement = mock_connection.execute.call_args[0][0]
+        assert str(statement).startswith("INSERT OR IGNORE INTO")
+        assert statement.compile().params == {"test_name": "test_example", "start_time": 1234567890}
+        mock_connection.commit.assert_called_once()
 
-    @patch("database.Session")
     @patch("database.create_engine")
     @patch("database.get_data_collector_base")
     @patch("database.Base.metadata.create_all")
-    def test_insert_start_time_already_exists(
-        self, mock_create_all, mock_get_base, mock_create_engine, mock_session_class
-    ):
-        """Test inserting start time when entry already exists (should not insert again)"""
+    def test_insert_start_time_batched_commits(self, mock_create_all, mock_get_base, mock_create_engine):
+        """Test inserts are committed once commit_batch_size inserts are pending"""
         mock_get_base.return_value = "/tmp/data/"
         mock_engine = MagicMock()
         mock_create_engine.return_value = mock_engine
+        mock_connection = mock_engine.connect.return_value
 
-        # Mock session - existing entry
-        existing_entry = MagicMock()
-        mock_session = MagicMock()
-        mock_session.query.return_value.filter_by.return_value.first.return_value = existing_entry
-        mock_session_class.return_value.__enter__.return_value = mock_session
+        db = Database(commit_batch_size=3)
+        mock_connection.reset_mock()
+        db.insert_start_time(name="test_1", start_time=1)
+        db.insert_start_time(name="test_2", start_time=2)
 
-        db = Database()
+        mock_connection.commit.assert_not_called()
+
+        db.insert_start_time(name="test_3", start_time=3)
+
+        mock_connection.commit.assert_called_once()
+
+    @patch("database.get_data_collector_base")
+    def test_insert_start_time_already_exists(self, mock_get_base):
+        """Test inserting start time when entry already exists (should keep the first start time)"""
+        mock_get_base.return_value = "/tmp/data/"
+
+        db = Database(verbose=False, in_memory=True)
+        db.insert_start_time(name="test_example", start_time=1234567890)
+        db.insert_start_time(name="test_example", start_time=1234567999)
+
+        assert db.get_start_time(name="test_example") == 1234567890
+        db.close()
+
+    @patch("database.get_data_collector_base")
+    def test_flush_in_memory_database_to_file(self, mock_get_base, tmp_path):
+        """Test flush copies the in-memory database to database_file_path"""
+        mock_get_base.return_value = f"{tmp_path}/"
+
+        db = Database(verbose=False, in_memory=True, commit_batch_size=10)
         db.insert_start_time(name="test_example", start_time=1234567890)
+        db.flush()
+        db.close()
+
+        file_db = Database(verbose=False, base_dir=str(tmp_path))
+        assert file_db.get_start_time(name="test_example") == 1234567890
+        file_db.close()
+
+    @patch("database.time")
+    @patch("database.get_data_collector_base")
+    def test_periodic_flush_in_memory_database(self, mock_get_base, mock_time, tmp_path):
+        """Test an in-memory database is flushed once flush_interval seconds passed since the last flush"""
+        mock_get_base.return_value = f"{tmp_path}/"
+        mock_time.monotonic.return_value = 100
 
-        # Check that add and commit were NOT called (entry already exists)
-        mock_session.add.assert_not_called()
-        mock_session.commit.assert_not_called()
+        db = Database(verbose=False, in_memory=True, commit_batch_size=10, flush_interval=60)
+        db.insert_start_time(name="test_1", start_time=1)
+
+        assert not (tmp_path / CNV_TEST_DB).exists()
+
+        mock_time.monotonic.return_value = 160
+        db.insert_start_time(name="test_2", start_time=2)
+
+        assert (tmp_path / CNV_TEST_DB).exists()
+        db.close()
 
-    @patch("database.Session")
     @patch("database.create_engine")
     @patch("database.get_data_collector_base")
     @patch("database.Base.metadata.create_all")
-    def test_get_start_time_found(self, mock_create_all, mock_get_base, mock_create_engine, mock_session_class):
+    def test_get_start_time_found(self, mock_create_all, mock_get_base, mock_create_engine):
         """Test getting start time when it exists"""
         mock_get_base.return_value = "/tmp/data/"
         mock_engine = MagicMock()
         mock_create_engine.return_value = mock_engine
 
-        # Mock session and query
-        mock_session = MagicMock()
-        mock_query = MagicMock()
-        mock_with_entities = MagicMock()
-        mock_filter_by = MagicMock()
-
-        # Setup chain of mocks
-        mock_session.query.return_value = mock_query
-        mock_query.with_entities.return_value = mock_with_entities
-        mock_with_entities.filter_by.return_value = mock_filter_by
-        mock_filter_by.first.return_value = [1234567890]
-
-        mock_session_class.return_value.__enter__.return_value = mock_session
+        # Mock the start time query result
+        mock_engine.connect.return_value.execute.return_value.first.return_value = [1234567890]
 
         db = Database()
         result = db.get_start_time(name="test_example")
 
         assert result == 1234567890
-        mock_session.query.assert_called_once_with(CnvTestTable)
-        mock_query.with_entities.assert_called_once_with(CnvTestTable.start_time)
-        mock_with_entities.filter_by.assert_called_once_with(test_name="test_example")
+        statement = mock_engine.connect.return_value.execute.call_args[0][0]
+        assert list(statement.compile().params.values()) == ["test_example"]
 
     @patch("database.create_engine")
     @patch("database.get_data_collector_base")
@@ -177,29 +218,17 @@ class TestDatabase:
         assert db.engine is not None
         assert db.engine == mock_engine
 
-    @patch("database.Session")
     @patch("database.create_engine")
     @patch("database.get_data_collector_base")
     @patch("database.Base.metadata.create_all")
-    def test_get_start_time_not_found(self, mock_create_all, mock_get_base, mock_create_engine, mock_session_class):
+    def test_get_start_time_not_found(self, mock_create_all, mock_get_base, mock_create_engine):
         """Test getting start time when it doesn't exist"""
         mock_get_base.return_value = "/tmp/data/"
         mock_engine = MagicMock()
         mock_create_engine.return_value = mock_engine
 
-        # Mock session and query
-        mock_session = MagicMock()
-        mock_query = MagicMock()
-        mock_with_entities = MagicMock()
-        mock_filter_by = MagicMock()
-
-        # Setup chain of mocks - return None
-        mock_session.query.return_value = mock_query
-        mock_query.with_entities.return_value = mock_with_entities
-        mock_with_entities.filter_by.return_value = mock_filter_by
-        mock_filter_by.first.return_value = None
-
-        mock_session_class.return_value.__enter__.return_value = mock_session
+        # Mock the start time query result
+        mock_engine.connect.return_value.execute.return_value.first.return_value = None
 
         db = Database()
         result = db.get_start_time(name="test_example")
@@ -208,7 +237,6 @@ class TestDatabase:
 
     @patch("database.datetime")
     @patch("database.get_scope_identifier")
-    @patch("database.Session")
     @patch("database.create_engine")
     @patch("database.get_data_collector_base")
     @patch("database.Base.metadata.create_all")
@@ -219,7 +247,6 @@ class TestDatabase:
         mock_create_all,
         mock_get_base,
         mock_create_engine,
-        mock_session_class,
         mock_get_scope_identifier,
         mock_datetime,
     ):
@@ -237,18 +264,8 @@ class TestDatabase:
         # Mock get_scope_identifier
         mock_get_scope_identifier.return_value = "/path/to/test_module.py"
 
-        # Mock session and query
-        mock_session = MagicMock()
-        mock_query = MagicMock()
-        mock_with_entities = MagicMock()
-        mock_filter_by = MagicMock()
-
-        mock_session.query.return_value = mock_query
-        mock_query.with_entities.return_value = mock_with_entities
-        mock_with_entities.filter_by.return_value = mock_filter_by
-        mock_filter_by.first.return_value = [1234567890]
-
-        mock_session_class.return_value.__enter__.return_value = mock_session
+        # Mock the start time query result
+        mock_engine.connect.return_value.execute.return_value.first.return_value = [1234567890]
 
         # Mock datetime for time delta calculation
         mock_datetime_now = MagicMock()
@@ -267,7 +284,6 @@ class TestDatabase:
 
     @patch("database.datetime")
     @patch("database.get_scope_identifier")
-    @patch("database.Session")
     @patch("database.create_engine")
     @patch("database.get_data_collector_base")
     @patch("database.Base.metadata.create_all")
@@ -278,7 +294,6 @@ class TestDatabase:
         mock_create_all,
         mock_get_base,
         mock_create_engine,
-        mock_session_class,
         mock_get_scope_identifier,
         mock_datetime,
     ):
@@ -296,18 +311,8 @@ class TestDatabase:
         # Mock get_scope_identifier
         mock_get_scope_identifier.return_value = "/path/to/test_file.py::TestClass"
 
-        # Mock session and query
-        mock_session = MagicMock()
-        mock_query = MagicMock()
-        mock_with_entities = MagicMock()
-        mock_filter_by = MagicMock()
-
-        mock_session.query.return_value = mock_query
-        mock_query.with_entities.return_value = mock_with_entities
-        mock_with_entities.filter_by.return_value = mock_filter_by
-        mock_filter_by.first.return_value = [1700000000]
-
-        mock_session_class.return_value.__enter__.return_value = mock_session
+        # Mock the start time query result
+        mock_engine.connect.return_value.execute.return_value.first.return_value = [1700000000]
 
         # Mock datetime for time delta calculation
         mock_datetime_now = MagicMock()
@@ -324,7 +329,6 @@ class TestDatabase:
 
     @patch("database.datetime")
     @patch("database.get_scope_identifier")
-    @patch("database.Session")
     @patch("database.create_engine")
     @patch("database.get_data_collector_base")
     @patch("database.Base.metadata.create_all")
@@ -335,7 +339,6 @@ class TestDatabase:
         mock_create_all,
         mock_get_base,
         mock_create_engine,
-        mock_session_class,
         mock_get_scope_identifier,
         mock_datetime,
     ):
@@ -351,18 +354,8 @@ class TestDatabase:
         # Mock get_scope_identifier
         mock_get_scope_identifier.return_value = "/path/to/test_file.py::test_function"
 
-        # Mock session and query
-        mock_session = MagicMock()
-        mock_query = MagicMock()
-        mock_with_entities = MagicMock()
-        mock_filter_by = MagicMock()
-
-        mock_session.query.return_value = mock_query
-        mock_query.with_entities.return_value = mock_with_entities
-        mock_with_entities.filter_by.return_value = mock_filter_by
-        mock_filter_by.first.return_value = [1600000000]
-
-        mock_session_class.return_value.__enter__.return_value = mock_session
+        # Mock the start time query result
+        mock_engine.connect.return_value.execute.return_value.first.return_value = [1600000000]
 
         # Mock datetime for time delta calculation
         mock_datetime_now = MagicMock()
@@ -378,7 +371,6 @@ class TestDatabase:
         assert "TEST scope: 300s (5m)" in mock_logger.info.call_args[0][0]
 
     @patch("database.get_scope_identifier")
-    @patch("database.Session")
     @patch("database.create_engine")
     @patch("database.get_data_collector_base")
     @patch("database.Base.metadata.create_all")
@@ -389,7 +381,6 @@ class TestDatabase:
         mock_create_all,
         mock_get_base,
         mock_create_engine,
-        mock_session_class,
         mock_get_scope_identifier,
     ):
         """Test get_start_time_for_collection when start time not found in database"""
@@ -404,18 +395,8 @@ class TestDatabase:
         # Mock get_scope_identifier
         mock_get_scope_identifier.return_value = "/path/to/test_file.py::test_function"
 
-        # Mock session and query - return None (not found)
-        mock_session = MagicMock()
-        mock_query = MagicMock()
-        mock_with_entities = MagicMock()
-        mock_filter_by = MagicMock()
-
-        mock_session.query.return_value = mock_query
-        mock_query.with_entities.return_value = mock_with_entities
-        mock_with_entities.filter_by.return_value = mock_filter_by
-        mock_filter_by.first.return_value = None
-
-        mock_session_class.return_value.__enter__.return_value = mock_session
+        # Mock the start time query result
+        mock_engine.connect.return_value.execute.return_value.first.return_value = None
 
         db = Database()
         result = db.get_start_time_for_collection(node=mock_node)
@@ -0,0 +1,216 @@
+"""Unit tests for informer module"""
+
+import threading
+from unittest.mock import ANY, MagicMock, patch
+
+import pytest
+from kubernetes.dynamic.resource import ResourceField
+from timeout_sampler import TimeoutExpiredError
+
+import utilities.informer
+from utilities.informer import (
+    ADDED,
+    ALL_NAMESPACES,
+    DELETED,
+    MODIFIED,
+    InformerCache,
+    ResourceInformer,
+    UnsupportedLabelSelectorError,
+    get_session_informer,
+    parse_label_selector,
+    start_session_informers,
+    stop_session_informers,
+)
+
+
+def _resource(name, namespace="test-ns", labels=None, phase=None, resource_version="1"):
+    return ResourceField(
+        params={
+            "metadata": ResourceField(
+                params={
+                    "name": name,
+                    "namespace": namespace,
+                    "labels": ResourceField(params=labels) if labels else None,
+                    "resourceVersion": resource_version,
+                }
+            ),
+            "status": ResourceField(params={"phase": phase}),
+        }
+    )
+
+
+@pytest.fixture
+def mock_resource_kind():
+    resource_kind = MagicMock()
+    resource_kind.kind = "VirtualMachineInstance"
+    resource_kind.api_version = "kubevirt.io/v1"
+    return resource_kind
+
+
+@pytest.fixture
+def informer(mock_resource_kind):
+    """ResourceInformer seeded with two objects, without a running watch thread"""
+    _informer = ResourceInformer(client=MagicMock(), resource_kind=mock_resource_kind, namespace="test-ns")
+    _informer.api.get.return_value = ResourceField(
+        params={
+            "items": [
+                _resource(name="vm-a", labels={"app": "a", "tier": "web"}, phase="Running"),
+                _resource(name="vm-b", labels={"app": "b"}, phase="Pending"),
+            ],
+            "metadata": ResourceField(params={"resourceVersion": "10"}),
+        }
+    )
+    _informer._relist()
+    return _informer
+
+
+class TestParseLabelSelector:
+    """Test cases for parse_label_selector function"""
+
+    def test_parse_label_selector_all_requirement_types(self):
+        """Test equality, inequality and existence requirements"""
+        requirements = parse_label_selector(label_selector="app=a, tier==web,env!=prod,kubevirt.io,!debug")
+
+        assert requirements == {
+            "equal": {"app": "a", "tier": "web"},
+            "not_equal": {"env": "prod"},
+            "exists": {"kubevirt.io"},
+            "not_exists": {"debug"},
+        }
+
+    def test_parse_label_selector_empty(self):
+        """Test empty selector has no requirements"""
+        assert parse_label_selector(label_selector="") == {
+            "equal": {},
+            "not_equal": {},
+            "exists": set(),
+            "not_exists": set(),
+        }
+
+    def test_parse_label_selector_set_based_unsupported(self):
+        """Test set-based selectors raise UnsupportedLabelSelectorError"""
+        with pytest.raises(UnsupportedLabelSelectorError):
+            parse_label_selector(label_selector="app in (a,b)")
+
+
+class TestResourceInformer:
+    """Test cases for ResourceInformer class"""
+
+    def test_get_returns_cached_object(self, informer):
+        """Test get returns objects seeded by the initial LIST"""
+        assert informer.get(name="vm-a", namespace="test-ns").status.phase == "Running"
+        assert informer.get(name="vm-a", namespace="other-ns") is None
+        assert informer._resource_version == "10"
+
+    def test_list_by_label_selector(self, informer):
+        """Test list filters by equality and existence requirements"""
+        assert [obj.metadata.name for obj in informer.list(label_selector="app=a")] == ["vm-a"]
+        assert [obj.metadata.name for obj in informer.list(label_selector="!tier")] == ["vm-b"]
+        assert len(informer.list(namespace="test-ns")) == 2
+        assert informer.list(namespace="other-ns") == []
+
+    def test_handle_event_updates_store_and_label_index(self, informer):
+        """Test MODIFIED and DELETED events update the store and the label index"""
+        informer._handle_event(
+            event_type=MODIFIED, obj=_resource(name="vm-a", labels={"app": "c"}, resource_version="11")
+        )
+        assert informer.list(label_selector="app=a") == []
+        assert [obj.metadata.name for obj in informer.list(label_selector="app=c")] == ["vm-a"]
+        assert informer._resource_version == "11"
+
+        informer._handle_event(event_type=DELETED, obj=_resource(name="vm-a", resource_version="12"))
+        assert informer.get(name="vm-a", namespace="test-ns") is None
+        assert ("app", "c") not in informer._label_index
+
+    def test_subscribe_and_unsubscribe(self, informer):
+        """Test subscribers are notified until they unsubscribe"""
+        callback = MagicMock()
+        unsubscribe = informer.subscribe(callback=callback)
+        new_vm = _resource(name="vm-c")
+
+        informer._handle_event(event_type=ADDED, obj=new_vm)
+        callback.assert_called_once_with(ADDED, new_vm)
+
+        unsubscribe()
+        informer._handle_event(event_type=MODIFIED, obj=new_vm)
+        callback.assert_called_once()
+
+    def test_failing_subscriber_does_not_break_informer(self, informer):
+        """Test a raising subscriber does not prevent the store update"""
+        informer.subscribe(callback=MagicMock(side_effect=RuntimeError("boom")))
+
+        informer._handle_event(event_type=ADDED, obj=_resource(name="vm-c"))
+
+        assert informer.get(name="vm-c", namespace="test-ns") is not None
+
+    def test_wait_for_returns_when_predicate_met(self, informer):
+        """Test wait_for wakes up on a change which satisfies the predicate"""
+        threading.Timer(
+            interval=0.1,
+            function=informer._handle_event,
+            kwargs={"event_type": MODIFIED, "obj": _resource(name="vm-b", phase="Running")},
+        ).start()
+
+        obj = informer.wait_for(
+            name="vm-b", namespace="test-ns", predicate=lambda _obj: _obj.status.phase == "Running", timeout=5
+        )
+
+        assert obj.metadata.name == "vm-b"
+
+    def test_wait_for_timeout(self, informer):
+        """Test wait_for raises TimeoutExpiredError when the predicate is never met"""
+        with pytest.raises(TimeoutExpiredError):
+            informer.wait_for(name="vm-b", namespace="test-ns", predicate=lambda _obj: False, timeout=0.1)
+
+
+class TestInformerCache:
+    """Test cases for InformerCache class"""
+
+    @patch("utilities.informer.ResourceInformer")
+    def test_informer_started_once_per_kind_and_namespace(self, mock_informer_class, mock_resource_kind):
+        """Test informers are created lazily and reused"""
+        cache = InformerCache(client=MagicMock())
+
+        first = cache.informer(resource_kind=mock_resource_kind, namespace="ns1")
+        second = cache.informer(resource_kind=mock_resource_kind, namespace="ns1")
+
+        assert first is second
+        mock_informer_class.assert_called_once()
+        mock_informer_class.return_value.start.assert_called_once()
+
+    @patch("utilities.informer.ResourceInformer")
+    def test_cluster_wide_informer_serves_all_namespaces(self, mock_informer_class, mock_resource_kind):
+        """Test an all-namespaces informer is returned for any namespace"""
+        cache = InformerCache(client=MagicMock())
+
+        cluster_informer = cache.informer(resource_kind=mock_resource_kind)
+
+        assert cache.informer(resource_kind=mock_resource_kind, namespace="ns1") is cluster_informer
+        mock_informer_class.assert_called_once()
+
+
+class TestSessionInformers:
+    """Test cases for session informer functions"""
+
+    def test_get_session_informer_disabled(self, mock_resource_kind):
+        """Test no informer is returned when session informers are not started"""
+        stop_session_informers()
+
+        assert get_session_informer(resource_kind=mock_resource_kind) is None
+
+    @patch("utilities.informer.ResourceInformer")
+    def test_start_and_stop_session_informers(self, mock_informer_class, mock_resource_kind):
+        """Test one cluster-wide informer per kind is served after start, and stopped on stop"""
+        start_session_informers(client=MagicMock())
+        try:
+            informer = get_session_informer(resource_kind=mock_resource_kind)
+            assert informer is mock_informer_class.return_value.start.return_value
+            assert get_session_informer(resource_kind=mock_resource_kind) is informer
+            mock_informer_class.assert_called_once_with(
+                client=ANY, resource_kind=mock_resource_kind, namespace=ALL_NAMESPACES
+            )
+        finally:
+            stop_session_informers()
+
+        informer.stop.assert_called_once()
+        assert utilities.informer._SESSION_INFORMER_CACHE is None
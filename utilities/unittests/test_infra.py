@@ -0,0 +1,293 @@
+"""Unit tests for infra module"""
+
+import json
+import sys
+import time
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+from kubernetes.client import ApiException
+from kubernetes.dynamic.resource import ResourceField
+from timeout_sampler import TimeoutExpiredError
+
+import utilities
+
+# conftest.py mocks utilities.infra; import the real module, with its utilities.virt import mocked, then put the
+# mocks back for the other test modules
+_mocked_modules = {name: sys.modules.get(name) for name in ("utilities.infra", "utilities.virt")}
+sys.modules["utilities.virt"] = MagicMock()
+del sys.modules["utilities.infra"]
+
+from utilities.infra import get_node_audit_log_entries, get_pods, wait_for_consistent_resource_conditions
+
+real_infra = sys.modules["utilities.infra"]
+
+for _name, _module in _mocked_modules.items():
+    if _module is None:
+        sys.modules.pop(_name, None)
+    else:
+        sys.modules[_name] = _module
+utilities.infra = _mocked_modules["utilities.infra"]
+
+# Runs the given shell script instead of `oc adm node-logs`, with the node as $1 and the log path as $2
+FAKE_OC_ADM_LOGS_COMMAND = "sh -c '{script}' oc-adm-node-logs"
+AUDIT_LOG_ENTRY = "pod-security.kubernetes.io/audit-violations"
+AVAILABLE = "Available"
+DEGRADED = "Degraded"
+EXPECTED_CONDITIONS = {AVAILABLE: "True", DEGRADED: "False"}
+
+
+def _cr(resource_version, available="True", degraded="False"):
+    return ResourceField(
+        params={
+            "metadata": ResourceField(params={"name": "kubevirt-hyperconverged", "resourceVersion": resource_version}),
+            "status": ResourceField(
+                params={
+                    "conditions": [
+                        ResourceField(params={"type": AVAILABLE, "status": available, "reason": "Reason"}),
+                        ResourceField(params={"type": DEGRADED, "status": degraded, "reason": "Reason"}),
+                    ]
+                }
+            ),
+        }
+    )
+
+
+def _event(resource_version, event_type="MODIFIED", **conditions):
+    return {"type": event_type, "object": _cr(resource_version=resource_version, **conditions)}
+
+
+@pytest.fixture
+def mock_resource():
+    resource = MagicMock()
+    resource.name = "kubevirt-hyperconverged"
+    return resource
+
+
+@pytest.fixture
+def mock_resource_kind(mock_resource):
+    resource_kind = MagicMock()
+    resource_kind.__name__ = "HyperConverged"
+    resource_kind.kind = "HyperConverged"
+    resource_kind.get.return_value = [mock_resource]
+    return resource_kind
+
+
+@pytest.fixture
+def mock_pod_informer():
+    informer = MagicMock()
+    informer.list.return_value = [
+        ResourceField(params={"metadata": ResourceField(params={"name": "virt-launcher-vm-a", "namespace": "test-ns"})})
+    ]
+    return informer
+
+
+def _wait(resource_kind, **kwargs):
+    wait_for_consistent_resource_conditions(
+        dynamic_client=MagicMock(),
+        expected_conditions=EXPECTED_CONDITIONS,
+        resource_kind=resource_kind,
+        **{"stable_for_seconds": 0, "total_timeout": 10, **kwargs},
+    )
+
+
+class TestWaitForConsistentResourceConditions:
+    """Test cases for wait_for_consistent_resource_conditions function"""
+
+    def test_conditions_already_met(self, mock_resource, mock_resource_kind):
+        """Test no watch is started when the fetched resource already meets the conditions"""
+        mock_resource.instance = _cr(resource_version="1")
+
+        _wait(resource_kind=mock_resource_kind)
+
+        mock_resource.watcher.assert_not_called()
+
+    def test_watch_resumes_from_last_resource_version(self, mock_resource, mock_resource_kind):
+        """Test every watch resumes from the resourceVersion of the last seen event"""
+        mock_resource.instance = _cr(resource_version="1", available="False")
+        mock_resource.watcher.side_effect = [
+            iter([_event(resource_version="2", available="False")]),
+            iter([_event(resource_version="3")]),
+        ]
+
+        _wait(resource_kind=mock_resource_kind)
+
+        assert [watch_call.kwargs["resource_version"] for watch_call in mock_resource.watcher.call_args_list] == [
+            "1",
+            "2",
+        ]
+
+    def test_expired_resource_version_resyncs(self, mock_resource, mock_resource_kind):
+        """Test an expired resourceVersion (410) re-reads the resource before watching again"""
+        instances = iter([_cr(resource_version="1", available="False"), _cr(resource_version="5", available="False")])
+        type(mock_resource).instance = property(lambda _resource: next(instances))
+        mock_resource.watcher.side_effect = [ApiException(status=410), iter([_event(resource_version="6")])]
+
+        _wait(resource_kind=mock_resource_kind)
+
+        assert mock_resource.watcher.call_args_list[1].kwargs["resource_version"] == "5"
+
+    @patch("time.sleep")
+    def test_tolerated_exception_resyncs(self, mock_sleep, mock_resource, mock_resource_kind):
+        """Test a tolerated watch exception waits polling_interval and re-reads the resource"""
+        mock_resource.instance = _cr(resource_version="1", available="False")
+        mock_resource.watcher.side_effect = [
+            ConnectionError("connection reset by peer"),
+            iter([_event(resource_version="2")]),
+        ]
+
+        _wait(
+            resource_kind=mock_resource_kind,
+            exceptions_dict={ConnectionError: ["connection reset"]},
+            polling_interval=3,
+        )
+
+        mock_sleep.assert_called_once_with(3)
+        assert mock_resource.watcher.call_args_list[1].kwargs["resource_version"] == "1"
+
+    def test_not_tolerated_exception_raised(self, mock_resource, mock_resource_kind):
+        """Test a watch exception not matching exceptions_dict is raised"""
+        mock_resource.instance = _cr(resource_version="1", available="False")
+        mock_resource.watcher.side_effect = ConnectionError("name resolution failed")
+
+        with pytest.raises(ConnectionError):
+            _wait(resource_kind=mock_resource_kind, exceptions_dict={ConnectionError: ["connection reset"]})
+
+    def test_timeout(self, mock_resource, mock_resource_kind):
+        """Test TimeoutExpiredError is raised when the conditions are not met in time"""
+        mock_resource.instance = _cr(resource_version="1", available="False")
+        mock_resource.watcher.side_effect = lambda **kwargs: iter([])
+
+        with pytest.raises(TimeoutExpiredError, match="HyperConverged/kubevirt-hyperconverged"):
+            _wait(resource_kind=mock_resource_kind, total_timeout=1)
+
+        assert mock_resource.watcher.call_args_list[0] == call(timeout=1, resource_version="1")
+
+    def test_stop_condition(self, mock_resource, mock_resource_kind):
+        """Test a matched stop condition fails the wait without waiting for the timeout"""
+        mock_resource.instance = _cr(resource_version="1", available="False")
+
+        with pytest.raises(TimeoutExpiredError, match="Stop condition met"):
+            _wait(resource_kind=mock_resource_kind, stop_conditions={AVAILABLE: "Reason"})
+
+        mock_resource.watcher.assert_not_called()
+
+    def test_conditions_must_hold_without_interruption(self, mock_resource, mock_resource_kind):
+        """Test a change away from the expected conditions restarts the stability window"""
+        mock_resource.instance = _cr(resource_version="1")
+        watches = iter([[_event(resource_version="2", degraded="True")], [_event(resource_version="3")]])
+        mock_resource.watcher.side_effect = lambda **kwargs: iter(next(watches, []))
+
+        _wait(resource_kind=mock_resource_kind, stable_for_seconds=1)
+
+        # The second watch matched again; the window completes on a quiet watch bounded by the remaining window
+        assert mock_resource.watcher.call_count >= 3
+        assert all(watch_call.kwargs["timeout"] == 1 for watch_call in mock_resource.watcher.call_args_list[2:])
+
+
+class TestGetPods:
+    """Test cases for get_pods function"""
+
+    @patch.object(real_infra, "Pod")
+    def test_without_session_informers(self, mock_pod):
+        """Test pods are listed from the API when session informers are not enabled"""
+        client = MagicMock()
+        namespace = MagicMock()
+        namespace.name = "test-ns"
+
+        with patch("utilities.informer._SESSION_INFORMER_CACHE", None):
+            pods = get_pods(client=client, namespace=namespace, label="kubevirt.io=virt-launcher")
+
+        assert pods == list(mock_pod.get.return_value)
+        mock_pod.get.assert_called_once_with(
+            client=client, namespace="test-ns", label_selector="kubevirt.io=virt-launcher"
+        )
+
+    @patch.object(real_infra, "Pod")
+    def test_admin_client_served_from_session_informer(self, mock_pod, mock_pod_informer):
+        """Test pods listed with the client of the session informer are served from it"""
+        namespace = MagicMock()
+        namespace.name = "test-ns"
+
+        with patch.object(real_infra, "get_session_informer", autospec=True, return_value=mock_pod_informer):
+            pods = get_pods(client=mock_pod_informer.client, namespace=namespace)
+
+        mock_pod.get.assert_not_called()
+        mock_pod.assert_called_once_with(
+            client=mock_pod_informer.client, name="virt-launcher-vm-a", namespace="test-ns"
+        )
+        assert pods == [mock_pod.return_value]
+
+    @patch.object(real_infra, "Pod")
+    def test_other_client_listed_from_api(self, mock_pod, mock_pod_informer):
+        """Test pods listed with another client (e.g. unprivileged) are listed from the API with that client"""
+        client = MagicMock()
+        namespace = MagicMock()
+        namespace.name = "test-ns"
+
+        with patch.object(real_infra, "get_session_informer", autospec=True, return_value=mock_pod_informer):
+            get_pods(client=client, namespace=namespace)
+
+        mock_pod_informer.list.assert_not_called()
+        mock_pod.get.assert_called_once_with(client=client, namespace="test-ns", label_selector="")
+
+
+@pytest.fixture
+def audit_log_dir(tmp_path):
+    with patch.object(real_infra, "AUDIT_LOGS_PATH", str(tmp_path)):
+        yield tmp_path
+
+
+def _get_node_audit_log_entries(script, kill_timeout=30):
+    """Call get_node_audit_log_entries, without its retries, with `oc adm node-logs` running the shell script"""
+    with (
+        patch.object(real_infra, "OC_ADM_LOGS_COMMAND", FAKE_OC_ADM_LOGS_COMMAND.format(script=script)),
+        patch.object(real_infra, "TIMEOUT_3MIN", kill_timeout),
+    ):
+        return get_node_audit_log_entries.__wrapped__(log="audit.log", node="node-1", log_entry=AUDIT_LOG_ENTRY)
+
+
+class TestGetNodeAuditLogEntries:
+    """Test cases for get_node_audit_log_entries function"""
+
+    def test_matching_entries_parsed(self, audit_log_dir):
+        """Test only the lines containing the log entry are parsed, other lines may be anything"""
+        matching_entry = {"auditID": "1", "annotations": {AUDIT_LOG_ENTRY: "would violate PodSecurity"}}
+        (audit_log_dir / "audit.log").write_text(
+            f"{json.dumps({'auditID': '0', 'annotations': {}})}\n{json.dumps(matching_entry)}\nnot a JSON line\n"
+        )
+
+        assert _get_node_audit_log_entries(script='cat "$2"') == (True, [matching_entry])
+
+    def test_invalid_matching_line(self, audit_log_dir):
+        """Test a line containing the log entry which is not JSON fails the read"""
+        (audit_log_dir / "audit.log").write_text(f"truncated {AUDIT_LOG_ENTRY}\n")
+
+        with pytest.raises(json.decoder.JSONDecodeError):
+            _get_node_audit_log_entries(script='cat "$2"')
+
+    def test_rotated_log_skipped(self, audit_log_dir):
+        """Test a log rotated since it was listed is skipped, without entries"""
+        assert _get_node_audit_log_entries(script="echo 404 page not found >&2; exit 1") == (True, [])
+
+    @pytest.mark.parametrize(
+        "script",
+        [
+            pytest.param("echo error: You must be logged in to the server >&2; exit 1", id="oc_error"),
+            pytest.param("echo read tcp 10.0.0.1:443: connection reset by peer >&2", id="connection_reset"),
+            pytest.param("exit 1", id="non_zero_return_code"),
+        ],
+    )
+    def test_oc_failure(self, audit_log_dir, script):
+        """Test a failed oc command raises RuntimeError, so the read is retried"""
+        with pytest.raises(RuntimeError):
+            _get_node_audit_log_entries(script=script)
+
+    def test_hanging_oc_killed(self, audit_log_dir):
+        """Test an oc command still running after the timeout is killed, and the read fails to be retried"""
+        start_time = time.monotonic()
+
+        with pytest.raises(RuntimeError):
+            _get_node_audit_log_entries(script="exec sleep 30", kill_timeout=0.5)
+
+        assert time.monotonic() - start_time < 10
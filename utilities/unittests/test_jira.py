@@ -2,12 +2,34 @@
 
 """Unit tests for jira module"""
 
+import json
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+import utilities.jira
 from utilities.exceptions import MissingEnvironmentVariableError
-from utilities.jira import get_jira_status, is_jira_open
+from utilities.jira import get_jira_connection, get_jira_status, is_jira_open, prefetch_jira_statuses
+
+JIRA_CREDENTIALS = {
+    "PYTEST_JIRA_TOKEN": "test-token",
+    "PYTEST_JIRA_URL": "https://jira.example.com",
+    "PYTEST_JIRA_USERNAME": "test@example.com",
+}
+
+
+@pytest.fixture(autouse=True)
+def jira_status_cache_file(tmp_path):
+    """Use an empty Jira status cache file and a new JIRA connection in each test"""
+    cache_file = tmp_path / "jira-status.json"
+    get_jira_connection.cache_clear()
+    with (
+        patch("utilities.jira.JIRA_STATUS_CACHE_FILE", str(cache_file)),
+        patch("utilities.jira._JIRA_STATUS_CACHE", None),
+    ):
+        yield cache_file
+    get_jira_connection.cache_clear()
 
 
 class TestGetJiraStatus:
@@ -358,3 +380,84 @@ class TestIsJiraOpen:
 
         # Verify
         assert result is True
+
+
+class TestJiraStatusCache:
+    """Test cases for the Jira status cache"""
+
+    @patch("utilities.jira.JIRA")
+    @patch("utilities.jira.os.getenv")
+    def test_get_jira_status_cached_across_calls_and_runs(self, mock_getenv, mock_jira_class, jira_status_cache_file):
+        """Test a looked up status is served from the cache, also after the in-memory cache is dropped"""
+        mock_getenv.side_effect = lambda key, default=None: JIRA_CREDENTIALS.get(key, default)
+        mock_jira_class.return_value.issue.return_value.fields.status.name = "New"
+
+        assert get_jira_status("CNV-12345") == "new"
+        assert get_jira_status("CNV-12345") == "new"
+        with patch("utilities.jira._JIRA_STATUS_CACHE", None):
+            assert get_jira_status("CNV-12345") == "new"
+
+        mock_jira_class.assert_called_once()
+        mock_jira_class.return_value.issue.assert_called_once_with(id="CNV-12345")
+        assert json.loads(jira_status_cache_file.read_text())["CNV-12345"]["status"] == "new"
+
+    @patch("utilities.jira.JIRA")
+    @patch("utilities.jira.os.getenv")
+    def test_get_jira_status_expired_cache(self, mock_getenv, mock_jira_class, jira_status_cache_file):
+        """Test an expired cached status is looked up again"""
+        mock_getenv.side_effect = lambda key, default=None: JIRA_CREDENTIALS.get(key, default)
+        mock_jira_class.return_value.issue.return_value.fields.status.name = "Closed"
+        jira_status_cache_file.write_text(json.dumps({"CNV-12345": {"status": "new", "time": 0}}))
+
+        assert get_jira_status("CNV-12345") == "closed"
+        mock_jira_class.return_value.issue.assert_called_once_with(id="CNV-12345")
+
+    @patch("utilities.jira.py_config")
+    @patch("utilities.jira.os.getenv")
+    def test_get_jira_status_offline_uses_expired_cache(self, mock_getenv, mock_py_config, jira_status_cache_file):
+        """Test without credentials the cached status is used whatever its age"""
+        mock_getenv.return_value = None
+        mock_py_config.get.return_value = True
+        jira_status_cache_file.write_text(json.dumps({"CNV-12345": {"status": "verified", "time": 0}}))
+
+        assert get_jira_status("CNV-12345") == "verified"
+
+
+class TestPrefetchJiraStatuses:
+    """Test cases for prefetch_jira_statuses function"""
+
+    @patch("utilities.jira.JIRA")
+    @patch("utilities.jira.os.getenv")
+    def test_prefetch_jira_statuses_single_search(self, mock_getenv, mock_jira_class, jira_status_cache_file):
+        """Test the missing Jira IDs are resolved in one search, and then served from the cache"""
+        mock_getenv.side_effect = lambda key, default=None: JIRA_CREDENTIALS.get(key, default)
+        jira_status_cache_file.write_text(json.dumps({"CNV-3": {"status": "closed", "time": time.time()}}))
+        issues = []
+        for key, status in (("CNV-1", "New"), ("CNV-2", "ON_QA")):
+            issue = MagicMock()
+            issue.key = key
+            issue.fields.status.name = status
+            issues.append(issue)
+        mock_jira_instance = mock_jira_class.return_value
+        mock_jira_instance.search_issues.return_value = issues
+
+        prefetch_jira_statuses(jira_ids=["CNV-2", "CNV-1", "CNV-3", "CNV-1"])
+
+        mock_jira_instance.search_issues.assert_called_once_with(
+            jql_str="key in (CNV-1, CNV-2)", fields="status", maxResults=False
+        )
+        assert is_jira_open("CNV-1") is True
+        assert is_jira_open("CNV-2") is False
+        assert is_jira_open("CNV-3") is False
+        mock_jira_instance.issue.assert_not_called()
+
+    @patch("utilities.jira.JIRA")
+    @patch("utilities.jira.os.getenv")
+    def test_prefetch_jira_statuses_without_credentials(self, mock_getenv, mock_jira_class):
+        """Test nothing is looked up without credentials"""
+        mock_getenv.return_value = None
+
+        prefetch_jira_statuses(jira_ids=["CNV-1"])
+
+        mock_jira_class.assert_not_called()
+        assert utilities.jira.get_jira_status_cache() == {}
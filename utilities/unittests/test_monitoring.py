@@ -9,8 +9,11 @@ from timeout_sampler import TimeoutExpiredError
 
 # Monitoring module can be imported safely with centralized mocking in conftest.py
 from utilities.monitoring import (
+    BATCH_QUERY_LABEL,
+    PrometheusQueryBatcher,
     get_all_firing_alerts,
     get_metrics_value,
+    get_metrics_values_over_time,
     validate_alert_cnv_labels,
     validate_alerts,
     wait_for_alert,
@@ -341,6 +344,18 @@ class TestGetMetricsValue:
         assert result == "42"
         mock_prometheus.query.assert_called_once_with(query="test_metric")
 
+    def test_get_metrics_value_not_cached(self):
+        """Test every read queries Prometheus, so that a baseline read is never served a cached response"""
+        mock_prometheus = MagicMock()
+        mock_prometheus.scrape_interval = 30
+        mock_prometheus.query.side_effect = [
+            {"data": {"result": [{"value": ["timestamp", "1"]}]}},
+            {"data": {"result": [{"value": ["timestamp", "2"]}]}},
+        ]
+
+        assert get_metrics_value(prometheus=mock_prometheus, metrics_name="test_metric") == "1"
+        assert get_metrics_value(prometheus=mock_prometheus, metrics_name="test_metric") == "2"
+
     def test_get_metrics_value_no_data(self):
         """Test getting metrics value with no data"""
         mock_prometheus = MagicMock()
@@ -375,3 +390,94 @@ class TestWaitForGaugeMetricsValue:
 
         with pytest.raises(TimeoutExpiredError):
             wait_for_gauge_metrics_value(prometheus=mock_prometheus, query="test_query", expected_value="1.0")
+
+
+def _batch_response(values):
+    return {
+        "status": "success",
+        "data": {
+            "resultType": "vector",
+            "result": [
+                {"metric": {"name": f"vm-{index}", BATCH_QUERY_LABEL: str(index)}, "value": ["timestamp", value]}
+                for index, value in enumerate(values)
+            ],
+        },
+    }
+
+
+class TestPrometheusQueryBatcher:
+    """Test cases for PrometheusQueryBatcher class"""
+
+    def test_query_many_single_request(self):
+        """Test queries are merged into one request and their results demultiplexed"""
+        mock_prometheus = MagicMock()
+        mock_prometheus.query.return_value = _batch_response(values=["1", "2"])
+        batcher = PrometheusQueryBatcher(prometheus=mock_prometheus, cache_ttl=30)
+
+        responses = batcher.query_many(queries=["metric_a", "metric_b"])
+
+        mock_prometheus.query.assert_called_once()
+        batch_query = mock_prometheus.query.call_args.kwargs["query"]
+        assert "metric_a" in batch_query and "%20or%20" in batch_query
+        assert responses["metric_a"]["data"]["result"] == [{"metric": {"name": "vm-0"}, "value": ["timestamp", "1"]}]
+        assert responses["metric_b"]["data"]["result"] == [{"metric": {"name": "vm-1"}, "value": ["timestamp", "2"]}]
+
+    def test_query_served_from_cache(self):
+        """Test a query is not sent again within the cache TTL"""
+        mock_prometheus = MagicMock()
+        mock_prometheus.query.return_value = {"status": "success", "data": {"result": []}}
+        batcher = PrometheusQueryBatcher(prometheus=mock_prometheus, cache_ttl=30)
+
+        batcher.query(query="metric_a")
+        batcher.query(query="metric_a")
+
+        mock_prometheus.query.assert_called_once_with(query="metric_a")
+
+    def test_pending_queries_fetched_together(self):
+        """Test added queries are fetched with the next query and then served from the cache"""
+        mock_prometheus = MagicMock()
+        mock_prometheus.query.return_value = _batch_response(values=["1", "2"])
+        batcher = PrometheusQueryBatcher(prometheus=mock_prometheus, cache_ttl=30)
+        batcher.add_queries(queries=["metric_b"])
+
+        batcher.query(query="metric_a")
+        response = batcher.query(query="metric_b")
+
+        mock_prometheus.query.assert_called_once()
+        assert response["data"]["result"][0]["value"] == ["timestamp", "2"]
+
+    def test_failed_batch_falls_back_to_single_queries(self):
+        """Test queries are sent one by one when the batched query fails"""
+        mock_prometheus = MagicMock()
+        single_response = {"status": "success", "data": {"resultType": "scalar", "result": ["timestamp", "1"]}}
+        mock_prometheus.query.side_effect = [{"status": "error"}, single_response, single_response]
+        batcher = PrometheusQueryBatcher(prometheus=mock_prometheus, cache_ttl=30)
+
+        responses = batcher.query_many(queries=["scalar(metric_a)", "metric_b"])
+
+        assert responses == {"scalar(metric_a)": single_response, "metric_b": single_response}
+        assert mock_prometheus.query.call_count == 3
+
+
+class TestGetMetricsValuesOverTime:
+    """Test cases for get_metrics_values_over_time function"""
+
+    def test_get_metrics_values_over_time(self):
+        """Test a range query is sent and its values returned as (timestamp, value) tuples"""
+        mock_prometheus = MagicMock()
+        mock_prometheus.scrape_interval = 30
+        mock_prometheus.api_v1 = "/api/v1"
+        mock_prometheus._get_response.return_value = {
+            "status": "success",
+            "data": {
+                "resultType": "matrix",
+                "result": [{"metric": {}, "values": [[1700000000, "1"], [1700000030, "2"]]}],
+            },
+        }
+
+        values = get_metrics_values_over_time(prometheus=mock_prometheus, query="metric_a", duration=60)
+
+        assert values == [(1700000000.0, "1"), (1700000030.0, "2")]
+        range_query = mock_prometheus._get_response.call_args.kwargs["query"]
+        assert range_query.startswith("/api/v1/query_range?query=metric_a&start=")
+        assert range_query.endswith("&step=30")
@@ -0,0 +1,173 @@
+"""Unit tests for network module"""
+
+from concurrent.futures import ThreadPoolExecutor
+from ipaddress import ip_address
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from libs.net.vmspec import IpNotFound
+from utilities.constants import IPV4_STR, IPV6_STR
+from utilities.network import (
+    MacPool,
+    MacPoolExhaustedError,
+    assert_ping_matrix_successful,
+    parse_ping_output,
+    ping_matrix,
+)
+
+SMALL_KMP_RANGE = {"RANGE_START": "02:00:00:00:00:00", "RANGE_END": "02:00:00:00:00:09"}
+
+
+def _allocate_macs(state_file, count):
+    return MacPool(kmp_range=SMALL_KMP_RANGE, state_file=state_file, block_size=2).get_macs_from_pool(count=count)
+
+
+PING_OUTPUT = """--- 10.0.0.2 ping statistics ---
+3 packets transmitted, 3 received, 0% packet loss, time 2003ms
+rtt min/avg/max/mdev = 0.302/0.415/0.610/0.138 ms"""
+PING_LOSS_OUTPUT = """--- 10.0.0.3 ping statistics ---
+3 packets transmitted, 0 received, 100% packet loss, time 2045ms"""
+
+
+def _vm(name, ip):
+    vm = MagicMock()
+    vm.name = name
+    vm.ip = ip_address(ip)
+    return vm
+
+
+def _run_ssh_batch(host, commands, check_rc):
+    # mktemp, background pings, one cat per destination, rm
+    return (
+        ["/tmp/dir", ""] + [PING_LOSS_OUTPUT if "10.0.0.3" in commands[1] else PING_OUTPUT] * (len(commands) - 3) + [""]
+    )
+
+
+def _vm_with_macs(macs):
+    vm = MagicMock()
+    vm.get_interfaces.return_value = [{"macAddress": mac} for mac in macs]
+    return vm
+
+
+class TestMacPool:
+    """Test cases for MacPool class"""
+
+    def test_get_macs_from_pool_whole_range(self):
+        """Test every MAC of the range is allocated once before the pool is exhausted"""
+        mac_pool = MacPool(kmp_range=SMALL_KMP_RANGE, block_size=3)
+
+        macs = mac_pool.get_macs_from_pool(count=10)
+
+        assert sorted(macs) == [f"02:00:00:00:00:0{index}" for index in range(10)]
+        with pytest.raises(MacPoolExhaustedError):
+            mac_pool.get_mac_from_pool()
+
+    def test_get_mac_from_pool_skips_used_macs(self):
+        """Test MACs of appended VMs are not allocated"""
+        mac_pool = MacPool(kmp_range=SMALL_KMP_RANGE)
+        mac_pool.append_macs(vm=_vm_with_macs(macs=["02:00:00:00:00:03", "02:00:00:00:00:07"]))
+
+        macs = mac_pool.get_macs_from_pool(count=8)
+
+        assert not {"02:00:00:00:00:03", "02:00:00:00:00:07"} & set(macs)
+
+    def test_remove_macs_releases_to_pool(self):
+        """Test MACs of a removed VM are allocated again"""
+        mac_pool = MacPool(kmp_range=SMALL_KMP_RANGE)
+        macs = mac_pool.get_macs_from_pool(count=10)
+        vm = _vm_with_macs(macs=macs[:2])
+        mac_pool.append_macs(vm=vm)
+
+        mac_pool.remove_macs(vm=vm)
+
+        assert mac_pool.get_macs_from_pool(count=2) == macs[:2]
+
+    def test_interfaces_without_mac_ignored(self):
+        """Test interfaces without MAC, as in namespaces ignored by KubeMacPool, are skipped"""
+        mac_pool = MacPool(kmp_range=SMALL_KMP_RANGE)
+        vm = _vm_with_macs(macs=["02:00:00:00:00:03"])
+        vm.get_interfaces.return_value.append({"name": "default"})
+        mac_pool.append_macs(vm=vm)
+
+        assert mac_pool.used_macs == {MacPool.mac_to_int(mac="02:00:00:00:00:03")}
+
+        mac_pool.remove_macs(vm=vm)
+
+        assert not mac_pool.used_macs
+
+    def test_shared_state_file(self, tmp_path):
+        """Test pools sharing a state file (as xdist workers do) split the range without collisions"""
+        state_file = str(tmp_path / "mac-pool.json")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(_allocate_macs, [state_file, state_file], [5, 5]))
+
+        assert len(set(results[0] + results[1])) == 10
+        with pytest.raises(MacPoolExhaustedError):
+            MacPool(kmp_range=SMALL_KMP_RANGE, state_file=state_file).get_mac_from_pool()
+
+
+class TestParsePingOutput:
+    """Test cases for parse_ping_output function"""
+
+    def test_parse_ping_output(self):
+        """Test packet loss and average RTT are parsed from the ping summary"""
+        assert parse_ping_output(out=PING_OUTPUT) == (0.0, 0.415)
+
+    def test_parse_ping_output_no_reply(self):
+        """Test the RTT is None when no reply was received"""
+        assert parse_ping_output(out=PING_LOSS_OUTPUT) == (100.0, None)
+
+
+@patch("utilities.network.lookup_iface_status_ip", side_effect=lambda vm, iface_name, ip_family: vm.ip)
+@patch("utilities.network.run_ssh_batch", side_effect=_run_ssh_batch)
+class TestPingMatrix:
+    """Test cases for ping_matrix and assert_ping_matrix_successful functions"""
+
+    def test_ping_matrix_one_session_per_source(self, mock_run_ssh_batch, mock_lookup_ip):
+        """Test every VM pings every other VM, all destinations of a source in one SSH batch"""
+        vms = [_vm(name="vm-a", ip="10.0.0.1"), _vm(name="vm-b", ip="10.0.0.2"), _vm(name="vm-c", ip="10.0.0.4")]
+
+        results = ping_matrix(vms=vms, ip_families=(IPV4_STR,), iface_name="default")
+
+        assert mock_run_ssh_batch.call_count == 3
+        assert {(result.src_vm.name, result.dst_vm.name) for result in results} == {
+            (src_vm.name, dst_vm.name) for src_vm in vms for dst_vm in vms if src_vm is not dst_vm
+        }
+        assert all(result.packet_loss == 0 and result.rtt_avg == 0.415 for result in results)
+
+    def test_assert_ping_matrix_successful_reports_failed_edges(self, mock_run_ssh_batch, mock_lookup_ip):
+        """Test all the edges with packet loss are reported"""
+        vms = [_vm(name="vm-a", ip="10.0.0.1"), _vm(name="vm-b", ip="10.0.0.3")]
+
+        with pytest.raises(AssertionError) as exc_info:
+            assert_ping_matrix_successful(vms=vms, iface_name="default")
+
+        assert "vm-b -> vm-a" not in str(exc_info.value)
+        assert "vm-a -> vm-b (10.0.0.3): packet loss 100.0" in str(exc_info.value)
+
+    def test_ping_matrix_missing_ip_family_left_out(self, mock_run_ssh_batch, mock_lookup_ip):
+        """Test destinations without an address of a requested IP family are not pinged"""
+        vms = [_vm(name="vm-a", ip="10.0.0.1"), _vm(name="vm-b", ip="10.0.0.2")]
+
+        def _lookup_ip(vm, iface_name, ip_family):
+            if ip_family == 6:
+                raise IpNotFound(f"IPv6 address not found on VM {vm.name}")
+            return vm.ip
+
+        mock_lookup_ip.side_effect = _lookup_ip
+
+        results = ping_matrix(vms=vms, ip_families=(IPV4_STR, IPV6_STR), iface_name="default")
+
+        assert sorted(str(result.dst_ip) for result in results) == ["10.0.0.1", "10.0.0.2"]
+
+    def test_missing_ping_output_is_failed_edge(self, mock_run_ssh_batch, mock_lookup_ip):
+        """Test a destination without ping output, e.g. a cut short SSH batch, is a failed edge"""
+        mock_run_ssh_batch.side_effect = lambda host, commands, check_rc: ["/tmp/dir", "", PING_OUTPUT]
+        vms = [_vm(name="vm-a", ip="10.0.0.1"), _vm(name="vm-b", ip="10.0.0.2"), _vm(name="vm-c", ip="10.0.0.4")]
+
+        with pytest.raises(AssertionError) as exc_info:
+            assert_ping_matrix_successful(vms=vms, iface_name="default")
+
+        assert str(exc_info.value).count("packet loss None") == 3
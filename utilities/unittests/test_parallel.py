@@ -0,0 +1,105 @@
+"""Unit tests for the concurrent VM operations of libs.vm.parallel"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from libs.vm.parallel import VMOperationResult, VMsOperationError, run_concurrently
+
+
+def _vm(name, namespace="test-ns"):
+    return SimpleNamespace(name=name, namespace=namespace)
+
+
+class TestRunConcurrently:
+    """Test cases for run_concurrently function"""
+
+    def test_all_succeed(self):
+        """Test every VM gets a successful result, in the order of the VMs"""
+        vms = [_vm(name="vm-a"), _vm(name="vm-b"), _vm(name="vm-c")]
+        operated = []
+
+        results = run_concurrently(vms=vms, operation=lambda vm: operated.append(vm.name))
+
+        assert sorted(operated) == ["vm-a", "vm-b", "vm-c"]
+        assert [result.vm_name for result in results] == ["vm-a", "vm-b", "vm-c"]
+        assert all(result.succeeded for result in results)
+
+    def test_operations_run_concurrently(self):
+        """Test the operations run at the same time, up to max_workers"""
+        barrier = threading.Barrier(parties=3, timeout=5)
+
+        run_concurrently(
+            vms=[_vm(name="vm-a"), _vm(name="vm-b"), _vm(name="vm-c")],
+            operation=lambda vm: barrier.wait(),
+            max_workers=3,
+        )
+
+    def test_same_name_in_different_namespaces(self):
+        """Test VMs sharing a name in different namespaces each keep their own duration"""
+        vms = [_vm(name="vm", namespace="ns-1"), _vm(name="vm", namespace="ns-2")]
+
+        results = run_concurrently(vms=vms, operation=lambda vm: time.sleep(0.2 if vm.namespace == "ns-1" else 0))
+
+        assert results[0].duration_sec >= 0.2
+        assert results[1].duration_sec < 0.2
+
+    def test_failures_collected(self):
+        """Test all failures are reported in a single VMsOperationError when not failing fast"""
+
+        def _operation(vm):
+            if vm.name != "vm-ok":
+                raise TimeoutError(f"{vm.name} not ready")
+
+        with pytest.raises(VMsOperationError) as error:
+            run_concurrently(
+                vms=[_vm(name="vm-ok"), _vm(name="vm-1"), _vm(name="vm-2")],
+                operation=_operation,
+                fail_fast=False,
+            )
+
+        assert sorted(result.vm_name for result in error.value.failures) == ["vm-1", "vm-2"]
+        assert len(error.value.results) == 3
+        assert "2 of 3 VM operation(s) failed" in str(error.value)
+
+    def test_fail_fast_cancels_pending(self):
+        """Test operations not started yet are cancelled once an operation failed"""
+        vms = [_vm(name=f"vm-{index}") for index in range(5)]
+        started = []
+
+        def _operation(vm):
+            started.append(vm.name)
+            if vm.name == "vm-0":
+                raise TimeoutError(f"{vm.name} not ready")
+            time.sleep(0.1)
+
+        with pytest.raises(VMsOperationError) as error:
+            run_concurrently(vms=vms, operation=_operation, max_workers=1)
+
+        assert [result.vm_name for result in error.value.failures] == ["vm-0"]
+        # The single worker may pick the next VM before the pending ones are cancelled
+        assert len(error.value.cancelled) >= 3
+        assert not set(error.value.cancelled) & set(started)
+        assert "Cancelled before start" in str(error.value)
+
+    def test_no_vms(self):
+        """Test no VMs give no results"""
+        assert run_concurrently(vms=[], operation=lambda vm: None) == []
+
+
+class TestVMOperationResult:
+    """Test cases for VMOperationResult class"""
+
+    @pytest.mark.parametrize(
+        "result, succeeded",
+        [
+            pytest.param(VMOperationResult(vm_name="vm", duration_sec=1), True, id="success"),
+            pytest.param(VMOperationResult(vm_name="vm", duration_sec=1, error=ValueError()), False, id="error"),
+            pytest.param(VMOperationResult(vm_name="vm", duration_sec=0, cancelled=True), False, id="cancelled"),
+        ],
+    )
+    def test_succeeded(self, result, succeeded):
+        """Test only results without error that were not cancelled succeeded"""
+        assert result.succeeded is succeeded
@@ -0,0 +1,90 @@
+"""Unit tests for the rate-limited VM pipeline of libs.vm.pipeline"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.dynamic.resource import ResourceField
+
+from libs.vm.pipeline import run_vm_pipeline
+
+
+def _vm(name, namespace="test-ns"):
+    return SimpleNamespace(name=name, namespace=namespace)
+
+
+def _vmi(name, namespace="test-ns", phase="Running"):
+    return ResourceField(
+        params={
+            "metadata": ResourceField(params={"name": name, "namespace": namespace}),
+            "status": ResourceField(params={"phase": phase}),
+        }
+    )
+
+
+@pytest.fixture
+def mock_vmi_informer():
+    informer = MagicMock()
+    informer.list.side_effect = lambda namespace: [
+        vmi
+        for vmi in [_vmi(name="vm-a", namespace="ns-1"), _vmi(name="vm-b", namespace="ns-2")]
+        if vmi.metadata.namespace == namespace
+    ]
+    return informer
+
+
+class TestRunVMPipeline:
+    """Test cases for run_vm_pipeline function"""
+
+    def test_steps_run_for_every_vm(self):
+        """Test every step runs once per VM, without waiting for the VMIs"""
+        vms = [_vm(name="vm-a"), _vm(name="vm-b")]
+        step = MagicMock()
+
+        report = run_vm_pipeline(vms=vms, steps=[step], requests_per_second=100)
+
+        assert step.call_count == 2
+        assert report.succeeded
+        assert not report.wait_for_running
+
+    def test_wait_for_running_with_session_informer(self, mock_vmi_informer):
+        """Test the VMIs of every namespace are read from the single cluster-wide session informer"""
+        vms = [_vm(name="vm-a", namespace="ns-1"), _vm(name="vm-b", namespace="ns-2")]
+
+        with patch("libs.vm.pipeline.get_session_informer", autospec=True, return_value=mock_vmi_informer):
+            report = run_vm_pipeline(vms=vms, steps=[MagicMock()], requests_per_second=100, running_timeout=1)
+
+        assert report.succeeded
+        assert all(result.time_to_running_sec is not None for result in report.results)
+        mock_vmi_informer.subscribe.assert_called_once()
+        mock_vmi_informer.subscribe.return_value.assert_called_once()
+        mock_vmi_informer.stop.assert_not_called()
+
+    def test_wait_for_running_without_session_informer(self, mock_vmi_informer):
+        """Test an informer per namespace is started, and stopped, when session informers are not enabled"""
+        vms = [_vm(name="vm-a", namespace="ns-1"), _vm(name="vm-b", namespace="ns-2")]
+
+        with (
+            patch("utilities.informer._SESSION_INFORMER_CACHE", None),
+            patch("libs.vm.pipeline.ResourceInformer") as mock_resource_informer,
+        ):
+            mock_resource_informer.return_value.start.return_value = mock_vmi_informer
+            report = run_vm_pipeline(vms=vms, steps=[MagicMock()], requests_per_second=100, running_timeout=1)
+
+        assert report.succeeded
+        assert {call.kwargs["namespace"] for call in mock_resource_informer.call_args_list} == {"ns-1", "ns-2"}
+        assert mock_vmi_informer.stop.call_count == 2
+
+    def test_vmi_of_other_namespace_ignored(self, mock_vmi_informer):
+        """Test a running VMI of the same name in another namespace does not count as running"""
+        mock_vmi_informer.list.side_effect = lambda namespace: [_vmi(name="vm-a", namespace="other-ns")]
+
+        with patch("libs.vm.pipeline.get_session_informer", autospec=True, return_value=mock_vmi_informer):
+            report = run_vm_pipeline(
+                vms=[_vm(name="vm-a", namespace="ns-1")],
+                steps=[MagicMock()],
+                requests_per_second=100,
+                running_timeout=0.1,
+            )
+
+        assert report.not_running == ["vm-a"]
@@ -3,11 +3,13 @@
 """Unit tests for pytest_matrix_utils module"""
 
 from inspect import signature
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
+from kubernetes.dynamic.resource import ResourceField
 
 from utilities.pytest_matrix_utils import (
+    _get_storage_class_provisioners,
     hpp_matrix,
     immediate_matrix,
     online_resize_matrix,
@@ -124,31 +126,22 @@ class TestOnlineResizeMatrix:
 class TestHppMatrix:
     """Test cases for hpp_matrix function"""
 
-    @patch("utilities.infra.cache_admin_client")
-    @patch("utilities.pytest_matrix_utils.StorageClass")
-    def test_hpp_matrix_with_hpp_provisioner(self, mock_storage_class, mock_cache_admin_client):
-        """Test hpp_matrix filters storage classes with HPP provisioner"""
-        mock_client = MagicMock()
-        mock_cache_admin_client.return_value = mock_client
-
-        # Mock StorageClass instances
-        mock_sc_hpp = MagicMock()
-        mock_sc_hpp.instance.provisioner = "kubevirt.io.hostpath-provisioner"
-
-        mock_sc_non_hpp = MagicMock()
-        mock_sc_non_hpp.instance.provisioner = "other.provisioner"
-
-        # Configure StorageClass mock to return different instances
-        def storage_class_side_effect(client, name):
-            if name == "hpp-sc":
-                return mock_sc_hpp
-            if name == "non-hpp-sc":
-                return mock_sc_non_hpp
-            return MagicMock()
-
-        mock_storage_class.side_effect = storage_class_side_effect
-        mock_storage_class.Provisioner.HOSTPATH_CSI = "kubevirt.io/hostpath-csi"
-        mock_storage_class.Provisioner.HOSTPATH = "kubevirt.io.hostpath-provisioner"
+    @patch("utilities.pytest_matrix_utils.cache_admin_client")
+    def test_hpp_matrix_with_hpp_provisioner(self, mock_cache_admin_client):
+        """Test hpp_matrix filters storage classes with HPP provisioner, listing the storage classes once"""
+        _get_storage_class_provisioners.cache_clear()
+        mock_list = mock_cache_admin_client.return_value.resources.get.return_value.get
+        mock_list.return_value.items = [
+            ResourceField(
+                params={
+                    "metadata": ResourceField(params={"name": "hpp-sc"}),
+                    "provisioner": "kubevirt.io.hostpath-provisioner",
+                }
+            ),
+            ResourceField(
+                params={"metadata": ResourceField(params={"name": "non-hpp-sc"}), "provisioner": "other.provisioner"}
+            ),
+        ]
 
         matrix = [
             {"hpp-sc": {"other": "value"}},
@@ -156,9 +149,12 @@ class TestHppMatrix:
         ]
 
         result = hpp_matrix(matrix)
+        hpp_matrix(matrix)
+        _get_storage_class_provisioners.cache_clear()
 
         assert len(result) == 1
         assert {"hpp-sc": {"other": "value"}} in result
+        mock_list.assert_called_once()
 
     def test_hpp_matrix_empty_matrix(self):
         """Test hpp_matrix with empty matrix"""
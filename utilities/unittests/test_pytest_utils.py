@@ -2,6 +2,7 @@
 
 """Unit tests for pytest_utils module"""
 
+import sys
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
@@ -31,7 +32,9 @@ from utilities.pytest_utils import (
     get_artifactory_server_url,
     get_base_matrix_name,
     get_cnv_version_explorer_url,
+    get_collected_tests_jira_ids,
     get_current_running_data,
+    get_dynamic_matrix_params_cache_stats,
     get_matrix_params,
     get_tests_cluster_markers,
     mark_nmstate_dependent_tests,
@@ -256,6 +259,45 @@ class TestGetMatrixParams:
         assert result == [{"param": "value"}]
 
 
+class TestGetMatrixParamsCache:
+    """Test cases for the dynamic matrices cache of get_matrix_params"""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        """Start each test with an empty cache, and restore the session cache after it"""
+        with (
+            patch.dict("utilities.pytest_utils._DYNAMIC_MATRIX_PARAMS_CACHE", clear=True),
+            patch.dict("utilities.pytest_utils._DYNAMIC_MATRIX_PARAMS_CACHE_STATS", clear=True),
+        ):
+            yield
+
+    @patch("utilities.pytest_utils.py_config", {"base_matrix": [{"sc-1": {}}, {"sc-2": {}}]})
+    @patch("utilities.pytest_utils.skip_if_pytest_flags_exists", return_value=False)
+    def test_dynamic_matrix_resolved_once(self, mock_skip_flags):
+        """Test a dynamic matrix function runs once, and later calls are served from the cache"""
+        mock_matrix_func = MagicMock(return_value=[{"sc-1": {}}])
+        with patch.dict(sys.modules, {"utilities.pytest_matrix_utils": MagicMock(filter_matrix=mock_matrix_func)}):
+            get_matrix_params(MagicMock(), "base_matrix_filter_matrix")
+            second_result = get_matrix_params(MagicMock(), "base_matrix_filter_matrix")
+
+        assert second_result == [{"sc-1": {}}]
+        mock_matrix_func.assert_called_once_with(matrix=[{"sc-1": {}}, {"sc-2": {}}])
+        assert get_dynamic_matrix_params_cache_stats() == {"hits": 1, "misses": 1, "matrices": 1}
+
+    @patch("utilities.pytest_utils.py_config", {"base_matrix": [{"sc-1": {}}, {"sc-2": {}}]})
+    @patch("utilities.pytest_utils.skip_if_pytest_flags_exists", return_value=False)
+    def test_cached_matrix_not_altered_by_callers(self, mock_skip_flags):
+        """Test changes of a returned matrix, or of its param dicts, do not alter the cached matrix"""
+        mock_matrix_func = MagicMock(return_value=[{"sc-1": {"volume_mode": "Block"}}])
+        with patch.dict(sys.modules, {"utilities.pytest_matrix_utils": MagicMock(filter_matrix=mock_matrix_func)}):
+            first_result = get_matrix_params(MagicMock(), "base_matrix_filter_matrix")
+            first_result.append({"sc-2": {}})
+            first_result[0]["sc-1"]["volume_mode"] = "Filesystem"
+            second_result = get_matrix_params(MagicMock(), "base_matrix_filter_matrix")
+
+        assert second_result == [{"sc-1": {"volume_mode": "Block"}}]
+
+
 class TestConfigDefaultStorageClass:
     """Test cases for config_default_storage_class function"""
 
@@ -1167,6 +1209,27 @@ class TestGetTestsClusterMarkers:
         assert "ipv4" in logged_markers
 
 
+class TestGetCollectedTestsJiraIds:
+    """Test cases for get_collected_tests_jira_ids function"""
+
+    def test_get_collected_tests_jira_ids(self, tmp_path):
+        """Test Jira IDs are collected from jira markers and literal is_jira_open calls of the modules"""
+        test_module = tmp_path / "test_module.py"
+        test_module.write_text(
+            'if is_jira_open("CNV-1"):\n    pass\nis_jira_open(jira_id="OCPBUGS-2")\nis_jira_open(jira_id=jira_key)\n'
+        )
+        jira_marker = MagicMock()
+        jira_marker.args = ("CNV-3",)
+        items = []
+        for markers in ([jira_marker], []):
+            item = MagicMock()
+            item.path = test_module
+            item.iter_markers.return_value = markers
+            items.append(item)
+
+        assert get_collected_tests_jira_ids(items=items) == {"CNV-1", "OCPBUGS-2", "CNV-3"}
+
+
 class TestExitPytestExecution:
     """Test cases for exit_pytest_execution function"""
 
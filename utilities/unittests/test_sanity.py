@@ -2,24 +2,69 @@
 
 """Unit tests for sanity module"""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 from kubernetes.client import ApiException
 from kubernetes.dynamic.exceptions import ResourceNotFoundError
+from kubernetes.dynamic.resource import ResourceField
 from ocp_utilities.exceptions import NodeNotReadyError, NodeUnschedulableError
 from timeout_sampler import TimeoutExpiredError
 
 from utilities.exceptions import ClusterSanityError
 from utilities.sanity import (
+    ClusterSnapshot,
     _discover_webhook_services,
+    _SnapshotNode,
+    check_nodes_health,
     check_vm_creation_capability,
     check_webhook_endpoints_health,
     cluster_sanity,
+    get_not_running_snapshot_pods,
     storage_sanity_check,
+    take_cluster_snapshot,
 )
 
 
+def _node(name, unschedulable=False):
+    return ResourceField(
+        params={
+            "metadata": ResourceField(params={"name": name}),
+            "spec": ResourceField(params={"unschedulable": unschedulable}),
+            "status": ResourceField(params={"conditions": []}),
+        }
+    )
+
+
+def _pod(name, phase="Running", container_statuses=None, deletion_timestamp=None):
+    metadata = {"name": name}
+    if deletion_timestamp:
+        metadata["deletionTimestamp"] = deletion_timestamp
+    return ResourceField(
+        params={
+            "metadata": ResourceField(params=metadata),
+            "status": ResourceField(params={"phase": phase, "containerStatuses": container_statuses or []}),
+        }
+    )
+
+
+def _snapshot(nodes=(), pods=(), endpoints=None, webhook_configurations=()):
+    return ClusterSnapshot(
+        nodes=list(nodes),
+        pods=list(pods),
+        endpoints=endpoints or {},
+        webhook_configurations=list(webhook_configurations),
+        duration=0.1,
+    )
+
+
+@pytest.fixture
+def mock_take_cluster_snapshot():
+    with patch("utilities.sanity.take_cluster_snapshot", return_value=_snapshot(pods=[_pod(name="virt-api")])) as mock:
+        yield mock
+
+
 class TestStorageSanityCheck:
     """Test cases for storage_sanity_check function"""
 
@@ -105,6 +150,7 @@ class TestStorageSanityCheck:
         assert "['sc1']" in error_call_args
 
 
+@pytest.mark.usefixtures("mock_take_cluster_snapshot")
 class TestClusterSanity:
     """Test cases for cluster_sanity function"""
 
@@ -256,8 +302,9 @@ class TestClusterSanity:
         # Verify all checks were called
         mock_storage_sanity.assert_called_once_with(cluster_storage_classes_names=cluster_storage_classes)
         mock_assert_healthy.assert_called_once()
-        mock_assert_schedulable.assert_called_once_with(nodes=mock_nodes)
-        mock_wait_pods.assert_called_once()
+        mock_assert_schedulable.assert_called_once_with(nodes=[])
+        # All the pods are running in the cluster snapshot, no need to wait for them
+        mock_wait_pods.assert_not_called()
         mock_wait_hco.assert_called_once()
         mock_check_webhook.assert_called_once()
         mock_check_vm.assert_called_once()
@@ -437,6 +484,7 @@ class TestClusterSanity:
         mock_storage_sanity,
         _mock_check_vm,
         _mock_check_webhook,
+        mock_take_cluster_snapshot,
     ):
         """Test TimeoutExpiredError during wait_for_pods_running converted to ClusterSanityError"""
 
@@ -444,6 +492,7 @@ class TestClusterSanity:
         mock_request.config.getoption.return_value = ""
         mock_request.session.config.getoption.return_value = False
         mock_storage_sanity.return_value = True
+        mock_take_cluster_snapshot.return_value = _snapshot(pods=[_pod(name="virt-handler", phase="Pending")])
 
         mock_hco_namespace = MagicMock()
         mock_hco_namespace.name = "test-namespace"
@@ -469,58 +518,73 @@ class TestClusterSanity:
     @patch("utilities.sanity.storage_sanity_check")
     @patch("utilities.sanity.assert_nodes_in_healthy_condition")
     @patch("utilities.sanity.assert_nodes_schedulable")
-    @patch("utilities.sanity.wait_for_pods_running")
     @patch("utilities.sanity.wait_for_hco_conditions")
+    @patch("utilities.sanity.exit_pytest_execution")
     @patch("utilities.sanity.LOGGER")
-    def test_cluster_sanity_components_called_in_order(
+    def test_cluster_sanity_failures_raised_in_checks_order(
         self,
         _mock_logger,
-        mock_wait_hco,
-        mock_wait_pods,
+        mock_exit_pytest,
+        _mock_wait_hco,
         mock_assert_schedulable,
-        mock_assert_healthy,
+        _mock_assert_healthy,
         mock_storage_sanity,
-        mock_check_vm,
+        _mock_check_vm,
         mock_check_webhook,
     ):
-        """Test all components called in correct order (storage, nodes, webhook, HCO)"""
+        """Test the first failed check, in the checks order (storage, nodes, pods, webhook, vm), is reported"""
 
         mock_request = MagicMock()
         mock_request.config.getoption.return_value = ""
         mock_request.session.config.getoption.return_value = False
         mock_storage_sanity.return_value = True
+        mock_check_webhook.side_effect = ClusterSanityError("Webhook services have no available endpoints")
+        mock_assert_schedulable.side_effect = NodeUnschedulableError("Node is unschedulable")
 
-        call_order = []
-
-        def track_storage(*args, **kwargs):
-            call_order.append("storage")
-            return True
-
-        def track_healthy(*args, **kwargs):
-            call_order.append("healthy")
-
-        def track_schedulable(*args, **kwargs):
-            call_order.append("schedulable")
+        cluster_sanity(
+            request=mock_request,
+            admin_client=MagicMock(),
+            cluster_storage_classes_names=["sc1"],
+            nodes=MagicMock(),
+            hco_namespace=MagicMock(),
+        )
 
-        def track_pods(*args, **kwargs):
-            call_order.append("pods")
+        mock_exit_pytest.assert_called_once()
+        assert mock_exit_pytest.call_args[1]["log_message"] == "Node is unschedulable"
 
-        def track_webhook(*args, **kwargs):
-            call_order.append("webhook")
+    @patch("utilities.sanity.check_webhook_endpoints_health")
+    @patch("utilities.sanity.check_vm_creation_capability")
+    @patch("utilities.sanity.storage_sanity_check")
+    @patch("utilities.sanity.assert_nodes_in_healthy_condition")
+    @patch("utilities.sanity.assert_nodes_schedulable")
+    @patch("utilities.sanity.wait_for_hco_conditions")
+    @patch("utilities.sanity.exit_pytest_execution")
+    @patch("utilities.sanity.LOGGER")
+    def test_cluster_sanity_hco_wait_overlaps_checks(
+        self,
+        _mock_logger,
+        mock_exit_pytest,
+        mock_wait_hco,
+        _mock_assert_schedulable,
+        _mock_assert_healthy,
+        mock_storage_sanity,
+        _mock_check_vm,
+        mock_check_webhook,
+    ):
+        """Test the HCO conditions are waited for while the other checks run"""
 
-        def track_vm(*args, **kwargs):
-            call_order.append("vm")
+        mock_request = MagicMock()
+        mock_request.config.getoption.return_value = ""
+        mock_request.session.config.getoption.return_value = False
+        mock_storage_sanity.return_value = True
+        hco_wait_started = threading.Event()
+        mock_wait_hco.side_effect = lambda **kwargs: hco_wait_started.set()
 
-        def track_hco(*args, **kwargs):
-            call_order.append("hco")
+        def _check_webhook(**kwargs):
+            if not hco_wait_started.wait(timeout=5):
+                raise ClusterSanityError("HCO conditions were not waited for in the background")
 
-        mock_storage_sanity.side_effect = track_storage
-        mock_assert_healthy.side_effect = track_healthy
-        mock_assert_schedulable.side_effect = track_schedulable
-        mock_wait_pods.side_effect = track_pods
-        mock_check_webhook.side_effect = track_webhook
-        mock_check_vm.side_effect = track_vm
-        mock_wait_hco.side_effect = track_hco
+        mock_check_webhook.side_effect = _check_webhook
 
         cluster_sanity(
             request=mock_request,
@@ -530,8 +594,8 @@ class TestClusterSanity:
             hco_namespace=MagicMock(),
         )
 
-        # Verify the order: storage -> healthy -> schedulable -> pods -> webhook -> vm -> hco
-        assert call_order == ["storage", "healthy", "schedulable", "pods", "webhook", "vm", "hco"]
+        mock_exit_pytest.assert_not_called()
+        mock_wait_hco.assert_called_once()
 
     @patch("utilities.sanity.check_webhook_endpoints_health")
     @patch("utilities.sanity.check_vm_creation_capability")
@@ -552,6 +616,7 @@ class TestClusterSanity:
         mock_storage_sanity,
         _mock_check_vm,
         _mock_check_webhook,
+        mock_take_cluster_snapshot,
     ):
         """Test assert_nodes_in_healthy_condition called with correct parameters"""
 
@@ -560,7 +625,11 @@ class TestClusterSanity:
         mock_request.session.config.getoption.return_value = False
         mock_storage_sanity.return_value = True
 
-        mock_nodes = MagicMock()
+        mock_node = MagicMock()
+        mock_node.name = "node-1"
+        mock_nodes = [mock_node]
+        snapshot_node = _node(name="node-1")
+        mock_take_cluster_snapshot.return_value = _snapshot(nodes=[snapshot_node, _node(name="other-node")])
 
         cluster_sanity(
             request=mock_request,
@@ -570,7 +639,9 @@ class TestClusterSanity:
             hco_namespace=MagicMock(),
         )
 
-        mock_assert_healthy.assert_called_once_with(nodes=mock_nodes, healthy_node_condition_type="Ready")
+        mock_assert_healthy.assert_called_once_with(
+            nodes=[_SnapshotNode(name="node-1", instance=snapshot_node)], healthy_node_condition_type="Ready"
+        )
 
     @patch("utilities.sanity.check_webhook_endpoints_health")
     @patch("utilities.sanity.check_vm_creation_capability")
@@ -590,6 +661,7 @@ class TestClusterSanity:
         mock_storage_sanity,
         _mock_check_vm,
         _mock_check_webhook,
+        mock_take_cluster_snapshot,
     ):
         """Test assert_nodes_schedulable called"""
 
@@ -598,7 +670,11 @@ class TestClusterSanity:
         mock_request.session.config.getoption.return_value = False
         mock_storage_sanity.return_value = True
 
-        mock_nodes = MagicMock()
+        mock_node = MagicMock()
+        mock_node.name = "node-1"
+        mock_nodes = [mock_node]
+        snapshot_node = _node(name="node-1")
+        mock_take_cluster_snapshot.return_value = _snapshot(nodes=[snapshot_node, _node(name="other-node")])
 
         cluster_sanity(
             request=mock_request,
@@ -608,7 +684,7 @@ class TestClusterSanity:
             hco_namespace=MagicMock(),
         )
 
-        mock_assert_schedulable.assert_called_once_with(nodes=mock_nodes)
+        mock_assert_schedulable.assert_called_once_with(nodes=[_SnapshotNode(name="node-1", instance=snapshot_node)])
 
     @patch("utilities.sanity.check_webhook_endpoints_health")
     @patch("utilities.sanity.check_vm_creation_capability")
@@ -629,13 +705,19 @@ class TestClusterSanity:
         mock_storage_sanity,
         _mock_check_vm,
         _mock_check_webhook,
+        mock_take_cluster_snapshot,
     ):
-        """Test wait_for_pods_running called with correct namespace and filter"""
+        """Test wait_for_pods_running called with correct namespace and filter, when pods are not running"""
 
         mock_request = MagicMock()
         mock_request.config.getoption.return_value = ""
         mock_request.session.config.getoption.return_value = False
         mock_storage_sanity.return_value = True
+        mock_take_cluster_snapshot.return_value = _snapshot(
+            pods=[
+                _pod(name="virt-handler", container_statuses=[{"state": {"waiting": {"reason": "CrashLoopBackOff"}}}])
+            ]
+        )
 
         mock_admin_client = MagicMock()
         mock_hco_namespace = MagicMock()
@@ -1152,3 +1234,131 @@ class TestCheckVmCreationCapability:
         assert "Connection error during dry-run VM creation" in str(exc_info.value), (
             "Expected 'Connection error during dry-run VM creation' in exception message for timeout"
         )
+
+
+class TestTakeClusterSnapshot:
+    """Test cases for take_cluster_snapshot function"""
+
+    @patch("utilities.sanity.ValidatingWebhookConfiguration")
+    @patch("utilities.sanity.MutatingWebhookConfiguration")
+    @patch("utilities.sanity.Endpoints")
+    @patch("utilities.sanity.Pod")
+    @patch("utilities.sanity.Node")
+    @patch("utilities.sanity.LOGGER")
+    def test_take_cluster_snapshot_lists_each_kind_once(
+        self, _mock_logger, mock_node_class, mock_pod_class, mock_endpoints_class, mock_mutating, mock_validating
+    ):
+        """Test each resource kind is listed once, raw, and the endpoints are indexed by name"""
+
+        endpoint = ResourceField(params={"metadata": ResourceField(params={"name": "virt-api"})})
+        mock_node_class.get.return_value = [_node(name="node-1")]
+        mock_pod_class.get.return_value = [_pod(name="virt-handler")]
+        mock_endpoints_class.get.return_value = [endpoint]
+        mock_mutating.get.return_value = [MagicMock()]
+        mock_validating.get.return_value = [MagicMock()]
+        mock_admin_client = MagicMock()
+        mock_hco_namespace = MagicMock()
+        mock_hco_namespace.name = "openshift-cnv"
+
+        snapshot = take_cluster_snapshot(admin_client=mock_admin_client, hco_namespace=mock_hco_namespace)
+
+        assert len(snapshot.nodes) == 1
+        assert len(snapshot.pods) == 1
+        assert snapshot.endpoints == {"virt-api": endpoint}
+        assert len(snapshot.webhook_configurations) == 2
+        mock_pod_class.get.assert_called_once_with(client=mock_admin_client, raw=True, namespace="openshift-cnv")
+        mock_node_class.get.assert_called_once_with(client=mock_admin_client, raw=True, namespace=None)
+
+
+class TestCheckNodesHealth:
+    """Test cases for check_nodes_health function"""
+
+    @patch("utilities.sanity.assert_nodes_schedulable")
+    @patch("utilities.sanity.assert_nodes_in_healthy_condition")
+    def test_check_nodes_health_missing_node(self, mock_assert_healthy, mock_assert_schedulable):
+        """Test a node which is not in the snapshot is reported as not ready"""
+
+        mock_node = MagicMock()
+        mock_node.name = "deleted-node"
+
+        with pytest.raises(NodeNotReadyError, match="deleted-node"):
+            check_nodes_health(nodes=[mock_node], snapshot=_snapshot(nodes=[_node(name="node-1")]))
+
+        mock_assert_healthy.assert_not_called()
+        mock_assert_schedulable.assert_not_called()
+
+    def test_check_nodes_health_unschedulable_node(self):
+        """Test the ocp_utilities node asserts are evaluated against the snapshot nodes"""
+
+        mock_node = MagicMock()
+        mock_node.name = "node-1"
+
+        with pytest.raises(NodeUnschedulableError, match="node-1"):
+            check_nodes_health(nodes=[mock_node], snapshot=_snapshot(nodes=[_node(name="node-1", unschedulable=True)]))
+
+        mock_node.instance.assert_not_called()
+
+
+class TestGetNotRunningSnapshotPods:
+    """Test cases for get_not_running_snapshot_pods function"""
+
+    def test_get_not_running_snapshot_pods(self):
+        """Test not running, terminating and waiting container pods are reported, filtered pods are ignored"""
+
+        pods = [
+            _pod(name="virt-api"),
+            _pod(name="cdi-uploadproxy", phase="Succeeded"),
+            _pod(name="virt-handler", phase="Pending"),
+            _pod(name="virt-controller", deletion_timestamp="2026-01-01T00:00:00Z"),
+            _pod(name="virt-operator", container_statuses=[{"state": {"waiting": {"reason": "CrashLoopBackOff"}}}]),
+            _pod(name="image-cron-1", phase="Pending"),
+        ]
+
+        assert get_not_running_snapshot_pods(pods=pods, filter_pods_by_name="image-cron") == [
+            {"virt-handler": "Pending"},
+            {"virt-controller": "Running"},
+            {"virt-operator": "CrashLoopBackOff"},
+        ]
+
+
+class TestCheckWebhookEndpointsHealthFromSnapshot:
+    """Test cases for check_webhook_endpoints_health with a cluster snapshot"""
+
+    @staticmethod
+    def _webhook_snapshot(endpoints):
+        webhook_configuration = ResourceField(
+            params={
+                "metadata": ResourceField(params={"name": "virt-api-mutator"}),
+                "webhooks": [{"clientConfig": {"service": {"name": "virt-api", "namespace": "openshift-cnv"}}}],
+            }
+        )
+        return _snapshot(endpoints=endpoints, webhook_configurations=[webhook_configuration])
+
+    @patch("utilities.sanity.Endpoints")
+    @patch("utilities.sanity.MutatingWebhookConfiguration")
+    def test_check_webhook_endpoints_health_from_snapshot(self, mock_mutating, mock_endpoints_class):
+        """Test the webhook services and endpoints are read from the snapshot, without API requests"""
+
+        endpoint = ResourceField(params={"subsets": [ResourceField(params={"addresses": [{"ip": "10.0.0.1"}]})]})
+        mock_hco_namespace = MagicMock()
+        mock_hco_namespace.name = "openshift-cnv"
+
+        check_webhook_endpoints_health(
+            admin_client=MagicMock(),
+            namespace=mock_hco_namespace,
+            snapshot=self._webhook_snapshot(endpoints={"virt-api": endpoint}),
+        )
+
+        mock_mutating.get.assert_not_called()
+        mock_endpoints_class.assert_not_called()
+
+    def test_check_webhook_endpoints_health_missing_snapshot_endpoint(self):
+        """Test a webhook service without endpoints in the snapshot fails the check"""
+
+        mock_hco_namespace = MagicMock()
+        mock_hco_namespace.name = "openshift-cnv"
+
+        with pytest.raises(ClusterSanityError, match="virt-api"):
+            check_webhook_endpoints_health(
+                admin_client=MagicMock(), namespace=mock_hco_namespace, snapshot=self._webhook_snapshot(endpoints={})
+            )
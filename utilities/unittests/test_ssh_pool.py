@@ -0,0 +1,233 @@
+"""Unit tests for ssh_pool module"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from ocp_utilities.exceptions import CommandExecFailed
+from rrmngmnt.user import User
+
+import utilities.ssh_pool
+from utilities.ssh_pool import (
+    BATCH_RC_MARKER,
+    PooledRemoteExecutor,
+    PooledRemoteExecutorFactory,
+    PooledSSHSession,
+    SSHConnectionPool,
+    UnsupportedSSHSessionError,
+    get_ssh_connection_pool,
+    parse_batch_output,
+    run_ssh_batch,
+    start_ssh_connection_pool,
+    stop_ssh_connection_pool,
+)
+
+
+@pytest.fixture
+def mock_ssh_client():
+    with patch("paramiko.SSHClient") as mock_ssh_client_class:
+        ssh_client = mock_ssh_client_class.return_value
+        ssh_client.get_transport.return_value.is_active.return_value = False
+
+        def _connect(*args, **kwargs):
+            ssh_client.get_transport.return_value.is_active.return_value = True
+
+        ssh_client.connect.side_effect = _connect
+        yield ssh_client
+
+
+@pytest.fixture
+def pooled_executor():
+    with patch("paramiko.ProxyCommand"):
+        yield PooledRemoteExecutor(
+            user=User(name="user", password="pass"), address="test-vm", proxy_command="virtctl port-forward"
+        )
+
+
+class TestParseBatchOutput:
+    """Test cases for parse_batch_output function"""
+
+    def test_parse_batch_output(self):
+        """Test outputs are split on the markers, with and without a trailing newline"""
+        out = f"line1\nline2\n\n{BATCH_RC_MARKER}0\nno-newline\n{BATCH_RC_MARKER}0\n\n{BATCH_RC_MARKER}3\n"
+
+        assert parse_batch_output(out=out) == (["line1\nline2", "no-newline", ""], [0, 0, 3])
+
+
+class TestRunSSHBatch:
+    """Test cases for run_ssh_batch function"""
+
+    def test_run_ssh_batch_single_round_trip(self):
+        """Test all commands are sent as one script on stdin of a single command"""
+        host = MagicMock()
+        ssh_session = host.executor.return_value.session.return_value.__enter__.return_value
+        ssh_session.run_cmd.return_value = (0, f"a\n\n{BATCH_RC_MARKER}0\nb\n\n{BATCH_RC_MARKER}0\n", "")
+
+        assert run_ssh_batch(host=host, commands=["echo a", "echo b"]) == ["a", "b"]
+        ssh_session.run_cmd.assert_called_once()
+        script = ssh_session.run_cmd.call_args.kwargs["input_"]
+        assert ssh_session.run_cmd.call_args.kwargs["cmd"] == ["sh"]
+        assert script.index("echo a") < script.index("echo b")
+
+    def test_run_ssh_batch_failed_command(self):
+        """Test the first failing command is reported with the batch stderr"""
+        host = MagicMock()
+        ssh_session = host.executor.return_value.session.return_value.__enter__.return_value
+        ssh_session.run_cmd.return_value = (2, f"a\n\n{BATCH_RC_MARKER}0\n\n{BATCH_RC_MARKER}2\n", "no such file")
+
+        with pytest.raises(CommandExecFailed, match="no such file") as exc_info:
+            run_ssh_batch(host=host, commands=["echo a", "cat missing", "echo c"])
+
+        assert "cat missing" in str(exc_info.value)
+
+    def test_run_ssh_batch_without_rc_check(self):
+        """Test failing commands do not stop the batch when check_rc is False"""
+        host = MagicMock()
+        ssh_session = host.executor.return_value.session.return_value.__enter__.return_value
+        ssh_session.run_cmd.return_value = (0, f"\n{BATCH_RC_MARKER}1\nb\n\n{BATCH_RC_MARKER}0\n", "")
+
+        assert run_ssh_batch(host=host, commands=["false", "echo b"], check_rc=False) == ["", "b"]
+        assert "exit" not in ssh_session.run_cmd.call_args.kwargs["input_"]
+
+
+class TestPooledRemoteExecutor:
+    """Test cases for PooledRemoteExecutor class"""
+
+    def test_session_connects_once(self, mock_ssh_client, pooled_executor):
+        """Test sessions share one connection which stays open after the session context exits"""
+        with pooled_executor.session() as first_session:
+            pass
+        with pooled_executor.session() as second_session:
+            pass
+
+        assert first_session is second_session
+        mock_ssh_client.connect.assert_called_once()
+        mock_ssh_client.close.assert_not_called()
+        mock_ssh_client.get_transport.return_value.set_keepalive.assert_called_once_with(interval=30)
+
+    def test_session_reconnects_when_transport_lost(self, mock_ssh_client, pooled_executor):
+        """Test a new connection is opened when the transport is no longer active"""
+        with pooled_executor.session():
+            pass
+        mock_ssh_client.get_transport.return_value.is_active.return_value = False
+
+        with pooled_executor.session():
+            pass
+
+        assert mock_ssh_client.connect.call_count == 2
+        mock_ssh_client.close.assert_called_once()
+
+    def test_session_passes_disabled_algorithms(self, mock_ssh_client):
+        """Test the connection is opened with the disabled algorithms of the executor"""
+        disabled_algorithms = {"pubkeys": ["rsa-sha2-512", "rsa-sha2-256"]}
+        executor = PooledRemoteExecutor(
+            user=User(name="user", password="pass"), address="test-vm", disabled_algorithms=disabled_algorithms
+        )
+
+        with executor.session():
+            pass
+
+        assert mock_ssh_client.connect.call_args.kwargs["disabled_algorithms"] == disabled_algorithms
+
+    def test_session_without_rrmngmnt_internals(self, mock_ssh_client, pooled_executor):
+        """Test a session fails clearly when rrmngmnt no longer has the session internals"""
+        with (
+            patch.object(utilities.ssh_pool.ssh.RemoteExecutor.Session, "__init__", return_value=None),
+            pytest.raises(UnsupportedSSHSessionError, match="_ssh"),
+        ):
+            PooledSSHSession(executor=pooled_executor)
+
+    def test_disconnect(self, mock_ssh_client, pooled_executor):
+        """Test disconnect closes the connection and the proxy command"""
+        ssh_session = pooled_executor.session()
+        proxy = ssh_session._proxy
+
+        pooled_executor.disconnect()
+
+        mock_ssh_client.close.assert_called_once()
+        proxy.close.assert_called_once()
+        assert pooled_executor._session is None
+
+
+class TestSSHConnectionPool:
+    """Test cases for SSHConnectionPool class"""
+
+    def test_executor_reused_per_key_and_user(self):
+        """Test the same executor is returned for the same key and user"""
+        pool = SSHConnectionPool()
+        user = User(name="user", password="pass")
+
+        executor = pool.executor(key="uid-1", user=user, address="vm1")
+
+        assert pool.executor(key="uid-1", user=user, address="vm1") is executor
+        assert pool.executor(key="uid-2", user=user, address="vm2") is not executor
+
+    def test_factory_builds_pooled_executor(self):
+        """Test Host executors built by the factory come from the pool"""
+        pool = SSHConnectionPool()
+        factory = PooledRemoteExecutorFactory(
+            pool=pool,
+            key="uid-1",
+            proxy_command="virtctl port-forward",
+            disabled_algorithms={"pubkeys": ["rsa-sha2-512"]},
+        )
+        host = MagicMock()
+        host.ip = "vm1"
+        user = User(name="user", password="pass")
+
+        executor = factory.build(host=host, user=user)
+
+        assert executor is pool.executor(
+            key="uid-1", user=user, address="vm1", disabled_algorithms={"pubkeys": ["rsa-sha2-512"]}
+        )
+        assert executor.proxy_command == "virtctl port-forward"
+        assert executor.disabled_algorithms == {"pubkeys": ["rsa-sha2-512"]}
+
+    def test_executor_replaced_on_other_disabled_algorithms(self):
+        """Test an executor is not reused for other disabled algorithms"""
+        pool = SSHConnectionPool()
+        user = User(name="user", password="pass")
+        executor = pool.executor(key="uid-1", user=user, address="vm1")
+
+        with patch.object(executor, "disconnect") as mock_disconnect:
+            new_executor = pool.executor(
+                key="uid-1", user=user, address="vm1", disabled_algorithms={"pubkeys": ["rsa-sha2-512"]}
+            )
+
+        assert new_executor is not executor
+        assert new_executor.disabled_algorithms == {"pubkeys": ["rsa-sha2-512"]}
+        mock_disconnect.assert_called_once()
+
+    def test_close_key(self):
+        """Test close disconnects only the executors of the given key"""
+        pool = SSHConnectionPool()
+        user = User(name="user", password="pass")
+        executor_1 = pool.executor(key="uid-1", user=user, address="vm1")
+        executor_2 = pool.executor(key="uid-2", user=user, address="vm2")
+
+        with (
+            patch.object(executor_1, "disconnect") as mock_disconnect_1,
+            patch.object(executor_2, "disconnect") as mock_disconnect_2,
+        ):
+            pool.close(key="uid-1")
+
+        mock_disconnect_1.assert_called_once()
+        mock_disconnect_2.assert_not_called()
+        assert pool.executor(key="uid-1", user=user, address="vm1") is not executor_1
+
+
+class TestSessionSSHConnectionPool:
+    """Test cases for session SSH connection pool functions"""
+
+    def test_start_and_stop_ssh_connection_pool(self):
+        """Test the session pool is served after start and closed on stop"""
+        pool = start_ssh_connection_pool()
+        try:
+            assert get_ssh_connection_pool() is pool
+            assert start_ssh_connection_pool() is pool
+        finally:
+            with patch.object(pool, "close") as mock_close:
+                stop_ssh_connection_pool()
+
+        mock_close.assert_called_once()
+        assert get_ssh_connection_pool() is None
+        assert utilities.ssh_pool._SESSION_SSH_CONNECTION_POOL is None
@@ -0,0 +1,136 @@
+"""Unit tests for the stuntime measurement of tests.network.libs.stuntime"""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tests.network.libs.stuntime import (
+    ContinuousPing,
+    InsufficientStuntimeDataError,
+    StuntimeReport,
+    measure_stuntime,
+)
+
+DESTINATION_IP = "10.0.0.1"
+# ping -D -O -i 0.01 log: replies every 10ms, a 1.5s gap, then no reply until the session was stopped 2s later
+PING_LOG = """PING 10.0.0.1 (10.0.0.1) 56(84) bytes of data.
+[1700000000.000000] 64 bytes from 10.0.0.1: icmp_seq=1 ttl=64 time=0.301 ms
+[1700000000.010000] 64 bytes from 10.0.0.1: icmp_seq=2 ttl=64 time=0.297 ms
+[1700000000.020000] 64 bytes from 10.0.0.1: icmp_seq=3 ttl=64 time=0.310 ms
+[1700000001.520000] no answer yet for icmp_seq=4
+[1700000001.520000] 64 bytes from 10.0.0.1: icmp_seq=153 ttl=64 time=0.412 ms
+[1700000001.530000] 64 bytes from 10.0.0.1: icmp_seq=154 ttl=64 time=0.305 ms
+[1700000002.530000] no answer yet for icmp_seq=155
+
+--- 10.0.0.1 ping statistics ---
+354 packets transmitted, 5 received, 98.5876% packet loss, time 3530ms
+rtt min/avg/max/mdev = 0.297/0.325/0.412/0.043 ms
+"""
+
+
+def _run_console_commands(commands, timeout):
+    """Run the console commands in a local shell, returning the output lines per command, as vm.console does"""
+    return {
+        command: subprocess.run(["sh", "-c", command], capture_output=True, text=True, check=True).stdout.splitlines()
+        for command in commands
+    }
+
+
+@pytest.fixture
+def ping_log_path_template(tmp_path):
+    with patch("tests.network.libs.stuntime.STUNTIME_PING_LOG_PATH", str(tmp_path / "ping-{destination_ip}.log")):
+        yield str(tmp_path / "ping-{destination_ip}.log")
+
+
+@pytest.fixture
+def ping_log_path(ping_log_path_template):
+    return ping_log_path_template.format(destination_ip=DESTINATION_IP)
+
+
+@pytest.fixture
+def ping_session(ping_log_path):
+    vm = MagicMock()
+    vm.console.side_effect = _run_console_commands
+    return ContinuousPing(source_vm=vm, destination_ip=DESTINATION_IP)
+
+
+class TestStuntimeReport:
+    """Test cases for StuntimeReport class"""
+
+    def test_stuntime_is_largest_gap(self):
+        """Test the stuntime is the longest gap, wherever it is in the session"""
+        report = StuntimeReport(destination_ip=DESTINATION_IP, replies=10, gaps=[(1.0, 0.5), (2.0, 1.5), (5.0, 0.2)])
+
+        assert report.stuntime == 1.5
+
+    def test_no_gaps(self):
+        """Test a session without gaps has no stuntime and no percentiles"""
+        report = StuntimeReport(destination_ip=DESTINATION_IP, replies=10, gaps=[])
+
+        assert report.stuntime == 0.0
+        assert report.gap_percentiles == {}
+
+    def test_gap_percentiles(self):
+        """Test the percentiles of the gap durations are interpolated between the gaps"""
+        report = StuntimeReport(
+            destination_ip=DESTINATION_IP, replies=10, gaps=[(float(index), float(index)) for index in range(1, 102)]
+        )
+
+        assert report.gap_percentiles == {50: 51.0, 90: 91.0, 99: 100.0}
+
+    def test_single_gap_percentiles(self):
+        """Test every percentile of a single gap is its duration"""
+        report = StuntimeReport(destination_ip=DESTINATION_IP, replies=10, gaps=[(1.0, 0.7)])
+
+        assert report.gap_percentiles == {50: 0.7, 90: 0.7, 99: 0.7}
+
+
+class TestContinuousPingStuntimeReport:
+    """Test cases for ContinuousPing.stuntime_report method, running its awk command on a ping -D log"""
+
+    def test_gaps_with_trailing_outage(self, ping_session, ping_log_path):
+        """Test gaps between replies and the outage ongoing at the stop time are all reported"""
+        with open(ping_log_path, "w") as ping_log:
+            ping_log.write(f"{PING_LOG}[1700000003.530000] stuntime-stopped\n")
+
+        report = ping_session.stuntime_report()
+
+        assert report.replies == 5
+        assert report.gaps == [(1700000000.02, pytest.approx(1.5)), (1700000001.53, pytest.approx(2.0))]
+        assert report.stuntime == pytest.approx(2.0)
+
+    def test_stopped_right_after_reply(self, ping_session, ping_log_path):
+        """Test no trailing gap is reported when the last reply is within a ping interval of the stop time"""
+        with open(ping_log_path, "w") as ping_log:
+            ping_log.write(f"{PING_LOG}[1700000001.535000] stuntime-stopped\n")
+
+        report = ping_session.stuntime_report()
+
+        assert report.gaps == [(1700000000.02, pytest.approx(1.5))]
+        assert report.stuntime == pytest.approx(1.5)
+
+    def test_insufficient_replies(self, ping_session, ping_log_path):
+        """Test InsufficientStuntimeDataError is raised when the log has less than 2 replies"""
+        with open(ping_log_path, "w") as ping_log:
+            ping_log.write(
+                "[1700000000.000000] 64 bytes from 10.0.0.1: icmp_seq=1 ttl=64 time=0.301 ms\n"
+                "[1700000003.000000] stuntime-stopped\n"
+            )
+
+        with pytest.raises(InsufficientStuntimeDataError, match="Only 1 ping replies"):
+            ping_session.stuntime_report()
+
+
+class TestMeasureStuntime:
+    """Test cases for measure_stuntime function"""
+
+    def test_largest_gap_of_all_sessions(self):
+        """Test every session is stopped, and the stuntime is the largest gap of all the sessions"""
+        pings = [MagicMock(), MagicMock()]
+        pings[0].stuntime_report.return_value = StuntimeReport(destination_ip="10.0.0.1", replies=10, gaps=[(1.0, 0.5)])
+        pings[1].stuntime_report.return_value = StuntimeReport(destination_ip="10.0.0.2", replies=10, gaps=[(1.0, 1.2)])
+
+        assert measure_stuntime(active_pings=pings) == 1.2
+        for ping in pings:
+            ping.stop.assert_called_once()
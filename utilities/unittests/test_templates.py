@@ -0,0 +1,281 @@
+"""Unit tests for templates module"""
+
+import re
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.dynamic.resource import ResourceField
+from ocp_resources.template import Template
+
+from utilities.templates import (
+    PARTIAL_OBJECT_METADATA_LIST_ACCEPT,
+    TEMPLATE_NAMESPACE_LABEL,
+    UnsupportedTemplateError,
+    clear_base_templates_index,
+    generate_template_parameter,
+    get_base_template_by_labels,
+    get_base_templates_resource_versions,
+    process_template,
+    process_template_locally,
+)
+
+OS_LABEL = "os.template.kubevirt.io/fedora"
+WORKLOAD_LABEL = "workload.template.kubevirt.io/server"
+FLAVOR_LABEL = "flavor.template.kubevirt.io/small"
+
+
+def _template(name="fedora-server-small", namespace="openshift", labels=None, parameters=None, resource_version="1"):
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "resourceVersion": resource_version,
+            "labels": labels
+            if labels is not None
+            else {OS_LABEL: "true", WORKLOAD_LABEL: "true", FLAVOR_LABEL: "true"},
+        },
+        "labels": {"vm.kubevirt.io/template": name},
+        "objects": [
+            {
+                "kind": "VirtualMachine",
+                "metadata": {"name": "${NAME}", "labels": {"app": "${NAME}"}},
+                "spec": {
+                    "dataVolumeTemplates": [{"spec": {"sourceRef": {"name": "${DATA_SOURCE_NAME}"}}}],
+                    "template": {"spec": {"domain": {"cpu": {"cores": "${{CPU_CORES}}"}}}},
+                },
+            }
+        ],
+        "parameters": parameters
+        if parameters is not None
+        else [
+            {"name": "NAME", "generate": "expression", "from": "fedora-[a-z0-9]{16}"},
+            {"name": "DATA_SOURCE_NAME", "value": "fedora"},
+            {"name": "CPU_CORES", "value": "1"},
+        ],
+    }
+
+
+@pytest.fixture
+def base_templates_index():
+    index = {
+        "openshift/fedora-server-small": _template(),
+        "openshift/fedora-desktop-small": _template(
+            name="fedora-desktop-small",
+            labels={OS_LABEL: "true", "workload.template.kubevirt.io/desktop": "true", FLAVOR_LABEL: "true"},
+        ),
+        "custom-ns/fedora-server-small": _template(namespace="custom-ns"),
+    }
+    with patch("utilities.templates.get_base_templates_index", return_value=index):
+        yield index
+
+
+class TestProcessTemplateLocally:
+    """Test cases for process_template_locally function"""
+
+    def test_parameters_substituted(self):
+        """Test parameter values override the defaults, and ${{}} references get the JSON value"""
+        objects = process_template_locally(
+            template_dict=_template(), parameters={"NAME": "my-vm", "DATA_SOURCE_NAME": "fedora-42"}
+        )
+
+        vm = objects[0]
+        assert vm["metadata"]["name"] == "my-vm"
+        assert vm["spec"]["dataVolumeTemplates"][0]["spec"]["sourceRef"]["name"] == "fedora-42"
+        assert vm["spec"]["template"]["spec"]["domain"]["cpu"]["cores"] == 1
+
+    def test_template_labels_applied(self):
+        """Test the template labels and the template namespace label are set on the objects"""
+        vm = process_template_locally(template_dict=_template(), parameters={"NAME": "my-vm"})[0]
+
+        assert vm["metadata"]["labels"] == {
+            "app": "my-vm",
+            "vm.kubevirt.io/template": "fedora-server-small",
+            TEMPLATE_NAMESPACE_LABEL: "openshift",
+        }
+
+    def test_template_not_modified(self):
+        """Test processing does not modify the template"""
+        template_dict = _template()
+        process_template_locally(template_dict=template_dict, parameters={"NAME": "my-vm"})
+
+        assert template_dict == _template()
+
+    def test_generated_parameter(self):
+        """Test a parameter without value is generated from its expression"""
+        vm = process_template_locally(template_dict=_template(), parameters={})[0]
+
+        assert re.fullmatch(r"fedora-[a-z0-9]{16}", vm["metadata"]["name"])
+
+    def test_required_parameter_without_value(self):
+        """Test a required parameter without value cannot be processed locally"""
+        with pytest.raises(UnsupportedTemplateError, match="PASSWORD"):
+            process_template_locally(
+                template_dict=_template(parameters=[{"name": "PASSWORD", "required": True}]), parameters={}
+            )
+
+
+class TestGenerateTemplateParameter:
+    """Test cases for generate_template_parameter function"""
+
+    @pytest.mark.parametrize(
+        "expression, pattern",
+        [
+            pytest.param("[a-z0-9]{16}", r"[a-z0-9]{16}", id="char_class"),
+            pytest.param("vm-[A-Z]{4}-x", r"vm-[A-Z]{4}-x", id="literals"),
+            pytest.param(r"[\w]{8}", r"\w{8}", id="word_class"),
+            pytest.param(r"[\d]{3}", r"\d{3}", id="digit_class"),
+        ],
+    )
+    def test_supported_expression(self, expression, pattern):
+        """Test generated values match the expression"""
+        assert re.fullmatch(pattern, generate_template_parameter(expression=expression))
+
+    @pytest.mark.parametrize("expression", ["[a-z]+", r"[\s]{4}", "(a|b){2}"])
+    def test_unsupported_expression(self, expression):
+        """Test unsupported expressions raise UnsupportedTemplateError"""
+        with pytest.raises(UnsupportedTemplateError):
+            generate_template_parameter(expression=expression)
+
+
+class TestProcessTemplate:
+    """Test cases for process_template function"""
+
+    @patch("utilities.templates.Template")
+    def test_processed_locally(self, mock_template):
+        """Test supported templates are not sent to the server"""
+        objects = process_template(template_dict=_template(), parameters={"NAME": "my-vm"})
+
+        assert objects[0]["metadata"]["name"] == "my-vm"
+        mock_template.assert_not_called()
+
+    @patch("utilities.templates.cache_admin_client")
+    @patch("utilities.templates.Template")
+    def test_server_fallback(self, mock_template, mock_cache_admin_client):
+        """Test templates which cannot be processed locally are processed by the server"""
+        mock_template.return_value.process.return_value = [{"kind": "VirtualMachine"}]
+
+        objects = process_template(
+            template_dict=_template(parameters=[{"name": "PASSWORD", "required": True}]), parameters={"NAME": "vm"}
+        )
+
+        assert objects == [{"kind": "VirtualMachine"}]
+        mock_template.assert_called_once_with(
+            client=mock_cache_admin_client.return_value, name="fedora-server-small", namespace="openshift"
+        )
+        mock_template.return_value.process.assert_called_once_with(NAME="vm")
+
+
+class TestGetBaseTemplateByLabels:
+    """Test cases for get_base_template_by_labels function"""
+
+    def test_single_match(self, base_templates_index):
+        """Test the openshift template matching all the labels is returned"""
+        template_dict = get_base_template_by_labels(template_labels=[OS_LABEL, WORKLOAD_LABEL, FLAVOR_LABEL])
+
+        assert template_dict is base_templates_index["openshift/fedora-server-small"]
+
+    def test_multiple_matches(self, base_templates_index):
+        """Test labels matching several templates return None"""
+        assert get_base_template_by_labels(template_labels=[OS_LABEL, FLAVOR_LABEL]) is None
+
+    def test_no_match(self, base_templates_index):
+        """Test labels matching no template return None"""
+        assert get_base_template_by_labels(template_labels=["os.template.kubevirt.io/rhel9"]) is None
+
+    def test_negative_selector_not_indexed(self, base_templates_index):
+        """Test negative selectors are left to the API"""
+        assert get_base_template_by_labels(template_labels=[OS_LABEL, "!workload.template.kubevirt.io/desktop"]) is None
+
+
+class TestGetBaseTemplatesIndex:
+    """Test cases for get_base_templates_index function"""
+
+    @pytest.fixture
+    def mock_get_base_templates_list(self):
+        template = MagicMock()
+        template.namespace = "openshift"
+        template.name = "fedora-server-small"
+        template.instance.to_dict.return_value = _template()
+        clear_base_templates_index()
+        with (
+            patch("utilities.templates.cache_admin_client"),
+            patch("utilities.templates.get_base_templates_list", return_value=[template]) as mock_list,
+        ):
+            yield mock_list
+        clear_base_templates_index()
+
+    @patch("utilities.templates.get_base_templates_resource_versions")
+    def test_fetched_once(self, mock_get_resource_versions, mock_get_base_templates_list):
+        """Test the base templates are listed once while they do not change, and again once the index is cleared"""
+        mock_get_resource_versions.return_value = {"openshift/fedora-server-small": "1"}
+
+        get_base_template_by_labels(template_labels=[OS_LABEL])
+        assert get_base_template_by_labels(template_labels=[OS_LABEL]) == _template()
+        mock_get_base_templates_list.assert_called_once()
+
+        clear_base_templates_index()
+        get_base_template_by_labels(template_labels=[OS_LABEL])
+        assert mock_get_base_templates_list.call_count == 2
+
+    @pytest.mark.parametrize(
+        "resource_versions",
+        [
+            pytest.param({"openshift/fedora-server-small": "2"}, id="template_modified"),
+            pytest.param(
+                {"openshift/fedora-server-small": "1", "openshift/fedora-desktop-small": "1"}, id="template_added"
+            ),
+            pytest.param({}, id="template_removed"),
+        ],
+    )
+    @patch("utilities.templates.get_base_templates_resource_versions")
+    def test_fetched_again_when_changed(
+        self, mock_get_resource_versions, mock_get_base_templates_list, resource_versions
+    ):
+        """Test the base templates are listed again when the listed resource versions differ from the index"""
+        mock_get_resource_versions.return_value = resource_versions
+
+        get_base_template_by_labels(template_labels=[OS_LABEL])
+        get_base_template_by_labels(template_labels=[OS_LABEL])
+
+        assert mock_get_base_templates_list.call_count == 2
+
+
+class TestGetBaseTemplatesResourceVersions:
+    """Test cases for get_base_templates_resource_versions function"""
+
+    def test_metadata_listed(self):
+        """Test only the templates metadata is listed, and deprecated templates are left out"""
+        client = MagicMock()
+        client.resources.get.return_value.get.return_value = ResourceField(
+            params={
+                "items": [
+                    ResourceField(
+                        params={
+                            "metadata": ResourceField(
+                                params={"name": "fedora-server-small", "namespace": "openshift", "resourceVersion": "7"}
+                            )
+                        }
+                    ),
+                    ResourceField(
+                        params={
+                            "metadata": ResourceField(
+                                params={
+                                    "name": "fedora-old",
+                                    "namespace": "openshift",
+                                    "resourceVersion": "3",
+                                    "annotations": {Template.Annotations.DEPRECATED: "true"},
+                                }
+                            )
+                        }
+                    ),
+                ]
+            }
+        )
+
+        with patch.dict("utilities.templates.py_config", {"cpu_arch": "amd64"}):
+            resource_versions = get_base_templates_resource_versions(client=client)
+
+        assert resource_versions == {"openshift/fedora-server-small": "7"}
+        list_kwargs = client.resources.get.return_value.get.call_args.kwargs
+        assert list_kwargs["header_params"] == {"Accept": PARTIAL_OBJECT_METADATA_LIST_ACCEPT}
+        assert list_kwargs["label_selector"].endswith("=amd64")
@@ -0,0 +1,154 @@
+"""Unit tests for the iperf3 report parsing of the traffic generator"""
+
+import json
+
+import pytest
+
+from libs.net.traffic_generator import StreamStats, parse_iperf3_report, percentiles
+
+# iperf3 3.9 client reports (--json), trimmed to two intervals and the fields the parser reads
+TCP_REPORT = """{
+    "start": {"connected": [{"socket": 5}, {"socket": 7}], "version": "iperf 3.9", "test_start": {"protocol": "TCP"}},
+    "intervals": [
+        {
+            "streams": [
+                {"socket": 5, "start": 0, "end": 1.000043, "seconds": 1.000043, "bytes": 587202560,
+                 "bits_per_second": 4697418481.3, "retransmits": 12, "snd_cwnd": 1527432, "rtt": 410,
+                 "rttvar": 55, "pmtu": 1500, "omitted": false, "sender": true},
+                {"socket": 7, "start": 0, "end": 1.000043, "seconds": 1.000043, "bytes": 576716800,
+                 "bits_per_second": 4613539548.6, "retransmits": 3, "snd_cwnd": 1414560, "rtt": 530,
+                 "rttvar": 70, "pmtu": 1500, "omitted": false, "sender": true}
+            ],
+            "sum": {"start": 0, "end": 1.000043, "seconds": 1.000043, "bytes": 1163919360,
+                    "bits_per_second": 9310958029.9, "retransmits": 15, "omitted": false, "sender": true}
+        },
+        {
+            "streams": [
+                {"socket": 5, "start": 1.000043, "end": 2.000062, "seconds": 1.000019, "bytes": 599785472,
+                 "bits_per_second": 4798192765.2, "retransmits": 0, "snd_cwnd": 1527432, "rtt": 390,
+                 "rttvar": 40, "pmtu": 1500, "omitted": false, "sender": true},
+                {"socket": 7, "start": 1.000043, "end": 2.000062, "seconds": 1.000019, "bytes": 589299712,
+                 "bits_per_second": 4714307694.4, "retransmits": 0, "snd_cwnd": 1414560, "rtt": 470,
+                 "rttvar": 45, "pmtu": 1500, "omitted": false, "sender": true}
+            ],
+            "sum": {"start": 1.000043, "end": 2.000062, "seconds": 1.000019, "bytes": 1189085184,
+                    "bits_per_second": 9512500459.6, "retransmits": 0, "omitted": false, "sender": true}
+        }
+    ],
+    "end": {
+        "streams": [
+            {
+                "sender": {"socket": 5, "start": 0, "end": 2.000062, "seconds": 2.000062, "bytes": 1186988032,
+                           "bits_per_second": 4747768085.8, "retransmits": 12, "max_snd_cwnd": 1527432,
+                           "max_rtt": 410, "min_rtt": 390, "mean_rtt": 400, "sender": true},
+                "receiver": {"socket": 5, "start": 0, "end": 2.000181, "seconds": 2.000062, "bytes": 1184890880,
+                             "bits_per_second": 4739131838.7, "sender": true}
+            },
+            {
+                "sender": {"socket": 7, "start": 0, "end": 2.000062, "seconds": 2.000062, "bytes": 1166016512,
+                           "bits_per_second": 4663884700.1, "retransmits": 3, "max_snd_cwnd": 1414560,
+                           "max_rtt": 530, "min_rtt": 470, "mean_rtt": 500, "sender": true},
+                "receiver": {"socket": 7, "start": 0, "end": 2.000181, "seconds": 2.000062, "bytes": 1163919360,
+                             "bits_per_second": 4655282009.1, "sender": true}
+            }
+        ],
+        "sum_sent": {"start": 0, "end": 2.000062, "seconds": 2.000062, "bytes": 2353004544,
+                     "bits_per_second": 9411652785.9, "retransmits": 15, "sender": true},
+        "sum_received": {"start": 0, "end": 2.000181, "seconds": 2.000181, "bytes": 2348810240,
+                         "bits_per_second": 9394413847.8, "sender": true}
+    }
+}"""
+UDP_REPORT = """{
+    "start": {"connected": [{"socket": 5}], "version": "iperf 3.9", "test_start": {"protocol": "UDP"}},
+    "intervals": [
+        {
+            "streams": [
+                {"socket": 5, "start": 0, "end": 1.000124, "seconds": 1.000124, "bytes": 12500256,
+                 "bits_per_second": 99989648.5, "packets": 8633, "omitted": false, "sender": true}
+            ],
+            "sum": {"start": 0, "end": 1.000124, "seconds": 1.000124, "bytes": 12500256,
+                    "bits_per_second": 99989648.5, "packets": 8633, "omitted": false, "sender": true}
+        },
+        {
+            "streams": [
+                {"socket": 5, "start": 1.000124, "end": 2.000107, "seconds": 0.999983, "bytes": 12498808,
+                 "bits_per_second": 99992164.0, "packets": 8632, "omitted": false, "sender": true}
+            ],
+            "sum": {"start": 1.000124, "end": 2.000107, "seconds": 0.999983, "bytes": 12498808,
+                    "bits_per_second": 99992164.0, "packets": 8632, "omitted": false, "sender": true}
+        }
+    ],
+    "end": {
+        "streams": [
+            {
+                "udp": {"socket": 5, "start": 0, "end": 2.000107, "seconds": 2.000107, "bytes": 24999064,
+                        "bits_per_second": 99990906.3, "jitter_ms": 0.012, "lost_packets": 3, "packets": 17265,
+                        "lost_percent": 0.017376, "out_of_order": 0, "sender": true}
+            }
+        ],
+        "sum": {"start": 0, "end": 2.000107, "seconds": 2.000107, "bytes": 24999064, "bits_per_second": 99990906.3,
+                "jitter_ms": 0.012, "lost_packets": 3, "packets": 17265, "lost_percent": 0.017376, "sender": true}
+    }
+}"""
+ERROR_REPORT = """{
+    "start": {"connected": [], "version": "iperf 3.9"},
+    "intervals": [],
+    "end": {},
+    "error": "unable to connect to server: Connection refused"
+}"""
+
+
+class TestParseIperf3Report:
+    """Test cases for parse_iperf3_report function"""
+
+    def test_tcp_report(self):
+        """Test TCP connections report the receiver throughput, the sender retransmits and mean RTT"""
+        stats = parse_iperf3_report(report=json.loads(TCP_REPORT))
+
+        assert stats.streams == [
+            StreamStats(socket=5, bits_per_second=4739131838.7, retransmits=12, mean_rtt_usec=400),
+            StreamStats(socket=7, bits_per_second=4655282009.1, retransmits=3, mean_rtt_usec=500),
+        ]
+        assert stats.bits_per_second == pytest.approx(9394413847.8)
+        assert stats.retransmits == 15
+        assert stats.jitter_ms is None
+        assert stats.throughput_percentiles[50] == pytest.approx((9310958029.9 + 9512500459.6) / 2)
+        assert stats.rtt_percentiles_usec[50] == pytest.approx(440)
+        assert stats.rtt_percentiles_usec[99] == pytest.approx(528.2)
+
+    def test_udp_report(self):
+        """Test UDP connections report jitter and loss, without retransmits nor RTT"""
+        stats = parse_iperf3_report(report=json.loads(UDP_REPORT))
+
+        assert stats.streams == [
+            StreamStats(socket=5, bits_per_second=99990906.3, jitter_ms=0.012, lost_percent=0.017376)
+        ]
+        assert stats.bits_per_second == pytest.approx(99990906.3)
+        assert stats.retransmits == 0
+        assert stats.jitter_ms == 0.012
+        assert stats.rtt_percentiles_usec == {}
+        assert set(stats.throughput_percentiles) == {50, 90, 99}
+
+    def test_error_report(self):
+        """Test a report with an iperf3 error raises ValueError"""
+        with pytest.raises(ValueError, match="Connection refused"):
+            parse_iperf3_report(report=json.loads(ERROR_REPORT))
+
+
+class TestPercentiles:
+    """Test cases for percentiles function"""
+
+    def test_no_samples(self):
+        """Test no samples give no percentiles"""
+        assert percentiles(values=[]) == {}
+
+    def test_single_sample(self):
+        """Test a single sample is every percentile"""
+        assert percentiles(values=[7]) == {50: 7.0, 90: 7.0, 99: 7.0}
+
+    def test_interpolated_percentiles(self):
+        """Test percentiles are interpolated between the closest samples"""
+        assert percentiles(values=[10, 20, 30, 40, 50], percents=(50, 90)) == {
+            50: pytest.approx(30),
+            90: pytest.approx(46),
+        }
@@ -0,0 +1,96 @@
+"""Unit tests for vmi_fleet_monitor module"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.dynamic.resource import ResourceField
+
+from utilities.informer import ADDED, DELETED, MODIFIED
+from utilities.vmi_fleet_monitor import VMIFleetMonitor
+
+
+def _vmi(name, phase, namespace="scale-ns"):
+    return ResourceField(
+        params={
+            "metadata": ResourceField(params={"name": name, "namespace": namespace}),
+            "status": ResourceField(params={"phase": phase}),
+        }
+    )
+
+
+@pytest.fixture
+def mock_informer():
+    informer = MagicMock()
+    informer.list.return_value = [_vmi(name="vm-a", phase="Running"), _vmi(name="vm-b", phase="Running")]
+    with patch("utilities.vmi_fleet_monitor.get_session_informer", autospec=True, return_value=informer):
+        yield informer
+
+
+@pytest.fixture
+def fleet_monitor(mock_informer):
+    with patch("utilities.vmi_fleet_monitor.time.time", return_value=1000.0):
+        monitor = VMIFleetMonitor(client=MagicMock(), namespace="scale-ns", vmi_names=["vm-a", "vm-b"]).start()
+    return monitor
+
+
+def _send_event(mock_informer, event_type, vmi, now):
+    callback = mock_informer.subscribe.call_args.kwargs["callback"]
+    with patch("utilities.vmi_fleet_monitor.time.time", return_value=now):
+        callback(event_type, vmi)
+
+
+class TestVMIFleetMonitor:
+    """Test cases for VMIFleetMonitor class"""
+
+    def test_stable_fleet(self, mock_informer, fleet_monitor):
+        """Test a fleet without phase changes is stable, with a full uptime"""
+        with patch("utilities.vmi_fleet_monitor.time.time", return_value=1100.0):
+            summary = fleet_monitor.summary()
+
+        assert summary.stable
+        assert summary.uptimes == {"vm-a": 1.0, "vm-b": 1.0}
+        assert not fleet_monitor.transitions
+        mock_informer.subscribe.assert_called_once()
+
+    def test_flapping_vmi_recorded(self, mock_informer, fleet_monitor):
+        """Test a VMI restarted between two samples is counted, with its downtime"""
+        _send_event(mock_informer=mock_informer, event_type=DELETED, vmi=_vmi(name="vm-a", phase="Running"), now=1010)
+        _send_event(mock_informer=mock_informer, event_type=ADDED, vmi=_vmi(name="vm-a", phase="Pending"), now=1020)
+        _send_event(mock_informer=mock_informer, event_type=MODIFIED, vmi=_vmi(name="vm-a", phase="Running"), now=1030)
+
+        with patch("utilities.vmi_fleet_monitor.time.time", return_value=1100.0):
+            summary = fleet_monitor.summary()
+
+        assert not summary.stable
+        assert summary.not_running == []
+        assert summary.restarts == {"vm-a": 1, "vm-b": 0}
+        assert summary.uptimes["vm-a"] == pytest.approx(0.8)
+        assert [(transition.from_phase, transition.to_phase) for transition in fleet_monitor.transitions] == [
+            ("Running", None),
+            (None, "Pending"),
+            ("Pending", "Running"),
+        ]
+
+    def test_events_of_other_vmis_ignored(self, mock_informer, fleet_monitor):
+        """Test events of VMIs which are not monitored or from another namespace are ignored"""
+        _send_event(mock_informer=mock_informer, event_type=MODIFIED, vmi=_vmi(name="vm-c", phase="Failed"), now=1010)
+        _send_event(
+            mock_informer=mock_informer,
+            event_type=MODIFIED,
+            vmi=_vmi(name="vm-a", phase="Failed", namespace="other-ns"),
+            now=1010,
+        )
+
+        assert not fleet_monitor.transitions
+        assert fleet_monitor.summary().stable
+
+    def test_start_uses_session_informer(self, mock_informer, fleet_monitor):
+        """Test the monitor lists the VMIs of its namespace from the cluster-wide session informer"""
+        mock_informer.list.assert_called_once_with(namespace="scale-ns")
+
+    def test_stop_unsubscribes(self, mock_informer, fleet_monitor):
+        """Test stop unsubscribes from the session informer without stopping it"""
+        fleet_monitor.stop()
+
+        mock_informer.subscribe.return_value.assert_called_once()
+        mock_informer.stop.assert_not_called()
@@ -30,7 +30,7 @@ from ocp_resources.kubevirt import KubeVirt
 from ocp_resources.namespace import Namespace
 from ocp_resources.node import Node
 from ocp_resources.pod import Pod
-from ocp_resources.resource import Resource, ResourceEditor, get_client
+from ocp_resources.resource import Resource, ResourceEditor
 from ocp_resources.service import Service
 from ocp_resources.storage_profile import StorageProfile
 from ocp_resources.template import Template
@@ -51,7 +51,8 @@ import utilities.cpu
 import utilities.data_utils
 import utilities.infra
 from libs.net.cluster import is_ipv6_single_stack_cluster
-from utilities.console import Console
+from libs.vm.parallel import DEFAULT_MAX_WORKERS, run_concurrently
+from utilities.console import Console, close_console_session, get_console_session
 from utilities.constants import (
     CLOUD_INIT_DISK_NAME,
     CLOUD_INIT_NO_CLOUD,
@@ -97,10 +98,13 @@ from utilities.constants import (
 from utilities.data_collector import collect_vnc_screenshot_for_vms
 from utilities.exceptions import MigrationStuckSchedulingError, ResourceValueError
 from utilities.hco import get_hco_namespace, wait_for_hco_conditions
+from utilities.informer import get_session_informer
 from utilities.network import (
     cloud_init_network_data,
 )
+from utilities.ssh_pool import PooledRemoteExecutorFactory, get_ssh_connection_pool, run_ssh_batch
 from utilities.storage import get_default_storage_class
+from utilities.templates import get_base_template_by_labels, process_template
 
 if TYPE_CHECKING:
     from libs.vm.vm import BaseVirtualMachine
@@ -135,6 +139,18 @@ def wait_for_vm_interfaces(vmi: VirtualMachineInstance, timeout: int = TIMEOUT_1
     Raises:
         TimeoutExpiredError: After timeout reached.
     """
+    if informer := get_session_informer(resource_kind=VirtualMachineInstance):
+        LOGGER.info(f"Wait until guest agent is active and reports {vmi.name} network interfaces")
+        informer.wait_for(
+            name=vmi.name,
+            namespace=vmi.namespace,
+            predicate=lambda _vmi: (
+                _is_vmi_agent_connected(vmi_instance=_vmi) and _are_vmi_interfaces_active(vmi_instance=_vmi)
+            ),
+            timeout=timeout,
+        )
+        return True
+
     # Waiting for guest agent connection before checking guest agent interfaces report
     LOGGER.info(f"Wait until guest agent is active on {vmi.name}")
     vmi.wait_for_condition(
@@ -145,13 +161,25 @@ def wait_for_vm_interfaces(vmi: VirtualMachineInstance, timeout: int = TIMEOUT_1
     LOGGER.info(f"Wait for {vmi.name} network interfaces")
     sampler = TimeoutSampler(wait_timeout=timeout, sleep=1, func=lambda: vmi.instance)
     for sample in sampler:
-        interfaces = sample.get("status", {}).get("interfaces", [])
-        active_interfaces = [interface for interface in interfaces if interface.get("interfaceName")]
-        if len(active_interfaces) == len(interfaces):
+        if _are_vmi_interfaces_active(vmi_instance=sample):
             return True
     return False
 
 
+def _is_vmi_agent_connected(vmi_instance: Any) -> bool:
+    return any(
+        condition.type == VirtualMachineInstance.Condition.Type.AGENT_CONNECTED
+        and condition.status == VirtualMachineInstance.Condition.Status.TRUE
+        for condition in (vmi_instance.status and vmi_instance.status.conditions) or []
+    )
+
+
+def _are_vmi_interfaces_active(vmi_instance: Any) -> bool:
+    interfaces = vmi_instance.get("status", {}).get("interfaces", [])
+    active_interfaces = [interface for interface in interfaces if interface.get("interfaceName")]
+    return len(active_interfaces) == len(interfaces)
+
+
 def generate_cloud_init_data(data):
     """
     Generate cloud init data from a dictionary.
@@ -402,6 +430,7 @@ class VirtualMachineForTests(VirtualMachine):
         self.ssh = ssh
         self.ssh_secret = ssh_secret
         self.custom_service = None
+        self._instance_uid: str | None = None
         self.network_model = network_model
         self.network_multiqueue = network_multiqueue
         self.data_volume_template = data_volume_template
@@ -452,6 +481,11 @@ class VirtualMachineForTests(VirtualMachine):
         return self
 
     def clean_up(self, wait: bool = True, timeout: int | None = None) -> bool:
+        close_console_session(vm=self)
+        # Pooled SSH connections are keyed by the UID, which is only read once ssh_exec was used
+        if self._instance_uid and (ssh_connection_pool := get_ssh_connection_pool()):
+            ssh_connection_pool.close(key=self._instance_uid)
+        self._instance_uid = None
         if self.exists and self.ready:
             self.stop(wait=True, vmi_delete_timeout=TIMEOUT_8MIN)
         super().clean_up(wait=wait, timeout=timeout)
@@ -1166,6 +1200,13 @@ class VirtualMachineForTests(VirtualMachine):
                     self.username = secrets.token_urlsafe(nbytes=12)
                     self.password = secrets.token_urlsafe(nbytes=12)
 
+    @property
+    def instance_uid(self) -> str:
+        # The UID does not change until the VM is cleaned up, do not GET the VM on every ssh_exec access
+        if not self._instance_uid:
+            self._instance_uid = self.instance.metadata.uid
+        return self._instance_uid
+
     @property
     def ssh_exec(self):
         # In order to use this property VM should be created with ssh=True
@@ -1181,15 +1222,31 @@ class VirtualMachineForTests(VirtualMachine):
         else:
             host_user = user.UserWithPKey(name=self.username, private_key=os.environ[CNV_VM_SSH_KEY_PATH])
         host.executor_user = host_user
-        host.executor_factory = ssh.RemoteExecutorFactory(
-            sock=self.virtctl_port_forward_cmd,
-        )
+        if ssh_connection_pool := get_ssh_connection_pool():
+            host.executor_factory = PooledRemoteExecutorFactory(
+                pool=ssh_connection_pool,
+                key=self.instance_uid,
+                proxy_command=self.virtctl_port_forward_cmd,
+            )
+        else:
+            host.executor_factory = ssh.RemoteExecutorFactory(
+                sock=self.virtctl_port_forward_cmd,
+            )
         return host
 
     def wait_for_specific_status(self, status, timeout=TIMEOUT_3MIN, sleep=TIMEOUT_5SEC):
         LOGGER.info(f"Wait for {self.kind} {self.name} status to be {status}")
-        samples = TimeoutSampler(wait_timeout=timeout, sleep=sleep, func=lambda: self.printable_status)
         try:
+            if informer := get_session_informer(resource_kind=VirtualMachine):
+                informer.wait_for(
+                    name=self.name,
+                    namespace=self.namespace,
+                    predicate=lambda _vm: bool(_vm.status) and _vm.status.printableStatus == status,
+                    timeout=timeout,
+                )
+                return
+
+            samples = TimeoutSampler(wait_timeout=timeout, sleep=sleep, func=lambda: self.printable_status)
             for sample in samples:
                 if sample == status:
                     return
@@ -1453,14 +1510,18 @@ class VirtualMachineForTestsFromTemplate(VirtualMachineForTests):
             DATA_SOURCE_NAMESPACE: self.data_source.namespace if self.data_source else "mock-data-source-ns",
         }
 
-        template_object = self.template_object or get_template_by_labels(
-            admin_client=self.client, template_labels=self.template_labels
+        # Base templates are fetched once per session and processed locally
+        template_dict = (
+            self.template_object.instance.to_dict()
+            if self.template_object
+            else get_base_template_by_labels(template_labels=self.template_labels)
+            or get_template_by_labels(admin_client=self.client, template_labels=self.template_labels).instance.to_dict()
         )
 
         # Set password for non-Windows VMs; for Windows VM, the password is already set in the image
         if OS_FLAVOR_WINDOWS not in self.os_flavor:
             username, _ = username_password_from_cloud_init(
-                vm_volumes=template_object.instance.objects[0].spec.template.spec.volumes
+                vm_volumes=template_dict["objects"][0]["spec"]["template"]["spec"]["volumes"]
             )
 
             self.username = username
@@ -1469,7 +1530,7 @@ class VirtualMachineForTestsFromTemplate(VirtualMachineForTests):
         if self.template_params:
             template_kwargs.update(self.template_params)
 
-        resources_list = template_object.process(client=get_client(), **template_kwargs)
+        resources_list = process_template(template_dict=template_dict, parameters=template_kwargs)
         for resource in resources_list:
             if resource["kind"] == VirtualMachine.kind and resource["metadata"]["name"] == self.name:
                 return resource
@@ -1493,6 +1554,8 @@ def vm_console_run_commands(
         timeout (int): Time to wait for the command output
         return_code_validation (bool): Check commands return 0
 
+    The commands run on the pooled console session of the VM, which stays logged in between calls.
+
     Returns:
         Dict of the commands outputs, where the key is the command and the value is the output as a list of lines.
     """
@@ -1500,7 +1563,7 @@ def vm_console_run_commands(
     # Strip CSI (ESC[…) and OSC (ESC]…BEL/ST) terminal escape sequences
     ansi_escape = re.compile(r"(\x9B|\x1B\[)[0-?]*[ -\/]*[@-~]|\x1B\][^\x07\x1B]*(?:\x07|\x1B\\)")
     prompt = r"\$ "
-    with Console(vm=vm, prompt=prompt) as vmc:
+    with get_console_session(vm=vm, prompt=prompt) as vmc:
         for command in commands:
             LOGGER.info(f"Execute {command} on {vm.name}")
             try:
@@ -1521,6 +1584,40 @@ def vm_console_run_commands(
     return output
 
 
+def vms_console_run_commands(
+    vms: list[VirtualMachineForTests | BaseVirtualMachine],
+    commands: list[str],
+    timeout: int = TIMEOUT_1MIN,
+    return_code_validation: bool = True,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> dict[str, dict[str, list[str]]]:
+    """
+    Run a list of commands on the consoles of many VMs concurrently.
+
+    Args:
+        vms (list): VirtualMachines
+        commands (list): List of commands, run on each VM
+        timeout (int): Time to wait for the command output
+        return_code_validation (bool): Check commands return 0
+        max_workers (int): Maximum number of consoles used at the same time
+
+    Returns:
+        Dict of the commands outputs (as returned by vm_console_run_commands) per VM name.
+
+    Raises:
+        VMsOperationError: If the commands failed on at least one VM.
+    """
+    output = {}
+
+    def _run_commands(vm: VirtualMachineForTests | BaseVirtualMachine) -> None:
+        output[vm.name] = vm_console_run_commands(
+            vm=vm, commands=commands, timeout=timeout, return_code_validation=return_code_validation
+        )
+
+    run_concurrently(vms=vms, operation=_run_commands, max_workers=max_workers, fail_fast=False)
+    return output
+
+
 def fedora_vm_body(name: str) -> dict[str, Any]:
     pull_secret = utilities.infra.generate_openshift_pull_secret_file()
 
@@ -2301,30 +2398,6 @@ def get_hyperconverged_ovs_annotations(hyperconverged):
     return (hyperconverged.instance.to_dict()["metadata"].get("annotations", {})).get("deployOVS")
 
 
-def get_base_templates_list(client: DynamicClient) -> list[Template]:
-    """
-    Return base templates list.
-
-    Args:
-        client (DynamicClient): Client to use for getting base templates list.
-
-    Returns:
-        list[Template]: List of base templates.
-    """
-    common_templates_list = list(
-        Template.get(
-            client=client,
-            singular_name=Template.singular_name,
-            label_selector=f"{Template.Labels.BASE},{Template.Labels.ARCHITECTURE}={py_config['cpu_arch']}",
-        )
-    )
-    return [
-        template
-        for template in common_templates_list
-        if not template.instance.metadata.annotations.get(template.Annotations.DEPRECATED)
-    ]
-
-
 def get_template_by_labels(admin_client, template_labels):
     template = list(
         Template.get(
@@ -2650,6 +2723,38 @@ def wait_for_vmi_relocation_and_running(initial_node, vm, timeout=TIMEOUT_5MIN):
         raise
 
 
+def vms_run_ssh_commands(
+    vms: list[VirtualMachineForTests],
+    commands: list[str],
+    check_rc: bool = True,
+    timeout: int = TIMEOUT_1MIN,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> dict[str, list[str]]:
+    """
+    Run a batch of shell commands over SSH on many VMs concurrently, one round trip per VM.
+
+    Args:
+        vms (list): VirtualMachines
+        commands (list): Shell command lines, run on each VM
+        check_rc (bool): Stop at the first failing command of a VM and fail
+        timeout (int): Timeout of the batch on each VM
+        max_workers (int): Maximum number of VMs accessed at the same time
+
+    Returns:
+        Dict of the commands outputs (as returned by run_ssh_batch) per VM name.
+
+    Raises:
+        VMsOperationError: If the commands failed on at least one VM.
+    """
+    output = {}
+
+    def _run_commands(vm: VirtualMachineForTests) -> None:
+        output[vm.name] = run_ssh_batch(host=vm.ssh_exec, commands=commands, check_rc=check_rc, timeout=timeout)
+
+    run_concurrently(vms=vms, operation=_run_commands, max_workers=max_workers, fail_fast=False)
+    return output
+
+
 def check_qemu_guest_agent_installed(ssh_exec: Host) -> bool:
     rc, _, _ = ssh_exec.executor().run_cmd(cmd=shlex.split("rpm -q qemu-guest-agent"))
     return rc == 0
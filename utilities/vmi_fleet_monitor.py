@@ -0,0 +1,190 @@
+"""
+Watch-based monitor of the VMIs of a namespace.
+
+VMI phase changes are streamed by a single watch, so every transition is recorded (with its time) however short it
+is, and the number of API requests does not depend on the number of VMs.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.resource import ResourceField
+from ocp_resources.virtual_machine_instance import VirtualMachineInstance
+
+from utilities.informer import DELETED, ResourceInformer, get_session_informer
+
+LOGGER = logging.getLogger(__name__)
+
+RUNNING = VirtualMachineInstance.Status.RUNNING
+
+
+@dataclass(frozen=True)
+class VMIPhaseTransition:
+    """
+    A VMI phase change.
+
+    Args:
+        time (float): Epoch time the change was seen at.
+        name (str): VMI name.
+        from_phase (str | None): Previous phase, None if the VMI did not exist.
+        to_phase (str | None): New phase, None if the VMI was deleted.
+    """
+
+    time: float
+    name: str
+    from_phase: str | None
+    to_phase: str | None
+
+
+@dataclass(frozen=True)
+class VMIFleetSummary:
+    """
+    VMI fleet state over a monitoring window.
+
+    Args:
+        duration (float): Seconds since the monitor started.
+        not_running (list): Names of the VMIs not running now.
+        restarts (dict): VMI name to the times it left and re-entered the Running phase (or was re-created).
+        uptimes (dict): VMI name to the fraction (0 to 1) of the window it was running.
+        transitions (int): Number of phase transitions seen.
+    """
+
+    duration: float
+    not_running: list[str]
+    restarts: dict[str, int]
+    uptimes: dict[str, float]
+    transitions: int
+
+    @property
+    def stable(self) -> bool:
+        return not self.not_running and not any(self.restarts.values())
+
+    def __str__(self) -> str:
+        restarted = {name: count for name, count in self.restarts.items() if count}
+        min_uptime = min(self.uptimes.values(), default=1.0)
+        return (
+            f"{len(self.uptimes)} VMIs over {self.duration:.0f}s: {len(self.not_running)} not running "
+            f"{self.not_running}, restarted: {restarted}, minimal uptime: {min_uptime:.2%}, "
+            f"{self.transitions} phase transitions"
+        )
+
+
+class VMIFleetMonitor:
+    """
+    Record the phase transitions of the VMIs of a namespace, from the cluster-wide session VMI informer when enabled
+    or from an informer of its own.
+
+    Args:
+        client (DynamicClient): Dynamic client used by the informer.
+        namespace (str): Namespace of the VMIs.
+        vmi_names (Iterable, optional): VMIs to monitor; default is all the VMIs of the namespace.
+    """
+
+    def __init__(self, client: DynamicClient, namespace: str, vmi_names: Iterable[str] | None = None) -> None:
+        self.client = client
+        self.namespace = namespace
+        self.vmi_names = set(vmi_names) if vmi_names is not None else None
+        self.transitions: list[VMIPhaseTransition] = []
+        self._phases: dict[str, str | None] = {}
+        self._running_since: dict[str, float] = {}
+        self._running_time: Counter[str] = Counter()
+        self._restarts: Counter[str] = Counter()
+        self._start_time = 0.0
+        self._lock = threading.Lock()
+        self._informer: ResourceInformer | None = None
+        self._own_informer = False
+        self._unsubscribe = None
+
+    def __enter__(self) -> VMIFleetMonitor:
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def start(self) -> VMIFleetMonitor:
+        self._informer = get_session_informer(resource_kind=VirtualMachineInstance)
+        if self._informer is None:
+            self._informer = ResourceInformer(
+                client=self.client, resource_kind=VirtualMachineInstance, namespace=self.namespace
+            ).start()
+            self._own_informer = True
+
+        with self._lock:
+            self._start_time = time.time()
+            self._unsubscribe = self._informer.subscribe(callback=self._on_event)
+            for vmi in self._informer.list(namespace=self.namespace):
+                if self._is_monitored(name=vmi.metadata.name):
+                    self._set_phase(name=vmi.metadata.name, phase=_vmi_phase(vmi=vmi), now=self._start_time)
+            # The initial phases are the monitoring baseline, not transitions
+            self.transitions.clear()
+
+        LOGGER.info(f"Monitoring {len(self._phases)} VMIs in {self.namespace}")
+        return self
+
+    def stop(self) -> None:
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._own_informer and self._informer:
+            self._informer.stop()
+        LOGGER.info(f"VMI fleet of {self.namespace}: {self.summary()}")
+
+    def summary(self) -> VMIFleetSummary:
+        with self._lock:
+            now = time.time()
+            duration = now - self._start_time
+            names = sorted(self.vmi_names if self.vmi_names is not None else self._phases)
+            running_times = {
+                name: self._running_time[name]
+                + (now - self._running_since[name] if name in self._running_since else 0.0)
+                for name in names
+            }
+            return VMIFleetSummary(
+                duration=duration,
+                not_running=[name for name in names if self._phases.get(name) != RUNNING],
+                restarts={name: self._restarts[name] for name in names},
+                uptimes={name: running_times[name] / duration if duration else 1.0 for name in names},
+                transitions=len(self.transitions),
+            )
+
+    def _is_monitored(self, name: str) -> bool:
+        return self.vmi_names is None or name in self.vmi_names
+
+    def _on_event(self, event_type: str, obj: ResourceField) -> None:
+        if obj.metadata.namespace != self.namespace or not self._is_monitored(name=obj.metadata.name):
+            return
+
+        with self._lock:
+            self._set_phase(
+                name=obj.metadata.name,
+                phase=None if event_type == DELETED else _vmi_phase(vmi=obj),
+                now=time.time(),
+            )
+
+    def _set_phase(self, name: str, phase: str | None, now: float) -> None:
+        previous_phase = self._phases.get(name)
+        if phase == previous_phase and name in self._phases:
+            return
+
+        self._phases[name] = phase
+        self.transitions.append(VMIPhaseTransition(time=now, name=name, from_phase=previous_phase, to_phase=phase))
+        if phase == RUNNING:
+            # Running again after having run before: the VMI restarted (or flapped)
+            if self._running_time[name]:
+                self._restarts[name] += 1
+            self._running_since[name] = now
+        elif (running_since := self._running_since.pop(name, None)) is not None:
+            # A zero-length running period still marks the VMI as having run
+            self._running_time[name] += max(now - running_since, 1e-6)
+            LOGGER.warning(f"VMI {self.namespace}/{name} left the Running phase: {previous_phase} -> {phase}")
+
+
+def _vmi_phase(vmi: ResourceField) -> str | None:
+    return vmi.status.phase if vmi.status else None